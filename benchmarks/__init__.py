@@ -0,0 +1,24 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Performance benchmarks of the SDK, run from the root of the repository with
+
+        python -m benchmarks --output results.json
+
+    and compared against the results of an earlier release with
+
+        python -m benchmarks --compare baseline.json
+
+    Benchmarks are registered by the bench_* modules, see runner.benchmark.
+"""
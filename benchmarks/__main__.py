@@ -0,0 +1,78 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Command line of the benchmarks, see python -m benchmarks --help """
+
+from __future__ import print_function
+import argparse
+import io
+import json
+import sys
+
+from . import bench_decisions, bench_event_batching, bench_meg, bench_segmentor, bench_settings  # noqa: F401
+from . import runner
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Runs the benchmarks of the SDK")
+    parser.add_argument("-k", "--filter", help="run only the benchmarks whose id contains this text")
+    parser.add_argument("--list", action="store_true", help="list the benchmarks without running them")
+    parser.add_argument("--rounds", type=int, default=5, help="rounds of each benchmark (default: 5)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum seconds of a round (default: 0.2)")
+    parser.add_argument("-o", "--output", help="write the results as json to this file")
+    parser.add_argument("--compare", help="compare the results against those of an earlier run in this json file")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.2,
+        help="fail if a benchmark is slower than in --compare by more than this fraction (default: 0.2)",
+    )
+    args = parser.parse_args(argv)
+
+    benchmark_runs = [
+        benchmark_run for benchmark_run in runner.BENCHMARKS if not args.filter or args.filter in benchmark_run.id
+    ]
+    if args.list:
+        for benchmark_run in benchmark_runs:
+            print(benchmark_run.id)
+        return 0
+
+    def print_result(result):
+        print(
+            "{id:<72} {median:>12.3f} us/op {ops_per_second:>14,.0f} ops/s".format(
+                id=result["id"], median=result["median"] * 1e6, ops_per_second=result["ops_per_second"]
+            )
+        )
+
+    results = runner.run_all(benchmark_runs, rounds=args.rounds, min_time=args.min_time, on_result=print_result)
+
+    if args.output:
+        with io.open(args.output, "w", encoding="utf-8") as output_file:
+            output_file.write(json.dumps(results, indent=2, sort_keys=True))
+
+    if args.compare:
+        with io.open(args.compare, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        comparisons = runner.compare(results, baseline, args.max_regression)
+        print("\nCompared against sdk_version {}:".format(baseline.get("sdk_version")))
+        for benchmark_id, baseline_median, median, ratio, is_regression in comparisons:
+            print("{:<72} {:>8.2f}x{}".format(benchmark_id, ratio, "  REGRESSION" if is_regression else ""))
+        if any(comparison[4] for comparison in comparisons):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Throughput of the decision APIs, with and without UserStorage """
+
+from . import fixtures
+from .runner import benchmark
+
+USER_STORAGE_PARAMS = [{"user_storage": False}, {"user_storage": True}]
+
+
+def _launch(user_storage):
+    return fixtures.launch(
+        fixtures.get_decisions_settings_file(),
+        user_storage=fixtures.InMemoryUserStorage() if user_storage else None,
+    )
+
+
+@benchmark("decisions", params=USER_STORAGE_PARAMS)
+def bench_activate(user_storage):
+    vwo_instance = _launch(user_storage)
+    user_ids = fixtures.get_user_ids()
+
+    def activate():
+        vwo_instance.activate(fixtures.AB_CAMPAIGN_KEY, next(user_ids))
+
+    return activate
+
+
+@benchmark("decisions", params=USER_STORAGE_PARAMS)
+def bench_is_feature_enabled(user_storage):
+    vwo_instance = _launch(user_storage)
+    user_ids = fixtures.get_user_ids()
+
+    def is_feature_enabled():
+        vwo_instance.is_feature_enabled(fixtures.FEATURE_TEST_CAMPAIGN_KEY, next(user_ids))
+
+    return is_feature_enabled
+
+
+@benchmark("decisions", params=USER_STORAGE_PARAMS)
+def bench_get_feature_variable_value(user_storage):
+    vwo_instance = _launch(user_storage)
+    user_ids = fixtures.get_user_ids()
+    if user_storage:
+        # feature variables are served only to users who became part of the campaign earlier
+        for _ in range(fixtures.NO_OF_USERS):
+            vwo_instance.is_feature_enabled(fixtures.FEATURE_ROLLOUT_CAMPAIGN_KEY, next(user_ids))
+
+    def get_feature_variable_value():
+        vwo_instance.get_feature_variable_value(fixtures.FEATURE_ROLLOUT_CAMPAIGN_KEY, "JSON_VARIABLE", next(user_ids))
+
+    return get_feature_variable_value
+
+
+@benchmark("decisions", params=USER_STORAGE_PARAMS)
+def bench_track(user_storage):
+    vwo_instance = _launch(user_storage)
+    user_ids = fixtures.get_user_ids()
+    if user_storage:
+        # goals are tracked only for users who became part of the campaign earlier
+        for _ in range(fixtures.NO_OF_USERS):
+            vwo_instance.activate(fixtures.AB_CAMPAIGN_KEY, next(user_ids))
+
+    def track():
+        vwo_instance.track(fixtures.AB_CAMPAIGN_KEY, next(user_ids), "CUSTOM")
+
+    return track
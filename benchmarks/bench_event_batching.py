@@ -0,0 +1,93 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Event batching throughput, from queueing impressions till they are synced to a local stub server """
+
+import threading
+
+import mock
+
+from vwo.constants import constants
+from . import fixtures
+from .runner import benchmark
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """Accepts every request with 200, after reading its body like the VWO server would"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    do_GET = do_POST
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+@benchmark(
+    "event_batching",
+    params=[{"events": 1000, "events_per_request": events_per_request} for events_per_request in [10, 100]],
+    ops="events",
+)
+def bench_activate_and_flush(events, events_per_request):
+    server = StubServer(("127.0.0.1", 0), StubRequestHandler)
+    server_thread = threading.Thread(target=server.serve_forever)
+    server_thread.daemon = True
+    server_thread.start()
+
+    # every request of the SDK goes to the stub server over plain http
+    patchers = [
+        mock.patch.object(constants, "HTTPS_PROTOCOL", "http://"),
+        mock.patch.object(constants.ENDPOINTS, "BASE_URL", "127.0.0.1:{}".format(server.server_address[1])),
+    ]
+    for patcher in patchers:
+        patcher.start()
+
+    vwo_instance = fixtures.launch(
+        fixtures.get_decisions_settings_file(),
+        is_development_mode=False,
+        batch_events={"events_per_request": events_per_request, "request_time_interval": 600},
+    )
+    user_ids = fixtures.get_user_ids()
+
+    def activate_and_flush():
+        for _ in range(events):
+            vwo_instance.activate(fixtures.AB_CAMPAIGN_KEY, next(user_ids))
+        vwo_instance.flush_events(mode="sync")
+
+    def close():
+        vwo_instance.event_dispatcher.shutdown()
+        for patcher in patchers:
+            patcher.stop()
+        server.shutdown()
+        server.server_close()
+
+    activate_and_flush.close = close
+    return activate_and_flush
@@ -0,0 +1,39 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Decisions for campaigns of mutually exclusive groups(MEG), random vs advanced algorithm """
+
+from . import fixtures
+from .runner import benchmark
+
+# MEG algorithm sharing traffic as per weightage, see variation_decider.MEG_ALGO_ADVANCED
+MEG_ALGO_ADVANCED = 2
+
+
+@benchmark(
+    "meg",
+    params=[
+        {"algo": algo, "campaigns": no_of_campaigns} for algo in ["random", "advanced"] for no_of_campaigns in [2, 10]
+    ],
+)
+def bench_get_variation_name(algo, campaigns):
+    vwo_instance = fixtures.launch(
+        fixtures.get_group_settings_file(campaigns, MEG_ALGO_ADVANCED if algo == "advanced" else None)
+    )
+    user_ids = fixtures.get_user_ids()
+
+    def get_variation_name():
+        vwo_instance.get_variation_name("CAMPAIGN_0", next(user_ids))
+
+    return get_variation_name
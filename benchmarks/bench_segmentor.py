@@ -0,0 +1,60 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Segment evaluation over the segmentor test cases, walking the dsl vs compiled """
+
+import io
+import json
+
+from vwo.services.segmentor import SegmentEvaluator
+from .runner import benchmark
+
+SEGMENTOR_TEST_CASES_PATH = "tests/data/segmentor_test_cases.json"
+
+
+def get_test_cases():
+    """Returns the dsl and custom_variables of every segmentor test case"""
+    with io.open(SEGMENTOR_TEST_CASES_PATH, encoding="utf-8") as test_cases_file:
+        test_cases = json.load(test_cases_file)
+    return [
+        (test_case.get("dsl"), test_case.get("custom_variables") or {})
+        for group in test_cases.values()
+        for test_case in group.values()
+    ]
+
+
+@benchmark("segmentor", ops=len(get_test_cases()))
+def bench_evaluate():
+    segment_evaluator = SegmentEvaluator()
+    test_cases = get_test_cases()
+
+    def evaluate():
+        for dsl, custom_variables in test_cases:
+            segment_evaluator.evaluate(dsl, custom_variables)
+
+    return evaluate
+
+
+@benchmark("segmentor", ops=len(get_test_cases()))
+def bench_evaluate_compiled():
+    segment_evaluator = SegmentEvaluator()
+    compiled_test_cases = [
+        (segment_evaluator.compile(dsl), custom_variables) for dsl, custom_variables in get_test_cases()
+    ]
+
+    def evaluate_compiled():
+        for compiled_segments, custom_variables in compiled_test_cases:
+            compiled_segments(custom_variables)
+
+    return evaluate_compiled
@@ -0,0 +1,48 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Loading and refreshing synthetic settings_file of 10, 100 and 1000 campaigns """
+
+import itertools
+import json
+
+from . import fixtures
+from .runner import benchmark
+
+CAMPAIGNS_PARAMS = [{"campaigns": no_of_campaigns} for no_of_campaigns in [10, 100, 1000]]
+
+
+@benchmark("settings", params=CAMPAIGNS_PARAMS)
+def bench_launch(campaigns):
+    settings_file = fixtures.get_settings_file(campaigns)
+
+    def launch():
+        fixtures.launch(settings_file)
+
+    return launch
+
+
+@benchmark("settings", params=CAMPAIGNS_PARAMS)
+def bench_refresh(campaigns):
+    # settings_file alternates between two versions differing in one campaign, as on a usual refresh
+    settings_file_strings = [json.dumps(fixtures.get_settings_file(campaigns, version=version)) for version in [1, 2]]
+    latest_settings_file_strings = itertools.cycle(settings_file_strings)
+    vwo_instance = fixtures.launch(fixtures.get_settings_file(campaigns))
+
+    def refresh():
+        vwo_instance.get_and_update_settings_file(
+            fixtures.ACCOUNT_ID, fixtures.SDK_KEY, latest_settings_file=next(latest_settings_file_strings)
+        )
+
+    return refresh
@@ -0,0 +1,142 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Synthetic settings_file, users and storage shared by the benchmarks """
+
+from __future__ import division
+
+import copy
+import itertools
+import json
+
+import vwo
+from tests.data.settings_files import SETTINGS_FILES
+
+ACCOUNT_ID = 88888888
+SDK_KEY = "someuniquestuff1234567"
+NO_OF_USERS = 1000
+
+# campaigns of each type from the test settings_files, run as they are in the decision benchmarks
+AB_CAMPAIGN_KEY = "AB_T_100_W_50_50"
+FEATURE_TEST_CAMPAIGN_KEY = "FT_T_100_W_10_20_30_40"
+FEATURE_ROLLOUT_CAMPAIGN_KEY = "FR_T_100_W_100"
+
+
+class InMemoryUserStorage(object):
+    """UserStorage keeping the data in a dict, so that the benchmarks time the SDK and not a store"""
+
+    def __init__(self):
+        self.storage = {}
+
+    def get(self, user_id, campaign_key):
+        return self.storage.get((user_id, campaign_key))
+
+    def set(self, user_storage_data):
+        self.storage[(user_storage_data.get("userId"), user_storage_data.get("campaignKey"))] = user_storage_data
+
+
+def get_user_ids(no_of_users=NO_OF_USERS):
+    """Returns an endless iterator over distinct user ids, for spreading the calls over many users"""
+    return itertools.cycle(["user-{}".format(index) for index in range(no_of_users)])
+
+
+def get_decisions_settings_file():
+    """Returns a settings_file having an A/B, a feature test and a feature rollout campaign"""
+    settings_file = copy.deepcopy(SETTINGS_FILES[AB_CAMPAIGN_KEY])
+    for campaign_key in [FEATURE_TEST_CAMPAIGN_KEY, FEATURE_ROLLOUT_CAMPAIGN_KEY]:
+        settings_file["campaigns"] += copy.deepcopy(SETTINGS_FILES[campaign_key]["campaigns"])
+    return settings_file
+
+
+def get_campaign(index, no_of_variations=2, segments=None):
+    """Returns an A/B campaign with a pre-segment, having the index in its id and key
+
+    Args:
+        index (int): index of the campaign
+        no_of_variations (int): variations sharing the traffic equally
+        segments (dict|None): pre-segments, the campaign runs for everyone if None
+
+    Returns:
+        dict: campaign
+    """
+    return {
+        "id": 1000 + index,
+        "key": "CAMPAIGN_{}".format(index),
+        "name": "Campaign-{}".format(index),
+        "status": "RUNNING",
+        "type": "VISUAL_AB",
+        "percentTraffic": 100,
+        "isForcedVariationEnabled": False,
+        "segments": segments or {},
+        "goals": [{"identifier": "GOAL_{}".format(index), "id": 1, "type": "CUSTOM_GOAL"}],
+        "variations": [
+            {
+                "id": variation_index + 1,
+                "name": "Control" if variation_index == 0 else "Variation-{}".format(variation_index),
+                "changes": {},
+                "weight": 100 / no_of_variations,
+            }
+            for variation_index in range(no_of_variations)
+        ],
+    }
+
+
+def get_settings_file(no_of_campaigns, version=1):
+    """Returns a settings_file having no_of_campaigns A/B campaigns segmented on a custom variable
+
+    Args:
+        no_of_campaigns (int): number of campaigns
+        version (int): version of the settings_file, the first campaign is changed along with it
+
+    Returns:
+        dict: settings_file
+    """
+    campaigns = [
+        get_campaign(index, segments={"or": [{"custom_variable": {"plan": "regex(^(free|pro)$)"}}]})
+        for index in range(no_of_campaigns)
+    ]
+    campaigns[0]["percentTraffic"] = 100 - version % 2
+    return {"sdkKey": SDK_KEY, "accountId": ACCOUNT_ID, "version": version, "campaigns": campaigns}
+
+
+def get_group_settings_file(no_of_campaigns, group_algo=None):
+    """Returns a settings_file having a mutually exclusive group of no_of_campaigns campaigns
+
+    Args:
+        no_of_campaigns (int): number of campaigns of the group
+        group_algo (int|None): 2 for the advanced algorithm sharing traffic as per weightage, random if None
+
+    Returns:
+        dict: settings_file
+    """
+    campaigns = [get_campaign(index) for index in range(no_of_campaigns)]
+    group = {"name": "Group 1", "campaigns": [campaign["id"] for campaign in campaigns]}
+    if group_algo is not None:
+        group["et"] = group_algo
+        group["wt"] = {str(campaign["id"]): 100 / no_of_campaigns for campaign in campaigns}
+    return {
+        "sdkKey": SDK_KEY,
+        "accountId": ACCOUNT_ID,
+        "version": 1,
+        "campaigns": campaigns,
+        "groups": {"1": group},
+        "campaignGroups": {str(campaign["id"]): 1 for campaign in campaigns},
+    }
+
+
+def launch(settings_file, **kwargs):
+    """Launches the SDK with the settings_file, in development mode unless told otherwise, logging errors only"""
+    kwargs.setdefault("is_development_mode", True)
+    kwargs.setdefault("log_level", vwo.LOG_LEVELS.ERROR)
+    return vwo.launch(json.dumps(settings_file), **kwargs)
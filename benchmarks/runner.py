@@ -0,0 +1,180 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Registry and runner of the benchmarks, producing machine-readable results """
+
+from __future__ import division
+import gc
+import platform
+import statistics
+import time
+import timeit
+
+from vwo.constants import constants
+
+# version of the results format, bumped whenever it changes
+RESULTS_FORMAT_VERSION = 1
+
+BENCHMARKS = []
+
+
+class Benchmark(object):
+    """A registered benchmark, run once for each of its params"""
+
+    def __init__(self, group, name, setup, params, ops):
+        """
+        Args:
+            group (str): group of the benchmark e.g. decisions, settings
+            name (str): name of the benchmark, unique in its group
+            setup (function): called with params, returns the function to be timed
+            params (dict): params of the run
+            ops (int|str): operations done by one call of the timed function, or name of the param having it
+        """
+        self.group = group
+        self.name = name
+        self.setup = setup
+        self.params = params
+        self.ops = params[ops] if isinstance(ops, str) else ops
+
+    @property
+    def id(self):
+        """Unique id of the run, used for comparing results"""
+        return "/".join(
+            [self.group, self.name] + ["{}={}".format(key, value) for key, value in sorted(self.params.items())]
+        )
+
+
+def benchmark(group, params=None, ops=1):
+    """Registers the decorated function as a benchmark. The function sets up the benchmark and returns
+    the function to be timed, which is called repeatedly without arguments.
+
+    Args:
+        group (str): group of the benchmark
+        params (list|None): dicts of keyword arguments of the decorated function, one run per dict
+        ops (int|str): operations done by one call of the timed function, or name of the param having it
+
+    Returns:
+        function: decorator
+    """
+
+    def decorator(setup):
+        name = setup.__name__
+        if name.startswith("bench_"):
+            name = name.replace("bench_", "", 1)
+        for run_params in params or [{}]:
+            BENCHMARKS.append(Benchmark(group, name, setup, run_params, ops))
+        return setup
+
+    return decorator
+
+
+def run(benchmark_run, rounds=5, min_time=0.2):
+    """Times a benchmark. Calls per round are calibrated so that a round takes at least min_time,
+    and garbage collection is disabled while timing.
+
+    Args:
+        benchmark_run (Benchmark): benchmark to be run
+        rounds (int): number of rounds
+        min_time (float): minimum seconds a round should take
+
+    Returns:
+        dict: result of the benchmark having seconds per operation statistics and operations per second
+    """
+    func = benchmark_run.setup(**benchmark_run.params)
+    try:
+        timer = timeit.Timer(func)
+        # doubling the calls till they take min_time also warms up caches before timing
+        calls = 1
+        while timer.timeit(calls) < min_time:
+            calls *= 2
+
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            times = [timer.timeit(calls) / (calls * benchmark_run.ops) for _ in range(rounds)]
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+    finally:
+        close = getattr(func, "close", None)
+        if callable(close):
+            close()
+
+    median = statistics.median(times)
+    return {
+        "id": benchmark_run.id,
+        "group": benchmark_run.group,
+        "name": benchmark_run.name,
+        "params": benchmark_run.params,
+        "ops_per_call": benchmark_run.ops,
+        "calls_per_round": calls,
+        "rounds": rounds,
+        "min": min(times),
+        "max": max(times),
+        "mean": statistics.mean(times),
+        "median": median,
+        "stddev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "ops_per_second": 1 / median if median else None,
+    }
+
+
+def run_all(benchmark_runs, rounds=5, min_time=0.2, on_result=None):
+    """Runs the benchmarks and collects their results along with the environment they ran in
+
+    Args:
+        benchmark_runs (list): benchmarks to be run
+        rounds (int): number of rounds of each benchmark
+        min_time (float): minimum seconds a round should take
+        on_result (function|None): called with each result as soon as it is available
+
+    Returns:
+        dict: results, json serializable
+    """
+    results = []
+    for benchmark_run in benchmark_runs:
+        result = run(benchmark_run, rounds=rounds, min_time=min_time)
+        results.append(result)
+        if on_result:
+            on_result(result)
+
+    return {
+        "format_version": RESULTS_FORMAT_VERSION,
+        "sdk_version": constants.SDK_VERSION,
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "benchmarks": results,
+    }
+
+
+def compare(results, baseline, max_regression):
+    """Compares median seconds per operation of the benchmarks against a baseline
+
+    Args:
+        results (dict): results, see run_all
+        baseline (dict): results of an earlier run e.g. of the previous release
+        max_regression (float): allowed slowdown as a fraction e.g. 0.2 for 20%
+
+    Returns:
+        list: tuple(id, baseline median, median, ratio, is_regression) of each benchmark present in both
+    """
+    baseline_medians = {result["id"]: result["median"] for result in baseline.get("benchmarks", [])}
+    comparisons = []
+    for result in results["benchmarks"]:
+        baseline_median = baseline_medians.get(result["id"])
+        if baseline_median:
+            ratio = result["median"] / baseline_median
+            comparisons.append((result["id"], baseline_median, result["median"], ratio, ratio > 1 + max_regression))
+    return comparisons
@@ -57,7 +57,7 @@ class LicenseCheckCommand(Command):
 
     def run(self):
         subprocess.call(
-            'python3 ./scripts/apache_license_check.py vwo/ tests/ setup.py --copyright "2019-2022 Wingify Software Pvt. Ltd."',
+            'python3 ./scripts/apache_license_check.py vwo/ tests/ benchmarks/ setup.py --copyright "2019-2022 Wingify Software Pvt. Ltd."',
             shell=True,
         )
 
@@ -150,6 +150,6 @@ setup(
         "license_check": LicenseCheckCommand,
         "doc_check": DocCheckCommand,
     },
-    packages=find_packages(exclude=["tests"]),
+    packages=find_packages(exclude=["tests", "benchmarks"]),
     install_requires=REQUIREMENTS,
 )
@@ -0,0 +1,170 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import json
+import copy
+import mock
+
+import vwo
+from vwo.core.variation_decider import VariationDecider
+from vwo.helpers import uuid_util
+from ..data.settings_files import SETTINGS_FILES
+from ..config.config import TEST_LOG_LEVEL
+
+with open("tests/data/mutually_exclusive_test_cases.json") as mutually_exclusive_test_cases_json:
+    mutually_exclusive_test_cases = json.load(mutually_exclusive_test_cases_json)
+
+USER_IDS = ["Ashley", "Bill", "Chris", "Dominic", "Emma", "Faizan", "Gimi", "Harry", "Ian", "John"]
+
+
+def get_settings_file():
+    settings_file = copy.deepcopy(SETTINGS_FILES["AB_T_100_W_50_50"])
+    for config_variant in ["AB_T_100_W_20_80", "FR_T_100_W_100", "FT_T_100_W_10_20_30_40"]:
+        settings_file["campaigns"] += copy.deepcopy(SETTINGS_FILES[config_variant]["campaigns"])
+    return settings_file
+
+
+class ClientUserStorageWithGetMany:
+    def __init__(self):
+        self.storage = {}
+        self.get_calls = []
+        self.get_many_calls = []
+
+    def get(self, user_id, campaign_key):
+        self.get_calls.append(campaign_key)
+        return self.storage.get((user_id, campaign_key))
+
+    def get_many(self, user_id, campaign_keys):
+        self.get_many_calls.append(list(campaign_keys))
+        return {
+            campaign_key: self.storage[(user_id, campaign_key)]
+            for campaign_key in campaign_keys
+            if (user_id, campaign_key) in self.storage
+        }
+
+    def set(self, user_data):
+        self.storage[(user_data.get("userId"), user_data.get("campaignKey"))] = user_data
+
+
+class GetAllDecisionsTest(unittest.TestCase):
+    def set_up(self, settings_file=None, **kwargs):
+        kwargs.setdefault("is_development_mode", True)
+        self.settings_file = json.dumps(settings_file or get_settings_file())
+        self.vwo = vwo.launch(self.settings_file, log_level=TEST_LOG_LEVEL, **kwargs)
+
+    def test_get_all_decisions_invalid_params(self):
+        self.set_up()
+        self.assertIsNone(self.vwo.get_all_decisions(123))
+        self.assertIsNone(self.vwo.get_all_decisions("Ashley", "AB_T_100_W_50_50"))
+        self.assertIsNone(self.vwo.get_all_decisions("Ashley", ["AB_T_100_W_50_50", 123]))
+        self.assertIsNone(self.vwo.get_all_decisions("Ashley", custom_variables=[]))
+
+    def test_get_all_decisions_for_given_campaigns(self):
+        self.set_up()
+        decisions = self.vwo.get_all_decisions("Ashley", ["AB_T_100_W_20_80", "NO_SUCH_CAMPAIGN_KEY"])
+        self.assertEqual(list(decisions), ["AB_T_100_W_20_80"])
+        self.assertEqual(self.vwo.get_all_decisions("Ashley", []), {})
+
+    def test_get_all_decisions_same_as_single_campaign_apis(self):
+        self.set_up()
+        for user_id in USER_IDS:
+            decisions = self.vwo.get_all_decisions(user_id)
+            self.assertEqual(
+                list(decisions), ["AB_T_100_W_50_50", "AB_T_100_W_20_80", "FR_T_100_W_100", "FT_T_100_W_10_20_30_40"]
+            )
+            for campaign_key in ["AB_T_100_W_50_50", "AB_T_100_W_20_80"]:
+                self.assertEqual(
+                    decisions[campaign_key], {"variation_name": self.vwo.get_variation_name(campaign_key, user_id)}
+                )
+            for campaign_key in ["FR_T_100_W_100", "FT_T_100_W_10_20_30_40"]:
+                self.assertEqual(
+                    decisions[campaign_key]["is_feature_enabled"], self.vwo.is_feature_enabled(campaign_key, user_id)
+                )
+                for variable_key, variable_value in decisions[campaign_key]["variables"].items():
+                    self.assertEqual(
+                        variable_value, self.vwo.get_feature_variable_value(campaign_key, variable_key, user_id)
+                    )
+            self.assertEqual(len(decisions["FR_T_100_W_100"]["variables"]), 5)
+            self.assertEqual(
+                decisions["FT_T_100_W_10_20_30_40"]["variation_name"],
+                self.vwo.get_variation_name("FT_T_100_W_10_20_30_40", user_id),
+            )
+
+    def test_get_all_decisions_with_mutually_exclusive_groups(self):
+        settings_file = mutually_exclusive_test_cases.get("commonSettingsFile")
+        custom_variables = {"c1": 1, "c2": 1, "c3": 1}
+        for user_id in USER_IDS:
+            self.set_up(settings_file)
+            with mock.patch.object(
+                VariationDecider,
+                "_get_group_winner_campaign",
+                autospec=True,
+                side_effect=VariationDecider._get_group_winner_campaign,
+            ) as mock_get_group_winner_campaign:
+                decisions = self.vwo.get_all_decisions(user_id, custom_variables=custom_variables)
+            self.assertEqual(mock_get_group_winner_campaign.call_count, 1)
+
+            self.set_up(settings_file)
+            self.assertEqual(
+                decisions["c1"]["variation_name"],
+                self.vwo.get_variation_name("c1", user_id, custom_variables=custom_variables),
+            )
+            self.assertEqual(
+                decisions["c2"]["is_feature_enabled"],
+                self.vwo.is_feature_enabled("c2", user_id, custom_variables=custom_variables),
+            )
+            self.assertEqual(decisions["c3"], {"variation_name": None})
+            # only one campaign of the group can be the winner
+            self.assertFalse(decisions["c1"]["variation_name"] and decisions["c2"]["is_feature_enabled"])
+
+    def test_get_all_decisions_shares_user_work(self):
+        user_storage = ClientUserStorageWithGetMany()
+        self.set_up(mutually_exclusive_test_cases.get("commonSettingsFile"), user_storage=user_storage)
+        with mock.patch("vwo.helpers.uuid_util.generate_for", wraps=uuid_util.generate_for) as mock_generate_for:
+            decisions = self.vwo.get_all_decisions("Ashley", custom_variables={"c1": 1, "c2": 1, "c3": 1})
+        self.assertEqual(mock_generate_for.call_count, 1)
+        self.assertEqual(user_storage.get_many_calls, [["c1", "c2", "c3"]])
+        self.assertEqual(user_storage.get_calls, [])
+
+        # decisions are stored, and read back on next call
+        user_storage.get_many_calls = []
+        self.assertEqual(self.vwo.get_all_decisions("Ashley", custom_variables={"c1": 1, "c2": 1, "c3": 1}), decisions)
+        self.assertEqual(len(user_storage.get_many_calls), 1)
+
+    def test_get_all_decisions_sends_impressions(self):
+        self.set_up(is_development_mode=False)
+        with mock.patch("vwo.http.connection.Connection.get", return_value={"status_code": 200}) as mock_get:
+            self.vwo.get_all_decisions("Ashley")
+        self.assertEqual(mock_get.call_count, 4)
+        self.assertTrue(all("track-user" in call[0][0] for call in mock_get.call_args_list))
+
+    def test_get_all_decisions_batches_impressions(self):
+        self.set_up(is_development_mode=False)
+        with mock.patch("vwo.http.connection.Connection.get") as mock_get, mock.patch(
+            "vwo.http.connection.Connection.post", return_value={"status_code": 200}
+        ) as mock_post:
+            self.vwo.get_all_decisions("Ashley", batch_impressions=True)
+        mock_get.assert_not_called()
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertIn("batch-events", mock_post.call_args[0][0])
+        events = mock_post.call_args[1]["data"]["ev"]
+        self.assertEqual([event["e"] for event in events], [231, 232, 29, 22])
+        self.assertEqual(len(set(event["u"] for event in events)), 1)
+        self.assertEqual(mock_post.call_args[1]["params"]["a"], 88888888)
+
+    def test_get_all_decisions_when_opted_out(self):
+        self.set_up()
+        self.vwo.set_opt_out()
+        self.assertIsNone(self.vwo.get_all_decisions("Ashley"))
@@ -0,0 +1,66 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import unittest
+
+import mock
+
+import vwo
+from ..data.settings_files import SETTINGS_FILES
+from ..config.config import TEST_LOG_LEVEL
+
+
+class GetDispatcherStatsTest(unittest.TestCase):
+    def set_up(self, batch_events=None):
+        self.vwo = vwo.launch(
+            json.dumps(SETTINGS_FILES.get("AB_T_100_W_50_50")),
+            is_development_mode=False,
+            log_level=TEST_LOG_LEVEL,
+            batch_events=batch_events,
+        )
+
+    def test_get_dispatcher_stats_with_event_batching(self):
+        self.set_up(batch_events={"events_per_request": 5, "request_time_interval": 600})
+        with mock.patch("vwo.http.connection.Connection.post", return_value={"status_code": 200, "text": ""}):
+            for user_id in ["Ashley", "Bill", "Chris"]:
+                self.vwo.activate("AB_T_100_W_50_50", user_id)
+            stats = self.vwo.get_dispatcher_stats()
+            self.assertEqual(stats["queue_depth"], 3)
+            self.assertEqual(stats["events_queued"], 3)
+            self.assertEqual(stats["requests"], 0)
+
+            self.vwo.flush_events(mode="sync")
+
+        stats = self.vwo.get_dispatcher_stats()
+        self.assertEqual(stats["queue_depth"], 0)
+        self.assertEqual(stats["events_sent"], 3)
+        self.assertEqual(stats["status_codes"], {200: 1})
+        self.assertEqual(stats["batch_latency"]["count"], 1)
+        self.vwo.event_dispatcher.shutdown()
+
+    def test_get_dispatcher_stats_without_event_batching(self):
+        self.set_up()
+        with mock.patch("vwo.http.connection.Connection.get", return_value={"status_code": 500, "text": ""}):
+            self.vwo.activate("AB_T_100_W_50_50", "Ashley")
+
+        stats = self.vwo.get_dispatcher_stats()
+        self.assertIs(stats["event_batching"], False)
+        self.assertEqual(stats["events_failed"], 1)
+        self.assertEqual(stats["status_codes"], {500: 1})
+
+    def test_get_dispatcher_stats_when_opted_out(self):
+        self.set_up()
+        self.vwo.set_opt_out()
+        self.assertIsNone(self.vwo.get_dispatcher_stats())
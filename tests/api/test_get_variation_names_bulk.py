@@ -0,0 +1,83 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import json
+import copy
+
+import vwo
+from ..data.settings_files import SETTINGS_FILES
+from ..data.settings_file_and_user_expectations import USER_EXPECTATIONS
+
+from ..config.config import TEST_LOG_LEVEL
+
+
+class GetVariationNamesBulkTest(unittest.TestCase):
+    def set_up(self, config_variant="AB_T_50_W_50_50", settings_file=None):
+        self.settings_file = json.dumps(settings_file or SETTINGS_FILES.get(config_variant))
+        self.vwo = vwo.launch(self.settings_file, is_development_mode=True, log_level=TEST_LOG_LEVEL)
+        self.campaign_key = config_variant
+
+    def test_get_variation_names_bulk_invalid_params(self):
+        self.set_up()
+        self.assertIsNone(self.vwo.get_variation_names_bulk(123, ["user"]))
+        self.assertIsNone(self.vwo.get_variation_names_bulk(self.campaign_key, "user"))
+        self.assertIsNone(self.vwo.get_variation_names_bulk(self.campaign_key, ["user", 123]))
+
+    def test_get_variation_names_bulk_with_no_campaign_key_found(self):
+        self.set_up()
+        self.assertIsNone(self.vwo.get_variation_names_bulk("NO_SUCH_CAMPAIGN_KEY", ["user"]))
+
+    def test_get_variation_names_bulk_wrong_campaign_type_passed(self):
+        self.set_up("FR_T_0_W_100")
+        self.assertIsNone(self.vwo.get_variation_names_bulk("FR_T_0_W_100", ["user"]))
+
+    def test_get_variation_names_bulk_empty_user_ids(self):
+        self.set_up()
+        self.assertEqual(self.vwo.get_variation_names_bulk(self.campaign_key, []), {})
+
+    def test_get_variation_names_bulk_against_user_expectations(self):
+        for config_variant in [
+            "AB_T_50_W_50_50",
+            "AB_T_100_W_20_80",
+            "AB_T_20_W_10_90",
+            "AB_T_100_W_0_100",
+            "AB_T_100_W_33_33_33",
+            "T_75_W_10_TIMES_10",
+        ]:
+            self.set_up(config_variant)
+            user_ids = [test["user"] for test in USER_EXPECTATIONS[config_variant]]
+            self.assertEqual(
+                self.vwo.get_variation_names_bulk(self.campaign_key, user_ids),
+                {test["user"]: test["variation"] for test in USER_EXPECTATIONS[config_variant]},
+            )
+
+    def test_get_variation_names_bulk_same_as_get_variation_name_for_all_bucketing_algos(self):
+        for config_variant in [
+            "SETTINGS_WITHOUT_SEED_WITHOUT_ISOB",
+            "SETTINGS_WITH_SEED_WITHOUT_ISOB",
+            "SETTINGS_WITH_ISNB_WITH_ISOB",
+            "SETTINGS_WITH_ISNB_WITHOUT_ISOB",
+            "SETTINGS_WITHOUT_SEED_WITH_ISNB_WITHOUT_ISOB",
+        ]:
+            settings_file = copy.deepcopy(SETTINGS_FILES[config_variant])
+            for is_new_bucketing_v2_enabled in (False, True):
+                settings_file["isNBv2"] = is_new_bucketing_v2_enabled
+                campaign_key = settings_file["campaigns"][0]["key"]
+                self.set_up(campaign_key, settings_file)
+                user_ids = [test["user"] for test in USER_EXPECTATIONS[config_variant]]
+                self.assertEqual(
+                    self.vwo.get_variation_names_bulk(campaign_key, user_ids),
+                    {user_id: self.vwo.get_variation_name(campaign_key, user_id) for user_id in user_ids},
+                )
@@ -15,6 +15,7 @@
 import unittest
 import random
 import copy
+import mock
 from vwo.core import bucketer
 from vwo.helpers import campaign_util
 from ..data.settings_files import SETTINGS_FILES
@@ -223,3 +224,75 @@ class BucketerTest(unittest.TestCase):
             100,
         )
         self.assertEquals(bucket_value, 50)
+
+    def _assert_bucket_many_same_as_single_user(self, campaign, **kwargs):
+        user_ids = [str(random.random()) for _ in range(500)] + ["Bob", "someone@mail.com", "1111111111111111"]
+        variations = self.bucketer.bucket_many(user_ids, campaign, **kwargs)
+        self.assertEqual(len(variations), len(user_ids))
+        for user_id, variation in zip(user_ids, variations):
+            self.assertIs(
+                variation,
+                self.bucketer.bucket_user_to_variation(
+                    user_id,
+                    campaign,
+                    kwargs.get("is_new_bucketing_enabled"),
+                    kwargs.get("is_new_bucketing_v2_enabled"),
+                    kwargs.get("account_id"),
+                ),
+            )
+
+    def _assert_bucket_many_for_all_algos(self):
+        campaign = copy.deepcopy(SETTINGS_FILES["T_75_W_10_TIMES_10"]["campaigns"][0])
+        campaign_util.set_variation_allocation(campaign)
+        self._assert_bucket_many_same_as_single_user(campaign)
+        self._assert_bucket_many_same_as_single_user(self.dummy_campaign)
+        self._assert_bucket_many_same_as_single_user(self.dummy_campaign, is_new_bucketing_enabled=True)
+        self._assert_bucket_many_same_as_single_user(
+            self.dummy_campaign, is_new_bucketing_v2_enabled=True, account_id=12345
+        )
+        self.dummy_campaign["isOB"] = True
+        self._assert_bucket_many_same_as_single_user(self.dummy_campaign, is_new_bucketing_enabled=True)
+        self.dummy_campaign["isOBv2"] = True
+        self._assert_bucket_many_same_as_single_user(
+            self.dummy_campaign, is_new_bucketing_v2_enabled=True, account_id=12345
+        )
+
+    def test_bucket_many_same_as_bucket_user_to_variation(self):
+        self._assert_bucket_many_for_all_algos()
+
+    def test_bucket_many_same_as_bucket_user_to_variation_without_numpy(self):
+        with mock.patch("vwo.core.bucketer.numpy", None):
+            self._assert_bucket_many_for_all_algos()
+
+    def test_are_users_part_of_campaign_same_as_is_user_part_of_campaign(self):
+        user_ids = [str(random.random()) for _ in range(500)]
+        for is_new_bucketing_enabled in (False, True):
+            is_user_part = self.bucketer.are_users_part_of_campaign(
+                user_ids, self.dummy_campaign, is_new_bucketing_enabled
+            )
+            for user_id, is_part in zip(user_ids, is_user_part):
+                self.assertIs(
+                    is_part,
+                    self.bucketer.is_user_part_of_campaign(user_id, self.dummy_campaign, is_new_bucketing_enabled),
+                )
+
+    def test_get_allocated_items_same_as_get_allocated_item(self):
+        bucket_values = [0, 1, 999, 1000, 1001, 3000, 6000, 10000, 10001]
+        self.assertEqual(
+            self.bucketer.get_allocated_items(self.variations, bucket_values),
+            [self.bucketer.get_allocated_item(self.variations, bucket_value) for bucket_value in bucket_values],
+        )
+
+    def test_get_allocated_item_with_sorted_allocation_ranges(self):
+        allocation_ranges = campaign_util.get_sorted_allocation_ranges(self.variations)
+        for bucket_value in [0, 1, 999, 1000, 1001, 3000, 6000, 10000, 10001]:
+            self.assertIs(
+                self.bucketer.get_allocated_item(self.variations, bucket_value, allocation_ranges),
+                self.bucketer.get_allocated_item(self.variations, bucket_value),
+            )
+        allocation_ranges = campaign_util.get_sorted_allocation_ranges(self.dummy_campaign["variations"])
+        with mock.patch("vwo.helpers.campaign_util.get_sorted_allocation_ranges") as mock_get_sorted_allocation_ranges:
+            self.bucketer.bucket_user_to_variation(
+                "Ashley", self.dummy_campaign, False, allocation_ranges=allocation_ranges
+            )
+        mock_get_sorted_allocation_ranges.assert_not_called()
@@ -35,6 +35,20 @@ class ClientUserStorage:
         return True
 
 
+class ClientUserStorageWithGetMany(ClientUserStorage):
+    def __init__(self):
+        ClientUserStorage.__init__(self)
+        self.get_many_calls = []
+
+    def get_many(self, user_id, campaign_keys):
+        self.get_many_calls.append(list(campaign_keys))
+        return {
+            campaign_key: self.storage[(user_id, campaign_key)]
+            for campaign_key in campaign_keys
+            if (user_id, campaign_key) in self.storage
+        }
+
+
 class MutuallyExclusiveTest(unittest.TestCase):
     def setUp(self):
         self.user_id = str(random.random())
@@ -220,9 +234,11 @@ class MutuallyExclusiveTest(unittest.TestCase):
         self.assertEqual("Control", variation, self.case.get("description"))
 
         # Adding c5 campaign as part of another group
-        self.vwo_instance.config.settings_file.get("campaignGroups").update({"5": 1})
-        self.vwo_instance.config.settings_file.get("groups").get("1").get("campaigns").append(5)
-        self.vwo_instance.config.settings_file.get("groups").get("2").get("campaigns").remove(5)
+        settings_file = json.loads(self.settings_file)
+        settings_file.get("campaignGroups").update({"5": 1})
+        settings_file.get("groups").get("1").get("campaigns").append(5)
+        settings_file.get("groups").get("2").get("campaigns").remove(5)
+        self.vwo_instance.config.update_settings_file(json.dumps(settings_file))
 
         is_feature_enabled = self.vwo_instance.is_feature_enabled(
             self.campaign_key,
@@ -251,8 +267,10 @@ class MutuallyExclusiveTest(unittest.TestCase):
         self.assertEqual(variation, self.case.get("expectation"), self.case.get("description"))
         self.assertEqual(self.user_storage.get(self.user_id, self.campaign_key).get("campaignKey"), self.campaign_key)
 
-        self.vwo_instance.config.settings_file.get("groups").get("1").get("campaigns").append(3)
-        self.vwo_instance.config.settings_file.get("campaignGroups").update({"3": 1})
+        settings_file = json.loads(self.settings_file)
+        settings_file.get("groups").get("1").get("campaigns").append(3)
+        settings_file.get("campaignGroups").update({"3": 1})
+        self.vwo_instance.config.update_settings_file(json.dumps(settings_file))
 
         variation = self.vwo_instance.activate(
             self.campaign_key,
@@ -298,3 +316,19 @@ class MutuallyExclusiveTest(unittest.TestCase):
             self.case.get("expectation"),
             self.case.get("description"),
         )
+
+    def test_mutually_exclusive_group_storage_fetched_with_get_many(self):
+        user_storage = ClientUserStorageWithGetMany()
+        vwo_instance = vwo.launch(
+            json.dumps(mutually_exclusive_test_cases.get("commonSettingsFile")),
+            log_level=TEST_LOG_LEVEL,
+            user_storage=user_storage,
+            is_development_mode=True,
+        )
+        user_storage.set({"userId": "Ashley", "campaignKey": "c1", "variationName": "Control"})
+
+        is_feature_enabled = vwo_instance.is_feature_enabled(
+            "c2", "Ashley", custom_variables={"c1": 1, "c2": 1, "c3": 1}
+        )
+        self.assertIs(is_feature_enabled, False)
+        self.assertEqual(user_storage.get_many_calls, [["c1", "c3"]])
@@ -167,6 +167,17 @@ class VariationDeciderTest(unittest.TestCase):
         )
         self.assertEquals("Control", result_variation.get("name"))
 
+    def test_find_targeted_variation_leaves_campaign_unchanged(self):
+        variation_decider = VariationDecider()
+        campaign = copy.deepcopy(SETTINGS_FILES.get("FT_100_W_33_33_33_WS_WW")["campaigns"][0])
+        original_campaign = copy.deepcopy(campaign)
+        true_variation_targeting_variables = {"chrome": "false", "safari": "true", "browser": "chrome 107.107"}
+        result_variation = variation_decider.find_targeted_variation(
+            "Sarah", campaign, true_variation_targeting_variables
+        )
+        self.assertIs(result_variation, campaign["variations"][0])
+        self.assertEqual(campaign, original_campaign)
+
     def test_evaluate_pre_segmentation_fails(self):
         variation_decider = VariationDecider()
         settings_file = SETTINGS_FILES.get("FT_100_W_33_33_33_WS_WW")
@@ -288,6 +299,16 @@ class VariationDeciderTest(unittest.TestCase):
         result_user_storage_data = variation_decider._get_user_storage_data("Sarah", "FEATURE_TEST_1")
         self.assertDictEqual(result_user_storage_data, user_storage_data)
 
+    def test_update_goals_tracked_in_user_storage_leaves_user_storage_data_unchanged(self):
+        client_storage = ClientUserStorage()
+        variation_decider = VariationDecider(user_storage=client_storage)
+        user_storage_data = {"userId": "Sarah", "campaignKey": "FEATURE_TEST_1", "variationName": "DESIGN_4"}
+        client_storage.set(user_storage_data)
+        result_user_storage_data = variation_decider._get_user_storage_data("Sarah", "FEATURE_TEST_1")
+        variation_decider.update_goals_tracked_in_user_storage({"identifier": "GOAL_1"}, result_user_storage_data)
+        self.assertNotIn("goalIdentifiers", user_storage_data)
+        self.assertEqual(client_storage.get("Sarah", "FEATURE_TEST_1").get("goalIdentifiers"), "GOAL_1")
+
     def test_get_user_storage_data_false_different_campaign(self):
         client_storage = ClientUserStorage()
         variation_decider = VariationDecider(user_storage=client_storage)
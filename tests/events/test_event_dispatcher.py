@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import mock
+import threading
 import unittest
 import time
 
@@ -205,3 +206,264 @@ class DispatcherTest(unittest.TestCase):
             "vwo.event.event_dispatcher.EventDispatcher.update_queue_metadata", side_effect=Exception("Test")
         ):
             self.async_dispatcher.dispatch(test_properties.copy())
+
+    def test_event_batching_reuses_flusher_threads(self):
+        with mock.patch(
+            "vwo.http.connection.Connection.post", return_value={"status_code": 200, "text": ""}
+        ) as mock_connection_post:
+            for _ in range(25):
+                self.async_dispatcher.dispatch(test_properties.copy())
+            flushers = list(self.async_dispatcher.flushers)
+            self.async_dispatcher.flush_queue(mode="sync")
+            self.assertEqual(mock_connection_post.call_count, 5)
+            self.assertEqual(len(flushers), constants.BATCH_EVENTS.DEFAULT_MAX_IN_FLIGHT_REQUESTS)
+            self.assertEqual(self.async_dispatcher.flushers, flushers)
+            self.async_dispatcher.shutdown()
+        self.assertEqual(self.async_dispatcher.flushers, [])
+
+    def test_event_batching_max_in_flight_requests(self):
+        dispatcher = event_dispatcher.EventDispatcher(
+            batch_event_settings={"events_per_request": 1, "max_in_flight_requests": 3}, sdk_key="sample_key"
+        )
+        with mock.patch("vwo.http.connection.Connection.post", return_value={"status_code": 200, "text": ""}):
+            dispatcher.dispatch(test_properties.copy())
+            self.assertEqual(len(dispatcher.flushers), 3)
+            dispatcher.shutdown()
+
+    def test_event_batching_drops_events_when_queue_is_full(self):
+        dispatcher = event_dispatcher.EventDispatcher(
+            batch_event_settings={"events_per_request": 2, "max_queue_size": 3}, sdk_key="sample_key"
+        )
+        with mock.patch.object(dispatcher, "sync_with_vwo", side_effect=lambda *args: time.sleep(0.5)):
+            self.assertIs(dispatcher.dispatch(test_properties.copy()), True)
+            self.assertIs(dispatcher.dispatch(test_properties.copy()), True)
+            self.assertIs(dispatcher.dispatch(test_properties.copy()), True)
+            self.assertIs(dispatcher.dispatch(test_properties.copy()), False)
+            dispatcher.shutdown()
+
+    def test_event_batching_shutdown_drains_queue(self):
+        with mock.patch(
+            "vwo.http.connection.Connection.post", return_value={"status_code": 200, "text": ""}
+        ) as mock_connection_post:
+            self.async_dispatcher.dispatch(test_properties.copy())
+            self.async_dispatcher.dispatch(test_properties.copy())
+            self.async_dispatcher.shutdown()
+            self.assertEqual(mock_connection_post.call_count, 1)
+            self.assertEqual(len(mock_connection_post.call_args[1]["data"]["ev"]), 2)
+            self.assertIs(self.async_dispatcher.dispatch(test_properties.copy()), False)
+
+    def test_stats_of_batched_events(self):
+        self.assertEqual(self.async_dispatcher.get_stats()["queue_depth"], 0)
+        with mock.patch(
+            "vwo.http.connection.Connection.post",
+            side_effect=[
+                {"status_code": 200, "text": "", "request_size": 100},
+                {"status_code": 413, "text": "", "request_size": 40},
+                {"status_code": 200, "text": "", "request_size": 25},
+                {"status_code": 200, "text": "", "request_size": 25},
+            ],
+        ):
+            for _ in range(7):
+                self.async_dispatcher.dispatch(test_properties.copy())
+            stats = self.async_dispatcher.get_stats()
+            self.assertEqual(stats["queue_depth"], 2)
+            self.assertEqual(stats["events_queued"], 7)
+            self.async_dispatcher.flush_queue(mode="sync")
+
+        stats = self.async_dispatcher.get_stats()
+        self.assertEqual(stats["queue_depth"], 0)
+        self.assertEqual(stats["pending_batches"], 0)
+        self.assertEqual(stats["pending_events"], 0)
+        self.assertEqual(stats["in_flight_batches"], 0)
+        self.assertEqual(stats["events_sent"], 7)
+        self.assertEqual(stats["events_failed"], 2)
+        self.assertEqual(stats["batches_split"], 1)
+        self.assertEqual(stats["requests"], 4)
+        self.assertEqual(stats["status_codes"], {200: 3, 413: 1})
+        self.assertEqual(stats["bytes_sent"], 190)
+        self.assertEqual(stats["request_duration"]["count"], 4)
+        self.assertEqual(stats["batch_latency"]["count"], 3)
+        self.assertIs(stats["event_batching"], True)
+        self.assertEqual(stats["events_per_request"], 5)
+        self.assertEqual(stats["effective_events_per_request"], 2)
+
+    def test_stats_of_dropped_and_unsent_events(self):
+        dispatcher = event_dispatcher.EventDispatcher(
+            batch_event_settings={"events_per_request": 2, "max_queue_size": 2}, sdk_key="sample_key"
+        )
+        is_request_released = threading.Event()
+
+        def post(*args, **kwargs):
+            is_request_released.wait()
+            raise Exception("REQUEST FAILED")
+
+        with mock.patch("vwo.http.connection.Connection.post", side_effect=post):
+            for _ in range(3):
+                dispatcher.dispatch(test_properties.copy())
+            self.assertEqual(dispatcher.get_stats()["pending_events"], 2)
+            is_request_released.set()
+            dispatcher.shutdown()
+
+        stats = dispatcher.get_stats()
+        self.assertEqual(stats["events_queued"], 2)
+        self.assertEqual(stats["events_dropped"], 1)
+        self.assertEqual(stats["events_failed"], 2)
+        self.assertEqual(stats["status_codes"], {-1: 1})
+        self.assertEqual(stats["bytes_sent"], 0)
+
+    def test_stats_of_events_sent_without_batching(self):
+        with mock.patch("vwo.http.connection.Connection.get", return_value={"status_code": 200, "text": ""}):
+            self.dispatcher.dispatch(test_properties.copy())
+
+        stats = self.dispatcher.get_stats()
+        self.assertEqual(stats["queue_depth"], 0)
+        self.assertEqual(stats["events_queued"], 0)
+        self.assertEqual(stats["events_sent"], 1)
+        self.assertEqual(stats["status_codes"], {200: 1})
+        self.assertEqual(stats["batch_latency"]["count"], 0)
+
+    def test_event_batching_compression(self):
+        dispatcher = event_dispatcher.EventDispatcher(
+            batch_event_settings={"events_per_request": 2, "compression": "gzip", "compression_threshold": 0},
+            sdk_key="sample_key",
+        )
+        with mock.patch(
+            "vwo.http.connection.Connection.post", return_value={"status_code": 200, "text": "", "request_size": 50}
+        ) as mock_connection_post:
+            dispatcher.dispatch(test_properties.copy())
+            dispatcher.dispatch(test_properties.copy())
+            dispatcher.shutdown()
+        self.assertEqual(mock_connection_post.call_args[1]["compression"], "gzip")
+        self.assertEqual(mock_connection_post.call_args[1]["compression_threshold"], 0)
+        self.assertEqual(len(mock_connection_post.call_args[1]["data"]["ev"]), 2)
+        self.assertEqual(dispatcher.get_stats()["bytes_sent"], 50)
+
+    def test_event_batching_without_compression(self):
+        with mock.patch(
+            "vwo.http.connection.Connection.post", return_value={"status_code": 200, "text": ""}
+        ) as mock_connection_post:
+            self.async_dispatcher.dispatch(test_properties.copy())
+            self.async_dispatcher.shutdown()
+        self.assertIsNone(mock_connection_post.call_args[1]["compression"])
+
+    def test_event_batching_splits_batch_on_413(self):
+        flush_callback = mock.Mock()
+        dispatcher = event_dispatcher.EventDispatcher(
+            batch_event_settings={"events_per_request": 4, "flush_callback": flush_callback}, sdk_key="sample_key"
+        )
+
+        def post(*args, **kwargs):
+            return {"status_code": 413 if len(kwargs["data"]["ev"]) > 2 else 200, "text": ""}
+
+        with mock.patch("vwo.http.connection.Connection.post", side_effect=post) as mock_connection_post:
+            for _ in range(4):
+                dispatcher.dispatch(test_properties.copy())
+            dispatcher.flush_queue(mode="sync")
+            self.assertEqual([len(call[1]["data"]["ev"]) for call in mock_connection_post.call_args_list], [4, 2, 2])
+            self.assertEqual(flush_callback.call_count, 2)
+            self.assertEqual(dispatcher.get_stats()["effective_events_per_request"], 3)
+
+            # next batches are flushed at the grown size, rejected again and split
+            for _ in range(3):
+                dispatcher.dispatch(test_properties.copy())
+            self.assertEqual(len(dispatcher.queue), 0)
+            dispatcher.shutdown()
+            self.assertEqual(
+                [len(call[1]["data"]["ev"]) for call in mock_connection_post.call_args_list], [4, 2, 2, 3, 1, 2]
+            )
+
+        stats = dispatcher.get_stats()
+        self.assertEqual(stats["batches_split"], 2)
+        self.assertEqual(stats["events_sent"], 7)
+        self.assertEqual(stats["pending_events"], 0)
+
+    def test_event_batching_retries_failed_batch(self):
+        flush_callback = mock.Mock()
+        dispatcher = event_dispatcher.EventDispatcher(
+            batch_event_settings={"events_per_request": 2, "retry_backoff": 0.01, "flush_callback": flush_callback},
+            sdk_key="sample_key",
+        )
+        with mock.patch(
+            "vwo.http.connection.Connection.post",
+            side_effect=[{"status_code": 503, "text": ""}, {"status_code": None, "text": ""}, {"status_code": 200}],
+        ) as mock_connection_post:
+            dispatcher.dispatch(test_properties.copy())
+            dispatcher.dispatch(test_properties.copy())
+            dispatcher.shutdown()
+
+        self.assertEqual(mock_connection_post.call_count, 3)
+        self.assertEqual(flush_callback.call_count, 1)
+        self.assertIsNone(flush_callback.call_args[0][0])
+        self.assertEqual(len(flush_callback.call_args[0][1]), 2)
+        stats = dispatcher.get_stats()
+        self.assertEqual(stats["events_sent"], 2)
+        self.assertEqual(stats["events_retried"], 4)
+        self.assertEqual(stats["status_codes"], {503: 1, -1: 1, 200: 1})
+        self.assertEqual(stats["pending_events"], 0)
+        self.assertEqual(stats["retrying_batches"], 0)
+
+    def test_event_batching_gives_up_after_max_retries(self):
+        flush_callback = mock.Mock()
+        dispatcher = event_dispatcher.EventDispatcher(
+            batch_event_settings={
+                "events_per_request": 1,
+                "max_retries": 1,
+                "retry_backoff": 0.01,
+                "flush_callback": flush_callback,
+            },
+            sdk_key="sample_key",
+        )
+        with mock.patch(
+            "vwo.http.connection.Connection.post", return_value={"status_code": 500, "text": ""}
+        ) as mock_connection_post:
+            dispatcher.dispatch(test_properties.copy())
+            dispatcher.flush_queue(mode="sync")
+            self.assertEqual(mock_connection_post.call_count, 2)
+
+            # client errors are not retried
+            mock_connection_post.return_value = {"status_code": 400, "text": ""}
+            dispatcher.dispatch(test_properties.copy())
+            dispatcher.shutdown()
+            self.assertEqual(mock_connection_post.call_count, 3)
+
+        self.assertEqual(flush_callback.call_count, 2)
+        stats = dispatcher.get_stats()
+        self.assertEqual(stats["events_retried"], 1)
+        self.assertEqual(stats["events_failed"], 3)
+        self.assertEqual(stats["pending_events"], 0)
+
+    def test_sync_flush_from_flush_callback_does_not_wait(self):
+        flushed = threading.Event()
+
+        def flush_callback(err, events):
+            dispatcher.flush_queue(mode="sync")
+            flushed.set()
+
+        dispatcher = event_dispatcher.EventDispatcher(
+            batch_event_settings={"events_per_request": 1, "flush_callback": flush_callback}, sdk_key="sample_key"
+        )
+        with mock.patch("vwo.http.connection.Connection.post", return_value={"status_code": 200, "text": ""}):
+            dispatcher.dispatch(test_properties.copy())
+            self.assertIs(flushed.wait(5), True)
+            dispatcher.shutdown()
+
+    def test_sync_flush_stops_waiting_after_timeout(self):
+        dispatcher = event_dispatcher.EventDispatcher(
+            batch_event_settings={"events_per_request": 10}, sdk_key="sample_key"
+        )
+        synced = threading.Event()
+        with mock.patch.object(dispatcher, "sync_with_vwo", side_effect=lambda *args: synced.wait(5)):
+            dispatcher.dispatch(test_properties.copy())
+            started_at = time.time()
+            dispatcher.flush_queue(mode="sync", timeout=0.1)
+            self.assertLess(time.time() - started_at, 2)
+            self.assertEqual(dispatcher.get_stats()["in_flight_batches"], 1)
+            synced.set()
+            dispatcher.shutdown()
+
+    def test_retry_delay_backs_off_exponentially(self):
+        for attempts in range(3):
+            delay = self.async_dispatcher.get_retry_delay(attempts)
+            self.assertGreaterEqual(delay, 2**attempts / 2.0)
+            self.assertLessEqual(delay, 2**attempts)
+        self.assertLessEqual(self.async_dispatcher.get_retry_delay(20), constants.BATCH_EVENTS.MAX_RETRY_BACKOFF)
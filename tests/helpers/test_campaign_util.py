@@ -327,6 +327,17 @@ class CampaignUtilTest(unittest.TestCase):
             self.assertEquals(variation.get("allocation_range_start"), variation_allocation_ranges_list[i][0])
             self.assertEquals(variation.get("allocation_range_end"), variation_allocation_ranges_list[i][1])
 
+    def test_get_sorted_allocation_ranges(self):
+        variations = [
+            {"weight": 0, "allocation_range_start": -1, "allocation_range_end": -1},
+            {"weight": 60, "allocation_range_start": 4001, "allocation_range_end": 10000},
+            {"weight": 40, "allocation_range_start": 1, "allocation_range_end": 4000},
+        ]
+        range_starts, range_ends, indexes = campaign_util.get_sorted_allocation_ranges(variations)
+        self.assertEqual(list(range_starts), [1, 4001])
+        self.assertEqual(list(range_ends), [4000, 10000])
+        self.assertEqual(list(indexes), [2, 1])
+
     def test_is_part_of_group(self):
         settings_file = mutually_exclusive_test_cases.get("commonSettingsFile")
         self.assertEqual(campaign_util.is_part_of_group(settings_file, 1), True)
@@ -341,3 +352,38 @@ class CampaignUtilTest(unittest.TestCase):
     def test_get_group_campaigns_invalid_group_id(self):
         settings_file = mutually_exclusive_test_cases.get("commonSettingsFile")
         self.assertListEqual(campaign_util.get_group_campaigns(settings_file, -1), [])
+
+    def test_get_campaign_key_map_only_running(self):
+        campaigns = [
+            {"id": 1, "key": "c1", "status": "RUNNING"},
+            {"id": 2, "key": "c2", "status": "PAUSED"},
+            {"id": 3, "key": "c1", "status": "RUNNING"},
+        ]
+        campaign_key_map = campaign_util.get_campaign_key_map(campaigns)
+        self.assertIs(campaign_key_map.get("c1"), campaigns[0])
+        self.assertIsNone(campaign_key_map.get("c2"))
+
+    def test_get_campaign_with_campaign_key_map(self):
+        campaign_key_map = campaign_util.get_campaign_key_map(self.settings_file.get("campaigns"))
+        self.assertIs(
+            campaign_util.get_campaign(self.settings_file, self.campaign_key, campaign_key_map=campaign_key_map),
+            campaign_util.get_campaign(self.settings_file, self.campaign_key),
+        )
+        self.assertIsNone(campaign_util.get_campaign(self.settings_file, "NO_SUCH_CAMPAIGN", campaign_key_map={}))
+
+    def test_get_goal_campaigns_map(self):
+        settings_file = mutually_exclusive_test_cases.get("commonSettingsFile")
+        campaigns = settings_file.get("campaigns")
+        goal_campaigns_map = campaign_util.get_goal_campaigns_map(campaigns)
+        for goal_identifier, campaign_goal_list in goal_campaigns_map.items():
+            self.assertListEqual(
+                campaign_goal_list, campaign_util.get_campaigns_with_goal_id(campaigns, goal_identifier)[0]
+            )
+
+    def test_get_group_campaigns_with_campaign_id_map(self):
+        settings_file = mutually_exclusive_test_cases.get("commonSettingsFile")
+        campaign_id_map = campaign_util.get_campaign_id_map(settings_file.get("campaigns"))
+        self.assertListEqual(
+            campaign_util.get_group_campaigns(settings_file, 1, campaign_id_map=campaign_id_map),
+            campaign_util.get_group_campaigns(settings_file, 1),
+        )
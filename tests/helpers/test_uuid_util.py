@@ -14,6 +14,7 @@
 
 import unittest
 import random
+import mock
 
 import uuid
 from vwo.helpers import uuid_util
@@ -40,3 +41,31 @@ class UuidUtilTest(unittest.TestCase):
     def test_generate_valid_params(self):
         result = uuid_util.generate(VWO_NAMESPACE, TEST_USER_ID)
         self.assertIsNotNone(result)
+
+    def test_generate_for_is_same_as_uuid5(self):
+        uuid_util.clear_memoized_uuids()
+        account_namespace = uuid.uuid5(VWO_NAMESPACE, "88888888")
+        expected_uuid = str(uuid.uuid5(account_namespace, self.user_id)).replace("-", "").upper()
+        self.assertEqual(uuid_util.generate_for(self.user_id, 88888888), expected_uuid)
+        self.assertEqual(uuid_util.generate_for(self.user_id, "88888888"), expected_uuid)
+
+    def test_generate_for_is_memoized(self):
+        uuid_util.clear_memoized_uuids()
+        with mock.patch("vwo.helpers.uuid_util.uuid.uuid5", wraps=uuid.uuid5) as mock_uuid5:
+            desired_uuid = uuid_util.generate_for(self.user_id, 88888888)
+            self.assertEqual(mock_uuid5.call_count, 2)
+            self.assertEqual(uuid_util.generate_for(self.user_id, 88888888), desired_uuid)
+            self.assertEqual(mock_uuid5.call_count, 2)
+            # namespace of the account is reused for other users
+            uuid_util.generate_for(self.user_id + "_other", 88888888)
+            self.assertEqual(mock_uuid5.call_count, 3)
+
+    def test_memoized_uuids_are_bounded(self):
+        uuid_util.clear_memoized_uuids()
+        with mock.patch("vwo.helpers.uuid_util.MAX_MEMOIZED_UUIDS", 2):
+            uuid_util.generate_for("user_1", 88888888)
+            uuid_util.generate_for("user_2", 88888888)
+            uuid_util.generate_for("user_1", 88888888)
+            uuid_util.generate_for("user_3", 88888888)
+        # least recently used is evicted
+        self.assertEqual(list(uuid_util._memoized_uuids), [("88888888", "user_1"), ("88888888", "user_3")])
@@ -12,12 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import unittest
 import json
 import sys
+import mock
 
 from vwo.enums.file_name_enum import FileNameEnum
-from vwo.helpers import validate_util
+from vwo.helpers import campaign_util, validate_util
+from vwo.schemas.campaign_schema import CAMPAIGN
+from vwo.schemas.settings_file_schema import SETTINGS_FILE_SCHEMA
 from ..data.settings_files import SETTINGS_FILES
 
 
@@ -38,6 +42,54 @@ class ValidateUtilTest(unittest.TestCase):
         result = validate_util.is_valid_settings_file(json.dumps('{"a":1}'))
         self.assertIs(result, False)
 
+    def test_validator_is_built_once(self):
+        self.assertIs(
+            validate_util.get_validator(SETTINGS_FILE_SCHEMA), validate_util.get_validator(SETTINGS_FILE_SCHEMA)
+        )
+
+    def test_is_valid_settings_file_validates_changed_campaigns_only(self):
+        settings_file = copy.deepcopy(SETTINGS_FILES["NEW_SETTINGS_FILE"])
+        validated_campaign_digests = set()
+        campaign_validator = validate_util.get_validator(CAMPAIGN)
+        with mock.patch.object(campaign_validator, "is_valid", wraps=campaign_validator.is_valid) as mock_is_valid:
+            self.assertIs(
+                validate_util.is_valid_settings_file(
+                    json.dumps(settings_file), validated_campaign_digests=validated_campaign_digests
+                ),
+                True,
+            )
+            # jsonschema calls is_valid for sub-schemas too, with the sub-schema passed
+            validated_campaigns = [call[0][0] for call in mock_is_valid.call_args_list if len(call[0]) == 1]
+            self.assertEqual(validated_campaigns, settings_file["campaigns"])
+
+            mock_is_valid.reset_mock()
+            validated_campaign_digests = set(map(campaign_util.get_campaign_digest, settings_file["campaigns"]))
+            settings_file["campaigns"][1]["percentTraffic"] = 49
+            self.assertIs(
+                validate_util.is_valid_settings_file(
+                    json.dumps(settings_file), validated_campaign_digests=validated_campaign_digests
+                ),
+                True,
+            )
+            validated_campaigns = [call[0][0] for call in mock_is_valid.call_args_list if len(call[0]) == 1]
+            self.assertEqual(validated_campaigns, [settings_file["campaigns"][1]])
+
+    def test_is_valid_settings_file_rejects_invalid_changed_campaign(self):
+        settings_file = copy.deepcopy(SETTINGS_FILES["NEW_SETTINGS_FILE"])
+        validated_campaign_digests = set(map(campaign_util.get_campaign_digest, settings_file["campaigns"]))
+
+        settings_file["campaigns"][1]["percentTraffic"] = "50"
+        self.assertIs(validate_util.is_valid_settings_file(json.dumps(settings_file)), False)
+        self.assertIs(
+            validate_util.is_valid_settings_file(json.dumps(settings_file), validated_campaign_digests), False
+        )
+
+        del settings_file["accountId"]
+        settings_file["campaigns"][1]["percentTraffic"] = 100
+        self.assertIs(
+            validate_util.is_valid_settings_file(json.dumps(settings_file), validated_campaign_digests), False
+        )
+
     def test_utility_validate_util(self):
         class InvalidUtility:
             pass
@@ -90,6 +142,57 @@ class ValidateUtilTest(unittest.TestCase):
         result = validate_util.is_valid_batch_event_settings(val, FileNameEnum.Api.Launch)
         self.assertIs(result, False)
 
+    def test_is_valid_batch_event_settings_max_queue_size_invalid(self):
+        for max_queue_size in [0, 10.5, "100"]:
+            val = {"events_per_request": 400, "max_queue_size": max_queue_size}
+            result = validate_util.is_valid_batch_event_settings(val, FileNameEnum.Api.Launch)
+            self.assertIs(result, False)
+
+    def test_is_valid_batch_event_settings_max_in_flight_requests_invalid(self):
+        for max_in_flight_requests in [0, 11, 2.5]:
+            val = {"events_per_request": 400, "max_in_flight_requests": max_in_flight_requests}
+            result = validate_util.is_valid_batch_event_settings(val, FileNameEnum.Api.Launch)
+            self.assertIs(result, False)
+
+    def test_is_valid_batch_event_settings_with_queue_limits(self):
+        val = {"events_per_request": 400, "max_queue_size": 2000, "max_in_flight_requests": 2}
+        result = validate_util.is_valid_batch_event_settings(val, FileNameEnum.Api.Launch)
+        self.assertIs(result, True)
+
+    def test_is_valid_batch_event_settings_compression(self):
+        for compression in ["gzip", "deflate"]:
+            val = {"events_per_request": 400, "compression": compression, "compression_threshold": 0}
+            result = validate_util.is_valid_batch_event_settings(val, FileNameEnum.Api.Launch)
+            self.assertIs(result, True)
+
+    def test_is_valid_batch_event_settings_compression_invalid(self):
+        for val in [
+            {"events_per_request": 400, "compression": "br"},
+            {"events_per_request": 400, "compression": "gzip", "compression_threshold": -1},
+            {"events_per_request": 400, "compression": "gzip", "compression_threshold": "1024"},
+        ]:
+            result = validate_util.is_valid_batch_event_settings(val, FileNameEnum.Api.Launch)
+            self.assertIs(result, False)
+
+    def test_is_valid_batch_event_settings_retries(self):
+        for val in [
+            {"events_per_request": 400, "max_retries": 0},
+            {"events_per_request": 400, "max_retries": 5, "retry_backoff": 0.5},
+        ]:
+            result = validate_util.is_valid_batch_event_settings(val, FileNameEnum.Api.Launch)
+            self.assertIs(result, True)
+
+    def test_is_valid_batch_event_settings_retries_invalid(self):
+        for val in [
+            {"events_per_request": 400, "max_retries": -1},
+            {"events_per_request": 400, "max_retries": 11},
+            {"events_per_request": 400, "max_retries": "3"},
+            {"events_per_request": 400, "retry_backoff": 0},
+            {"events_per_request": 400, "retry_backoff": "1"},
+        ]:
+            result = validate_util.is_valid_batch_event_settings(val, FileNameEnum.Api.Launch)
+            self.assertIs(result, False)
+
     def test_is_valid_batch_event_settings_non_dict(self):
         val = 1
         result = validate_util.is_valid_batch_event_settings(val, FileNameEnum.Api.Launch)
@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gzip
+import json
 import mock
 import unittest
+import zlib
 from vwo.http import connection
 
 
@@ -50,3 +53,55 @@ class ConnectionTest(unittest.TestCase):
         with mock.patch("requests.Session.post", return_value=resp):
             result = self.connection.post("https://vwo.com/")
             self.assertDictEqual(result, return_value)
+
+    def test_connection_get_with_headers(self):
+        resp = Response(304, "")
+        resp.headers = {"ETag": '"v1"'}
+        with mock.patch("requests.Session.get", return_value=resp):
+            result = self.connection.get("https://vwo.com/", include_headers=True)
+            self.assertDictEqual(result, {"status_code": 304, "text": "", "headers": {"ETag": '"v1"'}})
+
+    def test_connection_post_sends_compact_json(self):
+        resp = Response(200, "success")
+        with mock.patch("requests.Session.post", return_value=resp) as mock_post:
+            result = self.connection.post(
+                "https://vwo.com/",
+                data={"ev": [{"u": "a"}]},
+                headers={"Authorization": "key"},
+                include_request_size=True,
+            )
+        self.assertDictEqual(result, {"status_code": 200, "text": "success", "request_size": 18})
+        self.assertEqual(mock_post.call_args[1]["data"], b'{"ev":[{"u":"a"}]}')
+        self.assertDictEqual(
+            mock_post.call_args[1]["headers"], {"Authorization": "key", "Content-Type": "application/json"}
+        )
+
+    def test_connection_post_compresses_above_threshold(self):
+        data = {"ev": [{"u": "09CD6107E42B51F9BFC3DD97EA900990", "e": 229}] * 100}
+        resp = Response(200, "success")
+        with mock.patch("requests.Session.post", return_value=resp) as mock_post:
+            result = self.connection.post(
+                "https://vwo.com/", data=data, compression="gzip", compression_threshold=1024, include_request_size=True
+            )
+        body = mock_post.call_args[1]["data"]
+        self.assertEqual(json.loads(gzip.decompress(body).decode("utf-8")), data)
+        self.assertEqual(mock_post.call_args[1]["headers"]["Content-Encoding"], "gzip")
+        self.assertEqual(result["request_size"], len(body))
+        self.assertLess(len(body), len(json.dumps(data)) / 10)
+
+        with mock.patch("requests.Session.post", return_value=resp) as mock_post:
+            self.connection.post("https://vwo.com/", data=data, compression="deflate")
+        self.assertEqual(json.loads(zlib.decompress(mock_post.call_args[1]["data"]).decode("utf-8")), data)
+        self.assertEqual(mock_post.call_args[1]["headers"]["Content-Encoding"], "deflate")
+
+    def test_connection_post_does_not_compress_below_threshold(self):
+        resp = Response(200, "success")
+        with mock.patch("requests.Session.post", return_value=resp) as mock_post:
+            self.connection.post("https://vwo.com/", data={"ev": []}, compression="gzip", compression_threshold=1024)
+        self.assertEqual(mock_post.call_args[1]["data"], b'{"ev":[]}')
+        self.assertNotIn("Content-Encoding", mock_post.call_args[1]["headers"])
+
+    def test_connection_max_retries(self):
+        self.assertEqual(self.connection.session.get_adapter("https://vwo.com/").max_retries.total, 3)
+        no_retry_connection = connection.Connection(max_retries=0)
+        self.assertEqual(no_retry_connection.session.get_adapter("https://vwo.com/").max_retries.total, 0)
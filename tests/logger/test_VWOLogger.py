@@ -155,3 +155,37 @@ class VWOLoggerTest(unittest.TestCase):
         logger = VWOLogger.getInstance(logger=logging_logger)
         self.assertIsInstance(logger, VWOLogger.VWOLogger)
         self.assertIsInstance(logger.logger, logging.Logger)
+
+    def test_lazy_log_formats_only_enabled_levels(self):
+        class Template:
+            def __init__(self):
+                self.format_calls = 0
+
+            def format(self, **kwargs):
+                self.format_calls += 1
+                return "({file}): [API_NAME] lazy".format(**kwargs)
+
+        logger_instance = VWOLogger.getInstance(log_level=logging.ERROR)
+        template = Template()
+        with patch.object(logger_instance.logger, "log") as mocked_log:
+            logger_instance.lazy_log(logging.DEBUG, template, file="test")
+            logger_instance.lazy_log(logging.ERROR, template, disable_logs=True, file="test")
+            self.assertEqual(template.format_calls, 0)
+            mocked_log.assert_not_called()
+
+            logger_instance.lazy_log(logging.ERROR, template, file="test")
+            self.assertEqual(template.format_calls, 1)
+            mocked_log.assert_called_once_with(logging.ERROR, "(test): [SDK] lazy")
+
+    def test_lazy_log_custom_logger_without_is_enabled_for(self):
+        class CustomLogger:
+            def __init__(self):
+                self.messages = []
+
+            def log(self, level, message):
+                self.messages.append((level, message))
+
+        logger_instance = VWOLogger.getInstance(logger=CustomLogger())
+        self.assertIs(logger_instance.is_enabled_for(logging.DEBUG), True)
+        logger_instance.lazy_log(logging.DEBUG, "({file}): [API_NAME] lazy", file="test")
+        self.assertEqual(logger_instance.logger.messages[-1], (logging.DEBUG, "(test): [SDK] lazy"))
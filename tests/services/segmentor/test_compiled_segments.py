@@ -0,0 +1,61 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import json
+from vwo.services.segmentor.segment_evaluator import SegmentEvaluator
+
+with open("tests/data/segmentor_test_cases.json") as json_file:
+    segmentor_test_cases = json.load(json_file)
+
+
+class TestCompiledSegments(unittest.TestCase):
+    def setUp(self):
+        self.segment_evaluator = SegmentEvaluator()
+
+    def test_compiled_segments_match_evaluate(self):
+        for group_name, test_cases in segmentor_test_cases.items():
+            for test_case_name, test_case in test_cases.items():
+                custom_variables = test_case.get("custom_variables") or {}
+                compiled_segments = self.segment_evaluator.compile(test_case.get("dsl"))
+                self.assertIs(
+                    compiled_segments(custom_variables),
+                    self.segment_evaluator.evaluate(test_case.get("dsl"), custom_variables),
+                    group_name + "." + test_case_name,
+                )
+
+    def test_compiled_segments_are_reusable(self):
+        test_case = segmentor_test_cases.get("regex").get("regex_operand2")
+        compiled_segments = self.segment_evaluator.compile(test_case.get("dsl"))
+        for _ in range(3):
+            self.assertIs(compiled_segments(test_case.get("custom_variables")), test_case.get("expectation"))
+
+    def test_compiled_numeric_comparison(self):
+        compiled_segments = self.segment_evaluator.compile({"custom_variable": {"price": "gte(10.0)"}})
+        self.assertIs(compiled_segments({"price": 10}), True)
+        self.assertIs(compiled_segments({"price": "9.99"}), False)
+        self.assertIs(compiled_segments({}), False)
+
+    def test_compiled_invalid_leaf_raises_like_evaluate(self):
+        segments = {"custom_variable": {"price": "gt(abc)"}}
+        compiled_segments = self.segment_evaluator.compile(segments)
+        with self.assertRaises(ValueError):
+            self.segment_evaluator.evaluate(segments, {"price": 1})
+        with self.assertRaises(ValueError):
+            compiled_segments({"price": 1})
+
+    def test_compiled_user(self):
+        compiled_segments = self.segment_evaluator.compile({"user": "user_1, user_2"})
+        self.assertIs(compiled_segments({"_vwo_user_id": "user_2"}), True)
+        self.assertIs(compiled_segments({"_vwo_user_id": "user_3"}), False)
@@ -0,0 +1,141 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import json
+import mock
+
+import vwo
+from vwo.storage.user import UserStorage
+from vwo.storage.cache import CachedUserStorage
+from ..data.settings_files import SETTINGS_FILES
+
+
+class ClientUserStorage(UserStorage):
+    def __init__(self):
+        self.storage = {}
+        self.get_calls = 0
+
+    def get(self, user_id, campaign_key):
+        self.get_calls += 1
+        return self.storage.get((user_id, campaign_key))
+
+    def set(self, user_data):
+        self.storage[(user_data.get("userId"), user_data.get("campaignKey"))] = user_data
+
+
+class CachedUserStorageTest(unittest.TestCase):
+    def setUp(self):
+        self.user_storage = ClientUserStorage()
+        self.cached_user_storage = CachedUserStorage(self.user_storage, max_size=2)
+        self.user_data = {"userId": "Ashley", "campaignKey": "AB_T_50_W_50_50", "variationName": "Control"}
+
+    def test_get_reads_through_once(self):
+        self.user_storage.set(self.user_data)
+        self.assertEqual(self.cached_user_storage.get("Ashley", "AB_T_50_W_50_50"), self.user_data)
+        self.assertEqual(self.cached_user_storage.get("Ashley", "AB_T_50_W_50_50"), self.user_data)
+        self.assertEqual(self.user_storage.get_calls, 1)
+        self.assertEqual(self.cached_user_storage.get_stats(), {"hits": 1, "misses": 1, "size": 1})
+
+    def test_misses_are_cached(self):
+        self.assertIsNone(self.cached_user_storage.get("Ashley", "AB_T_50_W_50_50"))
+        self.assertIsNone(self.cached_user_storage.get("Ashley", "AB_T_50_W_50_50"))
+        self.assertEqual(self.user_storage.get_calls, 1)
+
+        cached_user_storage = CachedUserStorage(self.user_storage, cache_misses=False)
+        cached_user_storage.get("Ashley", "AB_T_50_W_50_50")
+        cached_user_storage.get("Ashley", "AB_T_50_W_50_50")
+        self.assertEqual(self.user_storage.get_calls, 3)
+
+    def test_set_writes_through(self):
+        self.assertIsNone(self.cached_user_storage.get("Ashley", "AB_T_50_W_50_50"))
+        self.cached_user_storage.set(self.user_data)
+        self.assertEqual(self.user_storage.storage[("Ashley", "AB_T_50_W_50_50")], self.user_data)
+        self.assertEqual(self.cached_user_storage.get("Ashley", "AB_T_50_W_50_50"), self.user_data)
+        self.assertEqual(self.user_storage.get_calls, 1)
+
+    def test_failed_set_invalidates_entry(self):
+        self.cached_user_storage.set(self.user_data)
+        with mock.patch.object(self.user_storage, "set", side_effect=Exception("Test")):
+            with self.assertRaises(Exception):
+                self.cached_user_storage.set(dict(self.user_data, variationName="Variation-1"))
+        self.assertEqual(self.cached_user_storage.get_stats()["size"], 0)
+
+    def test_cached_data_is_not_changed_by_caller(self):
+        self.cached_user_storage.set(self.user_data)
+        self.cached_user_storage.get("Ashley", "AB_T_50_W_50_50")["variationName"] = "Variation-1"
+        self.user_data["variationName"] = "Variation-1"
+        self.assertEqual(self.cached_user_storage.get("Ashley", "AB_T_50_W_50_50")["variationName"], "Control")
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.cached_user_storage.get("user-1", "AB_T_50_W_50_50")
+        self.cached_user_storage.get("user-2", "AB_T_50_W_50_50")
+        self.cached_user_storage.get("user-1", "AB_T_50_W_50_50")
+        self.cached_user_storage.get("user-3", "AB_T_50_W_50_50")
+        self.assertEqual(self.cached_user_storage.get_stats()["size"], 2)
+        self.assertIn(("user-1", "AB_T_50_W_50_50"), self.cached_user_storage.cache)
+        self.assertNotIn(("user-2", "AB_T_50_W_50_50"), self.cached_user_storage.cache)
+
+    def test_entries_expire_after_ttl(self):
+        cached_user_storage = CachedUserStorage(self.user_storage, ttl=10, negative_ttl=1)
+        self.user_storage.set(self.user_data)
+        with mock.patch("vwo.storage.cache.time.time", return_value=1000):
+            cached_user_storage.get("Ashley", "AB_T_50_W_50_50")
+            cached_user_storage.get("Bob", "AB_T_50_W_50_50")
+        with mock.patch("vwo.storage.cache.time.time", return_value=1005):
+            cached_user_storage.get("Ashley", "AB_T_50_W_50_50")
+            cached_user_storage.get("Bob", "AB_T_50_W_50_50")
+        self.assertEqual(cached_user_storage.get_stats()["hits"], 1)
+        self.assertEqual(self.user_storage.get_calls, 3)
+
+    def test_get_many_fetches_only_missed_keys(self):
+        self.user_storage.set(self.user_data)
+        self.user_storage.get_many = mock.MagicMock(return_value={"AB_T_50_W_50_50": self.user_data})
+        cached_user_storage = CachedUserStorage(self.user_storage)
+        cached_user_storage.get("Ashley", "FT_T_75_W_10_20_30_40")
+
+        self.assertEqual(
+            cached_user_storage.get_many("Ashley", ["AB_T_50_W_50_50", "FT_T_75_W_10_20_30_40"]),
+            {"AB_T_50_W_50_50": self.user_data},
+        )
+        self.user_storage.get_many.assert_called_once_with("Ashley", ["AB_T_50_W_50_50"])
+        self.assertEqual(
+            cached_user_storage.get_many("Ashley", ["AB_T_50_W_50_50", "FT_T_75_W_10_20_30_40"]),
+            {"AB_T_50_W_50_50": self.user_data},
+        )
+        self.user_storage.get_many.assert_called_once()
+        self.assertEqual(cached_user_storage.get_stats(), {"hits": 3, "misses": 2, "size": 2})
+
+    def test_launch_with_user_storage_cache(self):
+        vwo_instance = vwo.launch(
+            json.dumps(SETTINGS_FILES["AB_T_100_W_50_50"]),
+            user_storage=self.user_storage,
+            is_development_mode=True,
+            user_storage_cache={"max_size": 100, "ttl": 60},
+        )
+        self.assertIsInstance(vwo_instance.variation_decider.user_storage, CachedUserStorage)
+        variation_name = vwo_instance.activate("AB_T_100_W_50_50", "Ashley")
+        for _ in range(5):
+            self.assertEqual(vwo_instance.activate("AB_T_100_W_50_50", "Ashley"), variation_name)
+        self.assertEqual(self.user_storage.get_calls, 1)
+
+    def test_launch_with_invalid_user_storage_cache(self):
+        for user_storage_cache in [1, {"size": 10}, {"max_size": 0}, {"ttl": -1}]:
+            vwo_instance = vwo.launch(
+                json.dumps(SETTINGS_FILES["AB_T_100_W_50_50"]),
+                user_storage=self.user_storage,
+                is_development_mode=True,
+                user_storage_cache=user_storage_cache,
+            )
+            self.assertIsNone(vwo_instance)
@@ -0,0 +1,101 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import json
+import unittest
+import mock
+
+import vwo
+from vwo.helpers import campaign_util
+from vwo.services.campaign_group import CampaignGroup, get_campaign_groups
+from ..data.settings_files import SETTINGS_FILES
+from ..config.config import TEST_LOG_LEVEL
+
+with open("tests/data/mutually_exclusive_test_cases.json") as mutually_exclusive_test_cases_json:
+    mutually_exclusive_test_cases = json.load(mutually_exclusive_test_cases_json)
+
+USER_IDS = ["Ashley", "Bill", "Chris", "Dominic", "Emma", "Faizan", "Gimi", "Harry", "Ian", "John"]
+
+
+class CampaignGroupTest(unittest.TestCase):
+    def setUp(self):
+        self.settings_file = copy.deepcopy(mutually_exclusive_test_cases.get("commonSettingsFile"))
+        self.campaign_id_map = campaign_util.get_campaign_id_map(self.settings_file.get("campaigns"))
+
+    def test_get_campaign_groups(self):
+        self.settings_file["campaigns"][1]["status"] = "PAUSED"
+        campaign_groups = get_campaign_groups(self.settings_file, self.campaign_id_map)
+        self.assertEqual(list(campaign_groups), ["1"])
+        campaign_group = campaign_groups["1"]
+        self.assertEqual(campaign_group.name, "Group 1")
+        self.assertIsNone(campaign_group.algo)
+        self.assertEqual([campaign.get("key") for campaign in campaign_group.campaigns], ["c1", "c3"])
+        self.assertIs(campaign_group.campaigns[0], self.settings_file["campaigns"][0])
+        self.assertEqual(get_campaign_groups({}, {}), {})
+
+    def test_campaign_group_is_immutable(self):
+        campaign_group = CampaignGroup(1, self.settings_file["groups"]["1"], self.campaign_id_map)
+        with self.assertRaises(AttributeError):
+            campaign_group.name = "Group 2"
+        with self.assertRaises(AttributeError):
+            del campaign_group.campaigns
+
+    def test_allocation_is_memoized_by_eligible_campaigns(self):
+        campaign_group = CampaignGroup(1, self.settings_file["groups"]["1"], self.campaign_id_map)
+        campaigns = self.settings_file["campaigns"]
+        with mock.patch(
+            "vwo.helpers.campaign_util.get_sorted_allocation_ranges_for_weights",
+            wraps=campaign_util.get_sorted_allocation_ranges_for_weights,
+        ) as mock_get_sorted_allocation_ranges_for_weights:
+            allocation = campaign_group.get_allocation(campaigns[:2])
+            self.assertIs(campaign_group.get_allocation(campaigns[:2]), allocation)
+            campaign_group.get_allocation(campaigns)
+        self.assertEqual(mock_get_sorted_allocation_ranges_for_weights.call_count, 2)
+
+        eligible_campaigns, (range_starts, range_ends, indexes) = allocation
+        self.assertEqual(eligible_campaigns, tuple(campaigns[:2]))
+        self.assertEqual(list(range_starts), [1, 5001])
+        self.assertEqual(list(range_ends), [5000, 10000])
+        # campaigns are left as they are
+        self.assertNotIn("weight", campaigns[0])
+        self.assertNotIn("allocation_range_start", campaigns[0])
+
+    def test_traffic_weightage_allocation(self):
+        settings_file = SETTINGS_FILES["SETTINGS_MEGNEW_ONLY_TRAFFIC"]
+        campaign_group = CampaignGroup(
+            1,
+            settings_file["groups"]["1"],
+            campaign_util.get_campaign_id_map(settings_file["campaigns"]),
+        )
+        eligible_campaigns, (range_starts, range_ends, indexes) = campaign_group.get_traffic_weightage_allocation(
+            campaign_group.campaigns
+        )
+        self.assertEqual([campaign.get("id") for campaign in eligible_campaigns], [231, 232])
+        self.assertEqual(list(range_ends), [8000, 10000])
+
+    def test_decisions_leave_group_campaigns_unchanged(self):
+        for settings_file in [
+            mutually_exclusive_test_cases.get("commonSettingsFile"),
+            SETTINGS_FILES["SETTINGS_MEGNEW_ONLY_PRIORITY"],
+            SETTINGS_FILES["SETTINGS_MEGNEW_ONLY_TRAFFIC"],
+        ]:
+            vwo_instance = vwo.launch(json.dumps(settings_file), log_level=TEST_LOG_LEVEL, is_development_mode=True)
+            campaigns = copy.deepcopy(vwo_instance.config.get_settings_file()["campaigns"])
+            for user_id in USER_IDS:
+                for campaign in campaigns:
+                    vwo_instance.get_variation_name(
+                        campaign.get("key"), user_id, custom_variables={"c1": 1, "c2": 1, "c3": 1}
+                    )
+            self.assertEqual(vwo_instance.config.get_settings_file()["campaigns"], campaigns)
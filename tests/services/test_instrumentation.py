@@ -0,0 +1,278 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import threading
+import unittest
+
+import mock
+
+import vwo
+from vwo.constants.constants import API_METHODS, INSTRUMENTATION
+from vwo.services import instrumentation
+from vwo.services.instrumentation import (
+    DecisionTrace,
+    Histogram,
+    HistogramSink,
+    Instrumentation,
+    SpanSink,
+    StatsdSink,
+)
+
+from ..data.settings_files import SETTINGS_FILES
+from ..config.config import TEST_LOG_LEVEL
+
+
+class ClientUserStorage:
+    def __init__(self):
+        self.storage = {}
+
+    def get(self, user_id, campaign_key):
+        return self.storage.get((user_id, campaign_key))
+
+    def set(self, user_data):
+        self.storage[(user_data.get("userId"), user_data.get("campaignKey"))] = user_data
+
+
+class Integrations:
+    def callback(self, properties):
+        pass
+
+
+def get_trace(clock_values):
+    """Returns a trace of activate, with bucketing nested in meg, timed by the clock_values"""
+    with mock.patch.object(instrumentation, "clock", side_effect=clock_values), mock.patch.object(
+        instrumentation.time, "time", return_value=100.0
+    ):
+        trace = DecisionTrace(API_METHODS.ACTIVATE)
+        trace.enter(INSTRUMENTATION.MEG)
+        trace.enter(INSTRUMENTATION.BUCKETING)
+        trace.exit()
+        trace.exit()
+        trace.increment(INSTRUMENTATION.USER_STORAGE_CALLS)
+        trace.increment(INSTRUMENTATION.USER_STORAGE_CALLS, 2)
+        trace.finish()
+    return trace
+
+
+class DecisionTraceTest(unittest.TestCase):
+    def test_nested_stage_is_excluded_from_its_parent(self):
+        trace = get_trace([0.0, 1.0, 2.0, 5.0, 7.0, 10.0])
+
+        self.assertEqual(trace.stages, {INSTRUMENTATION.MEG: 3.0, INSTRUMENTATION.BUCKETING: 3.0})
+        self.assertEqual(trace.counters, {INSTRUMENTATION.USER_STORAGE_CALLS: 3})
+        self.assertEqual(trace.duration, 10.0)
+        self.assertEqual(trace.spans, [(INSTRUMENTATION.MEG, 1.0, 7.0, None), (INSTRUMENTATION.BUCKETING, 2.0, 5.0, 0)])
+
+    def test_finish_exits_stages_left_entered(self):
+        with mock.patch.object(instrumentation, "clock", side_effect=[0.0, 1.0, 4.0, 4.0]):
+            trace = DecisionTrace(API_METHODS.TRACK)
+            trace.enter(INSTRUMENTATION.USER_STORAGE_GET)
+            trace.finish()
+
+        self.assertEqual(trace.stages, {INSTRUMENTATION.USER_STORAGE_GET: 3.0})
+        self.assertEqual(trace.duration, 4.0)
+
+
+class InstrumentationTest(unittest.TestCase):
+    def test_traces_are_per_thread_and_nest(self):
+        traces = []
+        instrumentation_service = Instrumentation(traces.append)
+        self.assertIsNone(instrumentation_service.get_trace())
+
+        trace = instrumentation_service.start_trace(API_METHODS.ACTIVATE)
+        other_thread_traces = []
+        thread = threading.Thread(target=lambda: other_thread_traces.append(instrumentation_service.get_trace()))
+        thread.start()
+        thread.join()
+        self.assertEqual(other_thread_traces, [None])
+
+        nested_trace = instrumentation_service.start_trace(API_METHODS.TRACK)
+        self.assertIs(instrumentation_service.get_trace(), nested_trace)
+        instrumentation_service.finish_trace(nested_trace)
+        self.assertIs(instrumentation_service.get_trace(), trace)
+        instrumentation_service.finish_trace(trace)
+
+        self.assertIsNone(instrumentation_service.get_trace())
+        self.assertEqual(traces, [nested_trace, trace])
+
+    def test_time_stage_only_within_a_trace(self):
+        instrumentation_service = Instrumentation(lambda trace: None)
+        timed_method = instrumentation_service.time_stage(lambda value: value * 2, INSTRUMENTATION.BUCKETING)
+        self.assertEqual(timed_method(2), 4)
+
+        trace = instrumentation_service.start_trace(API_METHODS.ACTIVATE)
+        self.assertEqual(timed_method(3), 6)
+        instrumentation_service.increment(INSTRUMENTATION.SEGMENTS_EVALUATED)
+        instrumentation_service.finish_trace(trace)
+
+        self.assertEqual(list(trace.stages), [INSTRUMENTATION.BUCKETING])
+        self.assertEqual(trace.counters, {INSTRUMENTATION.SEGMENTS_EVALUATED: 1})
+
+    def test_sink_exception_is_logged(self):
+        def sink(trace):
+            raise Exception("Some Error Occured")
+
+        instrumentation_service = Instrumentation(sink)
+        with mock.patch.object(instrumentation_service.logger, "lazy_log") as mock_lazy_log:
+            instrumentation_service.finish_trace(instrumentation_service.start_trace(API_METHODS.ACTIVATE))
+        self.assertEqual(mock_lazy_log.call_count, 1)
+
+
+class SinksTest(unittest.TestCase):
+    def test_histogram_percentiles(self):
+        histogram = Histogram()
+        for _ in range(98):
+            histogram.add(0.00001)
+        histogram.add(0.001)
+        histogram.add(0.002)
+
+        stats = histogram.get_stats()
+        self.assertEqual(stats["count"], 100)
+        self.assertEqual(stats["max"], 0.002)
+        self.assertAlmostEqual(stats["mean"], 0.0000398)
+        self.assertTrue(0.00001 <= stats["p50"] < 0.00001 * 1.19)
+        self.assertTrue(0.00001 <= stats["p90"] < 0.00001 * 1.19)
+        self.assertTrue(0.001 <= stats["p99"] < 0.001 * 1.19)
+        self.assertEqual(Histogram().get_stats()["p99"], 0.0)
+
+    def test_histogram_sink(self):
+        histogram_sink = HistogramSink()
+        histogram_sink(get_trace([0.0, 1.0, 2.0, 5.0, 7.0, 10.0]))
+        histogram_sink(get_trace([0.0, 1.0, 2.0, 3.0, 4.0, 4.0]))
+
+        stats = histogram_sink.get_stats()
+        self.assertEqual(list(stats), [API_METHODS.ACTIVATE])
+        self.assertEqual(stats[API_METHODS.ACTIVATE]["counters"], {INSTRUMENTATION.USER_STORAGE_CALLS: 6})
+        stages = stats[API_METHODS.ACTIVATE]["stages"]
+        self.assertEqual(
+            sorted(stages), sorted([INSTRUMENTATION.TOTAL, INSTRUMENTATION.MEG, INSTRUMENTATION.BUCKETING])
+        )
+        self.assertEqual(stages[INSTRUMENTATION.TOTAL]["count"], 2)
+        self.assertEqual(stages[INSTRUMENTATION.TOTAL]["max"], 10.0)
+        self.assertEqual(stages[INSTRUMENTATION.MEG]["sum"], 5.0)
+
+        histogram_sink.reset()
+        self.assertEqual(histogram_sink.get_stats(), {})
+
+    def test_statsd_sink(self):
+        metrics = []
+        StatsdSink(lambda *metric: metrics.append(metric), prefix="app.vwo")(get_trace([0.0, 1.0, 2.0, 5.0, 7.0, 10.0]))
+
+        self.assertEqual(
+            sorted(metrics),
+            [
+                ("app.vwo.activate.bucketing", 3000.0, "ms"),
+                ("app.vwo.activate.meg", 3000.0, "ms"),
+                ("app.vwo.activate.total", 10000.0, "ms"),
+                ("app.vwo.activate.user_storage_calls", 3, "c"),
+            ],
+        )
+
+    def test_span_sink(self):
+        spans = []
+        SpanSink(spans.append)(get_trace([0.0, 1.0, 2.0, 5.0, 7.0, 10.0]))
+
+        self.assertEqual(
+            [
+                (span["name"], span["start_time"], span["end_time"], span["span_id"], span["parent_id"])
+                for span in spans
+            ],
+            [
+                ("vwo.activate", 100 * 10**9, 110 * 10**9, 0, None),
+                ("vwo.meg", 101 * 10**9, 107 * 10**9, 1, 0),
+                ("vwo.bucketing", 102 * 10**9, 105 * 10**9, 2, 1),
+            ],
+        )
+        self.assertEqual(spans[0]["attributes"], {"vwo.api_method": "activate", "vwo.user_storage_calls": 3})
+
+
+class InstrumentedApisTest(unittest.TestCase):
+    def launch(self, settings_file_key, **kwargs):
+        self.traces = []
+        return vwo.launch(
+            json.dumps(SETTINGS_FILES.get(settings_file_key)),
+            is_development_mode=True,
+            log_level=TEST_LOG_LEVEL,
+            instrumentation_sink=self.traces.append,
+            **kwargs
+        )
+
+    def test_launch_invalid_instrumentation_sink(self):
+        self.assertIsNone(
+            vwo.launch(
+                json.dumps(SETTINGS_FILES.get("AB_T_50_W_50_50")), is_development_mode=True, instrumentation_sink=123
+            )
+        )
+
+    def test_without_instrumentation_sink_nothing_is_instrumented(self):
+        vwo_instance = vwo.launch(json.dumps(SETTINGS_FILES.get("AB_T_100_W_50_50")), is_development_mode=True)
+
+        self.assertIsNone(vwo_instance.instrumentation)
+        self.assertNotIn("find_targeted_variation", vars(vwo_instance.variation_decider))
+        self.assertNotIn("dispatch", vars(vwo_instance.event_dispatcher))
+        self.assertEqual(vwo_instance.activate("AB_T_100_W_50_50", "Ashley"), "Control")
+
+    def test_activate_stages_and_counters(self):
+        vwo_instance = self.launch("AB_T_100_W_50_50", user_storage=ClientUserStorage(), integrations=Integrations())
+
+        variation_name = vwo_instance.activate("AB_T_100_W_50_50", "Ashley")
+        self.assertEqual(vwo_instance.activate("AB_T_100_W_50_50", "Ashley"), variation_name)
+        vwo_instance.push("tag_key", "tag_value", "Ashley")
+
+        self.assertEqual([trace.api_method for trace in self.traces], [API_METHODS.ACTIVATE, API_METHODS.ACTIVATE])
+        bucketed_trace, stored_trace = self.traces
+        self.assertEqual(
+            sorted(bucketed_trace.stages),
+            sorted(
+                [
+                    INSTRUMENTATION.WHITELISTING,
+                    INSTRUMENTATION.USER_STORAGE_GET,
+                    INSTRUMENTATION.PRE_SEGMENTATION,
+                    INSTRUMENTATION.BUCKETING,
+                    INSTRUMENTATION.USER_STORAGE_SET,
+                    INSTRUMENTATION.HOOKS,
+                    INSTRUMENTATION.DISPATCH,
+                ]
+            ),
+        )
+        self.assertEqual(bucketed_trace.counters, {INSTRUMENTATION.USER_STORAGE_CALLS: 2})
+        self.assertTrue(bucketed_trace.duration >= sum(bucketed_trace.stages.values()))
+        self.assertEqual(
+            sorted(stored_trace.stages),
+            sorted([INSTRUMENTATION.WHITELISTING, INSTRUMENTATION.USER_STORAGE_GET, INSTRUMENTATION.HOOKS]),
+        )
+        self.assertEqual(stored_trace.counters, {INSTRUMENTATION.USER_STORAGE_CALLS: 1})
+
+    def test_meg_stage_and_segments_evaluated(self):
+        vwo_instance = self.launch("SETTINGS_MEGNEW_ONLY_PRIORITY")
+
+        vwo_instance.get_variation_name("MEGNEW_ONLY_PRIORITY_0", "Ashley")
+
+        trace = self.traces[0]
+        self.assertEqual(trace.api_method, API_METHODS.GET_VARIATION_NAME)
+        self.assertIn(INSTRUMENTATION.MEG, trace.stages)
+        # whitelisting of the other campaign is nested in the meg span
+        meg_span_index = [span[0] for span in trace.spans].index(INSTRUMENTATION.MEG)
+        self.assertIn((INSTRUMENTATION.WHITELISTING, meg_span_index), [(span[0], span[3]) for span in trace.spans])
+
+    def test_whitelisting_segments_evaluated(self):
+        vwo_instance = self.launch("FT_T_75_W_10_20_30_40_WS")
+
+        vwo_instance.is_feature_enabled(
+            "FT_T_75_W_10_20_30_40_WS", "Ashley", variation_targeting_variables={"chrome": "false"}
+        )
+
+        self.assertEqual(self.traces[0].api_method, API_METHODS.IS_FEATURE_ENABLED)
+        self.assertGreater(self.traces[0].counters.get(INSTRUMENTATION.SEGMENTS_EVALUATED), 0)
@@ -0,0 +1,175 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import json
+import mock
+
+import vwo
+from vwo.storage.redis import RedisUserStorage
+from ..data.settings_files import SETTINGS_FILES
+
+
+class RedisUserStorageTest(unittest.TestCase):
+    def setUp(self):
+        self.user_storage = RedisUserStorage("127.0.0.1", None, None)
+        self.user_storage.redis = mock.MagicMock()
+        self.user_data = {"userId": "Ashley", "campaignKey": "c1", "variationName": "Control"}
+
+    def test_get(self):
+        self.user_storage.redis.get.return_value = json.dumps(self.user_data)
+        self.assertEqual(self.user_storage.get("Ashley", "c1"), self.user_data)
+        self.user_storage.redis.get.assert_called_once_with("c1:Ashley")
+
+    def test_get_many_uses_single_mget(self):
+        self.user_storage.redis.mget.return_value = [json.dumps(self.user_data), None]
+        self.assertEqual(self.user_storage.get_many("Ashley", ["c1", "c2"]), {"c1": self.user_data})
+        self.user_storage.redis.mget.assert_called_once_with(["c1:Ashley", "c2:Ashley"])
+        self.user_storage.redis.get.assert_not_called()
+
+    def test_get_many_connection_error(self):
+        self.user_storage.redis.mget.side_effect = Exception("Connection refused")
+        with mock.patch.object(self.user_storage.logger, "lazy_log") as mock_lazy_log:
+            self.assertEqual(self.user_storage.get_many("Ashley", ["c1", "c2"]), {})
+        self.assertEqual(mock_lazy_log.call_args[1]["no_of_keys"], 2)
+        self.assertEqual(mock_lazy_log.call_args[1]["user_id"], "Ashley")
+
+    def test_set(self):
+        self.user_storage.set(self.user_data)
+        self.user_storage.redis.set.assert_called_once_with("c1:Ashley", json.dumps(self.user_data), ex=None)
+
+    def test_get_connection_error(self):
+        self.user_storage.redis.get.side_effect = Exception("Connection refused")
+        self.assertIsNone(self.user_storage.get("Ashley", "c1"))
+
+    def test_connection_pool_options(self):
+        user_storage = RedisUserStorage(
+            "127.0.0.1", port=6380, db=2, max_connections=5, socket_timeout=0.1, socket_connect_timeout=0.2, retries=2
+        )
+        connection_kwargs = user_storage.connection_pool.connection_kwargs
+        self.assertEqual(user_storage.connection_pool.max_connections, 5)
+        self.assertEqual(connection_kwargs["port"], 6380)
+        self.assertEqual(connection_kwargs["db"], 2)
+        self.assertEqual(connection_kwargs["socket_timeout"], 0.1)
+        self.assertEqual(connection_kwargs["socket_connect_timeout"], 0.2)
+        self.assertEqual(connection_kwargs["retry"]._retries, 2)
+        self.assertIs(user_storage.redis.connection_pool, user_storage.connection_pool)
+
+    def test_connection_pool_from_url(self):
+        user_storage = RedisUserStorage("redis://127.0.0.1:6380/3", max_connections=5)
+        self.assertEqual(user_storage.connection_pool.connection_kwargs["db"], 3)
+        self.assertEqual(user_storage.connection_pool.max_connections, 5)
+
+    def test_set_with_ttl(self):
+        self.user_storage.ttl = 60
+        self.user_storage.set(self.user_data)
+        self.user_storage.redis.set.assert_called_once_with("c1:Ashley", json.dumps(self.user_data), ex=60)
+
+    def test_compact_encoding(self):
+        user_storage = RedisUserStorage("127.0.0.1", encoding="compact")
+        user_storage.redis = mock.MagicMock()
+        user_data = dict(self.user_data, goalIdentifiers="_vwo_g1_vwo_")
+
+        user_storage.set(user_data)
+        value = user_storage.redis.set.call_args[0][1]
+        self.assertLess(len(value), len(json.dumps(user_data)))
+
+        user_storage.redis.get.return_value = value
+        self.assertEqual(user_storage.get("Ashley", "c1"), user_data)
+        user_storage.redis.mget.return_value = [value, json.dumps(self.user_data)]
+        self.assertEqual(user_storage.get_many("Ashley", ["c1", "c2"]), {"c1": user_data, "c2": self.user_data})
+
+    def test_compact_encoding_falls_back_to_json_for_unknown_fields(self):
+        user_storage = RedisUserStorage("127.0.0.1", encoding="compact")
+        user_storage.redis = mock.MagicMock()
+        user_data = dict(self.user_data, extra=1)
+        user_storage.set(user_data)
+        user_storage.redis.set.assert_called_once_with("c1:Ashley", json.dumps(user_data), ex=None)
+
+    def test_write_behind_flushes_pipelined_batches(self):
+        user_storage = RedisUserStorage(
+            "127.0.0.1", write_behind=True, write_behind_batch_size=2, write_behind_interval=60, ttl=30
+        )
+        user_storage.redis = mock.MagicMock()
+        pipeline = user_storage.redis.pipeline.return_value
+
+        user_storage.set(self.user_data)
+        user_storage.set(dict(self.user_data, variationName="Variation-1"))
+        # buffered writes are read before being flushed
+        self.assertEqual(user_storage.get("Ashley", "c1")["variationName"], "Variation-1")
+        user_storage.redis.get.assert_not_called()
+
+        user_storage.set(dict(self.user_data, campaignKey="c2"))
+        user_storage.set(dict(self.user_data, campaignKey="c3"))
+        user_storage.redis.set.assert_not_called()
+
+        user_storage.close()
+        self.assertEqual(user_storage.pending_writes, {})
+        user_storage.redis.pipeline.assert_called_with(transaction=False)
+        keys = [call[0][0] for call in pipeline.set.call_args_list]
+        self.assertEqual(sorted(keys), ["c1:Ashley", "c2:Ashley", "c3:Ashley"])
+        self.assertEqual(pipeline.set.call_args_list[0][1], {"ex": 30})
+        self.assertEqual(pipeline.execute.call_count, 2)
+
+        # writes after close are not buffered
+        user_storage.set(self.user_data)
+        user_storage.redis.set.assert_called_once_with("c1:Ashley", json.dumps(self.user_data), ex=30)
+
+    def test_write_behind_keeps_writes_buffered_when_flush_fails(self):
+        user_storage = RedisUserStorage("127.0.0.1", write_behind=True, write_behind_batch_size=2)
+        user_storage.redis = mock.MagicMock()
+        pipeline = user_storage.redis.pipeline.return_value
+        pipeline.execute.side_effect = Exception("Connection refused")
+
+        with mock.patch.object(user_storage, "run_writer"):
+            user_storage.set(self.user_data)
+            user_storage.set(dict(self.user_data, campaignKey="c2"))
+            user_storage.set(dict(self.user_data, campaignKey="c3"))
+        with mock.patch.object(user_storage.logger, "lazy_log") as mock_lazy_log:
+            self.assertIs(user_storage.flush(), False)
+        self.assertEqual(mock_lazy_log.call_args[1]["no_of_writes"], 3)
+        self.assertEqual(sorted(user_storage.pending_writes), ["c1:Ashley", "c2:Ashley", "c3:Ashley"])
+        self.assertEqual(user_storage.get("Ashley", "c1")["variationName"], "Control")
+
+        pipeline.execute.side_effect = None
+        self.assertIs(user_storage.flush(), True)
+        self.assertEqual(user_storage.pending_writes, {})
+        user_storage.close()
+
+    def test_write_behind_writes_inline_when_buffer_is_full(self):
+        user_storage = RedisUserStorage("127.0.0.1", write_behind=True, write_behind_max_pending=1)
+        user_storage.redis = mock.MagicMock()
+        user_storage.set(self.user_data)
+        user_storage.set(dict(self.user_data, campaignKey="c2"))
+        user_storage.redis.set.assert_called_once_with("c2:Ashley", mock.ANY, ex=None)
+        user_storage.close()
+
+    def test_launch_with_redis_creds_options(self):
+        vwo_instance = vwo.launch(
+            json.dumps(SETTINGS_FILES["AB_T_100_W_50_50"]),
+            is_development_mode=True,
+            redis_creds={"url": "127.0.0.1", "max_connections": 4, "ttl": 60, "encoding": "compact"},
+        )
+        user_storage = vwo_instance.variation_decider.user_storage
+        self.assertIsInstance(user_storage, RedisUserStorage)
+        self.assertEqual(user_storage.connection_pool.max_connections, 4)
+        self.assertEqual(user_storage.ttl, 60)
+        self.assertEqual(user_storage.encoding, "compact")
+
+    def test_launch_with_invalid_redis_creds(self):
+        for redis_creds in [{"host": "127.0.0.1"}, {"url": "127.0.0.1", "encoding": "xml"}, {"url": "a", "ttl": 0}]:
+            vwo_instance = vwo.launch(
+                json.dumps(SETTINGS_FILES["AB_T_100_W_50_50"]), is_development_mode=True, redis_creds=redis_creds
+            )
+            self.assertIsNone(vwo_instance)
@@ -0,0 +1,144 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import mock
+
+import vwo
+from vwo.services.segmentor import SegmentEvaluator
+from vwo.services.settings_cache import SettingsCache
+from vwo.services.settings_file_manager import SettingsFileManager
+from vwo.services.settings_snapshot import SettingsSnapshot
+from ..data.settings_files import SETTINGS_FILES
+
+SETTINGS_FILE = json.dumps(SETTINGS_FILES["FT_T_75_W_10_20_30_40_WS"])
+LATEST_SETTINGS_FILE = json.dumps(SETTINGS_FILES["AB_T_100_W_0_100"])
+
+
+class SettingsCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, "vwo")
+        self.settings_cache = SettingsCache(self.cache_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_nothing_is_loaded_from_empty_cache(self):
+        self.assertIsNone(self.settings_cache.get_settings_file())
+        self.assertIsNone(self.settings_cache.load(SETTINGS_FILE, SegmentEvaluator()))
+
+    def test_saved_snapshot_is_loaded(self):
+        snapshot = SettingsSnapshot(SETTINGS_FILE, SegmentEvaluator())
+        self.settings_cache.save(snapshot)
+        self.assertEqual(self.settings_cache.get_settings_file(), SETTINGS_FILE)
+
+        loaded_snapshot = self.settings_cache.load(SETTINGS_FILE, SegmentEvaluator())
+        self.assertEqual(loaded_snapshot.settings_file, snapshot.settings_file)
+        self.assertEqual(loaded_snapshot.get_state()[2:], snapshot.get_state()[2:])
+        # lookup tables keep referring to the campaigns of the settings_file
+        campaign = loaded_snapshot.settings_file["campaigns"][0]
+        self.assertIs(loaded_snapshot.campaign_key_map[campaign["key"]], campaign)
+        self.assertIs(loaded_snapshot.campaign_id_map[campaign["id"]], campaign)
+        self.assertEqual(len(loaded_snapshot.compiled_segments), len(snapshot.compiled_segments))
+        for segments, compiled_segments in loaded_snapshot.compiled_segments.values():
+            self.assertTrue(callable(compiled_segments))
+
+    def test_snapshot_of_other_settings_file_is_not_loaded(self):
+        self.settings_cache.save(SettingsSnapshot(SETTINGS_FILE, SegmentEvaluator()))
+        self.assertIsNone(self.settings_cache.load(LATEST_SETTINGS_FILE, SegmentEvaluator()))
+
+    def test_snapshot_of_other_sdk_version_is_not_loaded(self):
+        self.settings_cache.save(SettingsSnapshot(SETTINGS_FILE, SegmentEvaluator()))
+        with mock.patch("vwo.constants.constants.SDK_VERSION", "0.0.0"):
+            self.assertIsNone(self.settings_cache.load(SETTINGS_FILE, SegmentEvaluator()))
+
+    def test_corrupt_snapshot_is_not_loaded(self):
+        self.settings_cache.save(SettingsSnapshot(SETTINGS_FILE, SegmentEvaluator()))
+        with open(os.path.join(self.cache_dir, SettingsCache.SNAPSHOT_FILE_NAME), "wb") as snapshot_file:
+            snapshot_file.write(b"corrupt")
+        self.assertIsNone(self.settings_cache.load(SETTINGS_FILE, SegmentEvaluator()))
+
+    def test_snapshot_of_other_settings_file_is_not_unpickled(self):
+        self.settings_cache.save(SettingsSnapshot(SETTINGS_FILE, SegmentEvaluator()))
+        self.assertTrue(self.settings_cache.is_cached(SETTINGS_FILE))
+        self.assertFalse(self.settings_cache.is_cached(LATEST_SETTINGS_FILE))
+        with mock.patch("vwo.services.settings_cache.pickle.loads") as mock_loads:
+            self.assertIsNone(self.settings_cache.load(LATEST_SETTINGS_FILE, SegmentEvaluator()))
+        mock_loads.assert_not_called()
+
+    def test_snapshot_writable_by_others_is_not_loaded(self):
+        self.settings_cache.save(SettingsSnapshot(SETTINGS_FILE, SegmentEvaluator()))
+        os.chmod(os.path.join(self.cache_dir, SettingsCache.SNAPSHOT_FILE_NAME), 0o666)
+        self.assertFalse(self.settings_cache.is_cached(SETTINGS_FILE))
+        with mock.patch("vwo.services.settings_cache.pickle.loads") as mock_loads:
+            self.assertIsNone(self.settings_cache.load(SETTINGS_FILE, SegmentEvaluator()))
+        mock_loads.assert_not_called()
+
+    def test_same_settings_file_is_not_written_again(self):
+        self.settings_cache.save(SettingsSnapshot(SETTINGS_FILE, SegmentEvaluator()))
+        with mock.patch.object(self.settings_cache, "_write") as mock_write:
+            self.settings_cache.save(SettingsSnapshot(SETTINGS_FILE, SegmentEvaluator()))
+        mock_write.assert_not_called()
+        self.assertEqual(sorted(os.listdir(self.cache_dir)), sorted(["settings_file.json", "settings_snapshot.pickle"]))
+
+    def test_settings_file_manager_loads_and_saves_snapshots(self):
+        self.settings_cache.save(SettingsSnapshot(SETTINGS_FILE, SegmentEvaluator()))
+        with mock.patch("vwo.services.settings_file_manager.SettingsSnapshot") as mock_snapshot:
+            settings_file_manager = SettingsFileManager(SETTINGS_FILE, settings_cache=self.settings_cache)
+        mock_snapshot.assert_not_called()
+        self.assertEqual(settings_file_manager.get_settings_file_string(), SETTINGS_FILE)
+
+        settings_file_manager.update_settings_file(LATEST_SETTINGS_FILE)
+        self.assertEqual(self.settings_cache.get_settings_file(), LATEST_SETTINGS_FILE)
+        self.assertIsNotNone(self.settings_cache.load(LATEST_SETTINGS_FILE, SegmentEvaluator()))
+
+
+class LaunchWithSettingsCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_launch_offline_from_cache(self):
+        self.assertIsNone(vwo.launch(None, is_development_mode=True, settings_cache_dir=self.cache_dir))
+
+        vwo_instance = vwo.launch(SETTINGS_FILE, is_development_mode=True, settings_cache_dir=self.cache_dir)
+        variation_name = vwo_instance.get_variation_name("FT_T_75_W_10_20_30_40_WS", "Ashley")
+
+        for settings_file in [None, "{}"]:
+            cached_vwo_instance = vwo.launch(settings_file, is_development_mode=True, settings_cache_dir=self.cache_dir)
+            self.assertEqual(cached_vwo_instance.config.get_settings_file_string(), SETTINGS_FILE)
+            self.assertEqual(
+                cached_vwo_instance.get_variation_name("FT_T_75_W_10_20_30_40_WS", "Ashley"), variation_name
+            )
+
+    def test_cached_settings_file_is_not_validated_again(self):
+        vwo.launch(SETTINGS_FILE, is_development_mode=True, settings_cache_dir=self.cache_dir)
+        with mock.patch("vwo.helpers.validate_util.is_valid_settings_file") as mock_is_valid_settings_file:
+            vwo_instance = vwo.launch(SETTINGS_FILE, is_development_mode=True, settings_cache_dir=self.cache_dir)
+            self.assertIsNotNone(vwo_instance)
+            mock_is_valid_settings_file.assert_not_called()
+
+            vwo.launch(LATEST_SETTINGS_FILE, is_development_mode=True, settings_cache_dir=self.cache_dir)
+            mock_is_valid_settings_file.assert_called_once_with(LATEST_SETTINGS_FILE)
+
+    def test_launch_with_invalid_settings_cache_dir(self):
+        self.assertIsNone(vwo.launch(SETTINGS_FILE, is_development_mode=True, settings_cache_dir=""))
+        self.assertIsNone(vwo.launch(SETTINGS_FILE, is_development_mode=True, settings_cache_dir=1))
@@ -0,0 +1,231 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import json
+import threading
+import unittest
+import mock
+
+import vwo
+from vwo.helpers import campaign_util
+from vwo.services.settings_file_manager import SettingsFileManager
+from ..data.settings_files import SETTINGS_FILES
+
+
+def get_settings_file_with_weights(control_weight, variation_weight):
+    settings_file = copy.deepcopy(SETTINGS_FILES["AB_T_100_W_50_50"])
+    settings_file["campaigns"][0]["variations"][0]["weight"] = control_weight
+    settings_file["campaigns"][0]["variations"][1]["weight"] = variation_weight
+    return json.dumps(settings_file)
+
+
+class SettingsFileManagerTest(unittest.TestCase):
+    def setUp(self):
+        self.settings_file_manager = SettingsFileManager(get_settings_file_with_weights(100, 0))
+
+    def test_snapshot_is_immutable(self):
+        snapshot = self.settings_file_manager.get_snapshot()
+        with self.assertRaises(AttributeError):
+            snapshot.settings_file = {}
+        with self.assertRaises(AttributeError):
+            del snapshot.campaign_key_map
+
+    def test_update_publishes_a_new_snapshot(self):
+        snapshot = self.settings_file_manager.get_snapshot()
+        campaign = self.settings_file_manager.get_campaign("AB_T_100_W_50_50")
+        self.assertEqual(campaign["variations"][0]["allocation_range_end"], 10000)
+
+        self.settings_file_manager.update_settings_file(get_settings_file_with_weights(0, 100))
+
+        self.assertIsNot(self.settings_file_manager.get_snapshot(), snapshot)
+        self.assertIsNot(self.settings_file_manager.get_campaign("AB_T_100_W_50_50"), campaign)
+        self.assertEqual(
+            self.settings_file_manager.get_campaign("AB_T_100_W_50_50")["variations"][1]["allocation_range_end"],
+            10000,
+        )
+        # the previous snapshot, possibly in use by a decision in progress, is left untouched
+        self.assertIs(snapshot.campaign_key_map["AB_T_100_W_50_50"], campaign)
+        self.assertEqual(campaign["variations"][0]["allocation_range_end"], 10000)
+        self.assertEqual(campaign["variations"][1]["allocation_range_end"], -1)
+
+    def test_variation_allocation_ranges_are_kept_aside(self):
+        snapshot = self.settings_file_manager.get_snapshot()
+        campaign = snapshot.get_campaign("AB_T_100_W_50_50")
+        range_starts, range_ends, indexes = snapshot.get_variation_allocation_ranges(campaign)
+        self.assertEqual((list(range_starts), list(range_ends), list(indexes)), ([1], [10000], [0]))
+        # the processed settings_file stays serializable as json
+        self.assertNotIn("variation_allocation_ranges", campaign)
+        json.dumps(snapshot.settings_file)
+
+        # ranges of the campaigns unchanged are reused, and aren't returned for some other campaign object
+        self.settings_file_manager.update_settings_file(get_settings_file_with_weights(100, 0).replace("}", " }", 1))
+        latest_snapshot = self.settings_file_manager.get_snapshot()
+        self.assertIs(latest_snapshot.get_variation_allocation_ranges(campaign)[0], range_starts)
+        self.assertIsNone(latest_snapshot.get_variation_allocation_ranges(copy.deepcopy(campaign)))
+
+    def test_vwo_reads_the_published_snapshot(self):
+        vwo_instance = vwo.launch(get_settings_file_with_weights(100, 0), is_development_mode=True)
+        self.assertEqual(vwo_instance.get_variation_name("AB_T_100_W_50_50", "Ashley"), "Control")
+
+        vwo_instance.config.update_settings_file(get_settings_file_with_weights(0, 100))
+
+        self.assertIs(vwo_instance.settings_file, vwo_instance.config.get_settings_file())
+        self.assertIs(vwo_instance.variation_decider.settings_file, vwo_instance.config.get_settings_file())
+        self.assertEqual(vwo_instance.get_variation_name("AB_T_100_W_50_50", "Ashley"), "Variation-1")
+
+    def test_decisions_during_updates(self):
+        vwo_instance = vwo.launch(get_settings_file_with_weights(100, 0), is_development_mode=True)
+        settings_files = [get_settings_file_with_weights(0, 100), get_settings_file_with_weights(100, 0)]
+        variation_names = set()
+        is_updating = [True]
+
+        def decide():
+            while True:
+                variation_names.add(vwo_instance.get_variation_name("AB_T_100_W_50_50", "Ashley"))
+                if not is_updating[0]:
+                    break
+
+        thread = threading.Thread(target=decide)
+        thread.start()
+        for index in range(200):
+            vwo_instance.config.update_settings_file(settings_files[index % 2])
+        is_updating[0] = False
+        thread.join()
+
+        self.assertTrue(variation_names)
+        self.assertTrue(variation_names.issubset({"Control", "Variation-1"}))
+
+    def test_decision_is_based_on_one_snapshot(self):
+        with open("tests/data/mutually_exclusive_test_cases.json") as mutually_exclusive_test_cases_json:
+            settings_file = json.load(mutually_exclusive_test_cases_json)["commonSettingsFile"]
+        settings_file_without_groups = dict(copy.deepcopy(settings_file), campaignGroups={}, groups={})
+        custom_variables = {"c1": 1, "c2": 1, "c3": 1}
+        for user_id in ["Ashley", "Bill", "Chris", "Dominic", "Emma"]:
+            expected_variation_name = vwo.launch(
+                json.dumps(settings_file), is_development_mode=True
+            ).get_variation_name("c1", user_id, custom_variables=custom_variables)
+
+            vwo_instance = vwo.launch(json.dumps(settings_file), is_development_mode=True)
+            evaluate_pre_segmentation = vwo_instance.variation_decider.evaluate_pre_segmentation
+
+            def update_and_evaluate_pre_segmentation(*args, **kwargs):
+                # the settings_file gets updated while the decision is in progress
+                vwo_instance.config.update_settings_file(json.dumps(settings_file_without_groups))
+                return evaluate_pre_segmentation(*args, **kwargs)
+
+            vwo_instance.variation_decider.evaluate_pre_segmentation = update_and_evaluate_pre_segmentation
+            self.assertEqual(
+                vwo_instance.get_variation_name("c1", user_id, custom_variables=custom_variables),
+                expected_variation_name,
+            )
+
+    def test_same_settings_file_is_not_validated(self):
+        with mock.patch("vwo.helpers.validate_util.is_valid_settings_file") as mock_is_valid_settings_file:
+            self.assertIs(
+                self.settings_file_manager.get_and_update_settings_file(
+                    1, "sdk_key", False, self.settings_file_manager.get_settings_file_string()
+                ),
+                False,
+            )
+        mock_is_valid_settings_file.assert_not_called()
+
+    def test_changed_campaigns_are_validated(self):
+        self.assertIs(
+            self.settings_file_manager.get_and_update_settings_file(
+                1, "sdk_key", False, get_settings_file_with_weights(0, 100)
+            ),
+            True,
+        )
+        self.assertEqual(len(self.settings_file_manager.get_snapshot().campaign_digests), 1)
+        self.assertIs(
+            self.settings_file_manager.get_and_update_settings_file(1, "sdk_key", False, '{"campaigns": [{}]}'),
+            False,
+        )
+
+    def test_update_reprocesses_changed_campaigns_only(self):
+        settings_file = copy.deepcopy(SETTINGS_FILES["AB_T_100_W_50_50"])
+        settings_file["campaigns"] += copy.deepcopy(SETTINGS_FILES["T_100_W_50_50_WS"]["campaigns"])
+        self.settings_file_manager.update_settings_file(json.dumps(settings_file))
+        snapshot = self.settings_file_manager.get_snapshot()
+        segmented_campaign = snapshot.campaign_key_map["T_100_W_50_50_WS"]
+
+        settings_file["campaigns"][0]["variations"][0]["weight"] = 0
+        settings_file["campaigns"][0]["variations"][1]["weight"] = 100
+        with mock.patch(
+            "vwo.helpers.campaign_util.set_variation_allocation", wraps=campaign_util.set_variation_allocation
+        ) as mock_set_variation_allocation:
+            self.settings_file_manager.update_settings_file(json.dumps(settings_file))
+        latest_snapshot = self.settings_file_manager.get_snapshot()
+
+        self.assertEqual(mock_set_variation_allocation.call_count, 1)
+        self.assertIs(latest_snapshot.campaign_key_map["T_100_W_50_50_WS"], segmented_campaign)
+        self.assertIs(
+            latest_snapshot.compiled_segments[id(segmented_campaign["segments"])],
+            snapshot.compiled_segments[id(segmented_campaign["segments"])],
+        )
+        self.assertEqual(
+            latest_snapshot.campaign_key_map["AB_T_100_W_50_50"]["variations"][1]["allocation_range_end"], 10000
+        )
+        self.assertEqual(
+            latest_snapshot.changes,
+            {
+                "added_campaigns": [],
+                "changed_campaigns": ["AB_T_100_W_50_50"],
+                "removed_campaigns": [],
+                "is_other_settings_changed": False,
+            },
+        )
+
+    def test_update_summarizes_changes(self):
+        self.assertIsNone(self.settings_file_manager.get_snapshot().changes)
+
+        settings_file = copy.deepcopy(SETTINGS_FILES["T_100_W_50_50_WS"])
+        settings_file["version"] = settings_file.get("version", 0) + 1
+        settings_update_callback = mock.Mock(side_effect=Exception("callback failed"))
+        self.settings_file_manager.settings_update_callback = settings_update_callback
+        self.settings_file_manager.update_settings_file(json.dumps(settings_file))
+
+        changes = {
+            "added_campaigns": ["T_100_W_50_50_WS"],
+            "changed_campaigns": [],
+            "removed_campaigns": ["AB_T_100_W_50_50"],
+            "is_other_settings_changed": True,
+        }
+        self.assertEqual(self.settings_file_manager.get_snapshot().changes, changes)
+        # a failing callback doesn't stop the update
+        settings_update_callback.assert_called_once_with(changes)
+        self.assertEqual(self.settings_file_manager.get_settings_file_string(), json.dumps(settings_file))
+
+    def test_launch_with_settings_update_callback(self):
+        settings_update_callback = mock.Mock()
+        vwo_instance = vwo.launch(
+            get_settings_file_with_weights(100, 0),
+            is_development_mode=True,
+            settings_update_callback=settings_update_callback,
+        )
+        settings_update_callback.assert_not_called()
+
+        vwo_instance.get_and_update_settings_file(
+            1, "sdk_key", latest_settings_file=get_settings_file_with_weights(0, 100)
+        )
+        settings_update_callback.assert_called_once_with(
+            {
+                "added_campaigns": [],
+                "changed_campaigns": ["AB_T_100_W_50_50"],
+                "removed_campaigns": [],
+                "is_other_settings_changed": False,
+            }
+        )
+        self.assertIsNone(vwo.launch(get_settings_file_with_weights(100, 0), settings_update_callback="callback"))
@@ -0,0 +1,137 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import unittest
+import mock
+
+import vwo
+from vwo.http.connection import Connection
+from vwo.services.settings_file_manager import SettingsFileManager
+from vwo.services.settings_poller import SettingsPoller
+from ..data.settings_files import SETTINGS_FILES
+
+SETTINGS_FILE = json.dumps(SETTINGS_FILES["AB_T_100_W_50_50"])
+LATEST_SETTINGS_FILE = json.dumps(SETTINGS_FILES["AB_T_100_W_0_100"])
+
+
+def response(status_code=200, text="", headers=None):
+    return {"status_code": status_code, "text": text, "headers": headers or {}}
+
+
+class SettingsPollerTest(unittest.TestCase):
+    def setUp(self):
+        self.settings_file_manager = SettingsFileManager(SETTINGS_FILE)
+        self.connection = Connection()
+        self.settings_poller = SettingsPoller(self.settings_file_manager, self.connection, interval=60)
+
+    def test_account_id_and_sdk_key_default_to_settings_file(self):
+        self.assertEqual(self.settings_poller.account_id, SETTINGS_FILES["AB_T_100_W_50_50"]["accountId"])
+        self.assertEqual(self.settings_poller.sdk_key, SETTINGS_FILES["AB_T_100_W_50_50"]["sdkKey"])
+
+    def test_poll_publishes_changed_settings_file(self):
+        snapshot = self.settings_file_manager.get_snapshot()
+        with mock.patch.object(
+            self.connection, "get", return_value=response(text=LATEST_SETTINGS_FILE, headers={"ETag": '"v2"'})
+        ) as mock_get:
+            self.assertIs(self.settings_poller.poll(), True)
+        self.assertIsNone(mock_get.call_args[1]["headers"])
+        self.assertIs(mock_get.call_args[1]["include_headers"], True)
+        self.assertIsNot(self.settings_file_manager.get_snapshot(), snapshot)
+        self.assertEqual(self.settings_file_manager.get_settings_file_string(), LATEST_SETTINGS_FILE)
+        self.assertEqual(self.settings_poller.etag, '"v2"')
+
+    def test_poll_keeps_snapshot_of_unchanged_settings_file(self):
+        snapshot = self.settings_file_manager.get_snapshot()
+        with mock.patch.object(self.connection, "get", return_value=response(text=SETTINGS_FILE)):
+            self.assertIs(self.settings_poller.poll(), False)
+        self.assertIs(self.settings_file_manager.get_snapshot(), snapshot)
+
+    def test_poll_is_conditional_and_skips_processing_on_304(self):
+        headers = {"ETag": '"v1"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        with mock.patch.object(self.connection, "get", return_value=response(text=SETTINGS_FILE, headers=headers)):
+            self.settings_poller.poll()
+
+        with mock.patch.object(self.connection, "get", return_value=response(304)) as mock_get, mock.patch.object(
+            self.settings_file_manager, "get_and_update_settings_file"
+        ) as mock_update:
+            self.assertIs(self.settings_poller.poll(), False)
+        mock_update.assert_not_called()
+        self.assertEqual(
+            mock_get.call_args[1]["headers"],
+            {"If-None-Match": '"v1"', "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"},
+        )
+
+    def test_poll_forgets_validators_of_invalid_settings_file(self):
+        with mock.patch.object(self.connection, "get", return_value=response(text="{}", headers={"ETag": '"bad"'})):
+            self.assertIs(self.settings_poller.poll(), False)
+        self.assertIsNone(self.settings_poller.etag)
+        self.assertEqual(self.settings_file_manager.get_settings_file_string(), SETTINGS_FILE)
+
+    def test_poll_ignores_failed_requests(self):
+        with mock.patch.object(self.connection, "get", return_value={"status_code": None, "text": ""}):
+            self.assertIs(self.settings_poller.poll(), False)
+        with mock.patch.object(self.connection, "get", return_value=response(503, "error")), mock.patch("sys.stderr"):
+            self.assertIs(self.settings_poller.poll(), False)
+        self.assertEqual(self.settings_file_manager.get_settings_file_string(), SETTINGS_FILE)
+
+    def test_wait_time_is_jittered(self):
+        settings_poller = SettingsPoller(self.settings_file_manager, self.connection, interval=100, jitter=0.2)
+        wait_times = [settings_poller.get_wait_time() for _ in range(100)]
+        self.assertTrue(all(80 <= wait_time <= 120 for wait_time in wait_times))
+        self.assertGreater(len(set(wait_times)), 1)
+
+    def test_poller_thread_polls_till_stopped(self):
+        settings_poller = SettingsPoller(self.settings_file_manager, self.connection, interval=0.01, jitter=0)
+        with mock.patch.object(self.connection, "get", return_value=response(text=LATEST_SETTINGS_FILE)):
+            settings_poller.start()
+            for _ in range(100):
+                if self.settings_file_manager.get_settings_file_string() == LATEST_SETTINGS_FILE:
+                    break
+                settings_poller.stop_event.wait(0.01)
+            settings_poller.stop()
+        self.assertFalse(settings_poller.poller.is_alive())
+        self.assertEqual(self.settings_file_manager.get_settings_file_string(), LATEST_SETTINGS_FILE)
+
+
+class LaunchWithSettingsPollerTest(unittest.TestCase):
+    def test_launch_starts_and_opt_out_stops_poller(self):
+        vwo_instance = vwo.launch(SETTINGS_FILE, is_development_mode=True, settings_poller={"interval": 60})
+        settings_poller = vwo_instance.settings_poller
+        self.assertIsInstance(settings_poller, SettingsPoller)
+        self.assertIs(settings_poller.connection, vwo_instance.event_dispatcher.connection)
+        self.assertIs(settings_poller.settings_file_manager, vwo_instance.config)
+        self.assertTrue(settings_poller.poller.is_alive())
+
+        vwo_instance.set_opt_out()
+        self.assertIsNone(vwo_instance.settings_poller)
+        self.assertFalse(settings_poller.poller.is_alive())
+
+    def test_launch_without_poller(self):
+        self.assertIsNone(vwo.launch(SETTINGS_FILE, is_development_mode=True).settings_poller)
+
+    def test_launch_with_invalid_poller_settings(self):
+        for settings_poller_settings in [
+            [],
+            {"interval": 0},
+            {"interval": "60"},
+            {"jitter": 1},
+            {"jitter": -0.1},
+            {"sdk_key": ""},
+            {"account_id": []},
+            {"unknown": 1},
+        ]:
+            self.assertIsNone(
+                vwo.launch(SETTINGS_FILE, is_development_mode=True, settings_poller=settings_poller_settings)
+            )
@@ -0,0 +1,192 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import mock
+
+import vwo
+from vwo.services.segmentor import SegmentEvaluator
+from vwo.services.settings_file_manager import SharedSettingsFileManager
+from vwo.services.settings_snapshot import SettingsSnapshot
+from vwo.services.shared_settings import SharedSettings
+from ..data.settings_files import SETTINGS_FILES
+
+SETTINGS_FILE = json.dumps(SETTINGS_FILES["AB_T_100_W_50_50"])
+LATEST_SETTINGS_FILE = json.dumps(SETTINGS_FILES["AB_T_100_W_0_100"])
+
+
+class SharedSettingsTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "vwo_settings")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_nothing_is_loaded_before_publishing(self):
+        shared_settings = SharedSettings(self.path)
+        self.assertEqual(shared_settings.get_generation(), 0)
+        self.assertIsNone(shared_settings.get_settings_file())
+        self.assertIsNone(shared_settings.load(None, SegmentEvaluator()))
+
+    def test_published_snapshot_is_loaded(self):
+        snapshot = SettingsSnapshot(SETTINGS_FILE, SegmentEvaluator())
+        SharedSettings(self.path).save(snapshot)
+
+        shared_settings = SharedSettings(self.path)
+        self.assertEqual(shared_settings.get_generation(), 1)
+        self.assertTrue(shared_settings.is_updated())
+        self.assertEqual(shared_settings.get_settings_file(), SETTINGS_FILE)
+        self.assertIsNone(shared_settings.load(LATEST_SETTINGS_FILE, SegmentEvaluator()))
+
+        loaded_snapshot = shared_settings.load(None, SegmentEvaluator())
+        self.assertEqual(loaded_snapshot.settings_file_string, SETTINGS_FILE)
+        self.assertEqual(loaded_snapshot.settings_file, snapshot.settings_file)
+        self.assertFalse(shared_settings.is_updated())
+
+    def test_generation_is_bumped_only_when_settings_file_changes(self):
+        shared_settings = SharedSettings(self.path)
+        shared_settings.save(SettingsSnapshot(SETTINGS_FILE, SegmentEvaluator()))
+        shared_settings.save(SettingsSnapshot(SETTINGS_FILE, SegmentEvaluator()))
+        self.assertEqual(shared_settings.get_generation(), 1)
+        shared_settings.save(SettingsSnapshot(LATEST_SETTINGS_FILE, SegmentEvaluator()))
+        self.assertEqual(shared_settings.get_generation(), 2)
+        self.assertEqual(shared_settings.generation, 2)
+
+    def test_updates_are_picked_up_without_parsing(self):
+        publisher = SharedSettingsFileManager(SETTINGS_FILE, SharedSettings(self.path))
+        with mock.patch("vwo.services.settings_file_manager.SettingsSnapshot") as mock_snapshot:
+            follower = SharedSettingsFileManager(
+                SharedSettings(self.path).get_settings_file(), SharedSettings(self.path)
+            )
+        mock_snapshot.assert_not_called()
+        self.assertEqual(follower.get_settings_file_string(), SETTINGS_FILE)
+
+        publisher.update_settings_file(LATEST_SETTINGS_FILE)
+        with mock.patch("vwo.services.settings_file_manager.SettingsSnapshot") as mock_snapshot:
+            snapshot = follower.get_snapshot()
+            self.assertEqual(snapshot.settings_file_string, LATEST_SETTINGS_FILE)
+            self.assertEqual(snapshot.get_campaign("AB_T_100_W_0_100")["variations"][1]["allocation_range_end"], 10000)
+        mock_snapshot.assert_not_called()
+
+    def test_snapshot_in_use_is_kept_if_loading_fails(self):
+        publisher = SharedSettingsFileManager(SETTINGS_FILE, SharedSettings(self.path))
+        follower = SharedSettingsFileManager(SETTINGS_FILE, SharedSettings(self.path))
+        publisher.update_settings_file(LATEST_SETTINGS_FILE)
+        with open(self.path, "wb") as shared_file:
+            shared_file.write(b"corrupt")
+        self.assertEqual(follower.get_snapshot().settings_file_string, SETTINGS_FILE)
+        self.assertFalse(follower.settings_cache.is_updated())
+
+    def test_files_are_private_and_untrusted_ones_are_not_loaded(self):
+        SharedSettings(self.path).save(SettingsSnapshot(SETTINGS_FILE, SegmentEvaluator()))
+        self.assertEqual(os.stat(self.path).st_mode & 0o077, 0)
+        self.assertEqual(os.stat(self.path + ".generation").st_mode & 0o077, 0)
+
+        os.chmod(self.path, 0o666)
+        shared_settings = SharedSettings(self.path)
+        self.assertIsNone(shared_settings.get_settings_file())
+        with mock.patch("vwo.services.shared_settings.pickle.loads") as mock_loads:
+            self.assertIsNone(shared_settings.load(None, SegmentEvaluator()))
+        mock_loads.assert_not_called()
+
+    @unittest.skipUnless(hasattr(os, "symlink") and hasattr(os, "O_NOFOLLOW"), "requires symlinks")
+    def test_generation_symlink_is_not_followed(self):
+        target_path = os.path.join(self.temp_dir, "target")
+        with open(target_path, "wb") as target_file:
+            target_file.write(b"target")
+        os.symlink(target_path, self.path + ".generation")
+
+        SharedSettings(self.path).save(SettingsSnapshot(SETTINGS_FILE, SegmentEvaluator()))
+        with open(target_path, "rb") as target_file:
+            self.assertEqual(target_file.read(), b"target")
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_generation_is_checked_once_per_api_call(self):
+        vwo_instance = vwo.launch(SETTINGS_FILE, is_development_mode=True, shared_settings_path=self.path)
+        with mock.patch.object(
+            SharedSettings, "is_updated", autospec=True, side_effect=SharedSettings.is_updated
+        ) as mock_is_updated:
+            vwo_instance.get_variation_name("AB_T_100_W_50_50", "Ashley")
+        self.assertEqual(mock_is_updated.call_count, 1)
+
+
+class LaunchWithSharedSettingsTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "vwo_settings")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_launch_publishes_and_attaches(self):
+        self.assertIsNone(vwo.launch(None, is_development_mode=True, shared_settings_path=self.path))
+
+        vwo_instance = vwo.launch(SETTINGS_FILE, is_development_mode=True, shared_settings_path=self.path)
+        with mock.patch("vwo.helpers.validate_util.is_valid_settings_file") as mock_is_valid_settings_file:
+            attached_vwo_instance = vwo.launch(None, is_development_mode=True, shared_settings_path=self.path)
+        mock_is_valid_settings_file.assert_not_called()
+        self.assertEqual(
+            attached_vwo_instance.get_variation_name("AB_T_100_W_50_50", "Ashley"),
+            vwo_instance.get_variation_name("AB_T_100_W_50_50", "Ashley"),
+        )
+
+        vwo_instance.get_and_update_settings_file(
+            SETTINGS_FILES["AB_T_100_W_0_100"]["accountId"], "sdk_key", latest_settings_file=LATEST_SETTINGS_FILE
+        )
+        self.assertEqual(attached_vwo_instance.get_variation_name("AB_T_100_W_0_100", "Ashley"), "Variation-1")
+
+    def test_launch_with_invalid_shared_settings_path(self):
+        self.assertIsNone(vwo.launch(SETTINGS_FILE, is_development_mode=True, shared_settings_path=""))
+        self.assertIsNone(
+            vwo.launch(
+                SETTINGS_FILE,
+                is_development_mode=True,
+                shared_settings_path=self.path,
+                settings_cache_dir=self.temp_dir,
+            )
+        )
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_forked_worker_picks_up_updates(self):
+        vwo_instance = vwo.launch(SETTINGS_FILE, is_development_mode=True, shared_settings_path=self.path)
+        read_fd, write_fd = os.pipe()
+        go_read_fd, go_write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 1
+            try:
+                os.close(read_fd)
+                os.close(go_write_fd)
+                worker_vwo_instance = vwo.launch(None, is_development_mode=True, shared_settings_path=self.path)
+                os.read(go_read_fd, 1)
+                os.write(write_fd, worker_vwo_instance.config.get_snapshot().settings_file_string.encode("utf-8"))
+                exit_code = 0
+            finally:
+                os._exit(exit_code)
+
+        os.close(write_fd)
+        os.close(go_read_fd)
+        vwo_instance.config.update_settings_file(LATEST_SETTINGS_FILE)
+        os.write(go_write_fd, b"1")
+        with os.fdopen(read_fd, "rb") as worker_output:
+            worker_settings_file = worker_output.read().decode("utf-8")
+        os.close(go_write_fd)
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(status, 0)
+        self.assertEqual(worker_settings_file, LATEST_SETTINGS_FILE)
@@ -0,0 +1,302 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import threading
+import unittest
+import zlib
+import mock
+
+import vwo
+from vwo.http.async_connection import AsyncConnection
+from .data.settings_files import SETTINGS_FILES
+from .config import config
+
+TEST_LOG_LEVEL = config.TEST_LOG_LEVEL
+
+with open("tests/data/mutually_exclusive_test_cases.json") as mutually_exclusive_test_cases_json:
+    mutually_exclusive_test_cases = json.load(mutually_exclusive_test_cases_json)
+
+
+class ClientAsyncUserStorage(vwo.AsyncUserStorage):
+    def __init__(self):
+        self.storage = {}
+        self.get_calls = []
+        self.set_calls = []
+
+    async def get(self, user_id, campaign_key):
+        self.get_calls.append(campaign_key)
+        await asyncio.sleep(0)
+        return self.storage.get((user_id, campaign_key))
+
+    async def set(self, user_data):
+        self.set_calls.append(user_data)
+        await asyncio.sleep(0)
+        self.storage[(user_data.get("userId"), user_data.get("campaignKey"))] = user_data
+
+
+class ClientAsyncUserStorageWithGetMany(ClientAsyncUserStorage):
+    def __init__(self):
+        ClientAsyncUserStorage.__init__(self)
+        self.get_many_calls = []
+
+    async def get_many(self, user_id, campaign_keys):
+        self.get_many_calls.append(list(campaign_keys))
+        return {
+            campaign_key: self.storage[(user_id, campaign_key)]
+            for campaign_key in campaign_keys
+            if (user_id, campaign_key) in self.storage
+        }
+
+
+class ClientUserStorage(vwo.UserStorage):
+    def __init__(self):
+        self.storage = {}
+        self.threads = []
+
+    def get(self, user_id, campaign_key):
+        self.threads.append(threading.current_thread())
+        return self.storage.get((user_id, campaign_key))
+
+    def set(self, user_data):
+        self.threads.append(threading.current_thread())
+        self.storage[(user_data.get("userId"), user_data.get("campaignKey"))] = user_data
+
+
+def async_response(status_code=200, text=""):
+    async def response(*args, **kwargs):
+        return {"status_code": status_code, "text": text}
+
+    return response
+
+
+class AsyncVWOTest(unittest.IsolatedAsyncioTestCase):
+    def launch(self, config_variant="AB_T_100_W_50_50", **kwargs):
+        kwargs.setdefault("is_development_mode", True)
+        return vwo.launch_async(json.dumps(SETTINGS_FILES.get(config_variant)), log_level=TEST_LOG_LEVEL, **kwargs)
+
+    async def test_activate_matches_sync_vwo(self):
+        vwo_instance = vwo.launch(json.dumps(SETTINGS_FILES.get("AB_T_50_W_50_50")), is_development_mode=True)
+        async_vwo_instance = self.launch("AB_T_50_W_50_50")
+        self.assertIsInstance(async_vwo_instance, vwo.AsyncVWO)
+        for user_id in ["Ashley", "Bill", "Chris", "Dominic", "Emma"]:
+            self.assertEqual(
+                await async_vwo_instance.activate("AB_T_50_W_50_50", user_id),
+                vwo_instance.activate("AB_T_50_W_50_50", user_id),
+            )
+            self.assertEqual(
+                await async_vwo_instance.get_variation_name("AB_T_50_W_50_50", user_id),
+                vwo_instance.get_variation_name("AB_T_50_W_50_50", user_id),
+            )
+
+    async def test_activate_uses_async_user_storage(self):
+        user_storage = ClientAsyncUserStorage()
+        vwo_instance = self.launch(user_storage=user_storage)
+
+        variation_name = await vwo_instance.activate("AB_T_100_W_50_50", "Ashley")
+        self.assertEqual(user_storage.get_calls, ["AB_T_100_W_50_50"])
+        self.assertEqual(len(user_storage.set_calls), 1)
+        self.assertEqual(user_storage.set_calls[0]["variationName"], variation_name)
+
+        stored_variation_name = "Variation-1" if variation_name == "Control" else "Control"
+        user_storage.storage[("Ashley", "AB_T_100_W_50_50")]["variationName"] = stored_variation_name
+        self.assertEqual(await vwo_instance.activate("AB_T_100_W_50_50", "Ashley"), stored_variation_name)
+        self.assertEqual(len(user_storage.set_calls), 1)
+
+    async def test_sync_user_storage_is_called_off_the_event_loop(self):
+        user_storage = ClientUserStorage()
+        vwo_instance = self.launch(user_storage=user_storage)
+
+        variation_name = await vwo_instance.activate("AB_T_100_W_50_50", "Ashley")
+        self.assertEqual(user_storage.storage[("Ashley", "AB_T_100_W_50_50")]["variationName"], variation_name)
+        self.assertEqual(len(user_storage.threads), 2)
+        self.assertNotIn(threading.current_thread(), user_storage.threads)
+
+    async def test_track_saves_goal_in_async_user_storage(self):
+        user_storage = ClientAsyncUserStorage()
+        vwo_instance = self.launch("AB_T_100_W_50_50", user_storage=user_storage)
+        goal_identifier = SETTINGS_FILES["AB_T_100_W_50_50"]["campaigns"][0]["goals"][1]["identifier"]
+
+        await vwo_instance.activate("AB_T_100_W_50_50", "Ashley")
+        result = await vwo_instance.track("AB_T_100_W_50_50", "Ashley", goal_identifier)
+        self.assertEqual(result, {"AB_T_100_W_50_50": True})
+        self.assertIn(goal_identifier, user_storage.set_calls[-1]["goalIdentifiers"])
+        # goal is tracked once per user
+        self.assertEqual(await vwo_instance.track(None, "Ashley", goal_identifier), {"AB_T_100_W_50_50": False})
+
+    async def test_group_campaigns_are_fetched_with_get_many(self):
+        user_storage = ClientAsyncUserStorageWithGetMany()
+        vwo_instance = vwo.launch_async(
+            json.dumps(mutually_exclusive_test_cases.get("commonSettingsFile")),
+            log_level=TEST_LOG_LEVEL,
+            user_storage=user_storage,
+            is_development_mode=True,
+        )
+        user_storage.storage[("Ashley", "c1")] = {"userId": "Ashley", "campaignKey": "c1", "variationName": "Control"}
+
+        is_feature_enabled = await vwo_instance.is_feature_enabled(
+            "c2", "Ashley", custom_variables={"c1": 1, "c2": 1, "c3": 1}
+        )
+        self.assertIs(is_feature_enabled, False)
+        self.assertEqual(user_storage.get_many_calls, [["c2", "c1", "c3"]])
+        self.assertEqual(user_storage.get_calls, [])
+
+    async def test_get_all_decisions_matches_sync_vwo(self):
+        settings_file = json.dumps(mutually_exclusive_test_cases.get("commonSettingsFile"))
+        custom_variables = {"c1": 1, "c2": 1, "c3": 1}
+        user_storage = ClientAsyncUserStorageWithGetMany()
+        vwo_instance = vwo.launch(settings_file, is_development_mode=True)
+        async_vwo_instance = vwo.launch_async(
+            settings_file, log_level=TEST_LOG_LEVEL, user_storage=user_storage, is_development_mode=True
+        )
+
+        self.assertEqual(
+            await async_vwo_instance.get_all_decisions("Ashley", custom_variables=custom_variables),
+            vwo_instance.get_all_decisions("Ashley", custom_variables=custom_variables),
+        )
+        self.assertEqual(user_storage.get_many_calls, [["c1", "c2", "c3"]])
+        self.assertEqual(len(user_storage.set_calls), 1)
+
+    async def test_get_all_decisions_batches_impressions_with_async_connection(self):
+        vwo_instance = self.launch(is_development_mode=False)
+        vwo_instance.config.update_settings_file(
+            json.dumps(
+                dict(
+                    SETTINGS_FILES["AB_T_100_W_50_50"],
+                    campaigns=SETTINGS_FILES["AB_T_100_W_50_50"]["campaigns"]
+                    + SETTINGS_FILES["AB_T_100_W_20_80"]["campaigns"],
+                )
+            )
+        )
+        with mock.patch(
+            "vwo.http.async_connection.AsyncConnection.post", side_effect=async_response()
+        ) as mock_async_post, mock.patch("vwo.http.connection.Connection.post") as mock_post:
+            decisions = await vwo_instance.get_all_decisions("Ashley", batch_impressions=True)
+        self.assertEqual(list(decisions), ["AB_T_100_W_50_50", "AB_T_100_W_20_80"])
+        mock_post.assert_not_called()
+        self.assertEqual(mock_async_post.call_count, 1)
+        self.assertEqual(len(mock_async_post.call_args[1]["data"]["ev"]), 2)
+        self.assertIs(mock_async_post.call_args[1]["include_request_size"], True)
+
+    async def test_activate_sends_impression_with_async_connection(self):
+        vwo_instance = self.launch(is_development_mode=False)
+        with mock.patch(
+            "vwo.http.async_connection.AsyncConnection.get", side_effect=async_response()
+        ) as mock_async_get, mock.patch("vwo.http.connection.Connection.get") as mock_get:
+            self.assertIsNotNone(await vwo_instance.activate("AB_T_100_W_50_50", "Ashley"))
+        mock_get.assert_not_called()
+        self.assertEqual(mock_async_get.call_count, 1)
+        self.assertIn("track-user", mock_async_get.call_args[0][0])
+        self.assertEqual(mock_async_get.call_args[1]["params"]["experiment_id"], 231)
+
+    async def test_push_sends_events_with_async_connection(self):
+        vwo_instance = self.launch("SETTINGS_FILE_WITH_MCA", is_development_mode=False)
+        with mock.patch(
+            "vwo.http.async_connection.AsyncConnection.post", side_effect=async_response()
+        ) as mock_async_post, mock.patch("vwo.http.connection.Connection.post") as mock_post:
+            self.assertIs(await vwo_instance.push("tag_key", "tag_value", "Ashley"), True)
+        mock_post.assert_not_called()
+        self.assertEqual(mock_async_post.call_count, 1)
+        self.assertIn("events/t", mock_async_post.call_args[0][0])
+
+    async def test_flush_events_in_sync_mode(self):
+        vwo_instance = self.launch(is_development_mode=False, batch_events={"events_per_request": 10})
+        with mock.patch(
+            "vwo.http.connection.Connection.post", return_value={"status_code": 200, "text": ""}
+        ) as mock_post:
+            await vwo_instance.activate("AB_T_100_W_50_50", "Ashley")
+            await vwo_instance.activate("AB_T_100_W_50_50", "Bill")
+            self.assertIs(await vwo_instance.flush_events(mode="sync"), True)
+            self.assertEqual(mock_post.call_count, 1)
+            self.assertEqual(len(mock_post.call_args[1]["data"]["ev"]), 2)
+            await vwo_instance.close()
+
+    async def test_get_and_update_settings_file(self):
+        vwo_instance = self.launch()
+        latest_settings_file = json.dumps(SETTINGS_FILES.get("AB_T_100_W_0_100"))
+        with mock.patch(
+            "vwo.http.async_connection.AsyncConnection.get", side_effect=async_response(text=latest_settings_file)
+        ) as mock_async_get, mock.patch("vwo.helpers.settings_file_util.requests.get") as mock_get:
+            settings_file = await vwo_instance.get_and_update_settings_file(
+                SETTINGS_FILES["AB_T_100_W_0_100"]["accountId"], "sdk_key"
+            )
+        mock_get.assert_not_called()
+        self.assertEqual(mock_async_get.call_args[1]["params"]["i"], "sdk_key")
+        self.assertEqual(settings_file, latest_settings_file)
+        self.assertIs(vwo_instance.variation_decider.settings_file, vwo_instance.settings_file)
+
+    async def test_opted_out_skips_user_storage(self):
+        user_storage = ClientAsyncUserStorage()
+        vwo_instance = self.launch(user_storage=user_storage)
+        vwo_instance.set_opt_out()
+        self.assertIsNone(await vwo_instance.activate("AB_T_100_W_50_50", "Ashley"))
+        self.assertEqual(user_storage.get_calls, [])
+
+    def test_launch_async_with_user_storage_cache(self):
+        self.assertIsNone(self.launch(user_storage=ClientAsyncUserStorage(), user_storage_cache={}))
+        self.assertIsNotNone(self.launch(user_storage=vwo.UserStorage(), user_storage_cache={}))
+
+
+class AsyncConnectionTest(unittest.IsolatedAsyncioTestCase):
+    async def test_requests_are_made_off_the_event_loop_without_aiohttp(self):
+        with mock.patch("vwo.http.async_connection.aiohttp", None):
+            connection = AsyncConnection(pool_size=2)
+        with mock.patch(
+            "vwo.http.connection.Connection.get", return_value={"status_code": 200, "text": "ok"}
+        ) as mock_get, mock.patch(
+            "vwo.http.connection.Connection.post", return_value={"status_code": 200, "text": ""}
+        ) as mock_post:
+            self.assertEqual(
+                await connection.get("https://vwo.com", params={"a": 1}), {"status_code": 200, "text": "ok"}
+            )
+            await connection.post("https://vwo.com", data={"ev": []})
+        mock_get.assert_called_once_with("https://vwo.com", params={"a": 1}, headers=None)
+        mock_post.assert_called_once_with(
+            "https://vwo.com",
+            params=None,
+            data={"ev": []},
+            headers=None,
+            compression=None,
+            compression_threshold=0,
+            include_request_size=False,
+        )
+        await connection.close()
+
+    async def test_compact_compressed_body_is_posted_with_aiohttp(self):
+        with mock.patch("vwo.http.async_connection.aiohttp", mock.MagicMock()):
+            connection = AsyncConnection()
+        resp = mock.MagicMock(status=200)
+        resp.text = mock.AsyncMock(return_value="")
+        connection.session = mock.MagicMock()
+        connection.session.request.return_value.__aenter__.return_value = resp
+
+        data = {"ev": [{"d": {"msgId": "1"}}] * 20}
+        result = await connection.post(
+            "https://vwo.com",
+            data=data,
+            headers={"Authorization": "key"},
+            compression="gzip",
+            include_request_size=True,
+        )
+        kwargs = connection.session.request.call_args[1]
+        self.assertEqual(
+            kwargs["headers"],
+            {"Authorization": "key", "Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+        self.assertEqual(
+            zlib.decompress(kwargs["data"], 16 + zlib.MAX_WBITS),
+            json.dumps(data, separators=(",", ":")).encode("utf-8"),
+        )
+        self.assertEqual(result, {"status_code": 200, "text": "", "request_size": len(kwargs["data"])})
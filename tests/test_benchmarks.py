@@ -0,0 +1,60 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from benchmarks import __main__ as benchmarks_main
+from benchmarks import runner
+
+
+class BenchmarksTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_every_benchmark_runs(self):
+        benchmark_ids = [benchmark_run.id for benchmark_run in runner.BENCHMARKS]
+        self.assertEqual(len(benchmark_ids), len(set(benchmark_ids)))
+        self.assertEqual(
+            sorted(set(benchmark_run.group for benchmark_run in runner.BENCHMARKS)),
+            ["decisions", "event_batching", "meg", "segmentor", "settings"],
+        )
+
+        results = runner.run_all(runner.BENCHMARKS, rounds=1, min_time=0)
+        self.assertEqual([result["id"] for result in results["benchmarks"]], benchmark_ids)
+        for result in results["benchmarks"]:
+            self.assertGreater(result["median"], 0)
+        json.dumps(results)
+
+    def test_regression_is_reported_against_baseline(self):
+        output_path = os.path.join(self.temp_dir, "results.json")
+        self.assertEqual(
+            benchmarks_main.main(
+                ["-k", "segmentor/evaluate_compiled", "--rounds", "1", "--min-time", "0", "-o", output_path]
+            ),
+            0,
+        )
+        with open(output_path) as output_file:
+            baseline = json.load(output_file)
+
+        results = {"benchmarks": [dict(baseline["benchmarks"][0], median=baseline["benchmarks"][0]["median"] * 2)]}
+        self.assertEqual(runner.compare(results, baseline, 0.2)[0][3:], (2.0, True))
+        self.assertEqual(runner.compare(results, baseline, 1.5)[0][4], False)
+        self.assertEqual(runner.compare(results, {"benchmarks": []}, 0.2), [])
@@ -13,9 +13,17 @@
 # limitations under the License.
 
 
+import sys
+
 from .api.launch import launch
 from .helpers.settings_file_util import get as get_settings_file
 from .storage.user import UserStorage
+from .storage.cache import CachedUserStorage
+
+if sys.version_info >= (3, 7):
+    from .api.launch import launch_async
+    from .async_vwo import AsyncVWO
+    from .storage.async_user import AsyncUserStorage
 
 from .constants.constants import GOAL_TYPES
 from .enums import LogLevelEnum as LOG_LEVELS
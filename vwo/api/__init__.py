@@ -17,9 +17,12 @@
 from .activate import _activate
 from .get_feature_variable_value import _get_feature_variable_value
 from .get_variation_name import _get_variation_name
+from .get_variation_names_bulk import _get_variation_names_bulk
+from .get_all_decisions import _get_all_decisions
 from .is_feature_enabled import _is_feature_enabled
 from .push import _push
 from .track import _track
 from .flush_events import _flush_events
 from .get_and_update_settings_file import _get_and_update_settings_file
 from .set_opt_out import _set_opt_out
+from .get_dispatcher_stats import _get_dispatcher_stats
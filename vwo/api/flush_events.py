@@ -25,13 +25,12 @@ def _flush_events(vwo_instance, mode):
         servers.
 
     Args:
-        mode(string): In sync mode, function makes a synchronous call before exiting
-            In async mode, function spawns a thread to sync to VWO and exits
+        mode(string): In sync mode, function waits till all queued events are synced to VWO before exiting
+            In async mode, function hands over the queue to the background flushers and exits
     """
     if vwo_instance.is_opted_out:
-        vwo_instance.logger.log(
-            LogLevelEnum.INFO,
-            LogMessageEnum.INFO_MESSAGES.API_NOT_ENABLED.format(file=FILE, api=API_METHODS.FLUSH_EVENTS),
+        vwo_instance.logger.lazy_log(
+            LogLevelEnum.INFO, LogMessageEnum.INFO_MESSAGES.API_NOT_ENABLED, file=FILE, api=API_METHODS.FLUSH_EVENTS
         )
 
         return False
@@ -0,0 +1,225 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from ..helpers import impression_util
+from ..constants import constants
+from ..constants.constants import API_METHODS
+from ..helpers import campaign_util, feature_util, uuid_util, validate_util
+from ..enums.log_message_enum import LogMessageEnum
+from ..enums.file_name_enum import FileNameEnum
+from ..enums.log_level_enum import LogLevelEnum
+
+FILE = FileNameEnum.Api.GetAllDecisions
+
+
+def _get_all_decisions(vwo_instance, user_id, campaign_keys=None, **kwargs):
+    """This API method: Gets the decisions for the user for all the running
+        campaigns, or the given ones, in one call e.g. to render a page using
+        many features.
+
+    1. Validates the arguments being passed
+    2. Assigns the determinitic variation of each campaign to the user, doing
+        the work common to the campaigns once i.e. generating UUID, looking up
+        UserStorage and finding the winner campaign of each group
+    3. Sends an impression call to VWO server for each campaign the user becomes
+        part of, like activate and is_feature_enabled do
+
+    Args:
+        user_id (string): ID assigned to a user
+        campaign_keys (list|None): unique campaign keys, all running campaigns if None
+
+    Keywork Args:
+        custom_variables (dict): Custom variables required for segmentation
+        variation_targeting_variables (dict): Whitelisting variables to target users
+        batch_impressions (bool): send the impressions together in one request, unless
+            event batching is enabled already
+
+    Returns:
+        dict|None: campaign_key to decision, None if arguments are invalid. Decision has
+            variation_name for A/B and feature test campaigns, and is_feature_enabled along with
+            variables(variable_key to value) for feature campaigns. variation_name is None and
+            is_feature_enabled is False in case of user not becoming part. Campaigns which are
+            not running are left out.
+    """
+
+    vwo_instance.logger.set_api(API_METHODS.GET_ALL_DECISIONS)
+
+    if vwo_instance.is_opted_out:
+        vwo_instance.logger.lazy_log(
+            LogLevelEnum.INFO,
+            LogMessageEnum.INFO_MESSAGES.API_NOT_ENABLED,
+            file=FILE,
+            api=API_METHODS.GET_ALL_DECISIONS,
+        )
+
+        return None
+
+    # Retrieve custom variables
+    custom_variables = kwargs.get("custom_variables")
+    variation_targeting_variables = kwargs.get("variation_targeting_variables")
+    user_agent = kwargs.get("user_agent")
+    user_ip_address = kwargs.get("user_ip_address")
+    custom_properties = kwargs.get("custom_properties")  # to support custom properties in variationShown
+    batch_impressions = kwargs.get("batch_impressions")
+
+    # Validate input parameters
+    if (
+        not validate_util.is_valid_string(user_id)
+        or (
+            campaign_keys is not None
+            and not (
+                isinstance(campaign_keys, (list, tuple))
+                and all(validate_util.is_valid_string(campaign_key) for campaign_key in campaign_keys)
+            )
+        )
+        or (custom_variables is not None and not validate_util.is_valid_dict(custom_variables))
+        or (
+            variation_targeting_variables is not None and not validate_util.is_valid_dict(variation_targeting_variables)
+        )
+    ):
+        vwo_instance.logger.lazy_log(
+            LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.GET_ALL_DECISIONS_API_INVALID_PARAMS, file=FILE
+        )
+        return None
+
+    # Get the campaigns from one snapshot, so that they're consistent even if settings_file gets updated meanwhile
+    snapshot = vwo_instance.config.get_snapshot()
+    if campaign_keys is None:
+        campaigns = list(snapshot.campaign_key_map.values())
+    else:
+        campaigns = list(snapshot.get_campaigns(campaign_keys).values())
+
+    # check if user storage attached if MAB activated for campaign
+    if vwo_instance.variation_decider.user_storage is None:
+        for campaign in [campaign for campaign in campaigns if campaign.get("isMAB")]:
+            vwo_instance.logger.lazy_log(
+                LogLevelEnum.ERROR,
+                LogMessageEnum.ERROR_MESSAGES.NO_USERSTORAGE_WITH_MAB,
+                file=FILE,
+                campaign_key=campaign.get("key"),
+            )
+            campaigns.remove(campaign)
+
+    vwo_user_id = uuid_util.generate_for(user_id, snapshot.settings_file.get("accountId"))
+    variations = vwo_instance.variation_decider.get_variations(
+        user_id,
+        campaigns,
+        custom_variables=custom_variables,
+        variation_targeting_variables=variation_targeting_variables,
+        api_method=constants.API_METHODS.GET_ALL_DECISIONS,
+        vwo_user_id=vwo_user_id,
+        snapshot=snapshot,
+    )
+
+    decisions = {}
+    impressions = []
+    for campaign, (variation, is_user_tracked) in zip(campaigns, variations):
+        decisions[campaign.get("key")] = _get_decision(campaign, variation)
+
+        if not variation:
+            continue
+
+        # track user if user has not already been tracked
+        if is_user_tracked is False:
+            if not vwo_instance.is_event_arch_enabled or vwo_instance.is_event_batching_enabled is True:
+                impression = impression_util.create_impression(
+                    vwo_instance,
+                    campaign.get("id"),
+                    variation.get("id"),
+                    user_id,
+                    user_agent=user_agent,
+                    user_ip_address=user_ip_address,
+                    vwo_user_id=vwo_user_id,
+                    settings_file=snapshot.settings_file,
+                )
+
+                if batch_impressions:
+                    impressions.append(impression)
+                else:
+                    vwo_instance.event_dispatcher.dispatch(impression)
+                vwo_instance.logger.lazy_log(
+                    LogLevelEnum.INFO,
+                    LogMessageEnum.INFO_MESSAGES.MAIN_KEYS_FOR_IMPRESSION,
+                    file=FILE,
+                    campaign_id=impression.get("experiment_id"),
+                    account_id=impression.get("account_id"),
+                    variation_id=impression.get("combination"),
+                )
+            else:
+                params = impression_util.get_events_params(
+                    snapshot.settings_file,
+                    constants.EVENTS.VWO_VARIATION_SHOWN,
+                    user_agent=user_agent,
+                    user_ip_address=user_ip_address,
+                )
+                impression = impression_util.create_track_user_events_impression(
+                    snapshot.settings_file,
+                    campaign.get("id"),
+                    variation.get("id"),
+                    user_id,
+                    custom_properties,
+                    vwo_user_id=vwo_user_id,
+                )
+                vwo_instance.event_dispatcher.dispatch_events(params=params, impression=impression)
+        else:
+            vwo_instance.logger.lazy_log(
+                LogLevelEnum.INFO,
+                LogMessageEnum.INFO_MESSAGES.USER_ALREADY_TRACKED,
+                file=FILE,
+                user_id=user_id,
+                campaign_key=campaign.get("key"),
+                api_method=constants.API_METHODS.GET_ALL_DECISIONS,
+            )
+
+    if impressions:
+        vwo_instance.event_dispatcher.dispatch_many(impressions)
+
+    return decisions
+
+
+def _get_decision(campaign, variation):
+    """Builds the decision for the campaign from the variation assigned to the user
+
+    Args:
+        campaign (dict): campaign the decision is of
+        variation (dict|None): variation assigned, None in case of user not becoming part
+
+    Returns:
+        dict: decision, see _get_all_decisions
+    """
+    campaign_type = campaign.get("type")
+    decision = {}
+    if campaign_type != constants.CAMPAIGN_TYPES.FEATURE_ROLLOUT:
+        decision["variation_name"] = variation.get("name") if variation else None
+    if campaign_type == constants.CAMPAIGN_TYPES.VISUAL_AB:
+        return decision
+
+    variables = []
+    is_feature_enabled = False
+    if variation and campaign_type == constants.CAMPAIGN_TYPES.FEATURE_ROLLOUT:
+        is_feature_enabled = True
+        variables = campaign.get("variables")
+    elif variation:
+        is_feature_enabled = bool(variation.get("isFeatureEnabled"))
+        # variables of control variation apply when feature is not enabled for the variation
+        variables = (variation if is_feature_enabled else campaign_util.get_control_variation(campaign)).get(
+            "variables"
+        )
+
+    decision["is_feature_enabled"] = is_feature_enabled
+    decision["variables"] = {
+        variable.get("key"): feature_util.get_type_casted_feature_value(variable.get("value"), variable.get("type"))
+        for variable in variables or []
+    }
+    return decision
@@ -20,7 +20,7 @@ from ..constants.constants import API_METHODS
 FILE = FileNameEnum.Api.GetAndUpdateSettingsFile
 
 
-def _get_and_update_settings_file(vwo_instance, account_id, sdk_key, is_via_webhook=False):
+def _get_and_update_settings_file(vwo_instance, account_id, sdk_key, is_via_webhook=False, latest_settings_file=None):
     """ This API method: Makes a call to our server and fetch the latest settings_file
     and update the vwo_instance
 
@@ -29,6 +29,7 @@ def _get_and_update_settings_file(vwo_instance, account_id, sdk_key, is_via_webh
         sdk_key (string): Unique sdk key for user,
             can be retrieved from our webside
         is_via_webhook (bool): is triggered via webhook flag
+        latest_settings_file (json_string): settings_file already fetched, fetched here if None
 
     Returns:
         (json_string): stringified json representing the settings_file,
@@ -37,19 +38,21 @@ def _get_and_update_settings_file(vwo_instance, account_id, sdk_key, is_via_webh
     vwo_instance.logger.set_api(API_METHODS.GET_AND_UPDATE_SETTINGS_FILE)
 
     if vwo_instance.is_opted_out:
-        vwo_instance.logger.log(
+        vwo_instance.logger.lazy_log(
             LogLevelEnum.INFO,
-            LogMessageEnum.INFO_MESSAGES.API_NOT_ENABLED.format(
-                file=FILE, api=API_METHODS.GET_AND_UPDATE_SETTINGS_FILE
-            ),
+            LogMessageEnum.INFO_MESSAGES.API_NOT_ENABLED,
+            file=FILE,
+            api=API_METHODS.GET_AND_UPDATE_SETTINGS_FILE,
         )
 
         return False
 
-    is_settings_file_updated = vwo_instance.config.get_and_update_settings_file(account_id, sdk_key, is_via_webhook)
+    is_settings_file_updated = vwo_instance.config.get_and_update_settings_file(
+        account_id, sdk_key, is_via_webhook, latest_settings_file
+    )
 
     if is_settings_file_updated:
-        vwo_instance.settings_file = vwo_instance.config.get_settings_file()
-        vwo_instance.logger.log(LogLevelEnum.INFO, LogMessageEnum.INFO_MESSAGES.SETTINGS_FILE_UPDATED.format(file=FILE))
+        # vwo_instance and variation_decider read through config, hence see the new settings_file already
+        vwo_instance.logger.lazy_log(LogLevelEnum.INFO, LogMessageEnum.INFO_MESSAGES.SETTINGS_FILE_UPDATED, file=FILE)
 
     return vwo_instance.config.get_settings_file_string()
@@ -0,0 +1,43 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from ..constants.constants import API_METHODS
+from ..enums.file_name_enum import FileNameEnum
+from ..enums.log_level_enum import LogLevelEnum
+from ..enums.log_message_enum import LogMessageEnum
+
+FILE = FileNameEnum.Api.GetDispatcherStats
+
+
+def _get_dispatcher_stats(vwo_instance):
+    """This API method: Returns the state of the events queue and the stats of the events dispatched
+    to VWO servers so far, e.g. for sizing events_per_request and request_time_interval under load.
+
+    Returns:
+        dict|None: event_batching, events_per_request, request_time_interval, queue_depth, pending_batches,
+            pending_events, in_flight_batches, events_queued, events_dropped, events_sent, events_failed,
+            requests, bytes_sent, status_codes i.e. no. of requests by status code, -1 for no response, and
+            request_duration and batch_latency histograms i.e. count, sum, mean, max, p50, p90 and p99 in
+            seconds. None if opted out
+    """
+    if vwo_instance.is_opted_out:
+        vwo_instance.logger.lazy_log(
+            LogLevelEnum.INFO,
+            LogMessageEnum.INFO_MESSAGES.API_NOT_ENABLED,
+            file=FILE,
+            api=API_METHODS.GET_DISPATCHER_STATS,
+        )
+        return None
+
+    return vwo_instance.event_dispatcher.get_stats()
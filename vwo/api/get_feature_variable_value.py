@@ -52,9 +52,11 @@ def _get_feature_variable_value(vwo_instance, campaign_key, variable_key, user_i
     vwo_instance.logger.set_api(API_METHODS.GET_FEATURE_VARIABLE_VALUE)
 
     if vwo_instance.is_opted_out:
-        vwo_instance.logger.log(
+        vwo_instance.logger.lazy_log(
             LogLevelEnum.INFO,
-            LogMessageEnum.INFO_MESSAGES.API_NOT_ENABLED.format(file=FILE, api=API_METHODS.GET_FEATURE_VARIABLE_VALUE),
+            LogMessageEnum.INFO_MESSAGES.API_NOT_ENABLED,
+            file=FILE,
+            api=API_METHODS.GET_FEATURE_VARIABLE_VALUE,
         )
 
         return None
@@ -71,14 +73,14 @@ def _get_feature_variable_value(vwo_instance, campaign_key, variable_key, user_i
             variation_targeting_variables is not None and not validate_util.is_valid_dict(variation_targeting_variables)
         )
     ):  # noqa: E501
-        vwo_instance.logger.log(
-            LogLevelEnum.ERROR,
-            LogMessageEnum.ERROR_MESSAGES.GET_FEATURE_VARIABLE_VALUE_API_INVALID_PARAMS.format(file=FILE),
+        vwo_instance.logger.lazy_log(
+            LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.GET_FEATURE_VARIABLE_VALUE_API_INVALID_PARAMS, file=FILE
         )
         return None
 
-    # Get the campaign settings
-    campaign = campaign_util.get_campaign(vwo_instance.settings_file, campaign_key)
+    # Get the campaign settings, from the same settings_file the decision and impression are based on
+    snapshot = vwo_instance.config.get_snapshot()
+    campaign = snapshot.get_campaign(campaign_key)
 
     # Validate campaign
     if not campaign:
@@ -87,11 +89,13 @@ def _get_feature_variable_value(vwo_instance, campaign_key, variable_key, user_i
     campaign_type = campaign.get("type")
 
     if campaign_type == constants.CAMPAIGN_TYPES.VISUAL_AB:
-        vwo_instance.logger.log(
+        vwo_instance.logger.lazy_log(
             LogLevelEnum.ERROR,
-            LogMessageEnum.ERROR_MESSAGES.INVALID_API.format(
-                file=FILE, campaign_key=campaign_key, campaign_type=campaign_type, user_id=user_id
-            ),
+            LogMessageEnum.ERROR_MESSAGES.INVALID_API,
+            file=FILE,
+            campaign_key=campaign_key,
+            campaign_type=campaign_type,
+            user_id=user_id,
         )
         return None
 
@@ -101,6 +105,7 @@ def _get_feature_variable_value(vwo_instance, campaign_key, variable_key, user_i
         custom_variables=custom_variables,
         variation_targeting_variables=variation_targeting_variables,
         api_method=constants.API_METHODS.GET_FEATURE_VARIABLE_VALUE,
+        snapshot=snapshot,
     )  # noqa: E501
 
     # Check if variation has been assigned to user
@@ -115,19 +120,21 @@ def _get_feature_variable_value(vwo_instance, campaign_key, variable_key, user_i
 
     elif campaign_type == constants.CAMPAIGN_TYPES.FEATURE_TEST:
         if variation.get("isFeatureEnabled") is False:
-            vwo_instance.logger.log(
+            vwo_instance.logger.lazy_log(
                 LogLevelEnum.INFO,
-                LogMessageEnum.INFO_MESSAGES.FEATURE_NOT_ENABLED_FOR_USER.format(
-                    file=FILE, feature_key=campaign_key, user_id=user_id
-                ),
+                LogMessageEnum.INFO_MESSAGES.FEATURE_NOT_ENABLED_FOR_USER,
+                file=FILE,
+                feature_key=campaign_key,
+                user_id=user_id,
             )
             variation = campaign_util.get_control_variation(campaign)
         else:
-            vwo_instance.logger.log(
+            vwo_instance.logger.lazy_log(
                 LogLevelEnum.INFO,
-                LogMessageEnum.INFO_MESSAGES.FEATURE_ENABLED_FOR_USER.format(
-                    file=FILE, feature_key=campaign_key, user_id=user_id
-                ),
+                LogMessageEnum.INFO_MESSAGES.FEATURE_ENABLED_FOR_USER,
+                file=FILE,
+                feature_key=campaign_key,
+                user_id=user_id,
             )
         variables = variation.get("variables")
 
@@ -135,28 +142,26 @@ def _get_feature_variable_value(vwo_instance, campaign_key, variable_key, user_i
 
     if not variable:
         # Log variable not found
-        vwo_instance.logger.log(
+        vwo_instance.logger.lazy_log(
             LogLevelEnum.ERROR,
-            LogMessageEnum.ERROR_MESSAGES.VARIABLE_NOT_FOUND.format(
-                file=FILE,
-                variable_key=variable_key,
-                campaign_key=campaign_key,
-                campaign_type=campaign_type,
-                user_id=user_id,
-            ),
-        )
-        return None
-
-    vwo_instance.logger.log(
-        LogLevelEnum.INFO,
-        LogMessageEnum.INFO_MESSAGES.VARIABLE_FOUND.format(
+            LogMessageEnum.ERROR_MESSAGES.VARIABLE_NOT_FOUND,
             file=FILE,
             variable_key=variable_key,
-            variable_value=variable.get("value"),
             campaign_key=campaign_key,
             campaign_type=campaign_type,
             user_id=user_id,
-        ),
+        )
+        return None
+
+    vwo_instance.logger.lazy_log(
+        LogLevelEnum.INFO,
+        LogMessageEnum.INFO_MESSAGES.VARIABLE_FOUND,
+        file=FILE,
+        variable_key=variable_key,
+        variable_value=variable.get("value"),
+        campaign_key=campaign_key,
+        campaign_type=campaign_type,
+        user_id=user_id,
     )
 
     return feature_util.get_type_casted_feature_value(variable.get("value"), variable.get("type"))
@@ -14,7 +14,7 @@
 
 from ..constants import constants
 from ..constants.constants import API_METHODS
-from ..helpers import campaign_util, validate_util
+from ..helpers import validate_util
 from ..enums.log_message_enum import LogMessageEnum
 from ..enums.file_name_enum import FileNameEnum
 from ..enums.log_level_enum import LogLevelEnum
@@ -49,9 +49,11 @@ def _get_variation_name(vwo_instance, campaign_key, user_id, **kwargs):
     vwo_instance.logger.set_api(API_METHODS.GET_VARIATION_NAME)
 
     if vwo_instance.is_opted_out:
-        vwo_instance.logger.log(
+        vwo_instance.logger.lazy_log(
             LogLevelEnum.INFO,
-            LogMessageEnum.INFO_MESSAGES.API_NOT_ENABLED.format(file=FILE, api=API_METHODS.GET_VARIATION_NAME),
+            LogMessageEnum.INFO_MESSAGES.API_NOT_ENABLED,
+            file=FILE,
+            api=API_METHODS.GET_VARIATION_NAME,
         )
 
         return None
@@ -70,13 +72,14 @@ def _get_variation_name(vwo_instance, campaign_key, user_id, **kwargs):
         )
     ):  # noqa: E501
         # log invalid params
-        vwo_instance.logger.log(
-            LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.GET_VARIATION_NAME_API_INVALID_PARAMS.format(file=FILE)
+        vwo_instance.logger.lazy_log(
+            LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.GET_VARIATION_NAME_API_INVALID_PARAMS, file=FILE
         )
         return None
 
-    # Get the campaign settings
-    campaign = campaign_util.get_campaign(vwo_instance.settings_file, campaign_key)
+    # Get the campaign settings, from the same settings_file the decision and impression are based on
+    snapshot = vwo_instance.config.get_snapshot()
+    campaign = snapshot.get_campaign(campaign_key)
 
     # Validate campaign
     if not campaign:
@@ -85,11 +88,13 @@ def _get_variation_name(vwo_instance, campaign_key, user_id, **kwargs):
     campaign_type = campaign.get("type")
 
     if campaign_type == constants.CAMPAIGN_TYPES.FEATURE_ROLLOUT:
-        vwo_instance.logger.log(
+        vwo_instance.logger.lazy_log(
             LogLevelEnum.ERROR,
-            LogMessageEnum.ERROR_MESSAGES.INVALID_API.format(
-                file=FILE, user_id=user_id, campaign_key=campaign_key, campaign_type=campaign_type
-            ),
+            LogMessageEnum.ERROR_MESSAGES.INVALID_API,
+            file=FILE,
+            user_id=user_id,
+            campaign_key=campaign_key,
+            campaign_type=campaign_type,
         )
         return None
 
@@ -99,6 +104,7 @@ def _get_variation_name(vwo_instance, campaign_key, user_id, **kwargs):
         custom_variables=custom_variables,
         variation_targeting_variables=variation_targeting_variables,
         api_method=constants.API_METHODS.GET_VARIATION_NAME,
+        snapshot=snapshot,
     )  # noqa: E501
 
     # Check if variation_name has been assigned
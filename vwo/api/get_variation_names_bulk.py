@@ -0,0 +1,93 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from ..constants import constants
+from ..constants.constants import API_METHODS
+from ..helpers import validate_util
+from ..enums.log_message_enum import LogMessageEnum
+from ..enums.file_name_enum import FileNameEnum
+from ..enums.log_level_enum import LogLevelEnum
+
+FILE = FileNameEnum.Api.GetVariationNamesBulk
+
+
+def _get_variation_names_bulk(vwo_instance, campaign_key, user_ids):
+    """This API method: Gets the variation names assigned for a batch of
+        users for the campaign, e.g. for offline analysis or pre-computing
+        assignments.
+
+    1. Validates the arguments being passed
+    2. Checks which users are eligible to get bucketed into the campaign
+    3. Assigns the determinitic variation to each eligible user(based on userId)
+
+    Unlike get_variation_name, whitelisting, pre-segmentation, UserStorage and
+    mutually exclusive groups are not evaluated and no impression is sent.
+
+    Args:
+        campaign_key (string): unique campaign key
+        user_ids (list): IDs assigned to users
+
+    Returns:
+        dict|None: user_id to variation-name, variation-name being None in case of
+            user not becoming part. None if arguments or campaign are invalid
+    """
+
+    vwo_instance.logger.set_api(API_METHODS.GET_VARIATION_NAMES_BULK)
+
+    if vwo_instance.is_opted_out:
+        vwo_instance.logger.lazy_log(
+            LogLevelEnum.INFO,
+            LogMessageEnum.INFO_MESSAGES.API_NOT_ENABLED,
+            file=FILE,
+            api=API_METHODS.GET_VARIATION_NAMES_BULK,
+        )
+
+        return None
+
+    # Check for valid arguments
+    if (
+        not validate_util.is_valid_string(campaign_key)
+        or not isinstance(user_ids, (list, tuple))
+        or not all(validate_util.is_valid_string(user_id) for user_id in user_ids)
+    ):
+        # log invalid params
+        vwo_instance.logger.lazy_log(
+            LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.GET_VARIATION_NAMES_BULK_API_INVALID_PARAMS, file=FILE
+        )
+        return None
+
+    # Get the campaign settings, from the same settings_file the users are bucketed with
+    snapshot = vwo_instance.config.get_snapshot()
+    campaign = snapshot.get_campaign(campaign_key)
+
+    # Validate campaign
+    if not campaign:
+        return None
+
+    campaign_type = campaign.get("type")
+
+    if campaign_type == constants.CAMPAIGN_TYPES.FEATURE_ROLLOUT:
+        vwo_instance.logger.lazy_log(
+            LogLevelEnum.ERROR,
+            LogMessageEnum.ERROR_MESSAGES.INVALID_API,
+            file=FILE,
+            user_id=user_ids,
+            campaign_key=campaign_key,
+            campaign_type=campaign_type,
+        )
+        return None
+
+    variations = vwo_instance.variation_decider.bucket_users(user_ids, campaign, snapshot=snapshot)
+
+    return {user_id: variation.get("name") if variation else None for user_id, variation in zip(user_ids, variations)}
@@ -15,7 +15,7 @@
 from ..helpers import impression_util
 from ..constants import constants
 from ..constants.constants import API_METHODS
-from ..helpers import campaign_util, validate_util
+from ..helpers import validate_util
 from ..enums.log_message_enum import LogMessageEnum
 from ..enums.file_name_enum import FileNameEnum
 from ..enums.log_level_enum import LogLevelEnum
@@ -51,9 +51,11 @@ def _is_feature_enabled(vwo_instance, campaign_key, user_id, **kwargs):
     vwo_instance.logger.set_api(API_METHODS.IS_FEATURE_ENABLED)
 
     if vwo_instance.is_opted_out:
-        vwo_instance.logger.log(
+        vwo_instance.logger.lazy_log(
             LogLevelEnum.INFO,
-            LogMessageEnum.INFO_MESSAGES.API_NOT_ENABLED.format(file=FILE, api=API_METHODS.IS_FEATURE_ENABLED),
+            LogMessageEnum.INFO_MESSAGES.API_NOT_ENABLED,
+            file=FILE,
+            api=API_METHODS.IS_FEATURE_ENABLED,
         )
 
         return False
@@ -74,13 +76,14 @@ def _is_feature_enabled(vwo_instance, campaign_key, user_id, **kwargs):
         )
     ):  # noqa: E501
         # log invalid params
-        vwo_instance.logger.log(
-            LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.IS_FEATURE_ENABLED_API_INVALID_PARAMS.format(file=FILE)
+        vwo_instance.logger.lazy_log(
+            LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.IS_FEATURE_ENABLED_API_INVALID_PARAMS, file=FILE
         )
         return False
 
-    # Get the campaign settings
-    campaign = campaign_util.get_campaign(vwo_instance.settings_file, campaign_key)
+    # Get the campaign settings, from the same settings_file the decision and impression are based on
+    snapshot = vwo_instance.config.get_snapshot()
+    campaign = snapshot.get_campaign(campaign_key)
 
     # Validate campaign
     if not campaign:
@@ -88,9 +91,11 @@ def _is_feature_enabled(vwo_instance, campaign_key, user_id, **kwargs):
 
     # check if user storage attached if MAB activated for campaign
     if campaign.get("isMAB") and vwo_instance.variation_decider.user_storage is None:
-        vwo_instance.logger.log(
+        vwo_instance.logger.lazy_log(
             LogLevelEnum.ERROR,
-            LogMessageEnum.ERROR_MESSAGES.NO_USERSTORAGE_WITH_MAB.format(file=FILE, campaign_key=campaign_key),
+            LogMessageEnum.ERROR_MESSAGES.NO_USERSTORAGE_WITH_MAB,
+            file=FILE,
+            campaign_key=campaign_key,
         )
         return False
 
@@ -98,11 +103,13 @@ def _is_feature_enabled(vwo_instance, campaign_key, user_id, **kwargs):
     campaign_type = campaign.get("type")
 
     if campaign_type == constants.CAMPAIGN_TYPES.VISUAL_AB:
-        vwo_instance.logger.log(
+        vwo_instance.logger.lazy_log(
             LogLevelEnum.ERROR,
-            LogMessageEnum.ERROR_MESSAGES.INVALID_API.format(
-                file=FILE, user_id=user_id, campaign_key=campaign_key, campaign_type=campaign_type
-            ),
+            LogMessageEnum.ERROR_MESSAGES.INVALID_API,
+            file=FILE,
+            user_id=user_id,
+            campaign_key=campaign_key,
+            campaign_type=campaign_type,
         )
         return False
 
@@ -113,6 +120,7 @@ def _is_feature_enabled(vwo_instance, campaign_key, user_id, **kwargs):
         custom_variables=custom_variables,
         variation_targeting_variables=variation_targeting_variables,
         api_method=constants.API_METHODS.IS_FEATURE_ENABLED,
+        snapshot=snapshot,
     )  # noqa: E501
 
     # If no variation, did not become part of feature_test/rollout
@@ -130,38 +138,37 @@ def _is_feature_enabled(vwo_instance, campaign_key, user_id, **kwargs):
                 user_id,
                 user_agent=user_agent,
                 user_ip_address=user_ip_address,
+                settings_file=snapshot.settings_file,
             )
 
             vwo_instance.event_dispatcher.dispatch(impression)
-            vwo_instance.logger.log(
+            vwo_instance.logger.lazy_log(
                 LogLevelEnum.INFO,
-                LogMessageEnum.INFO_MESSAGES.MAIN_KEYS_FOR_IMPRESSION.format(
-                    file=FILE,
-                    campaign_id=impression.get("experiment_id"),
-                    account_id=impression.get("account_id"),
-                    variation_id=impression.get("combination"),
-                ),
+                LogMessageEnum.INFO_MESSAGES.MAIN_KEYS_FOR_IMPRESSION,
+                file=FILE,
+                campaign_id=impression.get("experiment_id"),
+                account_id=impression.get("account_id"),
+                variation_id=impression.get("combination"),
             )
         else:
             params = impression_util.get_events_params(
-                vwo_instance.settings_file,
+                snapshot.settings_file,
                 constants.EVENTS.VWO_VARIATION_SHOWN,
                 user_agent=user_agent,
                 user_ip_address=user_ip_address,
             )
             impression = impression_util.create_track_user_events_impression(
-                vwo_instance.settings_file, campaign.get("id"), variation.get("id"), user_id, custom_properties
+                snapshot.settings_file, campaign.get("id"), variation.get("id"), user_id, custom_properties
             )
             vwo_instance.event_dispatcher.dispatch_events(params=params, impression=impression)
     else:
-        vwo_instance.logger.log(
+        vwo_instance.logger.lazy_log(
             LogLevelEnum.INFO,
-            LogMessageEnum.INFO_MESSAGES.USER_ALREADY_TRACKED.format(
-                file=FILE,
-                user_id=user_id,
-                campaign_key=campaign_key,
-                api_method=constants.API_METHODS.IS_FEATURE_ENABLED,
-            ),
+            LogMessageEnum.INFO_MESSAGES.USER_ALREADY_TRACKED,
+            file=FILE,
+            user_id=user_id,
+            campaign_key=campaign_key,
+            api_method=constants.API_METHODS.IS_FEATURE_ENABLED,
         )
 
     # set True as default for feature rollout campaigns
@@ -170,17 +177,19 @@ def _is_feature_enabled(vwo_instance, campaign_key, user_id, **kwargs):
         result = variation.get("isFeatureEnabled")
 
     if result:
-        vwo_instance.logger.log(
+        vwo_instance.logger.lazy_log(
             LogLevelEnum.INFO,
-            LogMessageEnum.INFO_MESSAGES.FEATURE_ENABLED_FOR_USER.format(
-                file=FILE, user_id=user_id, feature_key=campaign_key
-            ),
+            LogMessageEnum.INFO_MESSAGES.FEATURE_ENABLED_FOR_USER,
+            file=FILE,
+            user_id=user_id,
+            feature_key=campaign_key,
         )
     else:
-        vwo_instance.logger.log(
+        vwo_instance.logger.lazy_log(
             LogLevelEnum.INFO,
-            LogMessageEnum.INFO_MESSAGES.FEATURE_NOT_ENABLED_FOR_USER.format(
-                file=FILE, user_id=user_id, feature_key=campaign_key
-            ),
+            LogMessageEnum.INFO_MESSAGES.FEATURE_NOT_ENABLED_FOR_USER,
+            file=FILE,
+            user_id=user_id,
+            feature_key=campaign_key,
         )
     return result
@@ -16,10 +16,13 @@ from ..enums.file_name_enum import FileNameEnum
 from ..enums.log_level_enum import LogLevelEnum
 from ..enums.log_message_enum import LogMessageEnum
 from ..helpers import validate_util
+from ..services.settings_cache import SettingsCache
+from ..services.shared_settings import SharedSettings
 from ..services.usage_stats_manager import UsageStats
 from ..vwo import VWO
 from ..logger import VWOLogger
 from ..storage.redis import RedisUserStorage
+from ..storage.cache import CachedUserStorage
 
 FILE = FileNameEnum.Api.Launch
 
@@ -43,14 +46,80 @@ def launch(settings_file, logger=None, user_storage=None, is_development_mode=Fa
         Default value is vwo.LOG_LEVELS.ERROR
         goal_type_to_track (vwo.GOAL_TYPES): which goal type to track when using track
         api. Default value is vwo.GOAL_TYPES.ALL
-        batch_events (dict): settings for configuring and enabling event batching
+        batch_events (dict): settings for configuring and enabling event batching i.e. events_per_request,
+        request_time_interval, flush_callback, max_queue_size, max_in_flight_requests, and compression i.e.
+        gzip or deflate for compressing batches of at least compression_threshold bytes (default: 1024), and
+        max_retries (default: 3) and retry_backoff i.e. base seconds (default: 1) for retrying failed batches
         integrations (object): an integrations service instance for third party integrations
-
+        user_storage_cache (dict): options of CachedUserStorage i.e. max_size, ttl, negative_ttl
+        and cache_misses, for caching user_storage in-process. Pass an empty dict for defaults
+        redis_creds (dict): url, user_id, password and other options of RedisUserStorage i.e. port, db,
+        max_connections, socket_timeout, socket_connect_timeout, retries, ttl, encoding and write_behind
+        options, used as user_storage if user_storage is not passed
+        settings_poller (dict): options for fetching the settings_file in the background i.e. interval,
+        jitter, account_id and sdk_key, the latter two default to those of the settings_file.
+        Pass an empty dict for defaults
+        settings_cache_dir (str): directory to cache the last good settings_file in. The settings_file
+        passed is processed only if it isn't the one cached, and the cached one is used if the one passed
+        isn't valid e.g. when fetching it failed. Pair it with settings_poller to refresh in the background
+        shared_settings_path (str): file, preferably on tmpfs e.g. /dev/shm, through which processes share
+        the processed settings_file. Launch with the settings_file to publish it e.g. in the master process
+        of a pre-fork server, and with None as settings_file to attach to it without validating or parsing
+        it e.g. in the workers. Updates made by any of them are picked up by all. Each process still holds its
+        own copy of the processed settings_file. The processes must run as the same user, as the file is
+        trusted only if owned by it. Can't be used along with settings_cache_dir
+        settings_update_callback (function): called whenever the settings_file is updated, with a dict having
+        keys of the added_campaigns, changed_campaigns and removed_campaigns, and is_other_settings_changed
+        instrumentation_sink (function): enables instrumentation of the decision APIs, called with a DecisionTrace
+        having the time spent in each stage e.g. whitelisting, user_storage_get, bucketing, meg or dispatch and
+        counters e.g. of UserStorage calls, once each call returns. Use a HistogramSink, StatsdSink or SpanSink
+        of vwo.services.instrumentation, or any function
 
     Returns:
         VWO object: Successfully creates and returns a VWO object with passed params
         if all the params are valid else None
     """
+    return _launch(VWO, settings_file, logger, user_storage, is_development_mode, **kwargs)
+
+
+def launch_async(settings_file, logger=None, user_storage=None, is_development_mode=False, **kwargs):
+    """Launch api for asyncio apps, accepts the same params as launch and returns an AsyncVWO instance,
+    whose APIs doing network or UserStorage I/O are coroutines.
+
+    Args:
+        settings_file (json_string): stringified json representing the settings_file consisting all
+            the campaign related data
+        logger (object): an object capable of logging events happening inside the SDK
+        user_storage (object): an AsyncUserStorage, or a UserStorage, object capable of doing get and set on
+        SDK provide data
+        is_development_mode (bool): should the SDK be initialized in development mode,
+        it toggles the event_dispatcher to off
+
+    Keyword Args:
+        see launch, user_storage_cache can't be used with an AsyncUserStorage
+
+    Returns:
+        AsyncVWO object: Successfully creates and returns an AsyncVWO object with passed params
+        if all the params are valid else None
+    """
+    from ..async_vwo import AsyncVWO
+
+    return _launch(AsyncVWO, settings_file, logger, user_storage, is_development_mode, **kwargs)
+
+
+def _launch(vwo_class, settings_file, logger, user_storage, is_development_mode, **kwargs):
+    """Validates the params and creates the instance, shared by launch and launch_async
+
+    Args:
+        vwo_class (class): VWO or AsyncVWO
+        settings_file, logger, user_storage, is_development_mode: see launch
+
+    Keyword Args:
+        see launch
+
+    Returns:
+        VWO|AsyncVWO object: instance of vwo_class if all the params are valid else None
+    """
     VWOLogger.clearExistingLoggerInstance()
 
     log_level = kwargs.get("log_level")
@@ -58,10 +127,12 @@ def launch(settings_file, logger=None, user_storage=None, is_development_mode=Fa
     batch_event_settings = kwargs.get("batch_events")
     integrations = kwargs.get("integrations")
     redis_creds = kwargs.get("redis_creds")
-
-    # if user storage not set, but redis creds are set, set redis to default user storage
-    if not user_storage and redis_creds:
-        user_storage = RedisUserStorage(redis_creds.get("url"), redis_creds.get("user_id"), redis_creds.get("password"))
+    user_storage_cache = kwargs.get("user_storage_cache")
+    settings_poller_settings = kwargs.get("settings_poller")
+    settings_cache_dir = kwargs.get("settings_cache_dir")
+    shared_settings_path = kwargs.get("shared_settings_path")
+    settings_update_callback = kwargs.get("settings_update_callback")
+    instrumentation_sink = kwargs.get("instrumentation_sink")
 
     invalid_log_level = False
     if log_level and not validate_util.is_valid_log_level(log_level):
@@ -74,11 +145,50 @@ def launch(settings_file, logger=None, user_storage=None, is_development_mode=Fa
         invalid_logger = True
     module_logger = VWOLogger.getInstance(log_level=log_level, logger=logger)
 
+    # validated below unless attaching to a settings_file shared by another process
+    is_valid_settings_file = None
+    invalid_settings_cache = False
+    settings_cache = None
+    shared_settings = None
+    if (settings_cache_dir is not None and not validate_util.is_valid_string(settings_cache_dir)) or (
+        shared_settings_path is not None
+        and (not validate_util.is_valid_string(shared_settings_path) or settings_cache_dir is not None)
+    ):
+        invalid_settings_cache = True
+    elif shared_settings_path is not None:
+        shared_settings = SharedSettings(shared_settings_path)
+        if settings_file is None:
+            # published by a process which launched with it, hence validated already
+            settings_file = shared_settings.get_settings_file()
+            is_valid_settings_file = settings_file is not None
+    elif settings_cache_dir is not None:
+        settings_cache = SettingsCache(settings_cache_dir)
+        # the settings_file cached was validated before being cached, so the same one isn't validated again
+        is_valid_settings_file = settings_cache.is_cached(settings_file) or validate_util.is_valid_settings_file(
+            settings_file
+        )
+        cached_settings_file = None if is_valid_settings_file else settings_cache.get_settings_file()
+        if cached_settings_file is not None:
+            module_logger.lazy_log(
+                LogLevelEnum.INFO,
+                LogMessageEnum.INFO_MESSAGES.CACHED_SETTINGS_FILE_USED,
+                file=FILE,
+                cache_dir=settings_cache_dir,
+            )
+            settings_file = cached_settings_file
+            is_valid_settings_file = settings_cache.is_cached(settings_file) or validate_util.is_valid_settings_file(
+                settings_file
+            )
+
+    if is_valid_settings_file is None:
+        is_valid_settings_file = validate_util.is_valid_settings_file(settings_file)
+
     if (
         invalid_log_level
         or invalid_logger
+        or invalid_settings_cache
         or (user_storage and not validate_util.is_valid_service(user_storage, "user_storage"))
-        or not validate_util.is_valid_settings_file(settings_file)
+        or not is_valid_settings_file
         or (is_development_mode and type(is_development_mode) is not bool)
         or (goal_type_to_track and not validate_util.is_valid_goal_type(goal_type_to_track))
         or (
@@ -86,11 +196,28 @@ def launch(settings_file, logger=None, user_storage=None, is_development_mode=Fa
             and not validate_util.is_valid_batch_event_settings(val=batch_event_settings, file=FILE)
         )
         or (integrations and not validate_util.is_valid_service(integrations, "integrations"))
+        or (user_storage_cache is not None and not validate_util.is_valid_user_storage_cache(user_storage_cache))
+        or (user_storage_cache is not None and user_storage and not validate_util.is_cacheable_service(user_storage))
+        or (not user_storage and redis_creds and not validate_util.is_valid_redis_creds(redis_creds))
+        or (
+            settings_update_callback is not None
+            and not validate_util.is_valid_settings_update_callback(settings_update_callback)
+        )
+        or (instrumentation_sink is not None and not validate_util.is_valid_instrumentation_sink(instrumentation_sink))
+        or (
+            settings_poller_settings is not None
+            and not validate_util.is_valid_settings_poller_settings(settings_poller_settings)
+        )
     ):
-        module_logger.log(LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.LAUNCH_API_INVALID_PARAMS.format(file=FILE))
+        module_logger.lazy_log(LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.LAUNCH_API_INVALID_PARAMS, file=FILE)
         return None
     else:
-        module_logger.log(LogLevelEnum.DEBUG, LogMessageEnum.DEBUG_MESSAGES.VALID_CONFIGURATION.format(file=FILE))
+        module_logger.lazy_log(LogLevelEnum.DEBUG, LogMessageEnum.DEBUG_MESSAGES.VALID_CONFIGURATION, file=FILE)
+        # if user storage not set, but redis creds are set, set redis to default user storage
+        if not user_storage and redis_creds:
+            user_storage = RedisUserStorage(**redis_creds)
+        if user_storage and user_storage_cache is not None:
+            user_storage = CachedUserStorage(user_storage, **user_storage_cache)
         if not is_development_mode:
             UsageStats.collect_usage_stats(
                 batch_event_settings=batch_event_settings,
@@ -100,6 +227,16 @@ def launch(settings_file, logger=None, user_storage=None, is_development_mode=Fa
                 log_level=log_level,
                 goal_type_to_track=goal_type_to_track,
             )
-        return VWO(
-            settings_file, user_storage, is_development_mode, goal_type_to_track, batch_event_settings, integrations
+        return vwo_class(
+            settings_file,
+            user_storage,
+            is_development_mode,
+            goal_type_to_track,
+            batch_event_settings,
+            integrations,
+            settings_poller_settings,
+            settings_cache,
+            shared_settings,
+            settings_update_callback,
+            instrumentation_sink,
         )
@@ -44,8 +44,8 @@ def _push(vwo_instance, tag_key="", tag_value="", user_id="", custom_dimension_m
     vwo_instance.logger.set_api(API_METHODS.PUSH)
 
     if vwo_instance.is_opted_out:
-        vwo_instance.logger.log(
-            LogLevelEnum.INFO, LogMessageEnum.INFO_MESSAGES.API_NOT_ENABLED.format(file=FILE, api=API_METHODS.PUSH)
+        vwo_instance.logger.lazy_log(
+            LogLevelEnum.INFO, LogMessageEnum.INFO_MESSAGES.API_NOT_ENABLED, file=FILE, api=API_METHODS.PUSH
         )
 
         return False
@@ -69,53 +69,56 @@ def _push(vwo_instance, tag_key="", tag_value="", user_id="", custom_dimension_m
         or (not custom_dimension_map and not validate_util.is_valid_string(tag_value))
         or not validate_util.is_valid_string(user_id)
     ):
-        vwo_instance.logger.log(
-            LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.PUSH_API_INVALID_PARAMS.format(file=FILE)
+        vwo_instance.logger.lazy_log(
+            LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.PUSH_API_INVALID_PARAMS, file=FILE
         )
         return False
 
     if not is_multiple_custom_dimension_used and len(tag_key) > constants.PUSH_API.TAG_KEY_LENGTH:
-        vwo_instance.logger.log(
+        vwo_instance.logger.lazy_log(
             LogLevelEnum.ERROR,
-            LogMessageEnum.ERROR_MESSAGES.TAG_KEY_LENGTH_EXCEEDED.format(file=FILE, user_id=user_id, tag_key=tag_key),
+            LogMessageEnum.ERROR_MESSAGES.TAG_KEY_LENGTH_EXCEEDED,
+            file=FILE,
+            user_id=user_id,
+            tag_key=tag_key,
         )
         return False
 
     if not is_multiple_custom_dimension_used and len(tag_value) > constants.PUSH_API.TAG_VALUE_LENGTH:
-        vwo_instance.logger.log(
+        vwo_instance.logger.lazy_log(
             LogLevelEnum.ERROR,
-            LogMessageEnum.ERROR_MESSAGES.TAG_VALUE_LENGTH_EXCEEDED.format(
-                file=FILE, user_id=user_id, tag_value=tag_value
-            ),
+            LogMessageEnum.ERROR_MESSAGES.TAG_VALUE_LENGTH_EXCEEDED,
+            file=FILE,
+            user_id=user_id,
+            tag_value=tag_value,
         )
         return False
 
     if not custom_dimension_map:
         custom_dimension_map = dict([(tag_key, tag_value)])
 
+    # Read the settings_file once, all the impressions are built from the same one
+    settings_file = vwo_instance.config.get_snapshot().settings_file
     if not vwo_instance.is_event_arch_enabled or vwo_instance.is_event_batching_enabled is True:
 
         for key, value in custom_dimension_map.items():
-            impression = custom_dimensions_util.get_url_params(vwo_instance.settings_file, key, value, user_id)
+            impression = custom_dimensions_util.get_url_params(settings_file, key, value, user_id)
 
             vwo_instance.event_dispatcher.dispatch(impression)
 
-            vwo_instance.logger.log(
+            vwo_instance.logger.lazy_log(
                 LogLevelEnum.INFO,
-                LogMessageEnum.INFO_MESSAGES.MAIN_KEYS_FOR_PUSH_API.format(
-                    file=FILE,
-                    u=impression.get("u"),
-                    account_id=impression.get("account_id"),
-                    tags=impression.get("tags"),
-                ),
+                LogMessageEnum.INFO_MESSAGES.MAIN_KEYS_FOR_PUSH_API,
+                file=FILE,
+                u=impression.get("u"),
+                account_id=impression.get("account_id"),
+                tags=impression.get("tags"),
             )
     else:
         params = impression_util.get_events_params(
-            vwo_instance.settings_file, constants.EVENTS.VWO_SYNC_VISITOR_PROP, user_agent=None, user_ip_address=None
-        )
-        impression = impression_util.create_push_events_impression(
-            vwo_instance.settings_file, user_id, custom_dimension_map
+            settings_file, constants.EVENTS.VWO_SYNC_VISITOR_PROP, user_agent=None, user_ip_address=None
         )
+        impression = impression_util.create_push_events_impression(settings_file, user_id, custom_dimension_map)
         vwo_instance.event_dispatcher.dispatch_events(params=params, impression=impression)
 
     return True
@@ -31,14 +31,17 @@ def _set_opt_out(vwo_instance):
 
     vwo_instance.logger.set_api(API_METHODS.SET_OPT_OUT)
 
-    vwo_instance.logger.log(LogLevelEnum.INFO, LogMessageEnum.INFO_MESSAGES.OPT_OUT_API_CALLED.format(file=FILE))
+    vwo_instance.logger.lazy_log(LogLevelEnum.INFO, LogMessageEnum.INFO_MESSAGES.OPT_OUT_API_CALLED, file=FILE)
 
     vwo_instance.is_opted_out = True
-    vwo_instance.settings_file = None
+
+    if vwo_instance.settings_poller:
+        vwo_instance.settings_poller.stop()
 
     if vwo_instance.is_event_batching_enabled:
-        vwo_instance.event_dispatcher.flush_queue(manual=True, mode="sync")
+        vwo_instance.event_dispatcher.shutdown()
 
+    vwo_instance.settings_poller = None
     vwo_instance.event_dispatcher = None
     vwo_instance.variation_decider = None
     vwo_instance.config = None
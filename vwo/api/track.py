@@ -54,8 +54,8 @@ def _track(vwo_instance, campaign_specifier, user_id, goal_identifier, **kwargs)
     vwo_instance.logger.set_api(API_METHODS.TRACK)
 
     if vwo_instance.is_opted_out:
-        vwo_instance.logger.log(
-            LogLevelEnum.INFO, LogMessageEnum.INFO_MESSAGES.API_NOT_ENABLED.format(file=FILE, api=API_METHODS.TRACK)
+        vwo_instance.logger.lazy_log(
+            LogLevelEnum.INFO, LogMessageEnum.INFO_MESSAGES.API_NOT_ENABLED, file=FILE, api=API_METHODS.TRACK
         )
 
         return None
@@ -87,35 +87,38 @@ def _track(vwo_instance, campaign_specifier, user_id, goal_identifier, **kwargs)
         valid_params = False
 
     if not valid_params:
-        vwo_instance.logger.log(
-            LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.TRACK_API_INVALID_PARAMS.format(file=FILE)
+        vwo_instance.logger.lazy_log(
+            LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.TRACK_API_INVALID_PARAMS, file=FILE
         )
         return None
 
+    # Read the settings once, the decisions and impressions are based on the same settings_file
+    snapshot = vwo_instance.config.get_snapshot()
     campaigns_without_goal = []
     no_campaign_found = False
     if type(campaign_specifier) is str:
-        campaign = campaign_util.get_campaign(vwo_instance.settings_file, campaign_specifier)
+        campaign = snapshot.get_campaign(campaign_specifier)
         goal = campaign_util.get_campaign_goal(campaign, goal_identifier)
         if not goal:
             no_campaign_found = True
         else:
             campaign_goal_list = [(campaign, goal)]
     elif type(campaign_specifier) is list:
-        campaigns = campaign_util.get_campaigns(vwo_instance.settings_file, campaign_specifier).values()
+        campaigns = snapshot.get_campaigns(campaign_specifier).values()
         (campaign_goal_list, campaigns_without_goal) = campaign_util.get_campaigns_with_goal_id(
             campaigns, goal_identifier
         )
         for campaign in campaigns_without_goal:
-            vwo_instance.logger.log(
+            vwo_instance.logger.lazy_log(
                 LogLevelEnum.ERROR,
-                LogMessageEnum.ERROR_MESSAGES.TRACK_API_GOAL_NOT_FOUND.format(
-                    file=FILE, goal_identifier=goal_identifier, user_id=user_id, campaign_key=campaign.get("key")
-                ),
+                LogMessageEnum.ERROR_MESSAGES.TRACK_API_GOAL_NOT_FOUND,
+                file=FILE,
+                goal_identifier=goal_identifier,
+                user_id=user_id,
+                campaign_key=campaign.get("key"),
             )
     elif campaign_specifier is None:
-        campaigns = vwo_instance.settings_file.get("campaigns")
-        campaign_goal_list = campaign_util.get_campaigns_with_goal_id(campaigns, goal_identifier)[0]
+        campaign_goal_list = snapshot.get_goal_campaigns(goal_identifier)
         if not campaign_goal_list:
             no_campaign_found = True
     else:
@@ -127,9 +130,11 @@ def _track(vwo_instance, campaign_specifier, user_id, goal_identifier, **kwargs)
         return None
 
     if no_campaign_found:
-        vwo_instance.logger.log(
+        vwo_instance.logger.lazy_log(
             LogLevelEnum.ERROR,
-            LogMessageEnum.ERROR_MESSAGES.NO_CAMPAIGN_FOUND.format(file=FILE, goal_identifier=goal_identifier),
+            LogMessageEnum.ERROR_MESSAGES.NO_CAMPAIGN_FOUND,
+            file=FILE,
+            goal_identifier=goal_identifier,
         )
         return None
 
@@ -138,11 +143,11 @@ def _track(vwo_instance, campaign_specifier, user_id, goal_identifier, **kwargs)
     for campaign, goal in campaign_goal_list:
         # check if user storage attached if MAB activated for campaign
         if campaign.get("isMAB") and vwo_instance.variation_decider.user_storage is None:
-            vwo_instance.logger.log(
+            vwo_instance.logger.lazy_log(
                 LogLevelEnum.ERROR,
-                LogMessageEnum.ERROR_MESSAGES.NO_USERSTORAGE_WITH_MAB.format(
-                    file=FILE, campaign_key=campaign.get("key")
-                ),
+                LogMessageEnum.ERROR_MESSAGES.NO_USERSTORAGE_WITH_MAB,
+                file=FILE,
+                campaign_key=campaign.get("key"),
             )
             ret_value[campaign.get("key")] = False
             continue
@@ -160,6 +165,7 @@ def _track(vwo_instance, campaign_specifier, user_id, goal_identifier, **kwargs)
             event_properties,
             user_agent,
             user_ip_address,
+            snapshot=snapshot,
         )
         ret_value[campaign.get("key")] = result
     for campaign in campaigns_without_goal:
@@ -169,10 +175,10 @@ def _track(vwo_instance, campaign_specifier, user_id, goal_identifier, **kwargs)
         not vwo_instance.is_event_batching_enabled and vwo_instance.is_event_arch_enabled is True
     ):
         params = impression_util.get_events_params(
-            vwo_instance.settings_file, goal_identifier, user_agent=user_agent, user_ip_address=user_ip_address
+            snapshot.settings_file, goal_identifier, user_agent=user_agent, user_ip_address=user_ip_address
         )
         impression = impression_util.create_track_goal_events_impression(
-            vwo_instance.settings_file,
+            snapshot.settings_file,
             user_id,
             goal_identifier,
             campaign_goal_revenue_prop_list,
@@ -197,6 +203,7 @@ def track_campaign_goal(
     event_properties,
     user_agent,
     user_ip_address,
+    snapshot=None,
 ):
     """
     It marks the conversion of given goal for the given campaign
@@ -218,6 +225,7 @@ def track_campaign_goal(
         global goal identifier
         campaign_goal_revenue_prop_list (list): list of campaign_id, goal_id & goal's revenueProp
             (if revenue goal else None) to build event arch impression
+        snapshot (SettingsSnapshot|None): snapshot the campaign was read from, the one published if None
 
     Returns:
         bool: True if goal successfully tracked else False
@@ -225,11 +233,13 @@ def track_campaign_goal(
 
     campaign_type = campaign.get("type")
     if campaign_type == constants.CAMPAIGN_TYPES.FEATURE_ROLLOUT:
-        vwo_instance.logger.log(
+        vwo_instance.logger.lazy_log(
             LogLevelEnum.ERROR,
-            LogMessageEnum.ERROR_MESSAGES.INVALID_API.format(
-                file=FILE, user_id=user_id, campaign_key=campaign.get("key"), campaign_type=campaign_type
-            ),
+            LogMessageEnum.ERROR_MESSAGES.INVALID_API,
+            file=FILE,
+            user_id=user_id,
+            campaign_key=campaign.get("key"),
+            campaign_type=campaign_type,
         )
         return False
 
@@ -248,14 +258,13 @@ def track_campaign_goal(
                 # In this case it is expected that goal will have revenueProp
                 # Error should be logged if eventProperties is not Defined OR eventProperties does not have revenueProp key
                 if event_properties is None or goal.get("revenueProp") not in event_properties:
-                    vwo_instance.logger.log(
+                    vwo_instance.logger.lazy_log(
                         LogLevelEnum.ERROR,
-                        LogMessageEnum.ERROR_MESSAGES.TRACK_API_REVENUE_NOT_PASSED_FOR_REVENUE_GOAL.format(
-                            file=FILE,
-                            user_id=user_id,
-                            goal_identifier=goal.get("identifier"),
-                            campaign_key=campaign.get("key"),
-                        ),
+                        LogMessageEnum.ERROR_MESSAGES.TRACK_API_REVENUE_NOT_PASSED_FOR_REVENUE_GOAL,
+                        file=FILE,
+                        user_id=user_id,
+                        goal_identifier=goal.get("identifier"),
+                        campaign_key=campaign.get("key"),
                     )
                     return False
             else:
@@ -265,28 +274,32 @@ def track_campaign_goal(
                 if goal.get("revenueProp"):
                     # Error should be logged if eventProperties is not Defined OR eventProperties does not have revenueProp key
                     if event_properties is None or goal.get("revenueProp") not in event_properties:
-                        vwo_instance.logger.log(
+                        vwo_instance.logger.lazy_log(
                             LogLevelEnum.ERROR,
-                            LogMessageEnum.ERROR_MESSAGES.TRACK_API_REVENUE_NOT_PASSED_FOR_REVENUE_GOAL.format(
-                                file=FILE,
-                                user_id=user_id,
-                                goal_identifier=goal.get("identifier"),
-                                campaign_key=campaign.get("key"),
-                            ),
+                            LogMessageEnum.ERROR_MESSAGES.TRACK_API_REVENUE_NOT_PASSED_FOR_REVENUE_GOAL,
+                            file=FILE,
+                            user_id=user_id,
+                            goal_identifier=goal.get("identifier"),
+                            campaign_key=campaign.get("key"),
                         )
                         return False
         else:
-            vwo_instance.logger.log(
+            vwo_instance.logger.lazy_log(
                 LogLevelEnum.ERROR,
-                LogMessageEnum.ERROR_MESSAGES.TRACK_API_REVENUE_NOT_PASSED_FOR_REVENUE_GOAL.format(
-                    file=FILE, user_id=user_id, goal_identifier=goal.get("identifier"), campaign_key=campaign.get("key")
-                ),
+                LogMessageEnum.ERROR_MESSAGES.TRACK_API_REVENUE_NOT_PASSED_FOR_REVENUE_GOAL,
+                file=FILE,
+                user_id=user_id,
+                goal_identifier=goal.get("identifier"),
+                campaign_key=campaign.get("key"),
             )
             return False
 
     if goal_type == constants.GOAL_TYPES.CUSTOM:
         revenue_value = None
 
+    if snapshot is None:
+        snapshot = vwo_instance.config.get_snapshot()
+
     variation, _ = vwo_instance.variation_decider.get_variation(
         user_id,
         campaign,
@@ -294,6 +307,7 @@ def track_campaign_goal(
         variation_targeting_variables=variation_targeting_variables,
         goal_data={"identifier": goal.get("identifier"),"mca": goal.get("mca"),"hasProps": goal.get("hasProps")},
         api_method=constants.API_METHODS.TRACK,
+        snapshot=snapshot,
     )
 
     if variation:
@@ -309,18 +323,18 @@ def track_campaign_goal(
                 revenue_value,
                 user_agent=user_agent,
                 user_ip_address=user_ip_address,
+                settings_file=snapshot.settings_file,
             )
 
             vwo_instance.event_dispatcher.dispatch(impression)
 
-            vwo_instance.logger.log(
+            vwo_instance.logger.lazy_log(
                 LogLevelEnum.INFO,
-                LogMessageEnum.INFO_MESSAGES.MAIN_KEYS_FOR_IMPRESSION.format(
-                    file=FILE,
-                    campaign_id=impression.get("experiment_id"),
-                    account_id=impression.get("account_id"),
-                    variation_id=impression.get("combination"),
-                ),
+                LogMessageEnum.INFO_MESSAGES.MAIN_KEYS_FOR_IMPRESSION,
+                file=FILE,
+                campaign_id=impression.get("experiment_id"),
+                account_id=impression.get("account_id"),
+                variation_id=impression.get("combination"),
             )
         else:
             campaign_goal_revenue_prop_list.append((campaign.get("id"), goal.get("id"), goal.get("revenueProp")))
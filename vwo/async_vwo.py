@@ -0,0 +1,274 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import functools
+from collections import OrderedDict
+
+from .vwo import VWO
+from .event.async_event_dispatcher import AsyncEventDispatcher
+from .helpers import settings_file_util
+from .helpers import validate_util
+from .storage.async_user import PrefetchedUserStorage
+
+
+class AsyncVWO(VWO):
+    """asyncio version of VWO, for async web frameworks. APIs doing network or UserStorage I/O are coroutines,
+    decisions are made by the same core as VWO.
+
+    Before an API call, the UserStorage data of the campaigns it needs is fetched. The decision is then made
+    synchronously, and the data set and impressions dispatched by it are awaited after it returns.
+    """
+
+    event_dispatcher_class = AsyncEventDispatcher
+
+    def __init__(
+        self,
+        settings_file,
+        user_storage,
+        is_development_mode,
+        goal_type_to_track,
+        batch_event_settings,
+        integrations,
+        settings_poller_settings=None,
+        settings_cache=None,
+        shared_settings=None,
+        settings_update_callback=None,
+        instrumentation_sink=None,
+    ):
+        """__init__ method to initialize the AsyncVWO object, all the argument types should be pre-checked.
+        Else object initialization fails.
+
+        Args:
+            settings_file (json_string): stringified json representing the settings_file consisting all
+                the campaign related data
+            user_storage (object): an AsyncUserStorage, or a UserStorage, object capable of doing get and set on
+            SDK provide data
+            is_development_mode (bool): should the SDK be initialized in development mode,
+            it toggles the event_dispatcher to off
+            goal_type_to_track (vwo.GOAL_TYPES): which goal type to track when using track
+            api. Default value is vwo.GOAL_TYPES.ALL
+            batch_events_settings (dict): settings for configuring and enabling event batching
+            integrations (dict): an integrations service instance for third party integrations
+            settings_poller_settings (dict): options of SettingsPoller, see VWO
+            settings_cache (SettingsCache): on-disk cache of the settings_file
+            shared_settings (SharedSettings): file sharing the processed settings_file among processes
+            settings_update_callback (function): called with the summary of changes on settings_file updates
+            instrumentation_sink (function): called with the DecisionTrace of each decision API call
+        """
+        self.user_storage = PrefetchedUserStorage(user_storage) if user_storage else None
+        super(AsyncVWO, self).__init__(
+            settings_file,
+            self.user_storage,
+            is_development_mode,
+            goal_type_to_track,
+            batch_event_settings,
+            integrations,
+            settings_poller_settings,
+            settings_cache,
+            shared_settings,
+            settings_update_callback,
+            instrumentation_sink,
+        )
+
+    # PUBLIC METHODS
+    async def activate(self, campaign_key, user_id, **kwargs):
+        """Awaitable VWO.activate"""
+        snapshot = self._get_snapshot()
+        campaign_keys = self._get_user_storage_campaign_keys(snapshot, [self._get_campaign(snapshot, campaign_key)])
+        return await self._call(VWO.activate, campaign_keys, user_id, campaign_key, user_id, **kwargs)
+
+    async def get_variation_name(self, campaign_key, user_id, **kwargs):
+        """Awaitable VWO.get_variation_name"""
+        snapshot = self._get_snapshot()
+        campaign_keys = self._get_user_storage_campaign_keys(snapshot, [self._get_campaign(snapshot, campaign_key)])
+        return await self._call(VWO.get_variation_name, campaign_keys, user_id, campaign_key, user_id, **kwargs)
+
+    async def track(self, campaign_specifier, user_id, goal_identifier, **kwargs):
+        """Awaitable VWO.track"""
+        snapshot = self._get_snapshot()
+        if self.is_opted_out:
+            campaigns = []
+        elif type(campaign_specifier) is str:
+            campaigns = [self._get_campaign(snapshot, campaign_specifier)]
+        elif type(campaign_specifier) is list:
+            campaigns = [self._get_campaign(snapshot, campaign_key) for campaign_key in campaign_specifier]
+        elif campaign_specifier is None and validate_util.is_valid_string(goal_identifier):
+            campaigns = [campaign for campaign, _ in snapshot.get_goal_campaigns(goal_identifier)]
+        else:
+            campaigns = []
+
+        campaign_keys = self._get_user_storage_campaign_keys(snapshot, campaigns)
+        return await self._call(
+            VWO.track, campaign_keys, user_id, campaign_specifier, user_id, goal_identifier, **kwargs
+        )
+
+    async def is_feature_enabled(self, campaign_key, user_id, **kwargs):
+        """Awaitable VWO.is_feature_enabled"""
+        snapshot = self._get_snapshot()
+        campaign_keys = self._get_user_storage_campaign_keys(snapshot, [self._get_campaign(snapshot, campaign_key)])
+        return await self._call(VWO.is_feature_enabled, campaign_keys, user_id, campaign_key, user_id, **kwargs)
+
+    async def get_feature_variable_value(self, campaign_key, variable_key, user_id, **kwargs):
+        """Awaitable VWO.get_feature_variable_value"""
+        snapshot = self._get_snapshot()
+        campaign_keys = self._get_user_storage_campaign_keys(snapshot, [self._get_campaign(snapshot, campaign_key)])
+        return await self._call(
+            VWO.get_feature_variable_value, campaign_keys, user_id, campaign_key, variable_key, user_id, **kwargs
+        )
+
+    async def get_all_decisions(self, user_id, campaign_keys=None, **kwargs):
+        """Awaitable VWO.get_all_decisions"""
+        snapshot = self._get_snapshot()
+        if self.is_opted_out:
+            campaigns = []
+        elif campaign_keys is None:
+            campaigns = list(snapshot.campaign_key_map.values())
+        elif isinstance(campaign_keys, (list, tuple)):
+            campaigns = [self._get_campaign(snapshot, campaign_key) for campaign_key in campaign_keys]
+        else:
+            campaigns = []
+
+        campaign_keys_to_fetch = self._get_user_storage_campaign_keys(snapshot, campaigns)
+        return await self._call(
+            VWO.get_all_decisions, campaign_keys_to_fetch, user_id, user_id, campaign_keys, **kwargs
+        )
+
+    async def push(self, tag_key="", tag_value="", user_id="", custom_dimension_map=None):
+        """Awaitable VWO.push"""
+        return await self._call(VWO.push, [], user_id, tag_key, tag_value, user_id, custom_dimension_map)
+
+    async def flush_events(self, mode="async"):
+        """Awaitable VWO.flush_events, in sync mode waits for the events to be synced off the event loop"""
+        if mode == "async":
+            return VWO.flush_events(self, mode)
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, functools.partial(VWO.flush_events, self, mode))
+
+    async def get_and_update_settings_file(self, account_id, sdk_key, is_via_webhook=False):
+        """Awaitable VWO.get_and_update_settings_file, fetches the settings_file with the pooled AsyncConnection"""
+        latest_settings_file = None
+        if not self.is_opted_out:
+            latest_settings_file = await self._fetch_settings_file(account_id, sdk_key, is_via_webhook)
+
+        return VWO.get_and_update_settings_file(self, account_id, sdk_key, is_via_webhook, latest_settings_file)
+
+    async def close(self):
+        """Syncs the queued events and closes the pooled connections, await it when the app shuts down"""
+        await self.event_dispatcher.close()
+
+    # PRIVATE METHODS
+    async def _call(self, api_method, campaign_keys, user_id, *args, **kwargs):
+        """Calls the API method of VWO after fetching the UserStorage data of the campaigns, then awaits
+        storing the data set and sending the impressions dispatched by it
+
+        Args:
+            api_method (function): API method of VWO
+            campaign_keys (list): keys of the campaigns whose UserStorage data is needed
+            user_id (string): ID assigned to a user
+
+        Returns:
+            value returned by the API method
+        """
+        if self.is_opted_out:
+            return api_method(self, *args, **kwargs)
+
+        user_storage_token = None
+        if self.user_storage is not None and campaign_keys and validate_util.is_valid_string(user_id):
+            user_storage_token = await self.user_storage.prefetch(user_id, campaign_keys)
+
+        requests_token = self.event_dispatcher.collect_requests()
+        try:
+            result = api_method(self, *args, **kwargs)
+        finally:
+            requests = self.event_dispatcher.release_requests(requests_token)
+            user_data_written = self.user_storage.release(user_storage_token) if user_storage_token else []
+
+        if user_data_written or requests:
+            await asyncio.gather(
+                self.user_storage.store(user_data_written) if user_data_written else _noop(),
+                self.event_dispatcher.send_requests(requests),
+            )
+        return result
+
+    def _get_snapshot(self):
+        """Retrieves the snapshot the campaigns of an API call are read from, None if opted out"""
+        if self.is_opted_out:
+            return None
+        return self.config.get_snapshot()
+
+    def _get_campaign(self, snapshot, campaign_key):
+        """Retrieves the campaign an API call is made for, so that its UserStorage data can be prefetched
+
+        Args:
+            snapshot (SettingsSnapshot): snapshot the API call reads campaigns from
+            campaign_key (string): Campaign identifier key
+
+        Returns:
+            dict|None: Campaign object, None if opted out, campaign_key is invalid or campaign not found
+        """
+        if self.is_opted_out or not validate_util.is_valid_string(campaign_key):
+            return None
+        return snapshot.get_campaign(campaign_key)
+
+    def _get_user_storage_campaign_keys(self, snapshot, campaigns):
+        """Returns keys of the campaigns, and of the other campaigns of their groups, whose
+        UserStorage data decisions may look up
+
+        Args:
+            snapshot (SettingsSnapshot): snapshot the campaigns were read from
+            campaigns (list): campaigns an API call is made for, None for the ones not found
+
+        Returns:
+            list: campaign keys
+        """
+        if self.user_storage is None or self.is_opted_out:
+            return []
+
+        campaign_groups = snapshot.settings_file.get("campaignGroups") or {}
+        campaign_keys = OrderedDict()
+        for campaign in campaigns:
+            if not campaign:
+                continue
+            campaign_keys[campaign.get("key")] = True
+            group_id = campaign_groups.get(str(campaign.get("id")))
+            campaign_group = snapshot.get_campaign_group(group_id) if group_id is not None else None
+            if campaign_group is not None:
+                for group_campaign in campaign_group.campaigns:
+                    campaign_keys[group_campaign.get("key")] = True
+        return list(campaign_keys)
+
+    async def _fetch_settings_file(self, account_id, sdk_key, is_via_webhook):
+        """Fetches the latest settings_file, see settings_file_util.get
+
+        Returns:
+            json_string: stringified json representing the settings_file
+        """
+        request = settings_file_util.get_request(account_id, sdk_key, is_via_webhook)
+        if request is None:
+            return "{}"
+
+        server_url, parameters = request
+        resp = await self.event_dispatcher.async_connection.get(server_url, params=parameters)
+        if resp.get("status_code") is None:
+            return "{}"
+        return settings_file_util.get_settings_file_from_response(
+            resp.get("status_code"), resp.get("text"), is_via_webhook
+        )
+
+
+async def _noop():
+    """Awaited in place of storing UserStorage data when an API call set none"""
+    pass
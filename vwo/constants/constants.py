@@ -59,6 +59,8 @@ class DATA_TYPE:
 class API_METHODS:
     ACTIVATE = "activate"
     GET_VARIATION_NAME = "get_variation_name"
+    GET_VARIATION_NAMES_BULK = "get_variation_names_bulk"
+    GET_ALL_DECISIONS = "get_all_decisions"
     TRACK = "track"
     IS_FEATURE_ENABLED = "is_feature_enabled"
     GET_FEATURE_VARIABLE_VALUE = "get_feature_variable_value"
@@ -66,6 +68,7 @@ class API_METHODS:
     FLUSH_EVENTS = "flush_events"
     GET_AND_UPDATE_SETTINGS_FILE = "get_and_update_settings_file"
     SET_OPT_OUT = "set_opt_out"
+    GET_DISPATCHER_STATS = "get_dispatcher_stats"
 
 
 class GOAL_TYPES:
@@ -78,11 +81,56 @@ class BATCH_EVENTS:
     EVENTS_PER_REQUEST = "events_per_request"
     REQUEST_TIME_INTERVAL = "request_time_interval"
     FLUSH_CALLBACK = "flush_callback"
+    MAX_QUEUE_SIZE = "max_queue_size"
+    MAX_IN_FLIGHT_REQUESTS = "max_in_flight_requests"
+    COMPRESSION = "compression"
+    COMPRESSION_THRESHOLD = "compression_threshold"
+    MAX_RETRIES = "max_retries"
+    RETRY_BACKOFF = "retry_backoff"
     MAX_EVENTS_PER_REQUEST = 5000
     MIN_EVENTS_PER_REQUEST = 1
     DEFAULT_EVENTS_PER_REQUEST = 100
     DEFAULT_REQUEST_TIME_INTERVAL = 600
     MIN_REQUEST_TIME_INTERVAL = 1
+    DEFAULT_MAX_QUEUE_SIZE = 10000
+    DEFAULT_MAX_IN_FLIGHT_REQUESTS = 1
+    MAX_IN_FLIGHT_REQUESTS_LIMIT = 10
+    FLUSHER_IDLE_TIMEOUT = 60
+    COMPRESSIONS = ("gzip", "deflate")
+    DEFAULT_COMPRESSION_THRESHOLD = 1024
+    DEFAULT_MAX_RETRIES = 3
+    MAX_RETRIES_LIMIT = 10
+    DEFAULT_RETRY_BACKOFF = 1
+    MAX_RETRY_BACKOFF = 60
+    SHUTDOWN_TIMEOUT = 10
+    SYNC_FLUSH_TIMEOUT = 60
+
+
+class SETTINGS_POLLER:
+    ACCOUNT_ID = "account_id"
+    SDK_KEY = "sdk_key"
+    INTERVAL = "interval"
+    JITTER = "jitter"
+    DEFAULT_INTERVAL = 600
+    MIN_INTERVAL = 1
+    DEFAULT_JITTER = 0.1
+
+
+class INSTRUMENTATION:
+    # stages of a decision timed by instrumentation
+    WHITELISTING = "whitelisting"
+    USER_STORAGE_GET = "user_storage_get"
+    PRE_SEGMENTATION = "pre_segmentation"
+    BUCKETING = "bucketing"
+    MEG = "meg"
+    USER_STORAGE_SET = "user_storage_set"
+    HOOKS = "hooks"
+    DISPATCH = "dispatch"
+    # counters of a decision
+    USER_STORAGE_CALLS = "user_storage_calls"
+    SEGMENTS_EVALUATED = "segments_evaluated"
+    # total time of the API call
+    TOTAL = "total"
 
 
 class CAMPAIGN_TYPES:
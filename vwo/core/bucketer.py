@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from __future__ import division
+import bisect
 import mmh3 as Hasher
 from ..constants import constants
 from ..helpers import validate_util, campaign_util
@@ -21,6 +22,12 @@ from ..enums.file_name_enum import FileNameEnum
 from ..enums.log_level_enum import LogLevelEnum
 from ..logger import VWOLogger
 
+try:
+    # numpy is optional, it only speeds up the bulk bucketing methods
+    import numpy
+except ImportError:
+    numpy = None
+
 # Took reference from StackOverflow(https://stackoverflow.com/) to:
 # convert signed to unsigned integer in python from StackOverflow
 # Author - Duncan (https://stackoverflow.com/users/107660/duncan)
@@ -28,6 +35,11 @@ from ..logger import VWOLogger
 U_MAX_32_BIT = 0xFFFFFFFF
 FILE = FileNameEnum.Core.Bucketer
 
+# Bucketing algos for variations
+BUCKETING_ALGO_OLD = "Old"
+BUCKETING_ALGO_NEW = "New"
+BUCKETING_ALGO_NEW_V2 = "New_V2"
+
 
 class Bucketer(object):
     """Class consisting the core bucketing/distribution logic for
@@ -37,33 +49,36 @@ class Bucketer(object):
         """Initializes bucketer with vwo common logger"""
         self.logger = VWOLogger.getInstance()
 
-    def get_allocated_item(self, items, bucket_value):
-        """Returns an allocation item(variation/campaign) by checking the Start and End
-        Bucket Allocations of each item
+    def get_allocated_item(self, items, bucket_value, allocation_ranges=None):
+        """Returns an allocation item(variation/campaign) by searching the Start and End
+        Bucket Allocations of the items
 
         Args:
             items (list): list of item(variation/campaign)
             bucket_value (int): the bucket value of the user
+            allocation_ranges (tuple|None): sorted allocation ranges of the items, see
+                campaign_util.get_sorted_allocation_ranges. Built from items if not passed.
 
         Returns:
             (dict|None): item(variation/campaign) allotted to the user or None if not
         """
-        for item in items:
-            if item.get("allocation_range_start") <= bucket_value <= item.get("allocation_range_end"):
-                return item
+        if allocation_ranges is None:
+            allocation_ranges = campaign_util.get_sorted_allocation_ranges(items)
 
-        variations_log_string = ""
-        for item in items:
-            variations_log_string += str(item) + "\n"
+        range_starts, range_ends, indexes = allocation_ranges
+        position = bisect.bisect_right(range_starts, bucket_value) - 1
+        if position >= 0 and bucket_value <= range_ends[position]:
+            return items[indexes[position]]
 
         # log for None item
-        self.logger.log(
-            LogLevelEnum.ERROR,
-            "tmpLog::bucketer::get_allocated_item() - Variation is None for bucket_value="
-            + str(bucket_value)
-            + ". Variations details - "
-            + variations_log_string,
-        )
+        if self.logger.is_enabled_for(LogLevelEnum.ERROR):
+            self.logger.log(
+                LogLevelEnum.ERROR,
+                "tmpLog::bucketer::get_allocated_item() - Variation is None for bucket_value="
+                + str(bucket_value)
+                + ". Allocation ranges - "
+                + str(list(zip(range_starts, range_ends))),
+            )
 
         return None
 
@@ -87,12 +102,14 @@ class Bucketer(object):
         multiplied_value = (max_value * ratio + 1) * multiplier
         bucket_value = int(multiplied_value)
 
-        self.logger.log(
+        self.logger.lazy_log(
             LogLevelEnum.DEBUG,
-            LogMessageEnum.DEBUG_MESSAGES.USER_HASH_BUCKET_VALUE.format(
-                file=FILE, hash_value=hash_value, bucket_value=bucket_value, user_id=user_id
-            ),
-            disable_logs,
+            LogMessageEnum.DEBUG_MESSAGES.USER_HASH_BUCKET_VALUE,
+            file=FILE,
+            hash_value=hash_value,
+            bucket_value=bucket_value,
+            user_id=user_id,
+            disable_logs=disable_logs,
         )
         return bucket_value
 
@@ -109,18 +126,21 @@ class Bucketer(object):
         """
 
         if not validate_util.is_valid_value(user_id):
-            self.logger.log(
+            self.logger.lazy_log(
                 LogLevelEnum.ERROR,
-                LogMessageEnum.ERROR_MESSAGES.INVALID_USER_ID.format(
-                    file=FILE, user_id=user_id, method="is_user_part_of_campaign"
-                ),
+                LogMessageEnum.ERROR_MESSAGES.INVALID_USER_ID,
+                file=FILE,
+                user_id=user_id,
+                method="is_user_part_of_campaign",
             )
             return False
 
         if not campaign:
-            self.logger.log(
+            self.logger.lazy_log(
                 LogLevelEnum.ERROR,
-                LogMessageEnum.ERROR_MESSAGES.INVALID_CAMPAIGN.format(file=FILE, method="is_user_part_of_campaign"),
+                LogMessageEnum.ERROR_MESSAGES.INVALID_CAMPAIGN,
+                file=FILE,
+                method="is_user_part_of_campaign",
             )
             return False
 
@@ -135,17 +155,24 @@ class Bucketer(object):
             disable_logs=disable_logs,
         )
         is_user_part = value_assigned_to_user != 0 and value_assigned_to_user <= traffic_allocation
-        self.logger.log(
+        self.logger.lazy_log(
             LogLevelEnum.INFO,
-            LogMessageEnum.INFO_MESSAGES.USER_ELIGIBILITY_FOR_CAMPAIGN.format(
-                file=FILE, user_id=user_id, is_user_part=is_user_part
-            ),
-            disable_logs,
+            LogMessageEnum.INFO_MESSAGES.USER_ELIGIBILITY_FOR_CAMPAIGN,
+            file=FILE,
+            user_id=user_id,
+            is_user_part=is_user_part,
+            disable_logs=disable_logs,
         )
         return is_user_part
 
     def bucket_user_to_variation(
-        self, user_id, campaign, is_new_bucketing_enabled, is_new_bucketing_v2_enabled=False, account_id=None
+        self,
+        user_id,
+        campaign,
+        is_new_bucketing_enabled,
+        is_new_bucketing_v2_enabled=False,
+        account_id=None,
+        allocation_ranges=None,
     ):
         """Validates the User ID and
             returns Variation into which the User is bucketed in.
@@ -153,43 +180,30 @@ class Bucketer(object):
         Args:
             user_id (string): the unique ID assigned to User
             campaign (dict): the Campaign of which User is a part of
+            allocation_ranges (tuple|None): sorted allocation ranges of the variations of the campaign,
+                see SettingsSnapshot.get_variation_allocation_ranges. Built from the variations if not passed.
 
         Returns:
             (dict|None): variation data into which user is bucketed in
                 or None if not
         """
 
-        is_bucketing_done = False
-
-        # initialize new_bucketing_enabled and old_bucketing flags
-        if not is_new_bucketing_enabled:
-            is_new_bucketing_enabled = False
-        if campaign is None or campaign.get("isOB") is None:
-            is_old_bucketing_enabled = False
-        else:
-            is_old_bucketing_enabled = True
-
-        # initialize new_bucketing_v2_enabled and old_bucketing_v2 flags
-        if not is_new_bucketing_v2_enabled:
-            is_new_bucketing_v2_enabled = False
-        if campaign is None or campaign.get("isOBv2") is None:
-            is_old_bucketing_v2_enabled = False
-        else:
-            is_old_bucketing_v2_enabled = True
-
         if not validate_util.is_valid_value(user_id):
-            self.logger.log(
+            self.logger.lazy_log(
                 LogLevelEnum.ERROR,
-                LogMessageEnum.ERROR_MESSAGES.INVALID_USER_ID.format(
-                    file=FILE, user_id=user_id, method="bucket_user_to_variation"
-                ),
+                LogMessageEnum.ERROR_MESSAGES.INVALID_USER_ID,
+                file=FILE,
+                user_id=user_id,
+                method="bucket_user_to_variation",
             )
             return None
 
         if not campaign:
-            self.logger.log(
+            self.logger.lazy_log(
                 LogLevelEnum.ERROR,
-                LogMessageEnum.ERROR_MESSAGES.INVALID_CAMPAIGN.format(file=FILE, method="bucket_user_to_variation"),
+                LogMessageEnum.ERROR_MESSAGES.INVALID_CAMPAIGN,
+                file=FILE,
+                method="bucket_user_to_variation",
             )
             return None
 
@@ -215,69 +229,16 @@ class Bucketer(object):
             self.logger.logger(LogLevelEnum.ERROR, log_str)
 
         # based on bucketing algo flag, determine bucket value
-        # old bucketing
-        if (not is_new_bucketing_enabled and not is_new_bucketing_v2_enabled) or (
-            is_new_bucketing_enabled and campaign.get("isOB")
-        ):
-            # use old bucketing algo
-            normalize = constants.MAX_TRAFFIC_VALUE / campaign.get("percentTraffic")
-            multiplier = normalize / 100
-            bucket_value = self.get_bucket_value_for_user(
-                campaign_util.get_bucketing_seed(
-                    user_id=user_id, campaign=campaign, is_new_bucketing_enabled=is_new_bucketing_enabled
-                ),
-                user_id,
-                constants.MAX_TRAFFIC_VALUE,
-                multiplier,
-            )
-
-            # log
-            self.logger.log(
-                LogLevelEnum.INFO, LogMessageEnum.INFO_MESSAGES.BUCKETING_ALGO.format(file=FILE, algo="Old")
-            )
-
-            # set flag
-            is_bucketing_done = True
-
-        # new bucketing
-        if not is_bucketing_done and (
-            (is_new_bucketing_enabled and not is_old_bucketing_enabled and not is_new_bucketing_v2_enabled)
-            or (is_new_bucketing_v2_enabled and is_old_bucketing_v2_enabled)
-        ):
-            multiplier = 1
-            bucket_value = self.get_bucket_value_for_user(
-                campaign_util.get_bucketing_seed(
-                    user_id=user_id, campaign=None, is_new_bucketing_enabled=is_new_bucketing_enabled
-                ),
-                user_id,
-                constants.MAX_TRAFFIC_VALUE,
-                multiplier,
-            )
-
-            # log
-            self.logger.log(
-                LogLevelEnum.INFO, LogMessageEnum.INFO_MESSAGES.BUCKETING_ALGO.format(file=FILE, algo="New")
-            )
+        algo = self._get_variation_bucketing_algo(campaign, is_new_bucketing_enabled, is_new_bucketing_v2_enabled)
+        bucket_value = self.get_bucket_value_for_user(
+            self._get_variation_bucketing_seed(algo, user_id, campaign, is_new_bucketing_enabled, account_id),
+            user_id,
+            constants.MAX_TRAFFIC_VALUE,
+            self._get_variation_bucketing_multiplier(algo, campaign),
+        )
 
-            # set flag
-            is_bucketing_done = True
-
-        # new bucketing v2
-        if not is_bucketing_done:
-            multiplier = 1
-            bucket_value = self.get_bucket_value_for_user(
-                campaign_util.get_bucketing_seed(
-                    user_id=str(account_id) + "_" + str(user_id), campaign=campaign, is_new_bucketing_enabled=True
-                ),
-                user_id,
-                constants.MAX_TRAFFIC_VALUE,
-                multiplier,
-            )
-
-            # log
-            self.logger.log(
-                LogLevelEnum.INFO, LogMessageEnum.INFO_MESSAGES.BUCKETING_ALGO.format(file=FILE, algo="New_V2")
-            )
+        # log
+        self.logger.lazy_log(LogLevelEnum.INFO, LogMessageEnum.INFO_MESSAGES.BUCKETING_ALGO, file=FILE, algo=algo)
 
         # logging for problem with bucket value
         if bucket_value is not None and (bucket_value < 1 or bucket_value > 10000):
@@ -300,15 +261,202 @@ class Bucketer(object):
             )
             self.logger.log(LogLevelEnum.ERROR, log_str)
 
-        self.logger.log(
+        self.logger.lazy_log(
             LogLevelEnum.DEBUG,
-            LogMessageEnum.DEBUG_MESSAGES.VARIATION_HASH_BUCKET_VALUE.format(
-                file=FILE,
-                user_id=user_id,
-                campaign_key=campaign.get("key"),
-                percent_traffic=campaign.get("percentTraffic"),
-                bucket_value=bucket_value,
-            ),
+            LogMessageEnum.DEBUG_MESSAGES.VARIATION_HASH_BUCKET_VALUE,
+            file=FILE,
+            user_id=user_id,
+            campaign_key=campaign.get("key"),
+            percent_traffic=campaign.get("percentTraffic"),
+            bucket_value=bucket_value,
+        )
+
+        return self.get_allocated_item(campaign.get("variations"), bucket_value, allocation_ranges)
+
+    def bucket_many(
+        self,
+        user_ids,
+        campaign,
+        is_new_bucketing_enabled=False,
+        is_new_bucketing_v2_enabled=False,
+        account_id=None,
+        allocation_ranges=None,
+    ):
+        """Returns Variations into which the Users are bucketed in. Result for each user is the same
+        as bucket_user_to_variation, however hashing and range lookups are done for the whole batch
+        and nothing is logged per user.
+
+        Args:
+            user_ids (list): the unique IDs assigned to Users
+            campaign (dict): the Campaign of which Users are a part of
+            allocation_ranges (tuple|None): sorted allocation ranges of the variations of the campaign,
+                see SettingsSnapshot.get_variation_allocation_ranges. Built from the variations if not passed.
+
+        Returns:
+            list: variation data(dict|None) into which each user is bucketed in, in order of user_ids
+        """
+
+        algo = self._get_variation_bucketing_algo(campaign, is_new_bucketing_enabled, is_new_bucketing_v2_enabled)
+        bucket_values = self.get_bucket_values_for_users(
+            [
+                self._get_variation_bucketing_seed(algo, user_id, campaign, is_new_bucketing_enabled, account_id)
+                for user_id in user_ids
+            ],
+            constants.MAX_TRAFFIC_VALUE,
+            self._get_variation_bucketing_multiplier(algo, campaign),
+        )
+        self.logger.lazy_log(
+            LogLevelEnum.DEBUG,
+            LogMessageEnum.DEBUG_MESSAGES.BULK_BUCKETING,
+            file=FILE,
+            no_of_users=len(bucket_values),
+            campaign_key=campaign.get("key"),
+            algo=algo,
+        )
+        return self.get_allocated_items(campaign.get("variations"), bucket_values, allocation_ranges)
+
+    def are_users_part_of_campaign(self, user_ids, campaign, is_new_bucketing_enabled):
+        """Calculates if the provided user_ids should become part of the campaign or not,
+        same as is_user_part_of_campaign for each user.
+
+        Args:
+            user_ids (list): the unique IDs assigned to users
+            campaign (dict): for getting traffic allotted to the campaign
+
+        Returns:
+            list: bool for each user in order of user_ids, whether User is a part of Campaign or not
+        """
+
+        traffic_allocation = campaign.get("percentTraffic")
+        bucket_values = self.get_bucket_values_for_users(
+            [
+                campaign_util.get_bucketing_seed(
+                    is_new_bucketing_enabled=is_new_bucketing_enabled, user_id=user_id, campaign=campaign
+                )
+                for user_id in user_ids
+            ],
+            constants.MAX_TRAFFIC_PERCENT,
+        )
+        return [bucket_value != 0 and bucket_value <= traffic_allocation for bucket_value in bucket_values]
+
+    def get_bucket_values_for_users(self, user_seeds, max_value, multiplier=1):
+        """Returns Bucket Values for a batch of seeds, same as get_bucket_value_for_user for each seed.
+        Scaling is done over arrays when numpy is installed.
+
+        Args:
+            user_seeds (list): seeds for generating hash, see campaign_util.get_bucketing_seed
+            max_value(int): maximum value that can be alloted to the bucket value
+            multiplier(int): value for distributing ranges slightly
+
+        Returns:
+            list: the bucket values(int) in order of user_seeds
+        """
+
+        hash_values = [Hasher.hash(user_seed, constants.SEED_VALUE) & U_MAX_32_BIT for user_seed in user_seeds]
+        if numpy is None:
+            return [int((max_value * (hash_value / (2**32)) + 1) * multiplier) for hash_value in hash_values]
+
+        # same float64 operations in the same order as get_bucket_value_for_user, and
+        # astype truncates towards zero like int(), hence values are identical
+        ratios = numpy.array(hash_values, dtype=numpy.float64) / (2**32)
+        return ((max_value * ratios + 1) * multiplier).astype(numpy.int64).tolist()
+
+    def get_allocated_items(self, items, bucket_values, allocation_ranges=None):
+        """Returns allocation items(variation/campaign) for a batch of bucket values, same as
+        get_allocated_item for each value, using a sorted search over the allocation ranges.
+
+        Args:
+            items (list): list of item(variation/campaign)
+            bucket_values (list): bucket values of the users
+            allocation_ranges (tuple|None): sorted allocation ranges of the items, see
+                campaign_util.get_sorted_allocation_ranges. Built from items if not passed.
+
+        Returns:
+            list: item(variation/campaign)(dict|None) allotted for each bucket value
+        """
+
+        if allocation_ranges is None:
+            allocation_ranges = campaign_util.get_sorted_allocation_ranges(items)
+        range_starts, range_ends, indexes = allocation_ranges
+
+        if numpy is None:
+            positions = [bisect.bisect_right(range_starts, bucket_value) - 1 for bucket_value in bucket_values]
+        else:
+            positions = (numpy.searchsorted(range_starts, bucket_values, side="right") - 1).tolist()
+
+        return [
+            items[indexes[position]] if position >= 0 and bucket_value <= range_ends[position] else None
+            for position, bucket_value in zip(positions, bucket_values)
+        ]
+
+    def _get_variation_bucketing_algo(self, campaign, is_new_bucketing_enabled, is_new_bucketing_v2_enabled):
+        """Decides the bucketing algo for variations of the campaign from the bucketing flags
+
+        Args:
+            campaign (dict): the Campaign of which User is a part of
+            is_new_bucketing_enabled (bool): isNB flag of the settings file
+            is_new_bucketing_v2_enabled (bool): isNBv2 flag of the settings file
+
+        Returns:
+            string: Old, New or New_V2
+        """
+
+        is_old_bucketing_enabled = campaign.get("isOB") is not None
+        is_old_bucketing_v2_enabled = campaign.get("isOBv2") is not None
+
+        # old bucketing
+        if (not is_new_bucketing_enabled and not is_new_bucketing_v2_enabled) or (
+            is_new_bucketing_enabled and campaign.get("isOB")
+        ):
+            return BUCKETING_ALGO_OLD
+
+        # new bucketing
+        if (is_new_bucketing_enabled and not is_old_bucketing_enabled and not is_new_bucketing_v2_enabled) or (
+            is_new_bucketing_v2_enabled and is_old_bucketing_v2_enabled
+        ):
+            return BUCKETING_ALGO_NEW
+
+        # new bucketing v2
+        return BUCKETING_ALGO_NEW_V2
+
+    def _get_variation_bucketing_seed(self, algo, user_id, campaign, is_new_bucketing_enabled, account_id):
+        """Returns the seed for bucketing the user into variations for given bucketing algo
+
+        Args:
+            algo (string): Old, New or New_V2
+            user_id (string): the unique ID assigned to User
+            campaign (dict): the Campaign of which User is a part of
+            is_new_bucketing_enabled (bool): isNB flag of the settings file
+            account_id (int): account id, used by New_V2 algo
+
+        Returns:
+            string: user seed for generating hash
+        """
+
+        if algo == BUCKETING_ALGO_OLD:
+            return campaign_util.get_bucketing_seed(
+                user_id=user_id, campaign=campaign, is_new_bucketing_enabled=is_new_bucketing_enabled
+            )
+        if algo == BUCKETING_ALGO_NEW:
+            return campaign_util.get_bucketing_seed(
+                user_id=user_id, campaign=None, is_new_bucketing_enabled=is_new_bucketing_enabled
+            )
+        return campaign_util.get_bucketing_seed(
+            user_id=str(account_id) + "_" + str(user_id), campaign=campaign, is_new_bucketing_enabled=True
         )
 
-        return self.get_allocated_item(campaign.get("variations"), bucket_value)
+    def _get_variation_bucketing_multiplier(self, algo, campaign):
+        """Returns the multiplier for bucketing the user into variations for given bucketing algo
+
+        Args:
+            algo (string): Old, New or New_V2
+            campaign (dict): the Campaign of which User is a part of
+
+        Returns:
+            int|float: multiplier, see get_bucket_value_for_user
+        """
+
+        if algo == BUCKETING_ALGO_OLD:
+            normalize = constants.MAX_TRAFFIC_VALUE / campaign.get("percentTraffic")
+            return normalize / 100
+        return 1
@@ -14,7 +14,7 @@
 
 import random
 import bisect
-import copy
+from collections import OrderedDict
 from ..enums.log_message_enum import LogMessageEnum
 from ..enums.file_name_enum import FileNameEnum
 from ..enums.log_level_enum import LogLevelEnum
@@ -25,7 +25,9 @@ from ..logger import VWOLogger
 from .bucketer import Bucketer
 from ..services.segmentor import SegmentEvaluator
 from ..services.hooks_manager import HooksManager
+from ..services.campaign_group import CampaignGroup
 from ..constants import constants
+from ..constants.constants import INSTRUMENTATION
 
 FILE = FileNameEnum.Core.VariationDecider
 
@@ -34,10 +36,67 @@ MEG_ALGO_RANDOM = 1
 MEG_ALGO_ADVANCED = 2
 
 
+class _SettingsFileView(object):
+    """Exposes a settings_file passed without a SettingsFileManager the way a SettingsSnapshot does,
+    resolving the groups afresh as no lookup tables are built for it"""
+
+    def __init__(self, settings_file):
+        """
+        Args:
+            settings_file (dict): processed settings_file
+        """
+        self.settings_file = settings_file
+
+    def get_campaign_group(self, group_id):
+        """Resolves the group from the settings_file, see SettingsSnapshot.get_campaign_group
+
+        Args:
+            group_id (int): id of group
+
+        Returns:
+            CampaignGroup|None: group, None if not found
+        """
+        group = (self.settings_file.get("groups") or {}).get(str(group_id))
+        if group is None:
+            return None
+        return CampaignGroup(group_id, group, campaign_util.get_campaign_id_map(self.settings_file.get("campaigns")))
+
+    def get_compiled_segments(self, segments):
+        """No segments are compiled for a settings_file without a snapshot, see SettingsSnapshot.get_compiled_segments
+
+        Args:
+            segments (dict): segments of a campaign/variation from the settings_file
+
+        Returns:
+            None: segments are evaluated uncompiled
+        """
+        return None
+
+    def get_variation_allocation_ranges(self, campaign):
+        """No allocation ranges are kept for a settings_file without a snapshot,
+        see SettingsSnapshot.get_variation_allocation_ranges
+
+        Args:
+            campaign (dict): campaign from the settings_file
+
+        Returns:
+            None: ranges are computed by the Bucketer from the variations
+        """
+        return None
+
+
 class VariationDecider(object):
     """Class responsible for deciding the variation for a visitor"""
 
-    def __init__(self, user_storage=None, account_id=None, integrations=None, settings_file=None):
+    def __init__(
+        self,
+        user_storage=None,
+        account_id=None,
+        integrations=None,
+        settings_file=None,
+        settings_file_manager=None,
+        instrumentation=None,
+    ):
         """Initializes VariationDecider with settings_file,
             UserStorage and logger.
 
@@ -46,7 +105,12 @@ class VariationDecider(object):
                 get and set.
             account_id (string): Account ID of user
             integrations (dict|None): an integrations service instance for third party integrations
-            settings_file (dict|None): settings_file consisting all the campaign related data
+            settings_file (dict|None): settings_file consisting all the campaign related data,
+                used only if settings_file_manager is not passed
+            settings_file_manager (SettingsFileManager|None): manager publishing the settings_file
+                along with the lookup tables built for it
+            instrumentation (Instrumentation|None): times the stages of the decisions and counts
+                UserStorage calls and segments evaluated, for the APIs traced by it
         """
 
         self.logger = VWOLogger.getInstance()
@@ -55,7 +119,42 @@ class VariationDecider(object):
         self.user_storage = user_storage
         self.account_id = account_id
         self.hooks_manager = HooksManager(integrations) if integrations else None
-        self.settings_file = settings_file
+        self.settings_file_manager = settings_file_manager
+        self._settings_file = settings_file
+        self.instrumentation = instrumentation
+        if instrumentation is not None:
+            instrumentation.instrument(self, INSTRUMENTATION.WHITELISTING, "find_targeted_variation")
+            instrumentation.instrument(self, INSTRUMENTATION.USER_STORAGE_GET, "_get_user_storage_data")
+            instrumentation.instrument(self, INSTRUMENTATION.PRE_SEGMENTATION, "evaluate_pre_segmentation")
+            instrumentation.instrument(self, INSTRUMENTATION.BUCKETING, "is_user_part_of_campaign")
+            instrumentation.instrument(self.bucketer, INSTRUMENTATION.BUCKETING, "bucket_user_to_variation")
+            instrumentation.instrument(self, INSTRUMENTATION.MEG, "_get_group_winner_campaign")
+            instrumentation.instrument(self, INSTRUMENTATION.USER_STORAGE_SET, "_set_user_storage_data")
+            if self.hooks_manager is not None:
+                instrumentation.instrument(self.hooks_manager, INSTRUMENTATION.HOOKS, "execute")
+
+    @property
+    def settings_file(self):
+        """settings_file currently published by settings_file_manager, else the one passed"""
+        if self.settings_file_manager is not None:
+            return self.settings_file_manager.get_settings_file()
+        return self._settings_file
+
+    @settings_file.setter
+    def settings_file(self, settings_file):
+        self._settings_file = settings_file
+
+    def get_snapshot(self):
+        """Retrieves the snapshot currently published by settings_file_manager, else a view of the
+        settings_file passed. Read it once per API call and pass it along, so that the whole decision
+        sees one settings_file even if it gets updated meanwhile
+
+        Returns:
+            SettingsSnapshot|_SettingsFileView: settings_file along with its groups and compiled segments
+        """
+        if self.settings_file_manager is not None:
+            return self.settings_file_manager.get_snapshot()
+        return _SettingsFileView(self._settings_file)
 
     def get_variation(self, user_id, campaign, **kwargs):  # noqa: C901
         """Returns variation for the user for given campaign
@@ -87,6 +186,12 @@ class VariationDecider(object):
             variation_targeting_variables(dict): variables for variation targeting, pass it through **kwargs as
             variation_targeting_variables = {}
             api_method (string): api's name calling get_variation method
+            vwo_user_id (string): UUID of the user, generated if not passed
+            user_storage_data_map (dict): user_storage_data prefetched for the campaign and the other
+                campaigns of its group mapped to their keys, looked up in UserStorage if not passed
+            group_winners (dict): winner campaigns of the groups already evaluated for the user mapped to
+                group ids, the winner of the campaign's group is reused from and added to it
+            snapshot (SettingsSnapshot): snapshot the campaign was read from, see get_snapshot
 
         Returns:
             variation (dict|None): Dict object containing the information regarding variation
@@ -97,14 +202,22 @@ class VariationDecider(object):
         variation_targeting_variables = kwargs.get("variation_targeting_variables")
         goal_data = kwargs.get("goal_data")
         api_method = kwargs.get("api_method")
-        is_campaign_part_of_group = self.settings_file and campaign_util.is_part_of_group(
-            self.settings_file, campaign.get("id")
-        )
+        user_storage_data_map = kwargs.get("user_storage_data_map")
+        group_winners = kwargs.get("group_winners")
+        snapshot = kwargs.get("snapshot")
+        if snapshot is None:
+            snapshot = self.get_snapshot()
+        settings_file = snapshot.settings_file
+        campaign_group = None
+        if settings_file and campaign_util.is_part_of_group(settings_file, campaign.get("id")):
+            group_id = settings_file.get("campaignGroups").get(str(campaign.get("id")))
+            campaign_group = self._get_campaign_group(group_id, snapshot=snapshot)
+        is_campaign_part_of_group = campaign_group is not None
         group_algo = MEG_ALGO_RANDOM
 
         # get is_new_bucleting_enabled flag from settings file
-        if self.settings_file:
-            is_new_bucketing_enabled = self.settings_file.get("isNB")
+        if settings_file:
+            is_new_bucketing_enabled = settings_file.get("isNB")
         else:
             is_new_bucketing_enabled = False
 
@@ -130,31 +243,28 @@ class VariationDecider(object):
             # Campaign Whitelisting conditions
             "variation_targeting_variables": variation_targeting_variables,
             # VWO generated UUID based on passed UserId and Account ID
-            "vwo_user_id": uuid_util.generate_for(user_id, self.account_id),
+            "vwo_user_id": kwargs.get("vwo_user_id") or uuid_util.generate_for(user_id, self.account_id),
         }
 
         # check if campaign part of MEG
         if is_campaign_part_of_group:
             # get group details
-            group_id = self.settings_file.get("campaignGroups").get(str(campaign.get("id")))
-            group_algo = (
-                self.settings_file.get("groups").get(str(group_id)).get("et")
-                if self.settings_file.get("groups").get(str(group_id)).get("et") != None
-                else MEG_ALGO_RANDOM
-            )
+            group_algo = campaign_group.algo if campaign_group.algo is not None else MEG_ALGO_RANDOM
 
             # update group details in decision dictionary
             decision.update(
                 {
                     # Group info
                     "group_id": group_id,
-                    "group_name": self.settings_file.get("groups").get(str(group_id)).get("name"),
+                    "group_name": campaign_group.name,
                     "group_algo": group_algo,
                 }
             )
 
         # Evaluate whitelisting at first
-        targeted_variation = self.find_targeted_variation(user_id, campaign, variation_targeting_variables)
+        targeted_variation = self.find_targeted_variation(
+            user_id, campaign, variation_targeting_variables, snapshot=snapshot
+        )
         if targeted_variation:
 
             decision.update({"from_user_storage_service": False, "is_user_whitelisted": True})
@@ -173,29 +283,39 @@ class VariationDecider(object):
             return targeted_variation, False
 
         # Try retrieving data from user_storage
-        user_storage_data = self._get_user_storage_data(user_id, campaign.get("key"))
+        if user_storage_data_map is not None:
+            user_storage_data = user_storage_data_map.get(campaign.get("key"))
+        else:
+            user_storage_data = self._get_user_storage_data(user_id, campaign.get("key"))
         is_user_tracked = bool(user_storage_data)
         if (
             bool(self.user_storage) is True
             and is_user_tracked is False
-            and api_method not in [constants.API_METHODS.IS_FEATURE_ENABLED, constants.API_METHODS.ACTIVATE, None]
+            and api_method
+            not in [
+                constants.API_METHODS.IS_FEATURE_ENABLED,
+                constants.API_METHODS.ACTIVATE,
+                constants.API_METHODS.GET_ALL_DECISIONS,
+                None,
+            ]
         ):
 
-            self.logger.log(
+            self.logger.lazy_log(
                 LogLevelEnum.DEBUG,
-                LogMessageEnum.DEBUG_MESSAGES.CAMPAIGN_NOT_ACTIVATED.format(
-                    file=FILE, campaign_key=campaign.get("key"), user_id=user_id, api_method=api_method
-                ),
+                LogMessageEnum.DEBUG_MESSAGES.CAMPAIGN_NOT_ACTIVATED,
+                file=FILE,
+                campaign_key=campaign.get("key"),
+                user_id=user_id,
+                api_method=api_method,
             )
 
-            self.logger.log(
+            self.logger.lazy_log(
                 LogLevelEnum.INFO,
-                LogMessageEnum.INFO_MESSAGES.CAMPAIGN_NOT_ACTIVATED.format(
-                    file=FILE,
-                    campaign_key=campaign.get("key"),
-                    user_id=user_id,
-                    reason="track it" if api_method is constants.API_METHODS.TRACK else "get the decision/value",
-                ),
+                LogMessageEnum.INFO_MESSAGES.CAMPAIGN_NOT_ACTIVATED,
+                file=FILE,
+                campaign_key=campaign.get("key"),
+                user_id=user_id,
+                reason="track it" if api_method is constants.API_METHODS.TRACK else "get the decision/value",
             )
 
             return None, is_user_tracked
@@ -205,14 +325,13 @@ class VariationDecider(object):
             if goal_data:
                 is_goal_tracked = self.identify_tracked_goal_from_user_storage(goal_data, user_storage_data)
                 if is_goal_tracked and (not goal_data.get("mca") == -1) and (not goal_data.get("hasProps") == True):
-                    self.logger.log(
+                    self.logger.lazy_log(
                         LogLevelEnum.INFO,
-                        LogMessageEnum.INFO_MESSAGES.GOAL_ALREADY_TRACKED.format(
-                            file=FILE,
-                            goal_identifier=goal_data.get("identifier"),
-                            campaign_key=campaign.get("key"),
-                            user_id=user_id,
-                        ),
+                        LogMessageEnum.INFO_MESSAGES.GOAL_ALREADY_TRACKED,
+                        file=FILE,
+                        goal_identifier=goal_data.get("identifier"),
+                        campaign_key=campaign.get("key"),
+                        user_id=user_id,
                     )
                     return None, is_user_tracked
             # Retreving variation from user_storage_data
@@ -237,114 +356,95 @@ class VariationDecider(object):
                 return variation, is_user_tracked
 
         is_presegmentation_and_traffic_passed = self.evaluate_pre_segmentation(
-            user_id, campaign, custom_variables
-        ) and self.is_user_part_of_campaign(user_id, campaign, is_new_bucketing_enabled)
+            user_id, campaign, custom_variables, snapshot=snapshot
+        ) and self.is_user_part_of_campaign(user_id, campaign, is_new_bucketing_enabled, snapshot=snapshot)
 
         # Group check
         if is_presegmentation_and_traffic_passed and is_campaign_part_of_group:
-
-            group_campaigns = campaign_util.get_group_campaigns(settings_file=self.settings_file, group_id=group_id)
-            is_any_campaign_whitelisted_or_stored = self._check_stored_or_whitelisted_campaigns(
-                user_id, campaign, group_id, group_campaigns, variation_targeting_variables
-            )
-
-            # Return None as other campaign(s) is/are whitelisted or stored
-            if is_any_campaign_whitelisted_or_stored:
-                self.logger.log(
-                    LogLevelEnum.INFO,
-                    LogMessageEnum.INFO_MESSAGES.CALLED_CAMPAIGN_NOT_WINNER.format(
-                        file=FILE,
-                        campaign_key=campaign.get("key"),
-                        group_name=self.settings_file.get("groups").get(str(group_id)).get("name"),
-                        user_id=user_id,
-                    ),
+            if group_winners is not None and group_id in group_winners:
+                winner_campaign = group_winners[group_id]
+            else:
+                winner_campaign = self._get_group_winner_campaign(
+                    user_id,
+                    campaign,
+                    group_id,
+                    group_algo,
+                    custom_variables,
+                    variation_targeting_variables,
+                    user_storage_data_map,
+                    snapshot=snapshot,
                 )
-                return None, is_user_tracked
-
-            # eligible campaigns cannot be empty as atleast called campaign will be present
-            eligible_campaigns = self._get_eligible_campaigns(user_id, custom_variables, campaign, group_campaigns)
-
-            non_eligible_campaigns_key = ",".join(
-                [
-                    group_campaign.get("key")
-                    for group_campaign in group_campaigns
-                    if group_campaign not in eligible_campaigns
-                ]
-            )
-
-            self.logger.log(
-                LogLevelEnum.DEBUG,
-                LogMessageEnum.DEBUG_MESSAGES.GOT_ELIGIBLE_CAMPAIGNS.format(
-                    file=FILE,
-                    eligible_campaigns_key=(
-                        ",".join([eligible_campaign.get("key") for eligible_campaign in eligible_campaigns])
-                    ),
-                    ineligible_campaigns_log_text=(
-                        "campaigns:{campaign_keys}".format(campaign_keys=non_eligible_campaigns_key)
-                        if non_eligible_campaigns_key
-                        else "no campaigns"
-                    ),
-                    group_name=self.settings_file.get("groups").get(str(group_id)).get("name"),
-                    user_id=user_id,
-                ),
-            )
-            self.logger.log(
-                LogLevelEnum.INFO,
-                LogMessageEnum.INFO_MESSAGES.GOT_ELIGIBLE_CAMPAIGNS.format(
-                    file=FILE,
-                    no_of_eligible_campaigns=len(eligible_campaigns),
-                    no_of_group_campaigns=len(group_campaigns),
-                    group_name=self.settings_file.get("groups").get(str(group_id)).get("name"),
-                    user_id=user_id,
-                ),
-            )
-
-            # get winner campaign based on algorithm
-            if group_algo == MEG_ALGO_RANDOM:
-                winner_campaign = self._get_winner_campaign(user_id, eligible_campaigns, group_id)
-            elif group_algo == MEG_ALGO_ADVANCED:
-                winner_campaign = self._get_winner_campaign_advanced(user_id, eligible_campaigns, group_id)
-
-            self.logger.log(
-                LogLevelEnum.INFO,
-                LogMessageEnum.INFO_MESSAGES.GOT_WINNER_CAMPAIGN.format(
-                    file=FILE,
-                    campaign_key=winner_campaign.get("key"),
-                    group_name=self.settings_file.get("groups").get(str(group_id)).get("name"),
-                    user_id=user_id,
-                ),
-            )
+                if group_winners is not None:
+                    group_winners[group_id] = winner_campaign
 
             # get variation from the winner campaign, if same as called campaign
             if winner_campaign and winner_campaign.get("id") == campaign.get("id"):
-                return self._get_bucketed_variation(user_id, campaign, decision, goal_data), is_user_tracked
+                return (
+                    self._get_bucketed_variation(user_id, campaign, decision, goal_data, snapshot=snapshot),
+                    is_user_tracked,
+                )
 
             # No winner/variation
-            self.logger.log(
+            self.logger.lazy_log(
                 LogLevelEnum.INFO,
-                LogMessageEnum.INFO_MESSAGES.CALLED_CAMPAIGN_NOT_WINNER.format(
-                    file=FILE,
-                    campaign_key=campaign.get("key"),
-                    group_name=self.settings_file.get("groups").get(str(group_id)).get("name"),
-                    user_id=user_id,
-                ),
+                LogMessageEnum.INFO_MESSAGES.CALLED_CAMPAIGN_NOT_WINNER,
+                file=FILE,
+                campaign_key=campaign.get("key"),
+                group_name=campaign_group.name,
+                user_id=user_id,
             )
 
             return None, is_user_tracked
 
         # Evaluate pre-segmentation and percent-traffic
         if is_presegmentation_and_traffic_passed:
-            return self._get_bucketed_variation(user_id, campaign, decision, goal_data), is_user_tracked
+            return (
+                self._get_bucketed_variation(user_id, campaign, decision, goal_data, snapshot=snapshot),
+                is_user_tracked,
+            )
 
         # No variation
-        self.logger.log(
+        self.logger.lazy_log(
             LogLevelEnum.INFO,
-            LogMessageEnum.INFO_MESSAGES.USER_GOT_NO_VARIATION.format(
-                file=FILE, user_id=user_id, campaign_key=campaign.get("key"), campaign_type=campaign.get("type")
-            ),
+            LogMessageEnum.INFO_MESSAGES.USER_GOT_NO_VARIATION,
+            file=FILE,
+            user_id=user_id,
+            campaign_key=campaign.get("key"),
+            campaign_type=campaign.get("type"),
         )
         return None, is_user_tracked
 
+    def get_variations(self, user_id, campaigns, **kwargs):
+        """Returns variations for the user for given campaigns, see get_variation. Work common to
+        the campaigns is done once for the user: UUID is generated once, user_storage_data of the campaigns
+        and of the other campaigns of their groups is fetched in one lookup if UserStorage provides get_many,
+        and the winner campaign of each group is found once.
+
+        Args:
+            user_id (string): the unique ID assigned to User
+            campaigns (list): campaigns in which user is participating
+            custom_variables(dict): variables for pre-segmentation, pass it through **kwargs
+            variation_targeting_variables(dict): variables for variation targeting, pass it through **kwargs
+            api_method (string): api's name calling get_variations method
+            vwo_user_id (string): UUID of the user, generated if not passed
+            snapshot (SettingsSnapshot): snapshot the campaigns were read from, see get_snapshot
+
+        Returns:
+            list: (variation, is_user_tracked) for each campaign in order, see get_variation
+        """
+        kwargs["vwo_user_id"] = kwargs.get("vwo_user_id") or uuid_util.generate_for(user_id, self.account_id)
+        kwargs["group_winners"] = {}
+        if kwargs.get("snapshot") is None:
+            kwargs["snapshot"] = self.get_snapshot()
+
+        if self.user_storage:
+            campaign_keys = self._get_campaign_keys_with_group_campaigns(campaigns, snapshot=kwargs["snapshot"])
+            kwargs["user_storage_data_map"] = dict(
+                zip(campaign_keys, self._get_user_storage_data_for_campaigns(user_id, campaign_keys))
+            )
+
+        return [self.get_variation(user_id, campaign, **kwargs) for campaign in campaigns]
+
     def identify_tracked_goal_from_user_storage(self, goal_data, user_storage_data):
         """Identifies whether the given goal has been already tracked or not.
 
@@ -374,8 +474,8 @@ class VariationDecider(object):
             updated_goals_tracked = goals_tracked + "_vwo_" + goal_data.get("identifier")
         else:
             updated_goals_tracked = goal_data.get("identifier")
-        user_storage_data["goalIdentifiers"] = updated_goals_tracked
-        self._set_user_storage_data(user_storage_data)
+        # data is as returned by UserStorage, hence it is updated on a copy
+        self._set_user_storage_data(dict(user_storage_data, goalIdentifiers=updated_goals_tracked))
 
     def get_variation_from_user_storage(self, user_id, campaign, user_storage_data):
         """Tries retrieving variation from user_storage
@@ -394,25 +494,27 @@ class VariationDecider(object):
                 if validate_util.is_valid_string(variation_name):
                     variation = campaign_util.get_campaign_variation(campaign, variation_name)
                     if variation:
-                        self.logger.log(
+                        self.logger.lazy_log(
                             LogLevelEnum.INFO,
-                            LogMessageEnum.INFO_MESSAGES.GOT_STORED_VARIATION.format(
-                                file=FILE,
-                                campaign_key=campaign.get("key"),
-                                user_id=user_id,
-                                variation_name=variation.get("name"),
-                            ),
+                            LogMessageEnum.INFO_MESSAGES.GOT_STORED_VARIATION,
+                            file=FILE,
+                            campaign_key=campaign.get("key"),
+                            user_id=user_id,
+                            variation_name=variation.get("name"),
                         )
                         return variation
-        self.logger.log(
+        self.logger.lazy_log(
             LogLevelEnum.DEBUG,
-            LogMessageEnum.DEBUG_MESSAGES.NO_STORED_VARIATION.format(
-                file=FILE, campaign_key=campaign.get("key"), user_id=user_id
-            ),
+            LogMessageEnum.DEBUG_MESSAGES.NO_STORED_VARIATION,
+            file=FILE,
+            campaign_key=campaign.get("key"),
+            user_id=user_id,
         )
         return None
 
-    def find_targeted_variation(self, user_id, campaign, variation_targeting_variables, disable_logs=False):
+    def find_targeted_variation(
+        self, user_id, campaign, variation_targeting_variables, disable_logs=False, snapshot=None
+    ):
         """Identifies and retrives if there exists any targeted variation in the given campaign
         for given user_id
 
@@ -421,30 +523,36 @@ class VariationDecider(object):
             campaign(dict): campaign for which the variation is to be retrieved
             variation_targeting_variables(dict): variables for finding targeted variation
             disable_logs (bool): disable logs if True
+            snapshot (SettingsSnapshot|None): snapshot the campaign was read from, see get_snapshot
 
         Returns:
             targeted_variation (dict|None): Dict object containing the information regarding forced
             variation assigned else None
         """
 
+        if snapshot is None:
+            snapshot = self.get_snapshot()
+        settings_file = snapshot.settings_file
+
         # get is_new_bucleting_enabled flag from settings file
-        if self.settings_file:
-            is_new_bucketing_enabled = self.settings_file.get("isNB")
+        if settings_file:
+            is_new_bucketing_enabled = settings_file.get("isNB")
         else:
             is_new_bucketing_enabled = False
 
         if campaign.get("isForcedVariationEnabled") is not True:
-            self.logger.log(
+            self.logger.lazy_log(
                 LogLevelEnum.DEBUG,
-                LogMessageEnum.DEBUG_MESSAGES.WHITELISTING_SKIPPED.format(
-                    file=FILE, user_id=user_id, campaign_key=campaign.get("key")
-                ),
-                disable_logs,
+                LogMessageEnum.DEBUG_MESSAGES.WHITELISTING_SKIPPED,
+                file=FILE,
+                user_id=user_id,
+                campaign_key=campaign.get("key"),
+                disable_logs=disable_logs,
             )
             return None
         else:
             white_listed_variations_list = self._get_white_listed_variations_list(
-                user_id, campaign, variation_targeting_variables, disable_logs
+                user_id, campaign, variation_targeting_variables, disable_logs, snapshot=snapshot
             )
             white_listed_variations_len = len(white_listed_variations_list)
             if white_listed_variations_len == 0:
@@ -452,11 +560,12 @@ class VariationDecider(object):
             elif white_listed_variations_len == 1:
                 targeted_variation = white_listed_variations_list[0]
             else:
-                # Scale the traffic percent of each variation
-                campaign_util.scale_variations(white_listed_variations_list)
-                # Allocate new range
-                campaign_util.set_allocation_ranges(white_listed_variations_list)
-                # Now retrieve the variation from the modified_campaign_for_whitelisting
+                # Allocate new range as per the scaled traffic percent of each variation, leaving
+                # the variations of the campaign unchanged
+                allocation_ranges = campaign_util.get_sorted_allocation_ranges_for_weights(
+                    campaign_util.get_scaled_weights(white_listed_variations_list)
+                )
+                # Now retrieve the variation from the whitelisted variations
                 bucket_value = self.bucketer.get_bucket_value_for_user(
                     campaign_util.get_bucketing_seed(
                         is_new_bucketing_enabled=is_new_bucketing_enabled, user_id=user_id, campaign=campaign
@@ -464,31 +573,34 @@ class VariationDecider(object):
                     user_id,
                     constants.MAX_TRAFFIC_VALUE,
                 )
-                targeted_variation = self.bucketer.get_allocated_item(white_listed_variations_list, bucket_value)
-            variation_status = (
-                "and variation {variation_name} is assigned"
-                if campaign.get("type") != constants.CAMPAIGN_TYPES.FEATURE_ROLLOUT
-                else ""
-            )
-            self.logger.log(
-                LogLevelEnum.INFO,
-                LogMessageEnum.INFO_MESSAGES.SEGMENTATION_STATUS.format(
-                    file=FILE,
-                    campaign_key=campaign.get("key"),
-                    user_id=user_id,
-                    campaign_type=campaign.get("type"),
-                    variables=variation_targeting_variables,
-                    variation_status=variation_status.format(
-                        variation_name=targeted_variation.get("name") if targeted_variation else None
+                targeted_variation = self.bucketer.get_allocated_item(
+                    white_listed_variations_list, bucket_value, allocation_ranges
+                )
+            if self.logger.is_enabled_for(LogLevelEnum.INFO):
+                variation_status = (
+                    "and variation {variation_name} is assigned"
+                    if campaign.get("type") != constants.CAMPAIGN_TYPES.FEATURE_ROLLOUT
+                    else ""
+                )
+                self.logger.log(
+                    LogLevelEnum.INFO,
+                    LogMessageEnum.INFO_MESSAGES.SEGMENTATION_STATUS.format(
+                        file=FILE,
+                        campaign_key=campaign.get("key"),
+                        user_id=user_id,
+                        campaign_type=campaign.get("type"),
+                        variables=variation_targeting_variables,
+                        variation_status=variation_status.format(
+                            variation_name=targeted_variation.get("name") if targeted_variation else None
+                        ),
+                        segmentation_type=constants.SEGMENTATION_TYPES.WHITELISTING,
+                        status=ResultStatus.PASSED if targeted_variation is not None else ResultStatus.FAILED,
                     ),
-                    segmentation_type=constants.SEGMENTATION_TYPES.WHITELISTING,
-                    status=ResultStatus.PASSED if targeted_variation is not None else ResultStatus.FAILED,
-                ),
-                disable_logs,
-            )
+                    disable_logs,
+                )
             return targeted_variation
 
-    def evaluate_pre_segmentation(self, user_id, campaign, custom_variables, disable_logs=False):
+    def evaluate_pre_segmentation(self, user_id, campaign, custom_variables, disable_logs=False, snapshot=None):
         """Evaluates segmentation for the user_id against the segments found inside
         the campaign.
 
@@ -497,6 +609,7 @@ class VariationDecider(object):
             campaign(dict): running campaign for which the segments is to be evaluated
             custom_variables(dict): variables for segmentation
             disable_logs (bool): disable logs if True
+            snapshot (SettingsSnapshot|None): snapshot the campaign was read from, see get_snapshot
 
         Returns:
             bool: True if user passes segmentation, else False
@@ -504,62 +617,58 @@ class VariationDecider(object):
         segments = campaign.get("segments")
         if not validate_util.is_valid_value(segments):
             result = True
-            self.logger.log(
+            self.logger.lazy_log(
                 LogLevelEnum.DEBUG,
-                LogMessageEnum.DEBUG_MESSAGES.SEGMENTATION_SKIPPED.format(
-                    file=FILE,
-                    user_id=user_id,
-                    campaign_key=campaign.get("key"),
-                    variables=custom_variables,
-                    variation_status="",
-                ),
-                disable_logs,
+                LogMessageEnum.DEBUG_MESSAGES.SEGMENTATION_SKIPPED,
+                file=FILE,
+                user_id=user_id,
+                campaign_key=campaign.get("key"),
+                variables=custom_variables,
+                variation_status="",
+                disable_logs=disable_logs,
             )
         else:
             if not validate_util.is_valid_value(custom_variables):
-                self.logger.log(
+                self.logger.lazy_log(
                     LogLevelEnum.DEBUG,
-                    LogMessageEnum.DEBUG_MESSAGES.NO_VARIABLES.format(
-                        file=FILE,
-                        user_id=user_id,
-                        campaign_key=campaign.get("key"),
-                        segmentation_type=constants.SEGMENTATION_TYPES.PRE_SEGMENTATION,
-                    ),
-                    disable_logs,
+                    LogMessageEnum.DEBUG_MESSAGES.NO_VARIABLES,
+                    file=FILE,
+                    user_id=user_id,
+                    campaign_key=campaign.get("key"),
+                    segmentation_type=constants.SEGMENTATION_TYPES.PRE_SEGMENTATION,
+                    disable_logs=disable_logs,
                 )
                 custom_variables = {}
             try:
-                result = self.segment_evaluator.evaluate(segments, custom_variables)
-                self.logger.log(
+                result = self._evaluate_segments(segments, custom_variables, snapshot=snapshot)
+                self.logger.lazy_log(
                     LogLevelEnum.INFO,
-                    LogMessageEnum.INFO_MESSAGES.SEGMENTATION_STATUS.format(
-                        file=FILE,
-                        user_id=user_id,
-                        campaign_key=campaign.get("key"),
-                        campaign_type=campaign.get("type"),
-                        variables=custom_variables,
-                        variation_status="",
-                        segmentation_type=constants.SEGMENTATION_TYPES.PRE_SEGMENTATION,
-                        status=ResultStatus.PASSED if result else ResultStatus.FAILED,
-                    ),
-                    disable_logs,
+                    LogMessageEnum.INFO_MESSAGES.SEGMENTATION_STATUS,
+                    file=FILE,
+                    user_id=user_id,
+                    campaign_key=campaign.get("key"),
+                    campaign_type=campaign.get("type"),
+                    variables=custom_variables,
+                    variation_status="",
+                    segmentation_type=constants.SEGMENTATION_TYPES.PRE_SEGMENTATION,
+                    status=ResultStatus.PASSED if result else ResultStatus.FAILED,
+                    disable_logs=disable_logs,
                 )
             except Exception as e:
                 result = False
-                self.logger.log(
+                self.logger.lazy_log(
                     LogLevelEnum.ERROR,
-                    LogMessageEnum.ERROR_MESSAGES.SEGMENTATION_ERROR.format(
-                        file=FILE,
-                        user_id=user_id,
-                        campaign_key=campaign.get("key"),
-                        variables=custom_variables,
-                        variation_status="",
-                        error_message=e,
-                    ),
+                    LogMessageEnum.ERROR_MESSAGES.SEGMENTATION_ERROR,
+                    file=FILE,
+                    user_id=user_id,
+                    campaign_key=campaign.get("key"),
+                    variables=custom_variables,
+                    variation_status="",
+                    error_message=e,
                 )
         return result
 
-    def is_user_part_of_campaign(self, user_id, campaign, disable_logs=False):
+    def is_user_part_of_campaign(self, user_id, campaign, disable_logs=False, snapshot=None):
         """Evaluates whether the user should become part of campaign
         or not
 
@@ -567,14 +676,19 @@ class VariationDecider(object):
             user_id (string): the unique ID assigned to User
             campaign (dict): campaign in which user is participating
             disable_logs (bool): disable logs if True
+            snapshot (SettingsSnapshot|None): snapshot the campaign was read from, see get_snapshot
 
         Returns:
             bool: True if user should become part of campaign, else False
         """
 
+        if snapshot is None:
+            snapshot = self.get_snapshot()
+        settings_file = snapshot.settings_file
+
         # get is_new_bucleting_enabled flag from settings file
-        if self.settings_file:
-            is_new_bucketing_enabled = self.settings_file.get("isNB")
+        if settings_file:
+            is_new_bucketing_enabled = settings_file.get("isNB")
         else:
             is_new_bucketing_enabled = False
 
@@ -582,22 +696,67 @@ class VariationDecider(object):
             return True
         else:
             # not part of campaign
-            self.logger.log(
+            self.logger.lazy_log(
                 LogLevelEnum.DEBUG,
-                LogMessageEnum.DEBUG_MESSAGES.USER_NOT_PART_OF_CAMPAIGN.format(
-                    file=FILE,
-                    user_id=user_id,
-                    campaign_key=campaign.get("key"),
-                    method="is_user_part_of_campaign",
-                    campaign_type=campaign.get("type"),
-                ),
-                disable_logs,
+                LogMessageEnum.DEBUG_MESSAGES.USER_NOT_PART_OF_CAMPAIGN,
+                file=FILE,
+                user_id=user_id,
+                campaign_key=campaign.get("key"),
+                method="is_user_part_of_campaign",
+                campaign_type=campaign.get("type"),
+                disable_logs=disable_logs,
             )
             return False
 
+    def bucket_users(self, user_ids, campaign, snapshot=None):
+        """Buckets a batch of users into variations of the campaign. Only traffic
+        allocation and variation bucketing are evaluated, i.e. no whitelisting,
+        pre-segmentation, UserStorage or mutually exclusive groups.
+
+        Args:
+            user_ids (list): the unique IDs assigned to Users
+            campaign (dict): campaign in which users are participating
+            snapshot (SettingsSnapshot|None): snapshot the campaign was read from, see get_snapshot
+
+        Returns:
+            list: variation(dict|None) for each user in order of user_ids,
+                None if user does not become part of campaign
+        """
+
+        if snapshot is None:
+            snapshot = self.get_snapshot()
+        settings_file = snapshot.settings_file
+        if settings_file:
+            is_new_bucketing_enabled = settings_file.get("isNB")
+            is_new_bucketing_v2_enabled = settings_file.get("isNBv2")
+            account_id = settings_file.get("accountId")
+        else:
+            is_new_bucketing_enabled = False
+            is_new_bucketing_v2_enabled = False
+            account_id = None
+
+        is_user_part = self.bucketer.are_users_part_of_campaign(user_ids, campaign, is_new_bucketing_enabled)
+        part_user_ids = [user_id for user_id, is_part in zip(user_ids, is_user_part) if is_part]
+        if not part_user_ids:
+            return [None] * len(user_ids)
+
+        variations = iter(
+            self.bucketer.bucket_many(
+                part_user_ids,
+                campaign,
+                is_new_bucketing_enabled=is_new_bucketing_enabled,
+                is_new_bucketing_v2_enabled=is_new_bucketing_v2_enabled,
+                account_id=account_id,
+                allocation_ranges=snapshot.get_variation_allocation_ranges(campaign),
+            )
+        )
+        return [next(variations) if is_part else None for is_part in is_user_part]
+
     # Private helper methods
 
-    def _get_white_listed_variations_list(self, user_id, campaign, variation_targeting_variables, disable_logs=False):
+    def _get_white_listed_variations_list(
+        self, user_id, campaign, variation_targeting_variables, disable_logs=False, snapshot=None
+    ):
         """Identifies all forced variations which are targeted by variation_targeting_variables
 
         Args:
@@ -605,20 +764,20 @@ class VariationDecider(object):
             campaign(dict): campaign for which the targeted variation(s) is to be retrieved
             variation_targeting_variables(dict): variables for variation targeting
             disable_logs (bool): disable logs if True
+            snapshot (SettingsSnapshot|None): snapshot the campaign was read from, see get_snapshot
 
         Returns:
             targeted_variation (list): List of targeted variation objects
         """
         if not validate_util.is_valid_value(variation_targeting_variables):
-            self.logger.log(
+            self.logger.lazy_log(
                 LogLevelEnum.DEBUG,
-                LogMessageEnum.DEBUG_MESSAGES.NO_VARIABLES.format(
-                    file=FILE,
-                    user_id=user_id,
-                    campaign_key=campaign.get("key"),
-                    segmentation_type=constants.SEGMENTATION_TYPES.WHITELISTING,
-                ),
-                disable_logs,
+                LogMessageEnum.DEBUG_MESSAGES.NO_VARIABLES,
+                file=FILE,
+                user_id=user_id,
+                campaign_key=campaign.get("key"),
+                segmentation_type=constants.SEGMENTATION_TYPES.WHITELISTING,
+                disable_logs=disable_logs,
             )
             variation_targeting_variables = {}
 
@@ -628,54 +787,78 @@ class VariationDecider(object):
         for variation in campaign.get("variations"):
             if not validate_util.is_valid_value(variation.get("segments")):
                 result = False
-                self.logger.log(
-                    LogLevelEnum.DEBUG,
-                    LogMessageEnum.DEBUG_MESSAGES.SEGMENTATION_SKIPPED.format(
-                        file=FILE,
-                        user_id=user_id,
-                        variation_name=variation.get("name"),
-                        campaign_key=campaign.get("key"),
-                        variation_status="for variation %s" % variation.get("name")
-                        if campaign.get("type") != constants.CAMPAIGN_TYPES.FEATURE_ROLLOUT
-                        else "",
-                    ),
-                    disable_logs,
-                )
-            else:
-                try:
-                    result = self.segment_evaluator.evaluate(variation.get("segments"), variation_targeting_variables)
+                if self.logger.is_enabled_for(LogLevelEnum.DEBUG):
                     self.logger.log(
                         LogLevelEnum.DEBUG,
-                        LogMessageEnum.DEBUG_MESSAGES.SEGMENTATION_STATUS.format(
+                        LogMessageEnum.DEBUG_MESSAGES.SEGMENTATION_SKIPPED.format(
                             file=FILE,
                             user_id=user_id,
-                            status="passed" if result else "failed",
-                            variables=variation_targeting_variables,
+                            variation_name=variation.get("name"),
+                            campaign_key=campaign.get("key"),
                             variation_status="for variation %s" % variation.get("name")
                             if campaign.get("type") != constants.CAMPAIGN_TYPES.FEATURE_ROLLOUT
-                            else "and becomes part of the rollout",
-                            campaign_key=campaign.get("key"),
-                            segmentation_type=constants.SEGMENTATION_TYPES.WHITELISTING,
+                            else "",
                         ),
                         disable_logs,
                     )
+            else:
+                try:
+                    result = self._evaluate_segments(
+                        variation.get("segments"), variation_targeting_variables, snapshot=snapshot
+                    )
+                    if self.logger.is_enabled_for(LogLevelEnum.DEBUG):
+                        self.logger.log(
+                            LogLevelEnum.DEBUG,
+                            LogMessageEnum.DEBUG_MESSAGES.SEGMENTATION_STATUS.format(
+                                file=FILE,
+                                user_id=user_id,
+                                status="passed" if result else "failed",
+                                variables=variation_targeting_variables,
+                                variation_status="for variation %s" % variation.get("name")
+                                if campaign.get("type") != constants.CAMPAIGN_TYPES.FEATURE_ROLLOUT
+                                else "and becomes part of the rollout",
+                                campaign_key=campaign.get("key"),
+                                segmentation_type=constants.SEGMENTATION_TYPES.WHITELISTING,
+                            ),
+                            disable_logs,
+                        )
                 except Exception as e:
                     result = False
-                    self.logger.log(
+                    self.logger.lazy_log(
                         LogLevelEnum.ERROR,
-                        LogMessageEnum.ERROR_MESSAGES.SEGMENTATION_ERROR.format(
-                            file=FILE,
-                            user_id=user_id,
-                            variables=variation_targeting_variables,
-                            campaign_key=campaign.get("key"),
-                            variation_status=" for variation %s" % variation.get("name"),
-                            error_message=e,
-                        ),
+                        LogMessageEnum.ERROR_MESSAGES.SEGMENTATION_ERROR,
+                        file=FILE,
+                        user_id=user_id,
+                        variables=variation_targeting_variables,
+                        campaign_key=campaign.get("key"),
+                        variation_status=" for variation %s" % variation.get("name"),
+                        error_message=e,
                     )
             if result:
-                white_listed_variations_list.append(copy.deepcopy(variation))
+                white_listed_variations_list.append(variation)
         return white_listed_variations_list
 
+    def _evaluate_segments(self, segments, custom_variables, snapshot=None):
+        """Evaluates the segments using the function compiled while processing the settings_file,
+        falls back to walking the segments if they were not compiled
+
+        Args:
+            segments (dict): segments of a campaign/variation
+            custom_variables (dict): variables for segmentation
+            snapshot (SettingsSnapshot|None): snapshot the segments were read from, see get_snapshot
+
+        Returns:
+            bool: True if custom_variables satisfy the segments, else False
+        """
+        if self.instrumentation is not None:
+            self.instrumentation.increment(INSTRUMENTATION.SEGMENTS_EVALUATED)
+        if snapshot is None:
+            snapshot = self.get_snapshot()
+        compiled_segments = snapshot.get_compiled_segments(segments)
+        if compiled_segments:
+            return compiled_segments(custom_variables)
+        return self.segment_evaluator.evaluate(segments, custom_variables)
+
     def _create_user_storage_data(self, user_id, campaign_key, variation_name, **kwargs):
         """Creates a user_storage_data object to be set by user_storage service implemented by user
 
@@ -710,25 +893,115 @@ class VariationDecider(object):
         """
 
         if not self.user_storage:
-            self.logger.log(
-                LogLevelEnum.DEBUG, LogMessageEnum.DEBUG_MESSAGES.NO_USER_STORAGE_GET.format(file=FILE), disable_logs
+            self.logger.lazy_log(
+                LogLevelEnum.DEBUG,
+                LogMessageEnum.DEBUG_MESSAGES.NO_USER_STORAGE_GET,
+                file=FILE,
+                disable_logs=disable_logs,
             )
             return False
+        if self.instrumentation is not None:
+            self.instrumentation.increment(INSTRUMENTATION.USER_STORAGE_CALLS)
         try:
             user_storage_data = self.user_storage.get(user_id, campaign_key)
-            self.logger.log(
+            self.logger.lazy_log(
                 LogLevelEnum.INFO,
-                LogMessageEnum.INFO_MESSAGES.LOOKING_UP_USER_STORAGE.format(file=FILE, user_id=user_id),
-                disable_logs,
+                LogMessageEnum.INFO_MESSAGES.LOOKING_UP_USER_STORAGE,
+                file=FILE,
+                user_id=user_id,
+                disable_logs=disable_logs,
             )
-            return copy.deepcopy(user_storage_data)
+            return user_storage_data
         except Exception:
-            self.logger.log(
+            self.logger.lazy_log(
                 LogLevelEnum.ERROR,
-                LogMessageEnum.ERROR_MESSAGES.LOOK_UP_USER_STORAGE_FAILED.format(file=FILE, user_id=user_id),
+                LogMessageEnum.ERROR_MESSAGES.LOOK_UP_USER_STORAGE_FAILED,
+                file=FILE,
+                user_id=user_id,
             )
             return False
 
+    def _get_user_storage_data_for_campaigns(self, user_id, campaign_keys, disable_logs=False):
+        """Get the UserStorageData of multiple campaigns in one lookup if the UserStorage
+        service provides get_many method, else lazily with one lookup per campaign via get method
+
+        Args:
+            user_id (string): Unique user identifier
+            campaign_keys (list): Unique campaign identifiers
+            disable_logs (bool): disable logs if True
+
+        Yields:
+            dict: user_storage_data of each campaign_key in order, falsy if not found
+        """
+
+        get_many = getattr(self.user_storage, "get_many", None)
+        if campaign_keys and callable(get_many):
+            if self.instrumentation is not None:
+                self.instrumentation.increment(INSTRUMENTATION.USER_STORAGE_CALLS)
+                get_many = self.instrumentation.time_stage(get_many, INSTRUMENTATION.USER_STORAGE_GET)
+            try:
+                user_storage_data_map = get_many(user_id, campaign_keys) or {}
+            except Exception:
+                self.logger.lazy_log(
+                    LogLevelEnum.ERROR,
+                    LogMessageEnum.ERROR_MESSAGES.LOOK_UP_USER_STORAGE_FAILED,
+                    file=FILE,
+                    user_id=user_id,
+                )
+            else:
+                self.logger.lazy_log(
+                    LogLevelEnum.INFO,
+                    LogMessageEnum.INFO_MESSAGES.LOOKING_UP_USER_STORAGE,
+                    file=FILE,
+                    user_id=user_id,
+                    disable_logs=disable_logs,
+                )
+                for campaign_key in campaign_keys:
+                    yield user_storage_data_map.get(campaign_key)
+                return
+
+        for campaign_key in campaign_keys:
+            yield self._get_user_storage_data(user_id, campaign_key, disable_logs=disable_logs)
+
+    def _get_campaign_keys_with_group_campaigns(self, campaigns, snapshot=None):
+        """Returns keys of the campaigns, and of the other campaigns of their groups
+
+        Args:
+            campaigns (list): campaigns whose keys are needed
+            snapshot (SettingsSnapshot|None): snapshot the campaigns were read from, see get_snapshot
+
+        Returns:
+            list: unique campaign keys
+        """
+        if snapshot is None:
+            snapshot = self.get_snapshot()
+        settings_file = snapshot.settings_file
+        campaign_groups = (settings_file and settings_file.get("campaignGroups")) or {}
+        campaign_keys = OrderedDict()
+        for campaign in campaigns:
+            campaign_keys[campaign.get("key")] = True
+            group_id = campaign_groups.get(str(campaign.get("id")))
+            campaign_group = self._get_campaign_group(group_id, snapshot=snapshot) if group_id is not None else None
+            if campaign_group is not None:
+                for group_campaign in campaign_group.campaigns:
+                    campaign_keys[group_campaign.get("key")] = True
+        return list(campaign_keys)
+
+    def _get_campaign_group(self, group_id, snapshot=None):
+        """Returns the group resolved from the settings_file, resolving it afresh
+        when there is no settings_file_manager
+
+        Args:
+            group_id (int): id of group
+            snapshot (SettingsSnapshot|None): snapshot the group is read from, see get_snapshot
+
+        Returns:
+            CampaignGroup|None: group, None if not found
+        """
+        if snapshot is None:
+            snapshot = self.get_snapshot()
+        return snapshot.get_campaign_group(group_id)
+
     def _set_user_storage_data(self, user_storage_data):
         """If UserStorage is provided and variation was found,
         set the assigned variation in UserStorage.
@@ -744,28 +1017,32 @@ class VariationDecider(object):
         """
 
         if not self.user_storage:
-            self.logger.log(LogLevelEnum.DEBUG, LogMessageEnum.DEBUG_MESSAGES.NO_USER_STORAGE_SET.format(file=FILE))
+            self.logger.lazy_log(LogLevelEnum.DEBUG, LogMessageEnum.DEBUG_MESSAGES.NO_USER_STORAGE_SET, file=FILE)
             return False
 
+        if self.instrumentation is not None:
+            self.instrumentation.increment(INSTRUMENTATION.USER_STORAGE_CALLS)
         try:
             self.user_storage.set(user_storage_data)
-            self.logger.log(
+            self.logger.lazy_log(
                 LogLevelEnum.INFO,
-                LogMessageEnum.INFO_MESSAGES.SAVING_DATA_USER_STORAGE_STATUS.format(
-                    file=FILE, user_id=user_storage_data.get("userId"), status="successful"
-                ),
+                LogMessageEnum.INFO_MESSAGES.SAVING_DATA_USER_STORAGE_STATUS,
+                file=FILE,
+                user_id=user_storage_data.get("userId"),
+                status="successful",
             )
             return True
         except Exception as e:
-            self.logger.log(
+            self.logger.lazy_log(
                 LogLevelEnum.ERROR,
-                LogMessageEnum.ERROR_MESSAGES.SET_USER_STORAGE_FAILED.format(
-                    file=FILE, user_id=user_storage_data.get("userId"), error_message=e
-                ),
+                LogMessageEnum.ERROR_MESSAGES.SET_USER_STORAGE_FAILED,
+                file=FILE,
+                user_id=user_storage_data.get("userId"),
+                error_message=e,
             )
             return False
 
-    def _get_bucketed_variation(self, user_id, campaign, decision, goal_data):
+    def _get_bucketed_variation(self, user_id, campaign, decision, goal_data, snapshot=None):
         """Returns variation for the user for given campaign, if user becomes
         part of campaign and store the variation found in the user_storage.
 
@@ -774,27 +1051,32 @@ class VariationDecider(object):
             campaign (dict): campaign in which user is participating
             decision (dict): data containing campaign info passed to hooks manager
             goal_data (dict): the goal related data
+            snapshot (SettingsSnapshot|None): snapshot the campaign was read from, see get_snapshot
 
         Returns:
             variation (dict|None): Dict object containing the information regarding variation
             assigned else None
         """
 
+        if snapshot is None:
+            snapshot = self.get_snapshot()
+        settings_file = snapshot.settings_file
+
         # get is_new_bucleting_enabled flag from settings file
-        if self.settings_file:
-            is_new_bucketing_enabled = self.settings_file.get("isNB")
+        if settings_file:
+            is_new_bucketing_enabled = settings_file.get("isNB")
         else:
             is_new_bucketing_enabled = False
 
         # get is_new_bucleting_v2_enabled flag from settings file
-        if self.settings_file:
-            is_new_bucketing_v2_enabled = self.settings_file.get("isNBv2")
+        if settings_file:
+            is_new_bucketing_v2_enabled = settings_file.get("isNBv2")
         else:
             is_new_bucketing_v2_enabled = False
 
         # get account id from settings file
-        if self.settings_file:
-            account_id = self.settings_file.get("accountId")
+        if settings_file:
+            account_id = settings_file.get("accountId")
         else:
             account_id = None
 
@@ -804,23 +1086,25 @@ class VariationDecider(object):
             is_new_bucketing_enabled=is_new_bucketing_enabled,
             is_new_bucketing_v2_enabled=is_new_bucketing_v2_enabled,
             account_id=account_id,
+            allocation_ranges=snapshot.get_variation_allocation_ranges(campaign),
         )
         new_user_storage_data = self._create_user_storage_data(
             user_id, campaign.get("key"), variation.get("name"), goal_data=goal_data
         )
         self._set_user_storage_data(new_user_storage_data)
-        self.logger.log(
-            LogLevelEnum.INFO,
-            LogMessageEnum.INFO_MESSAGES.GOT_VARIATION_FOR_USER.format(
-                file=FILE,
-                user_id=user_id,
-                campaign_key=campaign.get("key"),
-                campaign_type=campaign.get("type"),
-                variation_status="got variation_name:%s" % variation.get("name")
-                if campaign.get("type") != constants.CAMPAIGN_TYPES.FEATURE_ROLLOUT
-                else "becomes part of rollout",
-            ),
-        )
+        if self.logger.is_enabled_for(LogLevelEnum.INFO):
+            self.logger.log(
+                LogLevelEnum.INFO,
+                LogMessageEnum.INFO_MESSAGES.GOT_VARIATION_FOR_USER.format(
+                    file=FILE,
+                    user_id=user_id,
+                    campaign_key=campaign.get("key"),
+                    campaign_type=campaign.get("type"),
+                    variation_status="got variation_name:%s" % variation.get("name")
+                    if campaign.get("type") != constants.CAMPAIGN_TYPES.FEATURE_ROLLOUT
+                    else "becomes part of rollout",
+                ),
+            )
 
         decision.update({"from_user_storage_service": False, "is_user_whitelisted": False})
         if campaign.get("type") == constants.CAMPAIGN_TYPES.FEATURE_ROLLOUT:
@@ -836,8 +1120,113 @@ class VariationDecider(object):
 
         return variation
 
+    def _get_group_winner_campaign(
+        self,
+        user_id,
+        called_campaign,
+        group_id,
+        group_algo,
+        custom_variables,
+        variation_targeting_variables,
+        user_storage_data_map=None,
+        snapshot=None,
+    ):
+        """Finds the winner campaign of the group for the user, once the called campaign has passed
+        pre-segmentation and traffic allocation. The winner is the same for any such campaign of the group.
+
+        Args:
+            user_id (string): the unique ID assigned to User
+            called_campaign (dict): campaign for which api is called
+            group_id (int): group id of which called campaign is part of
+            group_algo (int): MEG algorithm of the group
+            custom_variables(dict): variables for segmentation
+            variation_targeting_variables (dict): variables for variation targeting
+            user_storage_data_map (dict|None): prefetched user_storage_data mapped to campaign keys
+            snapshot (SettingsSnapshot|None): snapshot the called campaign was read from, see get_snapshot
+
+        Returns:
+            dict|None: winner campaign, None if any other campaign of the group is whitelisted or stored
+        """
+        if snapshot is None:
+            snapshot = self.get_snapshot()
+        campaign_group = self._get_campaign_group(group_id, snapshot=snapshot)
+        group_campaigns = campaign_group.campaigns
+        is_any_campaign_whitelisted_or_stored = self._check_stored_or_whitelisted_campaigns(
+            user_id,
+            called_campaign,
+            campaign_group,
+            group_campaigns,
+            variation_targeting_variables,
+            user_storage_data_map=user_storage_data_map,
+            snapshot=snapshot,
+        )
+
+        # No winner as other campaign(s) is/are whitelisted or stored
+        if is_any_campaign_whitelisted_or_stored:
+            return None
+
+        # eligible campaigns cannot be empty as atleast called campaign will be present
+        eligible_campaigns = self._get_eligible_campaigns(
+            user_id, custom_variables, called_campaign, group_campaigns, snapshot=snapshot
+        )
+
+        if self.logger.is_enabled_for(LogLevelEnum.DEBUG):
+            non_eligible_campaigns_key = ",".join(
+                [
+                    group_campaign.get("key")
+                    for group_campaign in group_campaigns
+                    if group_campaign not in eligible_campaigns
+                ]
+            )
+
+            self.logger.log(
+                LogLevelEnum.DEBUG,
+                LogMessageEnum.DEBUG_MESSAGES.GOT_ELIGIBLE_CAMPAIGNS.format(
+                    file=FILE,
+                    eligible_campaigns_key=",".join(
+                        [eligible_campaign.get("key") for eligible_campaign in eligible_campaigns]
+                    ),
+                    ineligible_campaigns_log_text="campaigns:{campaign_keys}".format(
+                        campaign_keys=non_eligible_campaigns_key
+                    )
+                    if non_eligible_campaigns_key
+                    else "no campaigns",
+                    group_name=campaign_group.name,
+                    user_id=user_id,
+                ),
+            )
+        self.logger.lazy_log(
+            LogLevelEnum.INFO,
+            LogMessageEnum.INFO_MESSAGES.GOT_ELIGIBLE_CAMPAIGNS,
+            file=FILE,
+            no_of_eligible_campaigns=len(eligible_campaigns),
+            no_of_group_campaigns=len(group_campaigns),
+            group_name=campaign_group.name,
+            user_id=user_id,
+        )
+
+        # get winner campaign based on algorithm
+        if group_algo == MEG_ALGO_RANDOM:
+            winner_campaign = self._get_winner_campaign(
+                user_id, eligible_campaigns, group_id, campaign_group, snapshot=snapshot
+            )
+        elif group_algo == MEG_ALGO_ADVANCED:
+            winner_campaign = self._get_winner_campaign_advanced(
+                user_id, eligible_campaigns, group_id, campaign_group, snapshot=snapshot
+            )
+
+        self.logger.lazy_log(
+            LogLevelEnum.INFO,
+            LogMessageEnum.INFO_MESSAGES.GOT_WINNER_CAMPAIGN,
+            file=FILE,
+            campaign_key=winner_campaign.get("key"),
+            group_name=campaign_group.name,
+            user_id=user_id,
+        )
+        return winner_campaign
+
     def _check_stored_or_whitelisted_campaigns(
-        self, user_id, called_campaign, group_id, group_campaigns, variation_targeting_variables
+        self, user_id, called_campaign, campaign_group, group_campaigns, variation_targeting_variables, **kwargs
     ):
         """Checks if any other campaign in group_campaigns satisfies whitelisting
         or is in user storage.
@@ -845,9 +1234,12 @@ class VariationDecider(object):
         Args:
             user_id (string): the unique ID assigned to User
             called_campaign (dict): campaign for which api is called
-            group_id (int): group id of which called campaign is part of
+            campaign_group (CampaignGroup): group of which called campaign is part of
             group_campaigns (list): campaigns part of group
             variation_targeting_variables (dict): variables for variation targeting
+            user_storage_data_map (dict|None): prefetched user_storage_data mapped to campaign keys,
+                pass it through **kwargs, looked up in UserStorage if None
+            snapshot (SettingsSnapshot|None): snapshot the campaigns were read from, pass it through **kwargs
 
         Returns:
             bool: True if any other campaign in group satisfes whitelisting or
@@ -856,40 +1248,44 @@ class VariationDecider(object):
         for campaign in group_campaigns:
             if called_campaign.get("id") != campaign.get("id"):
                 targeted_variation = self.find_targeted_variation(
-                    user_id, campaign, variation_targeting_variables, disable_logs=True
+                    user_id, campaign, variation_targeting_variables, disable_logs=True, snapshot=kwargs.get("snapshot")
                 )
                 if targeted_variation:
-                    self.logger.log(
+                    self.logger.lazy_log(
                         LogLevelEnum.INFO,
-                        LogMessageEnum.INFO_MESSAGES.OTHER_CAMPAIGN_SATIFIES_WHITELISTING_OR_STORAGE.format(
-                            file=FILE,
-                            campaign_key=campaign.get("key"),
-                            group_name=self.settings_file.get("groups").get(str(group_id)).get("name"),
-                            user_id=user_id,
-                            type="whitelisting",
-                        ),
+                        LogMessageEnum.INFO_MESSAGES.OTHER_CAMPAIGN_SATIFIES_WHITELISTING_OR_STORAGE,
+                        file=FILE,
+                        campaign_key=campaign.get("key"),
+                        group_name=campaign_group.name,
+                        user_id=user_id,
+                        type="whitelisting",
                     )
                     return True
 
-        for campaign in group_campaigns:
-            if called_campaign.get("id") != campaign.get("id"):
-                user_storage_data = self._get_user_storage_data(user_id, campaign.get("key"), disable_logs=True)
-                if user_storage_data:
-                    self.logger.log(
-                        LogLevelEnum.INFO,
-                        LogMessageEnum.INFO_MESSAGES.OTHER_CAMPAIGN_SATIFIES_WHITELISTING_OR_STORAGE.format(
-                            file=FILE,
-                            campaign_key=campaign.get("key"),
-                            group_name=self.settings_file.get("groups").get(str(group_id)).get("name"),
-                            user_id=user_id,
-                            type="user storage",
-                        ),
-                    )
-                    return True
+        other_campaigns = [campaign for campaign in group_campaigns if called_campaign.get("id") != campaign.get("id")]
+        user_storage_data_map = kwargs.get("user_storage_data_map")
+        if user_storage_data_map is not None:
+            user_storage_data_list = [user_storage_data_map.get(campaign.get("key")) for campaign in other_campaigns]
+        else:
+            user_storage_data_list = self._get_user_storage_data_for_campaigns(
+                user_id, [campaign.get("key") for campaign in other_campaigns], disable_logs=True
+            )
+        for campaign, user_storage_data in zip(other_campaigns, user_storage_data_list):
+            if user_storage_data:
+                self.logger.lazy_log(
+                    LogLevelEnum.INFO,
+                    LogMessageEnum.INFO_MESSAGES.OTHER_CAMPAIGN_SATIFIES_WHITELISTING_OR_STORAGE,
+                    file=FILE,
+                    campaign_key=campaign.get("key"),
+                    group_name=campaign_group.name,
+                    user_id=user_id,
+                    type="user storage",
+                )
+                return True
 
         return False
 
-    def _get_eligible_campaigns(self, user_id, custom_variables, called_campaign, group_campaigns):
+    def _get_eligible_campaigns(self, user_id, custom_variables, called_campaign, group_campaigns, snapshot=None):
         """Finds and returns eligible campaigns from group_campaigns.
 
         Args:
@@ -897,6 +1293,7 @@ class VariationDecider(object):
             custom_variables(dict): variables for segmentation
             called_campaign (dict): campaign for which api is called
             group_campaigns (list): campaigns part of group
+            snapshot (SettingsSnapshot|None): snapshot the campaigns were read from, see get_snapshot
 
         Returns:
             eligible_campaigns (list): eligible campaigns from which winner
@@ -906,14 +1303,16 @@ class VariationDecider(object):
 
         for campaign in group_campaigns:
             if called_campaign.get("id") == campaign.get("id") or (
-                self.evaluate_pre_segmentation(user_id, campaign, custom_variables, disable_logs=True)
-                and self.is_user_part_of_campaign(user_id, campaign, disable_logs=True)
+                self.evaluate_pre_segmentation(
+                    user_id, campaign, custom_variables, disable_logs=True, snapshot=snapshot
+                )
+                and self.is_user_part_of_campaign(user_id, campaign, disable_logs=True, snapshot=snapshot)
             ):
                 eligible_campaigns.append(campaign)
 
         return eligible_campaigns
 
-    def _get_winner_campaign(self, user_id, eligible_campaigns, group_id):
+    def _get_winner_campaign(self, user_id, eligible_campaigns, group_id, campaign_group, snapshot=None):
         """Finds and returns the winner campaign from eligible_campaigns list.
 
         Args:
@@ -921,25 +1320,28 @@ class VariationDecider(object):
             eligible_campaigns (list): campaigns part of group which were
                 eligible to be winner
             group_id (int): group id of which called campaign is part of
+            campaign_group (CampaignGroup): group of which called campaign is part of
+            snapshot (SettingsSnapshot|None): snapshot the campaigns were read from, see get_snapshot
 
         Returns:
             winner_campaign (dict): winner campaign from eligible_campaigns
         """
 
+        if snapshot is None:
+            snapshot = self.get_snapshot()
+        settings_file = snapshot.settings_file
+
         # get is_new_bucleting_enabled flag from settings file
-        if self.settings_file:
-            is_new_bucketing_enabled = self.settings_file.get("isNB")
+        if settings_file:
+            is_new_bucketing_enabled = settings_file.get("isNB")
         else:
             is_new_bucketing_enabled = False
 
         if len(eligible_campaigns) == 1:
             return eligible_campaigns[0]
 
-        # Scale the traffic percent of each campaign
-        campaign_util.scale_campaigns(eligible_campaigns)
-        # Allocate new range for campaigns
-        campaign_util.set_allocation_ranges(eligible_campaigns)
-        # Now retrieve the campaign from the modified_campaign_for_whitelisting
+        # Campaigns share the traffic equally, ranges are built once for the same eligible campaigns
+        campaigns, allocation_ranges = campaign_group.get_allocation(eligible_campaigns)
         bucket_value = self.bucketer.get_bucket_value_for_user(
             campaign_util.get_bucketing_seed(
                 is_new_bucketing_enabled=is_new_bucketing_enabled, user_id=user_id, group_id=group_id
@@ -948,24 +1350,28 @@ class VariationDecider(object):
             constants.MAX_TRAFFIC_VALUE,
             disable_logs=True,
         )
-        winner_campaign = self.bucketer.get_allocated_item(eligible_campaigns, bucket_value)
+        winner_campaign = self.bucketer.get_allocated_item(campaigns, bucket_value, allocation_ranges)
 
         return winner_campaign
 
-    def _get_winner_campaign_advanced(self, user_id, eligible_campaigns, group_id):
+    def _get_winner_campaign_advanced(self, user_id, eligible_campaigns, group_id, campaign_group, snapshot=None):
         """Finds and returns the winner campaign from eligible_campaigns list for advanced algo - priority campaigns and traffic distribution
 
         Args:
             user_id (string): the unique ID assigned to User
             eligible_campaigns (list): campaigns part of group which were eligible to be winner
             group_id (int): MEG id of which called campaign is part of
-            group_name (string): MEG name of which called campaign is part of
+            campaign_group (CampaignGroup): MEG of which called campaign is part of
+            snapshot (SettingsSnapshot|None): snapshot the campaigns were read from, see get_snapshot
 
         Returns:
             winner_campaign (dict): winner campaign from eligible_campaigns
         """
-        if self.settings_file:
-            is_new_bucketing_enabled = self.settings_file.get("isNB")
+        if snapshot is None:
+            snapshot = self.get_snapshot()
+        settings_file = snapshot.settings_file
+        if settings_file:
+            is_new_bucketing_enabled = settings_file.get("isNB")
         else:
             is_new_bucketing_enabled = False
 
@@ -974,63 +1380,31 @@ class VariationDecider(object):
         if len(eligible_campaigns) == 1:
             return eligible_campaigns[0]
 
-        # get the priorirty and traffic weightage campaigns
-        priority_campaigns = (
-            self.settings_file.get("groups").get(str(group_id)).get("p")
-            if self.settings_file.get("groups").get(str(group_id)).get("p") != None
-            else None
-        )
-        traffic_weightage_campaigns = (
-            self.settings_file.get("groups").get(str(group_id)).get("wt")
-            if self.settings_file.get("groups").get(str(group_id)).get("wt") != None
-            else None
-        )
-
-        # Traffic weightage campaigns
-        eligible_traffic_weightage_campaigns = []
-        percentage_traffic_for_weightage_campaigns = []
-
         # Parse through the priority campaigns and find the winner from the shortlisted campaigns
-        if priority_campaigns and eligible_campaigns:
-            for priority_campaign_id in priority_campaigns:
-                # Stop parsing if winner found
-                if winner_campaign:
-                    break
-
-                # Parse through the eligible campaigns to search for this priority campaign
-                for eligible_campaign in eligible_campaigns:
-                    if eligible_campaign.get("id") == priority_campaign_id:
-                        # Set the winner campaign
-                        winner_campaign = eligible_campaign
-
-                        # log priority campaign winner
-                        self.logger.log(
-                            LogLevelEnum.INFO,
-                            LogMessageEnum.INFO_MESSAGES.PRIORITY_CAMPAIGN_WINNER.format(
-                                file=FILE,
-                                campaign_id=winner_campaign.get("id"),
-                            ),
-                        )
-                        break
-
-        # If winner not found, parse through traffic weightage campaigns
-        if winner_campaign is None and eligible_campaigns and traffic_weightage_campaigns:
-            # Parse through eligible campaigns and get their traffic weightages
+        for priority_campaign_id in campaign_group.priority_campaign_ids:
+            # Search the eligible campaigns for this priority campaign
             for eligible_campaign in eligible_campaigns:
+                if eligible_campaign.get("id") == priority_campaign_id:
+                    # Set the winner campaign
+                    winner_campaign = eligible_campaign
 
-                if str(eligible_campaign.get("id")) in traffic_weightage_campaigns:
-                    # Get campaign and percentage traffic
-                    eligible_campaign["weight"] = traffic_weightage_campaigns.get(str(eligible_campaign.get("id")))
-                    eligible_traffic_weightage_campaigns.append(eligible_campaign)
-
-                """ Finding winner campaign using weighted Distibution :
-                    1. Re-distribute the traffic by assigning range values for each camapign in particaptingCampaignList 
-                    2. Calculate bucket value for the given userId and groupId
-                    3. Get the winnerCampaign by checking the Start and End Bucket Allocations of each campaign
-                """
-            # Allocate new range for campaigns
-            campaign_util.set_allocation_ranges(eligible_traffic_weightage_campaigns)
-            # Now retrieve the campaign from the modified_campaign_for_whitelisting
+                    # log priority campaign winner
+                    self.logger.lazy_log(
+                        LogLevelEnum.INFO,
+                        LogMessageEnum.INFO_MESSAGES.PRIORITY_CAMPAIGN_WINNER,
+                        file=FILE,
+                        campaign_id=winner_campaign.get("id"),
+                    )
+                    return winner_campaign
+
+        # If winner not found, parse through traffic weightage campaigns
+        if campaign_group.traffic_weightage:
+            # Finding winner campaign using weighted Distibution :
+            #   1. Re-distribute the traffic by assigning range values for each camapign in particaptingCampaignList,
+            #      built once for the same eligible campaigns
+            #   2. Calculate bucket value for the given userId and groupId
+            #   3. Get the winnerCampaign by checking the Start and End Bucket Allocations of each campaign
+            campaigns, allocation_ranges = campaign_group.get_traffic_weightage_allocation(eligible_campaigns)
             bucket_value = self.bucketer.get_bucket_value_for_user(
                 campaign_util.get_bucketing_seed(
                     is_new_bucketing_enabled=is_new_bucketing_enabled, user_id=user_id, group_id=group_id
@@ -1039,15 +1413,14 @@ class VariationDecider(object):
                 constants.MAX_TRAFFIC_VALUE,
                 disable_logs=True,
             )
-            winner_campaign = self.bucketer.get_allocated_item(eligible_traffic_weightage_campaigns, bucket_value)
+            winner_campaign = self.bucketer.get_allocated_item(campaigns, bucket_value, allocation_ranges)
 
             # log traffic weightage campaign winner
-            self.logger.log(
+            self.logger.lazy_log(
                 LogLevelEnum.INFO,
-                LogMessageEnum.INFO_MESSAGES.TRAFFIC_WEIGHTAGE_CAMPAIGN_WINNER.format(
-                    file=FILE,
-                    campaign_id=winner_campaign.get("id"),
-                ),
+                LogMessageEnum.INFO_MESSAGES.TRAFFIC_WEIGHTAGE_CAMPAIGN_WINNER,
+                file=FILE,
+                campaign_id=winner_campaign.get("id"),
             )
 
         return winner_campaign
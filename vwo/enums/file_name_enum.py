@@ -19,11 +19,14 @@ class FileNameEnum:
     class Vwo:
         VWO_PATH = "vwo/"
         VWO = VWO_PATH + "vwo"
+        AsyncVWO = VWO_PATH + "async_vwo"
 
     class Api:
         API_PATH = "vwo/api/"
         Activate = API_PATH + "activate"
         GetVariationName = API_PATH + "get_variation_name"
+        GetVariationNamesBulk = API_PATH + "get_variation_names_bulk"
+        GetAllDecisions = API_PATH + "get_all_decisions"
         Track = API_PATH + "track"
         IsFeatureEnabled = API_PATH + "is_feature_enabled"
         GetFeatureVariableValue = API_PATH + "get_feature_variable_value"
@@ -32,6 +35,7 @@ class FileNameEnum:
         FlushEvents = API_PATH + "flush_events"
         GetAndUpdateSettingsFile = API_PATH + "get_and_update_settings_file"
         SET_OPT_OUT = API_PATH + "set_opt_out"
+        GetDispatcherStats = API_PATH + "get_dispatcher_stats"
 
     class Core:
         CORE_PATH = "vwo/core/"
@@ -41,10 +45,17 @@ class FileNameEnum:
     class Event:
         EVENT_PATH = "vwo/event/"
         EventDispatcher = EVENT_PATH + "event_dispatcher"
+        AsyncEventDispatcher = EVENT_PATH + "async_event_dispatcher"
 
     class Http:
         HTTP_PATH = "vwo/http/"
         Connection = HTTP_PATH + "connection"
+        AsyncConnection = HTTP_PATH + "async_connection"
+
+    class Storage:
+        STORAGE_PATH = "vwo/storage/"
+        AsyncUser = STORAGE_PATH + "async_user"
+        Redis = STORAGE_PATH + "redis"
 
     class Helpers:
         HELPERS_PATH = "vwo/helpers/"
@@ -63,6 +74,10 @@ class FileNameEnum:
     class Services:
         SERVICES_PATH = "vwo/services/"
         SettingsFileManager = SERVICES_PATH + "settings_file_manager"
+        SettingsPoller = SERVICES_PATH + "settings_poller"
+        SettingsCache = SERVICES_PATH + "settings_cache"
+        SharedSettings = SERVICES_PATH + "shared_settings"
         SegmentEvaluator = SERVICES_PATH + "segment_evaluator"
         HooksManager = SERVICES_PATH + "hooks_manager"
+        Instrumentation = SERVICES_PATH + "instrumentation"
         UrlManager = SERVICES_PATH + "url_manager"
@@ -26,6 +26,15 @@ class LogMessageEnum:
         LOGGING_LOGGER_INSTANCE_USED = "({file}): [API_NAME] Python logging module's logger instantiated"
         SDK_INITIALIZED = "({file}): [API_NAME] SDK properly initialzed"
         SETTINGS_FILE_PROCESSED = "({file}): [API_NAME] Settings file processed"
+        SETTINGS_FILE_NOT_MODIFIED = (
+            "({file}): settings_file is not modified since it was last fetched, skipped processing it"
+        )
+        SETTINGS_FILE_CHANGES = "({file}): [API_NAME] settings_file updated with changes: {changes}"
+        SETTINGS_FILE_LOADED_FROM_CACHE = "({file}): Processed settings_file loaded from cache directory:{cache_dir}"
+        SHARED_SETTINGS_FILE_LOADED = (
+            "({file}): Processed settings_file of generation:{generation} loaded from shared file:{path}"
+        )
+        SETTINGS_POLLER_STARTED = "({file}): Polling settings_file every {interval} seconds with jitter:{jitter}"
         NO_STORED_VARIATION = "({file}): [API_NAME] No stored variation for user_id:{user_id} for campaign_key:{campaign_key} found in UserStorage"
         NO_USER_STORAGE_GET = "({file}): [API_NAME] No UserStorage to get data"
         NO_USER_STORAGE_SET = "({file}): [API_NAME] No UserStorage to set data"
@@ -34,6 +43,7 @@ class LogMessageEnum:
             "({file}): [API_NAME] user_id:{user_id} having hash:{hash_value} got bucketValue:{bucket_value}"
         )
         VARIATION_HASH_BUCKET_VALUE = "({file}): [API_NAME] user_id:{user_id} for campaign_key:{campaign_key} having percent traffic:{percent_traffic} got bucket value:{bucket_value}"
+        BULK_BUCKETING = "({file}): [API_NAME] {no_of_users} users bucketed for campaign_key:{campaign_key} using {algo} bucketing algo"
         GOT_VARIATION_FOR_USER = "({file}): [API_NAME] user_id:{user_id} for campaign_key:{campaign_key} type: {campaign_type} got variation_name:{variation_name} inside method:{method}"
         USER_NOT_PART_OF_CAMPAIGN = "({file}): [API_NAME] user_id:{user_id} for campaign_key:{campaign_key} type: {campaign_type} did not become part of campaign method:{method}"
         UUID_FOR_USER = (
@@ -104,6 +114,9 @@ class LogMessageEnum:
         USER_ALREADY_TRACKED = "({file}): [API_NAME] User ID:{user_id} for Campaign:{campaign_key} has already been tracked earlier for '{api_method}' API. Skipping now"
         SETTINGS_FILE_UPDATED = "({file}): [API_NAME] vwo_sdk_instance is updated with the latest settings_file"
         SETTINGS_FILE_NOT_UPDATED = "({file}): [API_NAME] settings_file fetched are same as earlier fetched settings"
+        CACHED_SETTINGS_FILE_USED = (
+            "({file}): settings_file passed is not valid, launching with the one cached in directory:{cache_dir}"
+        )
 
         BULK_IMPRESSION_SUCCESS = (
             "({file}): Impression event - {end_point} was successfully received by VWO having account_id:{account_id}"
@@ -129,6 +142,10 @@ class LogMessageEnum:
     class WARNING_MESSAGES:
         """Classobj encapsulating various WARNING messages"""
 
+        BATCH_EVENT_SPLIT = "({file}): Batch of {queue_length} events exceeded the payload size accepted by VWO, retrying it as two batches. events_per_request lowered to:{events_per_request} for accountId:{account_id}"
+        BULK_RETRY_SCHEDULED = "({file}): Batch events couldn't be received by VWO, got status code: {status_code}. Retrying {queue_length} events in {delay} seconds, attempt {attempt} of {max_retries}"
+        SYNC_FLUSH_NOT_AWAITED = "({file}): Stopped waiting for the events to be synced to VWO {reason}, they are still being synced in the background"
+
     class ERROR_MESSAGES:
         """Classobj encapsulating various ERROR messages"""
 
@@ -137,6 +154,8 @@ class LogMessageEnum:
         )
         ACTIVATE_API_INVALID_PARAMS = "({file}): [API_NAME] API got bad parameters. It expects campaign_key(String) as first and user_id(String) as second argument, custom_variables(dict) for pre-segmentation and variation_targeting_variables(dict) for white-listing can be passed via kwargs"
         API_CONFIG_CORRUPTED = "({file}): [API_NAME] API has corrupted configuration"
+        GET_VARIATION_NAMES_BULK_API_INVALID_PARAMS = "({file}): [API_NAME] API got bad parameters. It expects campaign_key(String) as first and user_ids(List of String) as second argument"
+        GET_ALL_DECISIONS_API_INVALID_PARAMS = "({file}): [API_NAME] API got bad parameters. It expects user_id(String) as first and campaign_keys(List of String or None) as second argument, custom_variables(dict) for pre-segmentation and variation_targeting_variables(dict) for white-listing can be passed via kwargs"
         GET_VARIATION_NAME_API_INVALID_PARAMS = "({file}): [API_NAME] API got bad parameters. It expects campaign_key(String) as first and user_id(String) as second argument, custom_variables(dict) for pre-segmentation and variation_targeting_variables(dict) for white-listing can be passed via kwargs"
         TRACK_API_INVALID_PARAMS = "({file}): [API_NAME] API got bad parameters. It expects campaign_key(String or Array of Strings or None) as first user_id(String) as second and goal_identifier(String/Number) as third argument. revenue_value(Float/Number/String) can be passed through kwargs and is required for revenue goal only. custom_variables(dict) for pre-segmentation and variation_targeting_variables(dict) for white-listing can be passed via kwargs"
         TRACK_API_GOAL_NOT_FOUND = "({file}): [API_NAME] Goal:{goal_identifier} not found for campaign_key:{campaign_key} and user_id:{user_id}"
@@ -148,6 +167,8 @@ class LogMessageEnum:
             "({file}): [API_NAME] campaign_key:{campaign_key} is not RUNNING. Please verify from VWO App"
         )
         LOOK_UP_USER_STORAGE_FAILED = "({file}): [API_NAME] Looking data from UserStorage failed for user_id:{user_id}"
+        REDIS_GET_MANY_FAILED = "({file}): Reading {no_of_keys} keys of user_id:{user_id} from redis with MGET failed. Error message: {error_message}"
+        REDIS_WRITE_BEHIND_FAILED = "({file}): Writing {no_of_writes} buffered set calls to redis failed, keeping them buffered for the next flush. Error message: {error_message}"
         SET_USER_STORAGE_FAILED = "({file}): [API_NAME] Error while saving data into UserStorage for user_id:{user_id}. Error message: {error_message}"
         INVALID_CAMPAIGN = "({file}): [API_NAME] Invalid campaign passed to {method} of this file"
         INVALID_USER_ID = "({file}): [API_NAME] Invalid user_id:{user_id} passed to {method} of this file"
@@ -184,6 +205,22 @@ class LogMessageEnum:
         CONNECTION_ERROR = "({file}): HTTP Connection - {reason}. Error - {err}"
 
         BATCH_EVENT_LIMIT_EXCEEDED = "({file}): Impression event - {end_point} failed due to exceeding payload size. Parameter events_per_request in batch_events config in launch API has value:{events_per_request} for accountId:{account_id}. Please read the official documentation for knowing the size limits."
+        SETTINGS_CACHE_READ_FAILED = (
+            "({file}): Reading settings_file from cache directory:{cache_dir} failed. Error message: {error_message}"
+        )
+        SETTINGS_CACHE_WRITE_FAILED = (
+            "({file}): Writing settings_file to cache directory:{cache_dir} failed. Error message: {error_message}"
+        )
+        SHARED_SETTINGS_READ_FAILED = (
+            "({file}): Reading settings_file from shared file:{path} failed. Error message: {error_message}"
+        )
+        SHARED_SETTINGS_WRITE_FAILED = (
+            "({file}): Publishing settings_file to shared file:{path} failed. Error message: {error_message}"
+        )
+        SETTINGS_UPDATE_CALLBACK_EXECUTION_ERROR = (
+            "({file}): Error while executing settings_update_callback. Error message: {error_message}"
+        )
+        SETTINGS_POLLER_FAILED = "({file}): Polling settings_file failed. Error message: {error_message}"
         INVALID_SETTINGS_FILE = "({file}): [API_NAME] settings_file fetched is not proper for the account_id: {account_id}, settings_file: {settings_file}"
 
         EVENT_BATCHING_NOT_OBJECT = "({file}): Batch event settings are not of type object"
@@ -195,10 +232,22 @@ class LogMessageEnum:
         EVENTS_PER_REQUEST_OUT_OF_BOUNDS = "({file}): events_per_request should be >= {min_value} and <= {max_value}"
         REQUEST_TIME_INTERVAL_OUT_OF_BOUNDS = "({file}): request_time_interval should be >= {min_value}"
         FLUSH_CALLBACK_INVALID = "({file}): flush_callback is not callable"
+        COMPRESSION_INVALID = "({file}): compression should be one of {compressions}"
+        COMPRESSION_THRESHOLD_INVALID = "({file}): compression_threshold should be an integer >= 0"
+        MAX_RETRIES_INVALID = "({file}): max_retries should be an integer >= 0 and <= {max_value}"
+        RETRY_BACKOFF_INVALID = "({file}): retry_backoff should be a number > 0"
+        MAX_QUEUE_SIZE_INVALID = "({file}): max_queue_size should be an integer >= {min_value}"
+        MAX_IN_FLIGHT_REQUESTS_INVALID = (
+            "({file}): max_in_flight_requests should be an integer >= {min_value} and <= {max_value}"
+        )
+        EVENTS_QUEUE_FULL = "({file}): [API_NAME] Impression event - {end_point} dropped as events queue is full or shut down, max_queue_size: {max_queue_size}"
         INTEGRATIONS_SERVICE_CALLBACK_INVALID = "({file}): Integrations service callback is not callable"
         INTEGRATIONS_SERVICE_CALLBACK_EXECUTION_ERROR = (
             "({file}): Error while executing integrations service callback. Error message: {error_message}"
         )
+        INSTRUMENTATION_SINK_EXECUTION_ERROR = (
+            "({file}): Error while executing instrumentation_sink. Error message: {error_message}"
+        )
         NO_USERSTORAGE_WITH_MAB = (
             "({file}): This campaign:{campaign_key} has MAB configured. Please configure User Storage to proceed."
         )
@@ -0,0 +1,189 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextvars
+import functools
+
+from .event_dispatcher import EventDispatcher
+from ..http.async_connection import AsyncConnection
+from ..constants import constants
+from ..services.url_manager import url_manager
+from ..services.instrumentation import clock
+
+# requests dispatched by the API call running in the current context
+_pending_requests = contextvars.ContextVar("vwo_pending_requests", default=None)
+
+
+class AsyncEventDispatcher(EventDispatcher):
+    """EventDispatcher of AsyncVWO. Requests dispatched by an API call are collected and sent by AsyncVWO
+    with an AsyncConnection once the call returns. Batched events are queued and synced by the flushers,
+    off the event loop, as with EventDispatcher."""
+
+    def __init__(self, is_development_mode=False, batch_event_settings=None, sdk_key=None):
+        """Initialize the dispatcher with logger
+
+        Args:
+            is_development_mode: To specify whether the request
+            to our server should be made or not.
+        """
+        super(AsyncEventDispatcher, self).__init__(is_development_mode, batch_event_settings, sdk_key)
+        self.async_connection = AsyncConnection()
+
+    def collect_requests(self):
+        """Starts collecting the requests dispatched in the current context, instead of sending them
+
+        Returns:
+            token: to be passed to release_requests
+        """
+        return _pending_requests.set([])
+
+    def release_requests(self, token):
+        """Stops collecting the requests dispatched in the current context
+
+        Args:
+            token: returned by collect_requests
+
+        Returns:
+            list: collected requests, to be passed to send_requests
+        """
+        requests = _pending_requests.get()
+        _pending_requests.reset(token)
+        return requests
+
+    async def send_requests(self, requests):
+        """Sends the collected requests concurrently
+
+        Args:
+            requests (list): returned by release_requests
+
+        Returns:
+            list: True for each request successfully received by our servers, else False
+        """
+        return await asyncio.gather(*[request() for request in requests])
+
+    def dispatch(self, impression):
+        """Collects the impression to be sent by send_requests, see EventDispatcher.dispatch
+
+        Args:
+            impression (dict): Dictionary object containing the information of the impression
+
+        Returns:
+            bool: True if impression is collected or queued, else false
+        """
+        pending_requests = _pending_requests.get()
+        if pending_requests is None or self.is_development_mode or self.event_batching:
+            return super(AsyncEventDispatcher, self).dispatch(impression)
+
+        pending_requests.append(functools.partial(self.dispatch_async, impression))
+        return True
+
+    def dispatch_many(self, impressions):
+        """Collects the impressions to be sent together by send_requests, see EventDispatcher.dispatch_many
+
+        Args:
+            impressions (list): track-user impressions, e.g. of a user for several campaigns
+
+        Returns:
+            bool: True if impressions are collected or queued, else false
+        """
+        pending_requests = _pending_requests.get()
+        if pending_requests is None or self.is_development_mode or self.event_batching or len(impressions) < 2:
+            return super(AsyncEventDispatcher, self).dispatch_many(impressions)
+
+        pending_requests.append(functools.partial(self.dispatch_many_async, impressions))
+        return True
+
+    def dispatch_events(self, params, impression):
+        """Collects the event to be sent by send_requests, see EventDispatcher.dispatch_events
+
+        Args:
+            params (dict): Dictionaty objet containing query params for the call
+            impression (dict): Dictionary object containing the information of the impression
+
+        Returns:
+            bool: True if event is collected
+        """
+        pending_requests = _pending_requests.get()
+        if pending_requests is None or self.is_development_mode:
+            return super(AsyncEventDispatcher, self).dispatch_events(params, impression)
+
+        pending_requests.append(functools.partial(self.dispatch_events_async, params, impression))
+        return True
+
+    async def dispatch_async(self, impression):
+        """Sends the impression to our servers
+
+        Args:
+            impression (dict): Dictionary object containing the information of the impression
+
+        Returns:
+            bool: True if impression is successfully received by our servers, else false
+        """
+        url = impression.pop("url")
+        started_at = clock()
+        resp = await self.async_connection.get(url, params=impression, headers=self.get_visitor_headers(impression))
+        self.stats.record_request(1, resp.get("status_code"), clock() - started_at)
+        return self.log_dispatch_result(url, resp.get("status_code") == 200)
+
+    async def dispatch_many_async(self, impressions):
+        """Sends the impressions to our servers together in one request to the batch events endpoint,
+        encoded as with post_batch
+
+        Args:
+            impressions (list): track-user impressions
+
+        Returns:
+            bool: True if impressions are successfully received by our servers, else false
+        """
+        events = [self.build_event_payload(impression.pop("url"), impression) for impression in impressions]
+        url, query_params, headers = self.get_batch_events_request()
+        started_at = clock()
+        resp = await self.async_connection.post(
+            url,
+            params=query_params,
+            data={"ev": events},
+            headers=headers,
+            compression=self.compression,
+            compression_threshold=self.compression_threshold,
+            include_request_size=True,
+        )
+        self.stats.record_request(
+            len(events), resp.get("status_code"), clock() - started_at, size=resp.get("request_size", 0)
+        )
+        return self.log_dispatch_result(url, resp.get("status_code") == 200)
+
+    async def dispatch_events_async(self, params, impression):
+        """Sends the impression to our servers at events endpoint
+
+        Args:
+            params (dict): Dictionaty objet containing query params for the call
+            impression (dict): Dictionary object containing the information of the impression
+
+        Returns:
+            bool: True if impression is successfully received by our servers, else false
+        """
+        url = constants.HTTPS_PROTOCOL + url_manager.get_base_url() + constants.ENDPOINTS.EVENTS
+        started_at = clock()
+        resp = await self.async_connection.post(
+            url, params=params, data=impression, headers=self.get_visitor_headers(params)
+        )
+        self.stats.record_request(1, resp.get("status_code"), clock() - started_at)
+        return self.log_dispatch_events_result(url, params, resp.get("status_code") == 200)
+
+    async def close(self):
+        """Syncs the queued events and closes the pooled connections"""
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, self.shutdown)
+        await self.async_connection.close()
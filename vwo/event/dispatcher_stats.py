@@ -0,0 +1,126 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Counters and latency histograms of the events dispatched by an EventDispatcher """
+
+import threading
+
+from ..services.instrumentation import Histogram
+
+# status code recorded for requests which got no response e.g. on connection errors
+NO_RESPONSE_STATUS_CODE = -1
+
+
+class DispatcherStats(object):
+    """Counters of the events queued, dropped, sent, failed and retried, along with the status codes of the requests,
+    bytes of the batches sent, and histograms of request durations and of batch latency i.e. the time from
+    queueing the first event of a batch till the batch is synced. Counters only ever increase."""
+
+    def __init__(self):
+        """Initialize the counters and histograms, all empty. They are updated by the threads dispatching events
+        and the flushers, hence under the lock"""
+        self.lock = threading.Lock()
+        # events queued, and dropped as the queue was full or shut down
+        self.events_queued = 0
+        self.events_dropped = 0
+        # events of the requests which got a 200, and of the ones which didn't
+        self.events_sent = 0
+        self.events_failed = 0
+        # events requeued to be retried, and batches split as rejected for being too large
+        self.events_retried = 0
+        self.batches_split = 0
+        # requests sent, bytes of the batches sent in them and no. of requests by status code of the response
+        self.requests = 0
+        self.bytes_sent = 0
+        self.status_codes = {}
+        # seconds taken by each request, and from queueing the first event of a batch till the batch is synced
+        self.request_duration = Histogram()
+        self.batch_latency = Histogram()
+
+    def record_queued(self):
+        """Records an event added to the queue"""
+        with self.lock:
+            self.events_queued += 1
+
+    def record_dropped(self):
+        """Records an event dropped as the queue was full or shut down"""
+        with self.lock:
+            self.events_dropped += 1
+
+    def record_request(self, no_of_events, status_code, duration, size=0):
+        """Records a request sent to VWO
+
+        Args:
+            no_of_events (int): events sent in the request
+            status_code (int|None): status code of the response, None if there was no response
+            duration (float): seconds taken by the request
+            size (int): bytes of the batch sent in the request body, if any
+        """
+        if status_code is None:
+            status_code = NO_RESPONSE_STATUS_CODE
+        with self.lock:
+            self.requests += 1
+            self.status_codes[status_code] = self.status_codes.get(status_code, 0) + 1
+            if status_code == 200:
+                self.events_sent += no_of_events
+            else:
+                self.events_failed += no_of_events
+            self.bytes_sent += size
+            self.request_duration.add(duration)
+
+    def record_retry(self, no_of_events):
+        """Records a failed batch requeued to be retried
+
+        Args:
+            no_of_events (int): events in the batch
+        """
+        with self.lock:
+            self.events_retried += no_of_events
+
+    def record_split(self):
+        """Records a batch split in two as its payload was too large for VWO"""
+        with self.lock:
+            self.batches_split += 1
+
+    def record_batch_latency(self, latency):
+        """Records the time taken to sync a batch
+
+        Args:
+            latency (float): seconds from queueing the first event of the batch till it was synced
+        """
+        with self.lock:
+            self.batch_latency.add(latency)
+
+    def get_stats(self):
+        """Returns the counters, status codes and stats of the histograms, see Histogram.get_stats
+
+        Returns:
+            dict: events_queued, events_dropped, events_sent, events_failed i.e. in requests which failed,
+                events_retried, batches_split, requests, bytes_sent, status_codes i.e. no. of requests by status
+                code, -1 for no response, request_duration and batch_latency
+        """
+        with self.lock:
+            return {
+                "events_queued": self.events_queued,
+                "events_dropped": self.events_dropped,
+                "events_sent": self.events_sent,
+                "events_failed": self.events_failed,
+                "events_retried": self.events_retried,
+                "batches_split": self.batches_split,
+                "requests": self.requests,
+                "bytes_sent": self.bytes_sent,
+                "status_codes": dict(self.status_codes),
+                "request_duration": self.request_duration.get_stats(),
+                "batch_latency": self.batch_latency.get_stats(),
+            }
@@ -12,7 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import atexit
+import heapq
+import itertools
+import random
 import threading
+import weakref
+from collections import deque
 from ..http.connection import Connection
 from ..services.usage_stats_manager import UsageStats
 from ..enums.log_message_enum import LogMessageEnum
@@ -21,11 +27,16 @@ from ..enums.log_level_enum import LogLevelEnum
 from ..logger import VWOLogger
 from ..constants import constants
 from ..services.url_manager import url_manager
+from ..services.instrumentation import clock
+from .dispatcher_stats import DispatcherStats
 from ..helpers import validate_util
 from ..constants import constants
 
 FILE = FileNameEnum.Event.EventDispatcher
 
+# dispatchers having a running flusher, drained when the interpreter exits
+_running_dispatchers = weakref.WeakSet()
+
 
 class EventDispatcher(object):
     """Class having request making/event dispatching capabilities to our servers"""
@@ -47,14 +58,38 @@ class EventDispatcher(object):
         self.account_id = None
         self.queue = None
         self.queue_metadata = {}
-        self.timer = None
+        # times are of the monotonic clock, so that the intervals and backoffs aren't thrown off by clock changes
+        self.queue_started_at = None
+
+        # batches waiting to be synced by the flushers, along with the time their first event was queued,
+        # and no. of events in them
+        self.batches = deque()
+        self.batched_events_count = 0
+        self.in_flight_requests = 0
+        self.flushers = []
+        self.is_shutdown = False
 
-        self.lock = threading.Lock()
+        self.lock = threading.RLock()
+        self.condition = threading.Condition(self.lock)
 
         self.event_batching = False
         self.events_per_request = constants.BATCH_EVENTS.DEFAULT_EVENTS_PER_REQUEST
         self.request_time_interval = constants.BATCH_EVENTS.DEFAULT_REQUEST_TIME_INTERVAL
+        self.max_queue_size = constants.BATCH_EVENTS.DEFAULT_MAX_QUEUE_SIZE
+        self.max_in_flight_requests = constants.BATCH_EVENTS.DEFAULT_MAX_IN_FLIGHT_REQUESTS
         self.flush_callback = None
+        self.compression = None
+        self.compression_threshold = constants.BATCH_EVENTS.DEFAULT_COMPRESSION_THRESHOLD
+        self.max_retries = constants.BATCH_EVENTS.DEFAULT_MAX_RETRIES
+        self.retry_backoff = constants.BATCH_EVENTS.DEFAULT_RETRY_BACKOFF
+        self.batch_connection = self.connection
+        self.stats = DispatcherStats()
+
+        # failed batches waiting for their backoff to pass, a heap of (retry_at, sequence, batch)
+        self.retries = []
+        self.retry_sequence = itertools.count()
+        # no. of events in the batches having been rejected last as too large, if any
+        self.rejected_events_per_request = None
 
         if batch_event_settings:
             self.event_batching = True
@@ -66,9 +101,36 @@ class EventDispatcher(object):
             if batch_event_settings.get(constants.BATCH_EVENTS.REQUEST_TIME_INTERVAL):
                 self.request_time_interval = batch_event_settings.get(constants.BATCH_EVENTS.REQUEST_TIME_INTERVAL)
 
+            if batch_event_settings.get(constants.BATCH_EVENTS.MAX_QUEUE_SIZE):
+                self.max_queue_size = batch_event_settings.get(constants.BATCH_EVENTS.MAX_QUEUE_SIZE)
+
+            if batch_event_settings.get(constants.BATCH_EVENTS.MAX_IN_FLIGHT_REQUESTS):
+                self.max_in_flight_requests = batch_event_settings.get(constants.BATCH_EVENTS.MAX_IN_FLIGHT_REQUESTS)
+
             if batch_event_settings.get(constants.BATCH_EVENTS.FLUSH_CALLBACK):
                 self.flush_callback = batch_event_settings.get(constants.BATCH_EVENTS.FLUSH_CALLBACK)
 
+            if batch_event_settings.get(constants.BATCH_EVENTS.COMPRESSION):
+                self.compression = batch_event_settings.get(constants.BATCH_EVENTS.COMPRESSION)
+
+            if batch_event_settings.get(constants.BATCH_EVENTS.COMPRESSION_THRESHOLD) is not None:
+                self.compression_threshold = batch_event_settings.get(constants.BATCH_EVENTS.COMPRESSION_THRESHOLD)
+
+            if batch_event_settings.get(constants.BATCH_EVENTS.MAX_RETRIES) is not None:
+                self.max_retries = batch_event_settings.get(constants.BATCH_EVENTS.MAX_RETRIES)
+
+            if batch_event_settings.get(constants.BATCH_EVENTS.RETRY_BACKOFF):
+                self.retry_backoff = batch_event_settings.get(constants.BATCH_EVENTS.RETRY_BACKOFF)
+
+            # failed batches are requeued by the flushers instead of being retried while blocking them
+            self.batch_connection = Connection(max_retries=0)
+
+            # a full batch must always fit in the queue
+            self.max_queue_size = max(self.max_queue_size, self.events_per_request)
+
+        # size of the batches, lowered from events_per_request when VWO rejects batches as too large
+        self.effective_events_per_request = self.events_per_request
+
     def dispatch_events(self, params, impression):
         """This method checks for development mode, if it is False then it sends the impression
         to our servers at events endpoint, else return True without sending the impression.
@@ -82,43 +144,17 @@ class EventDispatcher(object):
         """
 
         url = constants.HTTPS_PROTOCOL + url_manager.get_base_url() + constants.ENDPOINTS.EVENTS
-        headers = {"User-Agent": constants.SDK_NAME}
-
-        # check if params has visitor user agent and add it to header, if exists
-        if params is not None and constants.VISITOR.USER_AGENT in params:
-            visitor_ua = params.get(constants.VISITOR.USER_AGENT)
-            if visitor_ua is not None and len(visitor_ua) > 0:
-                # create and update http headers
-                custom_header = {constants.VISITOR.CUSTOM_HEADER_USER_AGENT: visitor_ua}
-                headers.update(custom_header)
-
-        # check if params has visitor IP and add it to header, if exists
-        if params is not None and constants.VISITOR.IP in params:
-            user_ip_address = params.get(constants.VISITOR.IP)
-            if user_ip_address is not None and len(user_ip_address) > 0:
-                # create and update http headers
-                custom_header = {constants.VISITOR.CUSTOM_HEADER_IP: user_ip_address}
-                headers.update(custom_header)
+        headers = self.get_visitor_headers(params)
 
         if self.is_development_mode:
             result = True
         else:
+            started_at = clock()
             resp = self.connection.post(url, params=params, data=impression, headers=headers)
+            self.stats.record_request(1, resp.get("status_code"), clock() - started_at)
             result = resp.get("status_code") == 200
 
-        if result is True:
-            self.logger.log(
-                LogLevelEnum.INFO,
-                LogMessageEnum.INFO_MESSAGES.IMPRESSION_SUCCESS_FOR_EVENT_ARCH.format(
-                    file=FILE, event=params.get("en"), account_id=params.get("a")
-                ),
-            )
-        else:
-            self.logger.log(
-                LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.IMPRESSION_FAILED.format(file=FILE, end_point=url)
-            )
-
-        return result
+        return self.log_dispatch_events_result(url, params, result)
 
     def dispatch(self, impression):
         """This method checks for development mode, if it is False then it sends the impression
@@ -133,63 +169,171 @@ class EventDispatcher(object):
         """
 
         url = impression.pop("url")
-        headers = {"User-Agent": constants.SDK_NAME}
 
         if self.is_development_mode:
             result = True
+        elif self.event_batching is False:
+            # sync API call
+            started_at = clock()
+            resp = self.connection.get(url, params=impression, headers=self.get_visitor_headers(impression))
+            self.stats.record_request(1, resp.get("status_code"), clock() - started_at)
+            result = resp.get("status_code") == 200
         else:
-            result = False
-            if self.event_batching is False:
-                # check if impression has visitor user agent and add it to header, if exists
-                if impression is not None and constants.VISITOR.USER_AGENT in impression:
-                    visitor_ua = impression.get(constants.VISITOR.USER_AGENT)
-                    if visitor_ua is not None and len(visitor_ua) > 0:
-                        # create and update http headers
-                        custom_header = {constants.VISITOR.CUSTOM_HEADER_USER_AGENT: visitor_ua}
-                        headers.update(custom_header)
-
-                # check if impression has visitor IP and add it to header, if exists
-                if impression is not None and constants.VISITOR.IP in impression:
-                    user_ip_address = impression.get(constants.VISITOR.IP)
-                    if user_ip_address is not None and len(user_ip_address) > 0:
-                        # create and update http headers
-                        custom_header = {constants.VISITOR.CUSTOM_HEADER_IP: user_ip_address}
-                        headers.update(custom_header)
-
-                # sync API call
-                resp = self.connection.get(url, params=impression, headers=headers)
-                result = resp.get("status_code") == 200
-            else:
-                result = self.async_dispatch(url, impression)
+            result = self.async_dispatch(url, impression)
+
+        return self.log_dispatch_result(url, result)
+
+    def dispatch_many(self, impressions):
+        """Sends impressions together in one request to the batch events endpoint, see dispatch.
+        When event batching is enabled, or in development mode, they are dispatched as usual.
+
+        Args:
+            impressions (list): track-user impressions, e.g. of a user for several campaigns
+
+        Returns:
+            bool: True if impressions are successfully received by our servers or queued, else false
+        """
+
+        if self.is_development_mode or self.event_batching is True or len(impressions) < 2:
+            return all([self.dispatch(impression) for impression in impressions])
+
+        events = [self.build_event_payload(impression.pop("url"), impression) for impression in impressions]
+        url, query_params, headers = self.get_batch_events_request()
+        started_at = clock()
+        resp = self.post_batch(url, query_params, events, headers)
+        self.stats.record_request(
+            len(events), resp.get("status_code"), clock() - started_at, size=resp.get("request_size", 0)
+        )
+        return self.log_dispatch_result(url, resp.get("status_code") == 200)
+
+    def get_batch_events_request(self):
+        """Returns url, query params and headers of a request to the batch events endpoint
+
+        Returns:
+            tuple: url, query params and headers
+        """
+        url = constants.HTTPS_PROTOCOL + url_manager.get_base_url() + constants.ENDPOINTS.BATCH_EVENTS
+        query_params = {"a": self.account_id, "sdk": self.sdk, "sdk-v": self.sdk_v, "env": self.sdk_key}
+        query_params.update(UsageStats.get_usage_stats())
+        headers = {"Authorization": self.sdk_key, "User-Agent": constants.SDK_NAME}
+        return url, query_params, headers
+
+    def post_batch(self, url, query_params, events, headers, connection=None):
+        """Posts the events to the batch events endpoint as compact json, compressed as configured
+        if the json is at least compression_threshold bytes
+
+        Args:
+            url (string): url of the batch events endpoint
+            query_params (dict): query params of the request
+            events (list): payloads of the events, see build_event_payload
+            headers (dict): headers of the request
+            connection (Connection): connection to post with, self.connection if None
+
+        Returns:
+            dict: status_code, text and request_size i.e. bytes of the body sent, see Connection.post
+        """
+        return (connection or self.connection).post(
+            url,
+            params=query_params,
+            data={"ev": events},
+            headers=headers,
+            compression=self.compression,
+            compression_threshold=self.compression_threshold,
+            include_request_size=True,
+        )
+
+    def get_visitor_headers(self, data):
+        """Builds the headers of a request, forwarding the visitor's user agent and IP if present in data
+
+        Args:
+            data (dict): impression or query params of the request
+
+        Returns:
+            dict: headers of the request
+        """
+        headers = {"User-Agent": constants.SDK_NAME}
+
+        # check if data has visitor user agent and add it to header, if exists
+        if data is not None and constants.VISITOR.USER_AGENT in data:
+            visitor_ua = data.get(constants.VISITOR.USER_AGENT)
+            if visitor_ua is not None and len(visitor_ua) > 0:
+                headers[constants.VISITOR.CUSTOM_HEADER_USER_AGENT] = visitor_ua
+
+        # check if data has visitor IP and add it to header, if exists
+        if data is not None and constants.VISITOR.IP in data:
+            user_ip_address = data.get(constants.VISITOR.IP)
+            if user_ip_address is not None and len(user_ip_address) > 0:
+                headers[constants.VISITOR.CUSTOM_HEADER_IP] = user_ip_address
+
+        return headers
+
+    def log_dispatch_result(self, url, result):
+        """Logs whether an impression was sent, or queued when event batching is enabled
 
+        Args:
+            url (string): VWO's url for syncing the impression
+            result (bool): True if the impression was sent or queued
+
+        Returns:
+            bool: result
+        """
         if result is True:
             if self.event_batching is True:
-                self.logger.log(
+                self.logger.lazy_log(
                     LogLevelEnum.INFO,
-                    LogMessageEnum.INFO_MESSAGES.IMPRESSION_SUCCESS_QUEUE.format(
-                        file=FILE, end_point=url, queue_length=len(self.queue), queue_metadata=self.queue_metadata
-                    ),
+                    LogMessageEnum.INFO_MESSAGES.IMPRESSION_SUCCESS_QUEUE,
+                    file=FILE,
+                    end_point=url,
+                    queue_length=len(self.queue),
+                    queue_metadata=self.queue_metadata,
                 )
             else:
-                self.logger.log(
-                    LogLevelEnum.INFO, LogMessageEnum.INFO_MESSAGES.IMPRESSION_SUCCESS.format(file=FILE, end_point=url)
+                self.logger.lazy_log(
+                    LogLevelEnum.INFO, LogMessageEnum.INFO_MESSAGES.IMPRESSION_SUCCESS, file=FILE, end_point=url
                 )
             return True
         else:
             if self.event_batching is True:
-                self.logger.log(
-                    LogLevelEnum.ERROR,
-                    LogMessageEnum.ERROR_MESSAGES.IMPRESSION_FAILED_QUEUE.format(file=FILE, end_point=url),
+                self.logger.lazy_log(
+                    LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.IMPRESSION_FAILED_QUEUE, file=FILE, end_point=url
                 )
             else:
-                self.logger.log(
-                    LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.IMPRESSION_FAILED.format(file=FILE, end_point=url)
+                self.logger.lazy_log(
+                    LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.IMPRESSION_FAILED, file=FILE, end_point=url
                 )
             return False
 
+    def log_dispatch_events_result(self, url, params, result):
+        """Logs whether an event was sent to the events endpoint
+
+        Args:
+            url (string): VWO's events url
+            params (dict): query params of the event
+            result (bool): True if the event was sent
+
+        Returns:
+            bool: result
+        """
+        if result is True:
+            self.logger.lazy_log(
+                LogLevelEnum.INFO,
+                LogMessageEnum.INFO_MESSAGES.IMPRESSION_SUCCESS_FOR_EVENT_ARCH,
+                file=FILE,
+                event=params.get("en"),
+                account_id=params.get("a"),
+            )
+        else:
+            self.logger.lazy_log(
+                LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.IMPRESSION_FAILED, file=FILE, end_point=url
+            )
+
+        return result
+
     def async_dispatch(self, url, impression):
         """
-        This method pushes impression in queue after modifying the payload
+        This method pushes impression in queue after modifying the payload.
+        Queue is handed over to the flushers when it is full or request_time_interval
+        has passed since its first event.
 
         Args:
             url (string): VWO's url for syncing an impression
@@ -200,22 +344,36 @@ class EventDispatcher(object):
         try:
             # only one thread at a time can add to queue, to keep queue thread safe
             with self.lock:
+                if self.is_shutdown or len(self.queue) + self.batched_events_count >= self.max_queue_size:
+                    self.stats.record_dropped()
+                    self.logger.lazy_log(
+                        LogLevelEnum.ERROR,
+                        LogMessageEnum.ERROR_MESSAGES.EVENTS_QUEUE_FULL,
+                        file=FILE,
+                        end_point=url,
+                        max_queue_size=self.max_queue_size,
+                    )
+                    return False
+
                 # build payload
                 payload = self.build_event_payload(url, impression)
+                self.update_queue_metadata(url=url)
                 # push in queue
                 self.queue.append(payload)
-                self.update_queue_metadata(url=url)
-                # flush queue periodically
+                self.stats.record_queued()
                 if len(self.queue) == 1:
-                    self.timer = threading.Timer(self.request_time_interval, self.flush_queue)
-                    self.timer.start()
+                    self.queue_started_at = clock()
+                    self.start_flushers()
                 # flush queue when full
-                if len(self.queue) >= self.events_per_request:
+                if len(self.queue) >= self.effective_events_per_request:
                     self.flush_queue()
+                else:
+                    # wake a flusher to wait for the interval of the first event
+                    self.condition.notify()
                 return True
         except Exception:
-            self.logger.log(
-                LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.IMPRESSION_FAILED.format(file=FILE, end_point=url)
+            self.logger.lazy_log(
+                LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.IMPRESSION_FAILED, file=FILE, end_point=url
             )
             return False
 
@@ -261,24 +419,104 @@ class EventDispatcher(object):
 
         return payload
 
-    def spawn_thread_to_sync(self, events):
+    def start_flushers(self):
+        """
+        Starts the long-lived flusher threads, max_in_flight_requests in number, if not already running.
+        Flushers stop by themselves after being idle for a while. Must be called with lock held.
+        """
+        self.flushers = [flusher for flusher in self.flushers if flusher.is_alive()]
+        for _ in range(self.max_in_flight_requests - len(self.flushers)):
+            flusher = threading.Thread(target=self.run_flusher)
+            flusher.daemon = True
+            flusher.start()
+            self.flushers.append(flusher)
+        _running_dispatchers.add(self)
+
+    def run_flusher(self):
         """
-        Spawns a thread to sync events to VWO servers
+        Loop of a flusher thread. Hands over the queue once request_time_interval has passed since
+        its first event, requeues failed batches once their backoff has passed and syncs batches to VWO
+        one at a time, until shut down and drained.
+        """
+        while True:
+            with self.lock:
+                idle_since = clock()
+                while True:
+                    if self.queue and clock() - self.queue_started_at >= self.request_time_interval:
+                        self.flush_queue()
+                    while self.retries and self.retries[0][0] <= clock():
+                        self.batches.append(heapq.heappop(self.retries)[2])
+                    if self.batches or (self.is_shutdown and not self.retries):
+                        break
+                    if self.queue or self.retries:
+                        idle_since = clock()
+                        wake_up_times = [self.retries[0][0]] if self.retries else []
+                        if self.queue:
+                            wake_up_times.append(self.queue_started_at + self.request_time_interval)
+                        self.condition.wait(max(0, min(wake_up_times) - clock()))
+                    elif clock() - idle_since < constants.BATCH_EVENTS.FLUSHER_IDLE_TIMEOUT:
+                        self.condition.wait(idle_since + constants.BATCH_EVENTS.FLUSHER_IDLE_TIMEOUT - clock())
+                    else:
+                        # started again with the next event
+                        self.flushers.remove(threading.current_thread())
+                        return
+
+                if not self.batches:
+                    # shut down and nothing left to sync
+                    self.flushers.remove(threading.current_thread())
+                    return
+
+                events, queued_at, attempts = self.batches.popleft()
+                self.in_flight_requests += 1
+
+            is_synced = None
+            try:
+                is_synced = self.sync_with_vwo(events, queued_at, attempts)
+            finally:
+                # requeued events stay pending, counting against max_queue_size
+                if is_synced is not False and queued_at is not None:
+                    self.stats.record_batch_latency(clock() - queued_at)
+                with self.lock:
+                    if is_synced is not False:
+                        self.batched_events_count -= len(events)
+                    self.in_flight_requests -= 1
+                    self.condition.notify_all()
+
+    def shutdown(self, timeout=None):
+        """
+        Flushes the queue and stops the flushers once every batch is synced to VWO.
+        No more events are queued after shutdown.
 
         Args:
-            events (list): List of events to be synced to VWO servers
+            timeout(float): max seconds to wait for each flusher to finish, waits till done if None
         """
-        sync_thread = threading.Thread(
-            target=self.sync_with_vwo,
-            args=(events,),
-        )
-        sync_thread.start()
+        if self.event_batching is False:
+            return
 
-    def sync_with_vwo(self, events):
-        url = constants.HTTPS_PROTOCOL + url_manager.get_base_url()
-        url = url + constants.ENDPOINTS.BATCH_EVENTS
-        query_params = {"a": self.account_id, "sdk": self.sdk, "sdk-v": self.sdk_v, "env": self.sdk_key}
-        headers = {"Authorization": self.sdk_key, "User-Agent": constants.SDK_NAME}
+        with self.lock:
+            self.is_shutdown = True
+            self.flush_queue(manual=True)
+            self.condition.notify_all()
+            flushers = list(self.flushers)
+
+        for flusher in flushers:
+            if flusher is not threading.current_thread():
+                flusher.join(timeout)
+
+    def sync_with_vwo(self, events, queued_at=None, attempts=0):
+        """Syncs a batch to VWO. A batch rejected as too large is split in two and requeued, and one failed
+        with a 429 or 5xx status code or no response is requeued to be retried after a backoff, at most
+        max_retries times. flush_callback is called once the batch is synced or given up on.
+
+        Args:
+            events (list): payloads of the events, see build_event_payload
+            queued_at (float): time the first event of the batch was queued
+            attempts (int): no. of times the batch has been retried
+
+        Returns:
+            bool: False if the batch was requeued, else True
+        """
+        url, query_params, headers = self.get_batch_events_request()
 
         queue_length = len(events)
         first_event = "No event in queue"
@@ -286,111 +524,265 @@ class EventDispatcher(object):
         if queue_length > 0:
             first_event = events[0]
 
+        resp = None
+        started_at = clock()
         try:
-            post_data = {"ev": events}
-            query_params.update(UsageStats.get_usage_stats())
-            resp = self.connection.post(url, params=query_params, data=post_data, headers=headers)
+            resp = self.post_batch(url, query_params, events, headers, connection=self.batch_connection)
             status_code = resp.get("status_code")
+            self.stats.record_request(queue_length, status_code, clock() - started_at, size=resp.get("request_size", 0))
 
             if status_code == 200:
-                self.logger.log(
+                self.adapt_events_per_request(queue_length, is_accepted=True)
+                self.logger.lazy_log(
                     LogLevelEnum.INFO,
-                    LogMessageEnum.INFO_MESSAGES.IMPRESSION_SUCCESS.format(
-                        file=FILE, end_point=url, account_id=self.account_id
-                    ),
+                    LogMessageEnum.INFO_MESSAGES.IMPRESSION_SUCCESS,
+                    file=FILE,
+                    end_point=url,
+                    account_id=self.account_id,
                 )
+            elif status_code == 413 and queue_length > 1:
+                self.adapt_events_per_request(queue_length, is_accepted=False)
+                self.split_batch(events, queued_at, attempts)
+                self.logger.lazy_log(
+                    LogLevelEnum.WARNING,
+                    LogMessageEnum.WARNING_MESSAGES.BATCH_EVENT_SPLIT,
+                    file=FILE,
+                    queue_length=queue_length,
+                    events_per_request=self.effective_events_per_request,
+                    account_id=self.account_id,
+                )
+                return False
             elif status_code == 413:
-                self.logger.log(
+                self.logger.lazy_log(
                     LogLevelEnum.ERROR,
-                    LogMessageEnum.ERROR_MESSAGES.BATCH_EVENT_LIMIT_EXCEEDED.format(
-                        file=FILE, end_point=url, events_per_request=queue_length, account_id=self.account_id
-                    ),
+                    LogMessageEnum.ERROR_MESSAGES.BATCH_EVENT_LIMIT_EXCEEDED,
+                    file=FILE,
+                    end_point=url,
+                    events_per_request=queue_length,
+                    account_id=self.account_id,
                 )
+            elif (status_code is None or status_code == 429 or status_code >= 500) and attempts < self.max_retries:
+                delay = self.get_retry_delay(attempts)
+                self.retry_batch(events, queued_at, attempts + 1, delay)
+                self.logger.lazy_log(
+                    LogLevelEnum.WARNING,
+                    LogMessageEnum.WARNING_MESSAGES.BULK_RETRY_SCHEDULED,
+                    file=FILE,
+                    status_code=status_code,
+                    queue_length=queue_length,
+                    delay=round(delay, 2),
+                    attempt=attempts + 1,
+                    max_retries=self.max_retries,
+                )
+                return False
             else:
-                self.logger.log(
+                self.logger.lazy_log(
                     LogLevelEnum.ERROR,
-                    LogMessageEnum.ERROR_MESSAGES.BULK_NOT_PROCESSED.format(
-                        file=FILE,
-                        url=url,
-                        status_code=status_code,
-                        queue_length=queue_length,
-                        first_event=first_event,
-                        query_params=query_params,
-                        headers=headers,
-                        err="Wrong status code",
-                    ),
-                )
-
-            if self.flush_callback:
-                self.flush_callback(None, events)
-        except Exception as err:
-            self.logger.log(
-                LogLevelEnum.ERROR,
-                LogMessageEnum.ERROR_MESSAGES.BULK_NOT_PROCESSED.format(
+                    LogMessageEnum.ERROR_MESSAGES.BULK_NOT_PROCESSED,
                     file=FILE,
                     url=url,
-                    status_code=-1,
+                    status_code=status_code,
                     queue_length=queue_length,
                     first_event=first_event,
                     query_params=query_params,
                     headers=headers,
-                    err=err,
-                ),
+                    err="Wrong status code",
+                )
+
+            if self.flush_callback:
+                self.flush_callback(None, events)
+        except Exception as err:
+            if resp is None:
+                self.stats.record_request(queue_length, None, clock() - started_at)
+            self.logger.lazy_log(
+                LogLevelEnum.ERROR,
+                LogMessageEnum.ERROR_MESSAGES.BULK_NOT_PROCESSED,
+                file=FILE,
+                url=url,
+                status_code=-1,
+                queue_length=queue_length,
+                first_event=first_event,
+                query_params=query_params,
+                headers=headers,
+                err=err,
             )
 
             if self.flush_callback:
                 self.flush_callback(err, events)
 
-    # Note : all calls to flush_queue must only be made from async_dispatcher, to keep it thread safe
-    def flush_queue(self, manual=False, mode="async"):
+        return True
+
+    def split_batch(self, events, queued_at, attempts):
+        """Requeues the halves of a batch ahead of the other batches
+
+        Args:
+            events (list): payloads of the events of the batch, at least 2
+            queued_at (float): time the first event of the batch was queued
+            attempts (int): no. of times the batch has been retried
+        """
+        half = len(events) // 2
+        with self.lock:
+            self.batches.extendleft([(events[half:], queued_at, attempts), (events[:half], queued_at, attempts)])
+            self.condition.notify_all()
+        self.stats.record_split()
+
+    def retry_batch(self, events, queued_at, attempts, delay):
+        """Requeues a failed batch to be synced again by the flushers once delay has passed
+
+        Args:
+            events (list): payloads of the events of the batch
+            queued_at (float): time the first event of the batch was queued
+            attempts (int): no. of times the batch has been retried, including this one
+            delay (float): seconds to wait before retrying
+        """
+        with self.lock:
+            retry_at = clock() + delay
+            heapq.heappush(self.retries, (retry_at, next(self.retry_sequence), (events, queued_at, attempts)))
+            self.condition.notify_all()
+        self.stats.record_retry(len(events))
+
+    def get_retry_delay(self, attempts):
+        """Returns the backoff before retrying a batch, doubling with each attempt from retry_backoff
+        up to MAX_RETRY_BACKOFF. It is jittered so that batches failed together are not retried together.
+
+        Args:
+            attempts (int): no. of times the batch has been retried so far
+
+        Returns:
+            float: seconds to wait
+        """
+        backoff = min(constants.BATCH_EVENTS.MAX_RETRY_BACKOFF, self.retry_backoff * 2**attempts)
+        return backoff / 2.0 + random.uniform(0, backoff / 2.0)
+
+    def adapt_events_per_request(self, no_of_events, is_accepted):
+        """Adapts effective_events_per_request to the payload sizes VWO accepts. It is halved below the size
+        of a batch rejected as too large, and grows back towards events_per_request by a tenth with each full
+        batch accepted, an event at a time when nearing the size rejected last.
+
+        Args:
+            no_of_events (int): events in the batch synced
+            is_accepted (bool): False if the batch was rejected as too large
+        """
+        with self.lock:
+            if not is_accepted:
+                self.rejected_events_per_request = no_of_events
+                self.effective_events_per_request = max(
+                    constants.BATCH_EVENTS.MIN_EVENTS_PER_REQUEST,
+                    min(self.effective_events_per_request, no_of_events // 2),
+                )
+            elif self.effective_events_per_request <= no_of_events and (
+                self.effective_events_per_request < self.events_per_request
+            ):
+                growth = max(1, self.effective_events_per_request // 10)
+                if self.rejected_events_per_request is not None:
+                    growth = max(
+                        1, min(growth, self.rejected_events_per_request - 1 - self.effective_events_per_request)
+                    )
+                self.effective_events_per_request = min(
+                    self.events_per_request, self.effective_events_per_request + growth
+                )
+
+    def flush_queue(self, manual=False, mode="async", timeout=constants.BATCH_EVENTS.SYNC_FLUSH_TIMEOUT):
         """
         Flush_queue
 
         Args:
             manual(bool): Informs if the function was triggered manually by user or not
-            mode(string): In sync mode, function makes a synchronous call before exiting
-                In async mode, function spawns a thread to sync to VWO and exits
+            mode(string): In sync mode, function waits till all queued events are synced to VWO before exiting
+                In async mode, function hands over the queue to the flushers and exits
+            timeout(float): max seconds to wait in sync mode. It doesn't wait if called from a flusher,
+                e.g. from flush_callback, as the flusher itself would have to sync the events
         """
         if self.event_batching is False:
             return
 
-        events = self.queue
-        no_of_events = len(events)
-        queue_metadata = self.queue_metadata
-
-        if no_of_events < 1:
-            return
-
-        self.logger.log(
-            LogLevelEnum.DEBUG,
-            LogMessageEnum.DEBUG_MESSAGES.BEFORE_FLUSHING.format(
-                file=FILE,
-                manually="manually" if manual else "",
-                length=no_of_events,
-                timer="Timer will be cleared and registered again" if manual else "",
-                queue_metadata=queue_metadata,
-            ),
-        )
+        # lock is reentrant, hence it can be called from within async_dispatch and the flushers
+        with self.lock:
+            events = self.queue
+            no_of_events = len(events)
+            queue_metadata = self.queue_metadata
+            queued_at = self.queue_started_at
+
+            if no_of_events > 0:
+                self.logger.lazy_log(
+                    LogLevelEnum.DEBUG,
+                    LogMessageEnum.DEBUG_MESSAGES.BEFORE_FLUSHING,
+                    file=FILE,
+                    manually="manually" if manual else "",
+                    length=no_of_events,
+                    timer="Timer will be cleared and registered again" if manual else "",
+                    queue_metadata=queue_metadata,
+                )
 
-        # stop timer
-        if self.timer:
-            self.timer.cancel()
+                # flush queue
+                self.queue = []
+                self.queue_metadata = {}
+                self.queue_started_at = None
 
-        # flush queue
-        self.queue = []
-        self.queue_metadata = {}
+                self.logger.lazy_log(
+                    LogLevelEnum.INFO,
+                    LogMessageEnum.INFO_MESSAGES.AFTER_FLUSHING,
+                    file=FILE,
+                    length=no_of_events,
+                    manually="manually" if manual else "",
+                    queue_metadata=queue_metadata,
+                )
 
-        self.logger.log(
-            LogLevelEnum.INFO,
-            LogMessageEnum.INFO_MESSAGES.AFTER_FLUSHING.format(
-                file=FILE, length=no_of_events, manually="manually" if manual else "", queue_metadata=queue_metadata
-            ),
-        )
+                # batches of effective_events_per_request events at most
+                batch_size = self.effective_events_per_request
+                for start in range(0, no_of_events, batch_size):
+                    end = start + batch_size
+                    self.batches.append((events[start:end], queued_at, 0))
+                self.batched_events_count += no_of_events
+                self.start_flushers()
+                self.condition.notify_all()
+
+            if mode != "async":
+                if threading.current_thread() in self.flushers:
+                    self.logger.lazy_log(
+                        LogLevelEnum.WARNING,
+                        LogMessageEnum.WARNING_MESSAGES.SYNC_FLUSH_NOT_AWAITED,
+                        file=FILE,
+                        reason="as flush_queue was called from a flusher",
+                    )
+                    return
+
+                wait_until = clock() + timeout
+                while self.batches or self.retries or self.in_flight_requests:
+                    remaining_time = wait_until - clock()
+                    if remaining_time <= 0:
+                        self.logger.lazy_log(
+                            LogLevelEnum.WARNING,
+                            LogMessageEnum.WARNING_MESSAGES.SYNC_FLUSH_NOT_AWAITED,
+                            file=FILE,
+                            reason="after {timeout} seconds".format(timeout=timeout),
+                        )
+                        return
+                    self.condition.wait(remaining_time)
+
+    def get_stats(self):
+        """Returns the state of the queue along with the stats of the events dispatched so far
 
-        if mode == "async":
-            self.spawn_thread_to_sync(events=events)
-        else:
-            self.sync_with_vwo(events=events)
+        Returns:
+            dict: event_batching, events_per_request, effective_events_per_request, request_time_interval,
+                queue_depth i.e. no. of events in the queue, pending_batches and pending_events i.e. handed over to
+                the flushers but not yet synced, retrying_batches i.e. waiting for their backoff to pass,
+                in_flight_batches, along with the stats of DispatcherStats.get_stats
+        """
+        with self.lock:
+            stats = {
+                "event_batching": self.event_batching,
+                "events_per_request": self.events_per_request,
+                "effective_events_per_request": self.effective_events_per_request,
+                "request_time_interval": self.request_time_interval,
+                "queue_depth": len(self.queue) if self.queue is not None else 0,
+                "pending_batches": len(self.batches) + len(self.retries),
+                "pending_events": self.batched_events_count,
+                "retrying_batches": len(self.retries),
+                "in_flight_batches": self.in_flight_requests,
+            }
+        stats.update(self.stats.get_stats())
+        return stats
 
     def update_queue_metadata(self, url):
         url_split = url.split("/")
@@ -398,3 +790,10 @@ class EventDispatcher(object):
         if self.queue_metadata.get(event_name) is None:
             self.queue_metadata[event_name] = 0
         self.queue_metadata[event_name] += 1
+
+
+@atexit.register
+def _shutdown_running_dispatchers():
+    """Syncs the events still queued when the interpreter exits"""
+    for dispatcher in list(_running_dispatchers):
+        dispatcher.shutdown(timeout=constants.BATCH_EVENTS.SHUTDOWN_TIMEOUT)
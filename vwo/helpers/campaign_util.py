@@ -15,8 +15,10 @@
 """ Utility module for manipulating VWO campaigns """
 
 from __future__ import division
+import array
+import hashlib
+import json
 import math
-import copy
 from ..constants import constants
 from ..enums.log_message_enum import LogMessageEnum
 from ..enums.file_name_enum import FileNameEnum
@@ -26,55 +28,124 @@ from ..logger import VWOLogger
 FILE = FileNameEnum.Helpers.CampaignUtil
 
 
-def get_campaign(settings_file, campaign_key):
+def get_campaign(settings_file, campaign_key, campaign_key_map=None):
     """Finds and Returns campaign from given campaign_key.
 
     Args:
         settings_file (dict): Settings file for the project
         campaign_key (string): Campaign identifier key
+        campaign_key_map (dict|None): Prebuilt running campaigns mapped to their keys,
+            see get_campaign_key_map. Settings file is scanned if not passed.
 
     Returns:
         dict: Campaign object
     """
 
-    for campaign in settings_file.get("campaigns"):
-        if campaign.get("key") == campaign_key and campaign.get("status") == constants.STATUS_RUNNING:
-            return campaign
-    VWOLogger.getInstance().log(
-        LogLevelEnum.ERROR,
-        LogMessageEnum.ERROR_MESSAGES.CAMPAIGN_NOT_RUNNING.format(file=FILE, campaign_key=campaign_key),
+    if campaign_key_map is None:
+        campaign_key_map = get_campaign_key_map(settings_file.get("campaigns"))
+    campaign = campaign_key_map.get(campaign_key)
+    if campaign:
+        return campaign
+    VWOLogger.getInstance().lazy_log(
+        LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.CAMPAIGN_NOT_RUNNING, file=FILE, campaign_key=campaign_key
     )
     return None
 
 
-def get_campaigns(settings_file, campaign_keys):
+def get_campaigns(settings_file, campaign_keys, campaign_key_map=None):
     """Finds and Returns campaign from given campaign_keys.
 
     Args:
         settings_file (dict): Settings file for the project
         campaign_keys (list): List of Campaign identifier keys
+        campaign_key_map (dict|None): Prebuilt running campaigns mapped to their keys,
+            see get_campaign_key_map. Settings file is scanned if not passed.
 
     Returns:
         dict: Dictionary of campaign object mapped to the campaign key
     """
-    campaign_key_map = {}
-    for campaign in settings_file.get("campaigns"):
-        campaign_key_map[campaign.get("key")] = campaign
+    if campaign_key_map is None:
+        campaign_key_map = get_campaign_key_map(settings_file.get("campaigns"))
     found_campaigns = {}
     for campaign_key in campaign_keys:
-        if (
-            campaign_key_map.get(campaign_key)
-            and campaign_key_map.get(campaign_key).get("status") == constants.STATUS_RUNNING
-        ):
+        if campaign_key_map.get(campaign_key):
             found_campaigns[campaign_key] = campaign_key_map.get(campaign_key)
         else:
-            VWOLogger.getInstance().log(
+            VWOLogger.getInstance().lazy_log(
                 LogLevelEnum.ERROR,
-                LogMessageEnum.ERROR_MESSAGES.CAMPAIGN_NOT_RUNNING.format(file=FILE, campaign_key=campaign_key),
+                LogMessageEnum.ERROR_MESSAGES.CAMPAIGN_NOT_RUNNING,
+                file=FILE,
+                campaign_key=campaign_key,
             )
     return found_campaigns
 
 
+def get_campaign_key_map(campaigns):
+    """Returns running campaigns mapped to their keys. If two running campaigns
+    share a key, the first one wins, same as a linear scan would.
+
+    Args:
+        campaigns (list): List of campaign objects
+
+    Returns:
+        dict: running campaign objects mapped to campaign key
+    """
+    campaign_key_map = {}
+    for campaign in campaigns:
+        if campaign.get("status") == constants.STATUS_RUNNING and campaign.get("key") not in campaign_key_map:
+            campaign_key_map[campaign.get("key")] = campaign
+    return campaign_key_map
+
+
+def get_campaign_id_map(campaigns):
+    """Returns campaigns, irrespective of their status, mapped to their ids.
+
+    Args:
+        campaigns (list): List of campaign objects
+
+    Returns:
+        dict: campaign objects mapped to campaign id
+    """
+    campaign_id_map = {}
+    for campaign in campaigns:
+        if campaign.get("id") not in campaign_id_map:
+            campaign_id_map[campaign.get("id")] = campaign
+    return campaign_id_map
+
+
+def get_goal_campaigns_map(campaigns):
+    """Returns list of (campaign, goal) tuples mapped to goal identifier, preserving
+    the order in which campaigns appear in the settings file.
+
+    Args:
+        campaigns (list): List of campaign objects
+
+    Returns:
+        dict: list of tuple(campaign, campaign_goal) mapped to goal identifier
+    """
+    goal_campaigns_map = {}
+    for campaign in campaigns:
+        for goal in campaign.get("goals") or []:
+            campaign_goals = goal_campaigns_map.setdefault(goal.get("identifier"), [])
+            # only the first goal having the identifier is considered, as in get_campaign_goal
+            if not campaign_goals or campaign_goals[-1][0] is not campaign:
+                campaign_goals.append((campaign, goal))
+    return goal_campaigns_map
+
+
+def get_campaign_digest(campaign):
+    """Returns digest of the content of a campaign as received in the settings_file,
+    equal for campaigns having equal content irrespective of the order of their keys.
+
+    Args:
+        campaign (dict): campaign object, before being processed
+
+    Returns:
+        bytes: sha1 digest
+    """
+    return hashlib.sha1(json.dumps(campaign, sort_keys=True, separators=(",", ":")).encode("utf-8")).digest()
+
+
 def set_variation_allocation(campaign):
     """Sets variation allocation range in the provided campaign.
 
@@ -83,16 +154,15 @@ def set_variation_allocation(campaign):
     """
     set_allocation_ranges(campaign.get("variations"))
     for variation in campaign.get("variations"):
-        VWOLogger.getInstance().log(
+        VWOLogger.getInstance().lazy_log(
             LogLevelEnum.INFO,
-            LogMessageEnum.INFO_MESSAGES.VARIATION_RANGE_ALLOCATION.format(
-                file=FILE,
-                campaign_key=campaign.get("key"),
-                variation_name=variation.get("name"),
-                variation_weight=variation.get("weight"),
-                start=variation.get("allocation_range_start"),
-                end=variation.get("allocation_range_end"),
-            ),
+            LogMessageEnum.INFO_MESSAGES.VARIATION_RANGE_ALLOCATION,
+            file=FILE,
+            campaign_key=campaign.get("key"),
+            variation_name=variation.get("name"),
+            variation_weight=variation.get("weight"),
+            start=variation.get("allocation_range_start"),
+            end=variation.get("allocation_range_end"),
         )
 
 
@@ -120,7 +190,19 @@ def get_allocation_ranges(items):
         variation
     """
 
-    weights = [item.get("weight") for item in items]
+    return _get_allocation_ranges_for_weights([item.get("weight") for item in items])
+
+
+def _get_allocation_ranges_for_weights(weights):
+    """Returns a list of allocation ranges laid out one after another from the weights,
+    (-1, -1) for a weight of 0 or None
+
+    Args:
+        weights (list): weight of each item(variation/campaign)
+
+    Returns:
+        list(tuple): list of tuple(start_range, end_range) for each weight
+    """
     current_allocation = 0
     allocation_ranges = []
     for weight in weights:
@@ -135,6 +217,50 @@ def get_allocation_ranges(items):
     return allocation_ranges
 
 
+def get_sorted_allocation_ranges(items):
+    """Returns the allocation ranges of items(variation/campaign) having one, as compact integer
+    arrays sorted by range start, so that the item a bucket value falls in is found with bisect.
+
+    Args:
+        items (list): List of item(variation/campaign) objects having allocation ranges set
+
+    Returns:
+        tuple(array): range starts, range ends and the index in items of each range
+    """
+
+    # ranges are built one after another, hence they never overlap
+    indexes = sorted(
+        (index for index, item in enumerate(items) if item.get("allocation_range_start") != -1),
+        key=lambda index: items[index].get("allocation_range_start"),
+    )
+    return (
+        array.array("i", [items[index].get("allocation_range_start") for index in indexes]),
+        array.array("i", [items[index].get("allocation_range_end") for index in indexes]),
+        array.array("i", indexes),
+    )
+
+
+def get_sorted_allocation_ranges_for_weights(weights):
+    """Returns the allocation ranges of items having the given weights, as returned by
+    get_sorted_allocation_ranges, without setting them on the items.
+
+    Args:
+        weights (list): weight(int|float) of each item(variation/campaign)
+
+    Returns:
+        tuple(array): range starts, range ends and the index in weights of each range
+    """
+
+    allocation_ranges = _get_allocation_ranges_for_weights(weights)
+    # ranges are built in order of weights, hence they are sorted already
+    indexes = [index for index, allocation_range in enumerate(allocation_ranges) if allocation_range[0] != -1]
+    return (
+        array.array("i", [allocation_ranges[index][0] for index in indexes]),
+        array.array("i", [allocation_ranges[index][1] for index in indexes]),
+        array.array("i", indexes),
+    )
+
+
 def _get_bucketing_range(weight):
     """Returns the bucket size of variation.
 
@@ -251,14 +377,24 @@ def scale_variations(variations):
     Args:
         variations(list): list of variations(dict object) having weight as a property
     """
+    for variation, weight in zip(variations, get_scaled_weights(variations)):
+        variation["weight"] = weight
+
+
+def get_scaled_weights(variations):
+    """Returns the weights of the variations scaled so that their total sum becomes 100%,
+    same as scale_variations sets, without modifying the variations
+
+    Args:
+        variations(list): list of variations(dict object) having weight as a property
+
+    Returns:
+        list: scaled weight(int|float) of each variation
+    """
     weight_sum = sum(variation.get("weight") for variation in variations)
     if weight_sum == 0:
-        normalized_weight = 100 / len(variations)
-        for variation in variations:
-            variation["weight"] = normalized_weight
-    else:
-        for variation in variations:
-            variation["weight"] = (variation["weight"] / weight_sum) * 100
+        return [100 / len(variations)] * len(variations)
+    return [(variation["weight"] / weight_sum) * 100 for variation in variations]
 
 
 def scale_campaigns(campaigns):
@@ -290,12 +426,14 @@ def is_part_of_group(settings_file, campaign_id):
     return False
 
 
-def get_group_campaigns(settings_file, group_id):
+def get_group_campaigns(settings_file, group_id, campaign_id_map=None):
     """Returns campaigns which are part of given group using group_id.
 
     Args:
         settings_file (dict): Settings file for the project
         group_id (int): id of group whose campaigns are to be return
+        campaign_id_map (dict|None): Prebuilt campaigns mapped to their ids,
+            see get_campaign_id_map. Settings file is scanned if not passed.
 
     Returns:
         group_campaigns (list): campaigns part of given group
@@ -308,10 +446,12 @@ def get_group_campaigns(settings_file, group_id):
         group_campaign_ids = groups.get(str(group_id)).get("campaigns")
 
     if group_campaign_ids:
+        if campaign_id_map is None:
+            campaign_id_map = get_campaign_id_map(settings_file.get("campaigns"))
         for campaign_id in group_campaign_ids:
-            for campaign in settings_file.get("campaigns"):
-                if campaign.get("id") == campaign_id and campaign.get("status") == constants.STATUS_RUNNING:
-                    group_campaigns.append(copy.copy(campaign))
+            campaign = campaign_id_map.get(campaign_id)
+            if campaign and campaign.get("status") == constants.STATUS_RUNNING:
+                group_campaigns.append(campaign)
 
     return group_campaigns
 
@@ -43,10 +43,12 @@ def get_url_params(settings_file, tag_key, tag_value, user_id):
     params = impression_util.get_common_properties(user_id, settings_file, None, None)
     params.update(url=url, tags=json.dumps(tag))
 
-    VWOLogger.getInstance().log(
-        LogLevelEnum.DEBUG,
-        LogMessageEnum.DEBUG_MESSAGES.PARAMS_FOR_PUSH_CALL.format(
-            file=FILE, properties=impression_util.get_stringified_log_impression(params)
-        ),
-    )
+    logger = VWOLogger.getInstance()
+    if logger.is_enabled_for(LogLevelEnum.DEBUG):
+        logger.log(
+            LogLevelEnum.DEBUG,
+            LogMessageEnum.DEBUG_MESSAGES.PARAMS_FOR_PUSH_CALL.format(
+                file=FILE, properties=impression_util.get_stringified_log_impression(params)
+            ),
+        )
     return params
@@ -53,10 +53,12 @@ def get_type_casted_feature_value(value, variable_type):
             # as it doesn't belong to bool type
             raise Exception
     except Exception:
-        VWOLogger.getInstance().log(
+        VWOLogger.getInstance().lazy_log(
             LogLevelEnum.ERROR,
-            LogMessageEnum.ERROR_MESSAGES.UNABLE_TO_TYPE_CAST.format(
-                file=FILE, value=value, variable_type=variable_type, of_type=type(value)
-            ),
+            LogMessageEnum.ERROR_MESSAGES.UNABLE_TO_TYPE_CAST,
+            file=FILE,
+            value=value,
+            variable_type=variable_type,
+            of_type=type(value),
         )
         return None
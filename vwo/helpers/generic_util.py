@@ -100,11 +100,14 @@ def safe_method(method, fail_return_value, FILE):
             args_log = str(args)
             kwargs_log = str(kwargs)
 
-            logger.log(
+            logger.lazy_log(
                 LogLevelEnum.ERROR,
-                LogMessageEnum.ERROR_MESSAGES.API_NOT_WORKING.format(
-                  file=FILE, exception=e, stacktrace=stacktrace, args_log=args_log, kwargs_log=kwargs_log
-                ),
+                LogMessageEnum.ERROR_MESSAGES.API_NOT_WORKING,
+                file=FILE,
+                exception=e,
+                stacktrace=stacktrace,
+                args_log=args_log,
+                kwargs_log=kwargs_log,
             )
 
             return fail_return_value
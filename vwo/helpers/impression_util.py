@@ -43,6 +43,8 @@ def create_impression(
     revenue=None,
     user_agent=None,
     user_ip_address=None,
+    vwo_user_id=None,
+    settings_file=None,
 ):
     """Creates the impression from the arguments passed according to
     call type
@@ -55,6 +57,8 @@ def create_impression(
         goal_id (string|None): Goal identifier, if building track impression
         revenue (string|float|int|None):
             Number value, in any representation, if building track impression
+        vwo_user_id (string|None): UUID of the user, generated if not passed
+        settings_file (dict|None): settings_file the campaign was read from, the one in use if not passed
 
     Returns:
         None|dict: None if campaign ID or variation ID is invalid,
@@ -68,7 +72,9 @@ def create_impression(
     if goal_id is not None:
         is_track_user_api = False
 
-    impression = get_common_properties(user_id, vwo_instance.settings_file, user_agent, user_ip_address)
+    if settings_file is None:
+        settings_file = vwo_instance.settings_file
+    impression = get_common_properties(user_id, settings_file, user_agent, user_ip_address, vwo_user_id=vwo_user_id)
 
     impression.update(experiment_id=campaign_id, combination=variation_id)
 
@@ -79,12 +85,13 @@ def create_impression(
         impression.update(ed=json.dumps({"p": constants.PLATFORM}))
         impression.update(url=url + constants.ENDPOINTS.TRACK_USER)
         impression.update(UsageStats.get_usage_stats())
-        logger.log(
-            LogLevelEnum.DEBUG,
-            LogMessageEnum.DEBUG_MESSAGES.IMPRESSION_FOR_TRACK_USER.format(
-                file=FILE, properties=get_stringified_log_impression(impression)
-            ),
-        )
+        if logger.is_enabled_for(LogLevelEnum.DEBUG):
+            logger.log(
+                LogLevelEnum.DEBUG,
+                LogMessageEnum.DEBUG_MESSAGES.IMPRESSION_FOR_TRACK_USER.format(
+                    file=FILE, properties=get_stringified_log_impression(impression)
+                ),
+            )
     else:
         impression.update(url=url + constants.ENDPOINTS.TRACK_GOAL)
         impression.update(goal_id=goal_id)
@@ -92,21 +99,23 @@ def create_impression(
             impression.update(r=revenue)
         elif(vwo_instance.is_event_arch_enabled and event_properties is not None and goal.get('revenueProp') in event_properties ):
             impression.update(r=event_properties[goal.get('revenueProp')])
-        logger.log(
-            LogLevelEnum.DEBUG,
-            LogMessageEnum.DEBUG_MESSAGES.IMPRESSION_FOR_TRACK_GOAL.format(
-                file=FILE, properties=get_stringified_log_impression(impression)
-            ),
-        )
+        if logger.is_enabled_for(LogLevelEnum.DEBUG):
+            logger.log(
+                LogLevelEnum.DEBUG,
+                LogMessageEnum.DEBUG_MESSAGES.IMPRESSION_FOR_TRACK_GOAL.format(
+                    file=FILE, properties=get_stringified_log_impression(impression)
+                ),
+            )
     return impression
 
 
-def get_common_properties(user_id, settings_file, user_agent, user_ip_address):
+def get_common_properties(user_id, settings_file, user_agent, user_ip_address, vwo_user_id=None):
     """Returns commonly used params for making requests to our servers.
 
     Args:
         user_id (string): Unique identification of user
         settings_file: settings file containing campaign data for extracting account_id
+        vwo_user_id (string|None): UUID of the user, generated if not passed
 
     Returns:
         properties(object): commonly used params for making call to our servers
@@ -117,26 +126,20 @@ def get_common_properties(user_id, settings_file, user_agent, user_ip_address):
     if user_agent is None:
         user_agent = ""
     else:
-        logger.log(
-            LogLevelEnum.DEBUG,
-            LogMessageEnum.DEBUG_MESSAGES.VISITOR_DATA.format(
-                file=FILE,
-                ua_or_ip="UA",
-                value=user_agent,
-            ),
+        logger.lazy_log(
+            LogLevelEnum.DEBUG, LogMessageEnum.DEBUG_MESSAGES.VISITOR_DATA, file=FILE, ua_or_ip="UA", value=user_agent
         )
 
     # initialize visitor IP to blank string if None
     if user_ip_address is None:
         user_ip_address = ""
     else:
-        logger.log(
+        logger.lazy_log(
             LogLevelEnum.DEBUG,
-            LogMessageEnum.DEBUG_MESSAGES.VISITOR_DATA.format(
-                file=FILE,
-                ua_or_ip="IP",
-                value=user_ip_address,
-            ),
+            LogMessageEnum.DEBUG_MESSAGES.VISITOR_DATA,
+            file=FILE,
+            ua_or_ip="IP",
+            value=user_ip_address,
         )
 
     account_id = settings_file.get("accountId")
@@ -147,7 +150,7 @@ def get_common_properties(user_id, settings_file, user_agent, user_ip_address):
         "sdk-v": constants.SDK_VERSION,
         "ap": constants.PLATFORM,
         "sId": generic_util.get_current_unix_timestamp(),
-        "u": uuid_util.generate_for(user_id, account_id),
+        "u": vwo_user_id or uuid_util.generate_for(user_id, account_id),
         "account_id": account_id,
         "env": sdk_key,
         constants.VISITOR.USER_AGENT: user_agent,
@@ -170,7 +173,9 @@ def get_stringified_log_impression(impression):
     return json.dumps(log_impression)
 
 
-def create_track_user_events_impression(settings_file, campaign_id, variation_id, user_id, custom_properties=None):
+def create_track_user_events_impression(
+    settings_file, campaign_id, variation_id, user_id, custom_properties=None, vwo_user_id=None
+):
     """Creates the event impression for track user call from the arguments passed accordingly
 
     Args:
@@ -178,24 +183,29 @@ def create_track_user_events_impression(settings_file, campaign_id, variation_id
         campaign_id (string): Campaign identifier
         variation_id (string): Variation identifier
         user_id (string): User identifier
+        vwo_user_id (string|None): UUID of the user, generated if not passed
 
     Returns:
         dict: impression for track user
     """
     logger = VWOLogger.getInstance()
 
-    impression = get_events_common_properties(settings_file, user_id, constants.EVENTS.VWO_VARIATION_SHOWN)
+    impression = get_events_common_properties(
+        settings_file, user_id, constants.EVENTS.VWO_VARIATION_SHOWN, vwo_user_id=vwo_user_id
+    )
 
     # impression["d"]["event"]["props"].update(UsageStats.get_usage_stats())
     impression["d"]["event"]["props"].update({"id": campaign_id, "variation": variation_id, "isFirst": 1})
     if custom_properties is not None:
         impression["d"]["event"]["props"].update({"vwoMeta": custom_properties})
 
-    logger.log(
+    logger.lazy_log(
         LogLevelEnum.DEBUG,
-        LogMessageEnum.DEBUG_MESSAGES.IMPRESSION_FOR_EVENT_ARCH_TRACK_USER.format(
-            file=FILE, account_id=settings_file.get("accountId"), user_id=user_id, campaign_id=campaign_id
-        ),
+        LogMessageEnum.DEBUG_MESSAGES.IMPRESSION_FOR_EVENT_ARCH_TRACK_USER,
+        file=FILE,
+        account_id=settings_file.get("accountId"),
+        user_id=user_id,
+        campaign_id=campaign_id,
     )
 
     return impression
@@ -228,15 +238,14 @@ def create_track_goal_events_impression(
         if revenue_prop and revenue:
             impression["d"]["event"]["props"]["vwoMeta"].update({revenue_prop: revenue})
 
-    logger.log(
+    logger.lazy_log(
         LogLevelEnum.DEBUG,
-        LogMessageEnum.DEBUG_MESSAGES.IMPRESSION_FOR_EVENT_ARCH_TRACK_GOAL.format(
-            file=FILE,
-            goal_identifier=goal_identifier,
-            account_id=settings_file.get("accountId"),
-            user_id=user_id,
-            campaign_ids=[campaign_id for campaign_id, _, _ in campaign_goal_revenue_prop_list],
-        ),
+        LogMessageEnum.DEBUG_MESSAGES.IMPRESSION_FOR_EVENT_ARCH_TRACK_GOAL,
+        file=FILE,
+        goal_identifier=goal_identifier,
+        account_id=settings_file.get("accountId"),
+        user_id=user_id,
+        campaign_ids=[campaign_id for campaign_id, _, _ in campaign_goal_revenue_prop_list],
     )
     if event_properties is not None and len(event_properties) > 0:
         for prop in event_properties:
@@ -264,33 +273,35 @@ def create_push_events_impression(settings_file, user_id, custom_dimension_map):
     for tag_key, tag_value in custom_dimension_map.items():
         impression["d"]["visitor"]["props"].update({str(tag_key): str(tag_value)})
 
-    logger.log(
-        LogLevelEnum.DEBUG,
-        LogMessageEnum.DEBUG_MESSAGES.IMPRESSION_FOR_EVENT_ARCH_PUSH.format(
-            file=FILE,
-            account_id=settings_file.get("accountId"),
-            user_id=user_id,
-            property=json.dumps(custom_dimension_map),
-        ),
-    )
+    if logger.is_enabled_for(LogLevelEnum.DEBUG):
+        logger.log(
+            LogLevelEnum.DEBUG,
+            LogMessageEnum.DEBUG_MESSAGES.IMPRESSION_FOR_EVENT_ARCH_PUSH.format(
+                file=FILE,
+                account_id=settings_file.get("accountId"),
+                user_id=user_id,
+                property=json.dumps(custom_dimension_map),
+            ),
+        )
 
     return impression
 
 
-def get_events_common_properties(settings_file, user_id, event_name):
+def get_events_common_properties(settings_file, user_id, event_name, vwo_user_id=None):
     """Returns common properties required for making events impression
 
     Args:
         settings_file (dict): settings file containing campaign data
         user_id (string): User identifier
         event_name (string): name of the event for which request will be made
+        vwo_user_id (string|None): UUID of the user, generated if not passed
 
     Returns:
         dict: common properties dict
     """
     account_id = settings_file.get("accountId")
     sdk_key = settings_file.get("sdkKey")
-    uuid = uuid_util.generate_for(user_id, account_id)
+    uuid = vwo_user_id or uuid_util.generate_for(user_id, account_id)
 
     properties = {
         "d": {
@@ -329,26 +340,24 @@ def get_events_params(settings_file, event_name, user_agent, user_ip_address):
     if user_agent is None:
         user_agent = ""
     else:
-        logger.log(
+        logger.lazy_log(
             LogLevelEnum.DEBUG,
-            LogMessageEnum.DEBUG_MESSAGES.VISITOR_DATA.format(
-                file=FILE,
-                ua_or_ip="UserAgent",
-                value=user_agent,
-            ),
+            LogMessageEnum.DEBUG_MESSAGES.VISITOR_DATA,
+            file=FILE,
+            ua_or_ip="UserAgent",
+            value=user_agent,
         )
 
     # initialize visitor IP to blank string if None, else log
     if user_ip_address is None:
         user_ip_address = ""
     else:
-        logger.log(
+        logger.lazy_log(
             LogLevelEnum.DEBUG,
-            LogMessageEnum.DEBUG_MESSAGES.VISITOR_DATA.format(
-                file=FILE,
-                ua_or_ip="IP",
-                value=user_ip_address,
-            ),
+            LogMessageEnum.DEBUG_MESSAGES.VISITOR_DATA,
+            file=FILE,
+            ua_or_ip="IP",
+            value=user_ip_address,
         )
 
     account_id = settings_file.get("accountId")
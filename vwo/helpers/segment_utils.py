@@ -67,6 +67,27 @@ def convert_to_true_types(operator_value, custom_variables_value):
     return str(true_type_operator_value), str(true_type_custom_variables_value)
 
 
+def convert_to_true_type(value):
+    """ Extracts true value represented in the arg, and returns stringified value of it.
+    Single value counterpart of convert_to_true_types, used when the operand_value is
+    converted upfront while compiling the segments
+
+    Args:
+        value(str): operand/dsl leaf value or custom_variables value
+
+    Returns:
+        str|None: stringified int/float value, None if value does not represent a number
+    """
+    try:
+        true_type_value = float(value)
+    except Exception:
+        return None
+
+    if true_type_value == math.floor(true_type_value):
+        true_type_value = int(true_type_value)
+    return str(true_type_value)
+
+
 def separate_operand(operand):
     """ Extract the operand_type, ie. lower, wildcard, regex or equals
 
@@ -37,11 +37,40 @@ def get(account_id, sdk_key, is_via_webhook=False):
             None if no settings_file is found or sdk_key is incorrect
     """
 
+    request = get_request(account_id, sdk_key, is_via_webhook)
+    if request is None:
+        return "{}"
+
+    server_url, parameters = request
+    try:
+        settings_file_response = requests.get(server_url, params=parameters)
+        settings_file = get_settings_file_from_response(
+            settings_file_response.status_code, settings_file_response.text, is_via_webhook
+        )
+    except requests.exceptions.RequestException as e:
+        print("Error fetching Settings File", e, file=sys.stderr)
+        return "{}"
+    return settings_file
+
+
+def get_request(account_id, sdk_key, is_via_webhook=False):
+    """ Builds the request to retrieve settings_file for customer from our server
+
+    Args:
+        account_id (string): Account ID of user
+        sdk_key (string): Unique sdk key for user,
+            can be retrieved from our webside
+        is_via_webhook (bool): is triggered via webhook flag
+
+    Returns:
+        tuple|None: url and query params of the request, None if account_id or sdk_key is invalid
+    """
+
     is_valid_account_id = validate_util.is_valid_number(account_id) or validate_util.is_valid_string(account_id)
 
     if not is_valid_account_id or not validate_util.is_valid_string(sdk_key):
         print(("account_id and sdk_key are required", "for fetching account settings. Aborting!"), file=sys.stderr)
-        return "{}"
+        return None
 
     protocol = constants.HTTPS_PROTOCOL
     hostname = constants.ENDPOINTS.BASE_URL
@@ -56,23 +85,31 @@ def get(account_id, sdk_key, is_via_webhook=False):
         "sdk": constants.SDK_NAME,
         "sdk-v": constants.SDK_VERSION,
     }
-    server_url = protocol + hostname + path
-    try:
-        settings_file_response = requests.get(server_url, params=parameters)
-        if settings_file_response.status_code != 200:
-            print(
-                "Request failed for fetching account settings. "
-                "{via_webhook_message}"
-                "Got Status Code: {status_code} "
-                "and message: {settings_file_response}.".format(
-                    via_webhook_message="[via Webhook] " if is_via_webhook else "",
-                    status_code=settings_file_response.status_code,
-                    settings_file_response=settings_file_response.text,
-                ),
-                file=sys.stderr,
-            )
-        settings_file = settings_file_response.text
-    except requests.exceptions.RequestException as e:
-        print("Error fetching Settings File", e, file=sys.stderr)
-        return "{}"
-    return settings_file
+    return protocol + hostname + path, parameters
+
+
+def get_settings_file_from_response(status_code, text, is_via_webhook=False):
+    """ Reports a failed request and returns the settings_file received
+
+    Args:
+        status_code (int): status code of the response
+        text (string): text of the response
+        is_via_webhook (bool): is triggered via webhook flag
+
+    Returns:
+        json_string: text of the response
+    """
+
+    if status_code != 200:
+        print(
+            "Request failed for fetching account settings. "
+            "{via_webhook_message}"
+            "Got Status Code: {status_code} "
+            "and message: {settings_file_response}.".format(
+                via_webhook_message="[via Webhook] " if is_via_webhook else "",
+                status_code=status_code,
+                settings_file_response=text,
+            ),
+            file=sys.stderr,
+        )
+    return text
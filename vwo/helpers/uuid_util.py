@@ -14,7 +14,9 @@
 
 """ Generating UUID required for sending impression to server """
 
+import threading
 import uuid
+from collections import OrderedDict
 from ..enums.log_message_enum import LogMessageEnum
 from ..enums.file_name_enum import FileNameEnum
 from ..enums.log_level_enum import LogLevelEnum
@@ -23,9 +25,18 @@ from ..logger import VWOLogger
 VWO_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "https://vwo.com")
 FILE = FileNameEnum.Helpers.UuidUtil
 
+# max no. of UUIDs memoized, least recently used are evicted
+MAX_MEMOIZED_UUIDS = 10000
+
+# account_id => namespace of the account, generated once per account
+_account_namespaces = {}
+# (account_id, user_id) => UUID, ordered from least to most recently used
+_memoized_uuids = OrderedDict()
+_lock = threading.Lock()
+
 
 def generate_for(user_id, account_id):
-    """ Generates desired UUID
+    """ Generates desired UUID, memoized for the most recently used users
 
     Args:
         user_id (int|string): User identifier
@@ -37,18 +48,64 @@ def generate_for(user_id, account_id):
 
     user_id = str(user_id)
     account_id = str(account_id)
-    user_id_namespace = generate(VWO_NAMESPACE, account_id)
-    uuid_for_account_user_id = generate(user_id_namespace, user_id)
+    key = (account_id, user_id)
+
+    with _lock:
+        desired_uuid = _memoized_uuids.pop(key, None)
+        if desired_uuid is not None:
+            # re-insert to mark it as most recently used
+            _memoized_uuids[key] = desired_uuid
+
+    if desired_uuid is None:
+        desired_uuid = _generate_for(user_id, account_id)
+        _memoize({key: desired_uuid})
+
+    _log_uuid(user_id, account_id, desired_uuid)
+    return desired_uuid
+
+
+def clear_memoized_uuids():
+    """ Removes the memoized UUIDs and account namespaces """
 
-    desired_uuid = str(uuid_for_account_user_id).replace("-", "").upper()
+    with _lock:
+        _memoized_uuids.clear()
+        _account_namespaces.clear()
 
-    VWOLogger.getInstance().log(
+
+def _generate_for(user_id, account_id):
+    """ Generates desired UUID of the user within the namespace of the account, bypassing the memo """
+    uuid_for_account_user_id = generate(_get_account_namespace(account_id), user_id)
+    return str(uuid_for_account_user_id).replace("-", "").upper()
+
+
+def _memoize(desired_uuids):
+    """ Memoizes (account_id, user_id) => UUID entries as most recently used, evicting the least recently used """
+    with _lock:
+        _memoized_uuids.update(desired_uuids)
+        while len(_memoized_uuids) > MAX_MEMOIZED_UUIDS:
+            _memoized_uuids.popitem(last=False)
+
+
+def _log_uuid(user_id, account_id, desired_uuid):
+    """ Logs the desired UUID generated for the user """
+    VWOLogger.getInstance().lazy_log(
         LogLevelEnum.DEBUG,
-        LogMessageEnum.DEBUG_MESSAGES.UUID_FOR_USER.format(
-            file=FILE, user_id=user_id, account_id=account_id, desired_uuid=desired_uuid
-        ),
+        LogMessageEnum.DEBUG_MESSAGES.UUID_FOR_USER,
+        file=FILE,
+        user_id=user_id,
+        account_id=account_id,
+        desired_uuid=desired_uuid,
     )
-    return desired_uuid
+
+
+def _get_account_namespace(account_id):
+    """ Returns namespace of the account i.e. uuid5 of account_id within VWO_NAMESPACE, generated once """
+    user_id_namespace = _account_namespaces.get(account_id)
+    if user_id_namespace is None:
+        user_id_namespace = generate(VWO_NAMESPACE, account_id)
+        # accounts are few, typically one per process, so namespaces are kept without bound
+        _account_namespaces[account_id] = user_id_namespace
+    return user_id_namespace
 
 
 def generate(namespace, name):
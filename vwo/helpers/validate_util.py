@@ -14,12 +14,14 @@
 
 """ Validate methods and parameters passed to the SDK """
 
+import inspect
 import sys
 import json
-import jsonschema
-from ..schemas.settings_file_schema import SETTINGS_FILE_SCHEMA
-from ..constants.constants import LOG_LEVELS, GOAL_TYPES, BATCH_EVENTS
-from . import generic_util
+from jsonschema.validators import validator_for
+from ..schemas.campaign_schema import CAMPAIGN
+from ..schemas.settings_file_schema import SETTINGS_FILE_SCHEMA, SETTINGS_FILE_SCHEMA_WITHOUT_CAMPAIGNS
+from ..constants.constants import LOG_LEVELS, GOAL_TYPES, BATCH_EVENTS, SETTINGS_POLLER
+from . import campaign_util, generic_util
 from ..logger import VWOLogger
 from ..enums.log_level_enum import LogLevelEnum
 from ..enums.log_message_enum import LogMessageEnum
@@ -31,14 +33,45 @@ services = {
     "integrations": ["callback"],
 }
 
-
-def is_valid_settings_file(settings_file):
+# schema id => validator, see get_validator
+_validators = {}
+
+USER_STORAGE_CACHE_OPTIONS = ["max_size", "ttl", "negative_ttl", "cache_misses"]
+REDIS_CREDS_OPTIONS = [
+    "url",
+    "user_id",
+    "password",
+    "port",
+    "db",
+    "max_connections",
+    "socket_timeout",
+    "socket_connect_timeout",
+    "retries",
+    "ttl",
+    "encoding",
+    "write_behind",
+    "write_behind_interval",
+    "write_behind_batch_size",
+    "write_behind_max_pending",
+]
+REDIS_ENCODINGS = ["json", "compact"]
+SETTINGS_POLLER_OPTIONS = [
+    SETTINGS_POLLER.ACCOUNT_ID,
+    SETTINGS_POLLER.SDK_KEY,
+    SETTINGS_POLLER.INTERVAL,
+    SETTINGS_POLLER.JITTER,
+]
+
+
+def is_valid_settings_file(settings_file, validated_campaign_digests=None):
     """ Validates the settings_file
 
     Args:
         settings_file (json):
             JSON object received from our server or somewhere else,
             must be json string representation.
+        validated_campaign_digests (set): digests of the campaigns validated earlier, see
+            campaign_util.get_campaign_digest. If passed, only the campaigns not in it are validated
 
     Returns:
         bool: Whether the settings_file is valid or not
@@ -48,12 +81,42 @@ def is_valid_settings_file(settings_file):
     except Exception:
         return False
     try:
-        jsonschema.validate(instance=settings_file, schema=SETTINGS_FILE_SCHEMA)
+        if validated_campaign_digests is None:
+            return get_validator(SETTINGS_FILE_SCHEMA).is_valid(settings_file)
+
+        if not get_validator(SETTINGS_FILE_SCHEMA_WITHOUT_CAMPAIGNS).is_valid(settings_file):
+            return False
+
+        campaigns = settings_file.get("campaigns")
+        if type(campaigns) is list:
+            campaign_validator = get_validator(CAMPAIGN)
+            for campaign in campaigns:
+                campaign_digest = campaign_util.get_campaign_digest(campaign)
+                if campaign_digest not in validated_campaign_digests and not campaign_validator.is_valid(campaign):
+                    return False
     except Exception:
         return False
     return True
 
 
+def get_validator(schema):
+    """ Returns validator of the schema, built and checked against its meta schema only once
+    instead of on every validation as jsonschema.validate does
+
+    Args:
+        schema (dict): one of the schemas of vwo.schemas
+
+    Returns:
+        object: jsonschema validator of the draft the schema is written in
+    """
+    validator = _validators.get(id(schema))
+    if validator is None:
+        validator_class = validator_for(schema)
+        validator_class.check_schema(schema)
+        validator = _validators[id(schema)] = validator_class(schema)
+    return validator
+
+
 def is_valid_service(service, service_name):
     """ Checks whether the service passed by the user contains the necessary methods or not
 
@@ -196,6 +259,134 @@ def is_valid_basic_data_type(val):
     return type(val) in [int, float, bool, str]
 
 
+def is_valid_user_storage_cache(val):
+    """ Validates if the value passed as user_storage_cache has correct keys and values or not.
+
+    Args:
+        val (dict): value to be tested
+
+    Returns:
+        bool: True if all conditions are passed else False
+    """
+    if not is_valid_dict(val) or not set(val).issubset(USER_STORAGE_CACHE_OPTIONS):
+        return False
+
+    if val.get("max_size") is not None and not (type(val.get("max_size")) is int and val.get("max_size") > 0):
+        return False
+
+    for ttl_option in ["ttl", "negative_ttl"]:
+        ttl = val.get(ttl_option)
+        if ttl is not None and not (type(ttl) in [int, float] and ttl > 0):
+            return False
+
+    return True
+
+
+def is_cacheable_service(service):
+    """ Checks whether the user_storage passed can be wrapped by CachedUserStorage,
+    i.e. its get method is not a coroutine function
+
+    Args:
+        service (classobj): User defined class instance
+
+    Returns:
+        bool: True if it can be cached else False
+    """
+    is_coroutine_function = getattr(inspect, "iscoroutinefunction", None)
+    return not (is_coroutine_function and is_coroutine_function(getattr(service, "get", None)))
+
+
+def is_valid_redis_creds(val):
+    """ Validates if the value passed as redis_creds has correct keys and values or not.
+
+    Args:
+        val (dict): value to be tested
+
+    Returns:
+        bool: True if all conditions are passed else False
+    """
+    if not is_valid_dict(val) or not set(val).issubset(REDIS_CREDS_OPTIONS) or not is_valid_string(val.get("url")):
+        return False
+
+    for int_option in ["port", "db", "retries"]:
+        option = val.get(int_option)
+        if option is not None and not (type(option) is int and option >= 0):
+            return False
+
+    for positive_int_option in ["max_connections", "ttl", "write_behind_batch_size", "write_behind_max_pending"]:
+        option = val.get(positive_int_option)
+        if option is not None and not (type(option) is int and option > 0):
+            return False
+
+    for number_option in ["socket_timeout", "socket_connect_timeout", "write_behind_interval"]:
+        option = val.get(number_option)
+        if option is not None and not (type(option) in [int, float] and option > 0):
+            return False
+
+    if val.get("encoding") is not None and val.get("encoding") not in REDIS_ENCODINGS:
+        return False
+
+    if val.get("write_behind") is not None and type(val.get("write_behind")) is not bool:
+        return False
+
+    return True
+
+
+def is_valid_settings_update_callback(val):
+    """ Validates if the value passed as settings_update_callback is callable
+
+    Args:
+        val (function): value to be tested
+
+    Returns:
+        bool: True if it is callable else False
+    """
+    return callable(val)
+
+
+def is_valid_instrumentation_sink(val):
+    """ Validates if the value passed as instrumentation_sink is callable
+
+    Args:
+        val (function): value to be tested
+
+    Returns:
+        bool: True if it is callable else False
+    """
+    return callable(val)
+
+
+def is_valid_settings_poller_settings(val):
+    """ Validates if the value passed as settings_poller has correct keys and values or not.
+
+    Args:
+        val (dict): value to be tested
+
+    Returns:
+        bool: True if all conditions are passed else False
+    """
+    if not is_valid_dict(val) or not set(val).issubset(SETTINGS_POLLER_OPTIONS):
+        return False
+
+    account_id = val.get(SETTINGS_POLLER.ACCOUNT_ID)
+    if account_id is not None and not (is_valid_number(account_id) or is_valid_string(account_id)):
+        return False
+
+    sdk_key = val.get(SETTINGS_POLLER.SDK_KEY)
+    if sdk_key is not None and not is_valid_string(sdk_key):
+        return False
+
+    interval = val.get(SETTINGS_POLLER.INTERVAL)
+    if interval is not None and not (type(interval) in [int, float] and interval >= SETTINGS_POLLER.MIN_INTERVAL):
+        return False
+
+    jitter = val.get(SETTINGS_POLLER.JITTER)
+    if jitter is not None and not (type(jitter) in [int, float] and 0 <= jitter < 1):
+        return False
+
+    return True
+
+
 def is_valid_batch_event_settings(val, file):
     """ Validates if the value passed batch_event_settings has correct data type and values or not.
 
@@ -208,7 +399,7 @@ def is_valid_batch_event_settings(val, file):
     logger = VWOLogger.getInstance()
 
     if not is_valid_dict(val):
-        logger.log(LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.EVENT_BATCHING_NOT_OBJECT.format(file=file))
+        logger.lazy_log(LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.EVENT_BATCHING_NOT_OBJECT, file=file)
         return False
 
     events_per_request = val.get(BATCH_EVENTS.EVENTS_PER_REQUEST)
@@ -216,15 +407,15 @@ def is_valid_batch_event_settings(val, file):
     flush_callback = val.get(BATCH_EVENTS.FLUSH_CALLBACK)
 
     if events_per_request is None and request_time_interval is None:
-        logger.log(LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.EVENT_BATCHING_INSUFFICIENT.format(file=file))
+        logger.lazy_log(LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.EVENT_BATCHING_INSUFFICIENT, file=file)
         return False
 
     if events_per_request is not None and not (type(events_per_request) in [int]):
-        logger.log(LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.EVENTS_PER_REQUEST_INVALID.format(file=file))
+        logger.lazy_log(LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.EVENTS_PER_REQUEST_INVALID, file=file)
         return False
 
     if request_time_interval is not None and not (type(request_time_interval) in [int, float]):
-        logger.log(LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.REQUEST_TIME_INTERVAL_INVALID.format(file=file))
+        logger.lazy_log(LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.REQUEST_TIME_INTERVAL_INVALID, file=file)
         return False
 
     if events_per_request is not None:
@@ -232,28 +423,86 @@ def is_valid_batch_event_settings(val, file):
             events_per_request < BATCH_EVENTS.MIN_EVENTS_PER_REQUEST
             or events_per_request > BATCH_EVENTS.MAX_EVENTS_PER_REQUEST
         ):
-            logger.log(
+            logger.lazy_log(
                 LogLevelEnum.ERROR,
-                LogMessageEnum.ERROR_MESSAGES.EVENTS_PER_REQUEST_OUT_OF_BOUNDS.format(
-                    file=file,
-                    min_value=BATCH_EVENTS.MIN_EVENTS_PER_REQUEST,
-                    max_value=BATCH_EVENTS.MAX_EVENTS_PER_REQUEST,
-                ),
+                LogMessageEnum.ERROR_MESSAGES.EVENTS_PER_REQUEST_OUT_OF_BOUNDS,
+                file=file,
+                min_value=BATCH_EVENTS.MIN_EVENTS_PER_REQUEST,
+                max_value=BATCH_EVENTS.MAX_EVENTS_PER_REQUEST,
             )
             return False
 
     if request_time_interval is not None:
         if request_time_interval < BATCH_EVENTS.MIN_REQUEST_TIME_INTERVAL:
-            logger.log(
+            logger.lazy_log(
                 LogLevelEnum.ERROR,
-                LogMessageEnum.ERROR_MESSAGES.REQUEST_TIME_INTERVAL_OUT_OF_BOUNDS.format(
-                    file=file, min_value=BATCH_EVENTS.MIN_REQUEST_TIME_INTERVAL
-                ),
+                LogMessageEnum.ERROR_MESSAGES.REQUEST_TIME_INTERVAL_OUT_OF_BOUNDS,
+                file=file,
+                min_value=BATCH_EVENTS.MIN_REQUEST_TIME_INTERVAL,
             )
             return False
 
+    max_queue_size = val.get(BATCH_EVENTS.MAX_QUEUE_SIZE)
+    if max_queue_size is not None and (
+        type(max_queue_size) is not int or max_queue_size < BATCH_EVENTS.MIN_EVENTS_PER_REQUEST
+    ):
+        logger.lazy_log(
+            LogLevelEnum.ERROR,
+            LogMessageEnum.ERROR_MESSAGES.MAX_QUEUE_SIZE_INVALID,
+            file=file,
+            min_value=BATCH_EVENTS.MIN_EVENTS_PER_REQUEST,
+        )
+        return False
+
+    compression = val.get(BATCH_EVENTS.COMPRESSION)
+    if compression is not None and compression not in BATCH_EVENTS.COMPRESSIONS:
+        logger.lazy_log(
+            LogLevelEnum.ERROR,
+            LogMessageEnum.ERROR_MESSAGES.COMPRESSION_INVALID,
+            file=file,
+            compressions=", ".join(BATCH_EVENTS.COMPRESSIONS),
+        )
+        return False
+
+    compression_threshold = val.get(BATCH_EVENTS.COMPRESSION_THRESHOLD)
+    if compression_threshold is not None and (type(compression_threshold) is not int or compression_threshold < 0):
+        logger.lazy_log(LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.COMPRESSION_THRESHOLD_INVALID, file=file)
+        return False
+
+    max_retries = val.get(BATCH_EVENTS.MAX_RETRIES)
+    if max_retries is not None and (
+        type(max_retries) is not int or max_retries < 0 or max_retries > BATCH_EVENTS.MAX_RETRIES_LIMIT
+    ):
+        logger.lazy_log(
+            LogLevelEnum.ERROR,
+            LogMessageEnum.ERROR_MESSAGES.MAX_RETRIES_INVALID,
+            file=file,
+            max_value=BATCH_EVENTS.MAX_RETRIES_LIMIT,
+        )
+        return False
+
+    retry_backoff = val.get(BATCH_EVENTS.RETRY_BACKOFF)
+    if retry_backoff is not None and (type(retry_backoff) not in [int, float] or retry_backoff <= 0):
+        logger.lazy_log(LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.RETRY_BACKOFF_INVALID, file=file)
+        return False
+
+    max_in_flight_requests = val.get(BATCH_EVENTS.MAX_IN_FLIGHT_REQUESTS)
+    if max_in_flight_requests is not None and (
+        type(max_in_flight_requests) is not int
+        or max_in_flight_requests < 1
+        or max_in_flight_requests > BATCH_EVENTS.MAX_IN_FLIGHT_REQUESTS_LIMIT
+    ):
+        logger.lazy_log(
+            LogLevelEnum.ERROR,
+            LogMessageEnum.ERROR_MESSAGES.MAX_IN_FLIGHT_REQUESTS_INVALID,
+            file=file,
+            min_value=1,
+            max_value=BATCH_EVENTS.MAX_IN_FLIGHT_REQUESTS_LIMIT,
+        )
+        return False
+
     if flush_callback is not None and not callable(flush_callback):
-        logger.log(LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.FLUSH_CALLBACK_INVALID.format(file=file))
+        logger.lazy_log(LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.FLUSH_CALLBACK_INVALID, file=file)
         return False
 
     return True
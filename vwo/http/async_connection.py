@@ -0,0 +1,175 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Module for making requests from asyncio code, uses aiohttp if installed else requests off the event loop """
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from .connection import Connection, encode_json_body
+from ..logger import VWOLogger
+from ..enums.log_message_enum import LogMessageEnum
+from ..enums.file_name_enum import FileNameEnum
+from ..enums.log_level_enum import LogLevelEnum
+
+FILE = FileNameEnum.Http.AsyncConnection
+
+DEFAULT_POOL_SIZE = 10
+
+
+class AsyncConnection:
+    """AsyncConnection class to provide SDK with awaitable network connectivity interfaces.
+
+    With aiohttp installed, requests are made by a pooled aiohttp session. Else they are made by the
+    pooled requests session of Connection on a bounded thread pool, so the event loop is never blocked.
+    """
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, timeout=None):
+        """Initializes connection class, the session is created on the first request as it needs a running loop
+
+        Args:
+            pool_size (int): max no. of concurrent connections
+            timeout (float): seconds to wait for a response, waits forever if None
+        """
+        self.logger = VWOLogger.getInstance()
+        self.pool_size = pool_size
+        self.timeout = timeout
+
+        self.session = None
+        self.connection = None
+        self.executor = None
+        if aiohttp is None:
+            self.connection = Connection()
+            self.executor = ThreadPoolExecutor(max_workers=pool_size)
+
+    async def get(self, url, params=None, headers=None):
+        """Get method, wraps upon aiohttp's get method or Connection.get.
+        Args:
+            url (str): Unique resource locator
+            params (dict): Parameters to be passed
+            headers (dict): Headers for request
+        Returns:
+            dict : Status code and Response text
+        """
+        if self.connection is not None:
+            return await self._run_in_executor(self.connection.get, url, params=params, headers=headers)
+
+        return await self._request("GET", url, params=params, headers=headers)
+
+    async def post(
+        self,
+        url,
+        params=None,
+        data=None,
+        headers=None,
+        compression=None,
+        compression_threshold=0,
+        include_request_size=False,
+    ):
+        """Post method, wraps upon aiohttp's post method or Connection.post.
+        Args:
+            url (str): Unique resource locator
+            params (dict): Parameters to be passed
+            data (dict): Json data to be passed
+            headers (dict): Headers for request
+            compression (str|None): Content-Encoding to compress data with i.e. gzip or deflate
+            compression_threshold (int): min bytes of the json of data to compress it
+            include_request_size (bool): whether to return the bytes of the request body too
+        Returns:
+            dict : Status code and Response text, and request_size if include_request_size
+        """
+        if self.connection is not None:
+            return await self._run_in_executor(
+                self.connection.post,
+                url,
+                params=params,
+                data=data,
+                headers=headers,
+                compression=compression,
+                compression_threshold=compression_threshold,
+                include_request_size=include_request_size,
+            )
+
+        body = None
+        request_headers = dict(headers or {})
+        if data is not None:
+            body, content_encoding = encode_json_body(data, compression, compression_threshold)
+            request_headers["Content-Type"] = "application/json"
+            if content_encoding is not None:
+                request_headers["Content-Encoding"] = content_encoding
+        resp = await self._request("POST", url, params=params, data=body, headers=request_headers)
+        if include_request_size:
+            resp["request_size"] = len(body or b"")
+        return resp
+
+    async def close(self):
+        """Closes the pooled connections"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+
+    async def _run_in_executor(self, method, *args, **kwargs):
+        """Calls a method of Connection on the bounded thread pool, so that the event loop isn't blocked"""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(method, *args, **kwargs))
+
+    async def _request(self, method, url, params=None, data=None, headers=None):
+        """Makes the request with the aiohttp session, data being the encoded body if any"""
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+
+        # unlike requests, aiohttp accepts only string query params and does not skip the None ones
+        if params:
+            params = {key: str(value) for key, value in params.items() if value is not None}
+
+        try:
+            async with self.session.request(method, url, params=params, data=data, headers=headers) as resp:
+                return {"status_code": resp.status, "text": await resp.text()}
+        except asyncio.TimeoutError as err:
+            self.logger.lazy_log(
+                LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.CONNECTION_ERROR, file=FILE, reason="Timeout", err=err
+            )
+
+            return {"status_code": None, "text": ""}
+        except aiohttp.ClientError as err:
+            self.logger.lazy_log(
+                LogLevelEnum.ERROR,
+                LogMessageEnum.ERROR_MESSAGES.CONNECTION_ERROR,
+                file=FILE,
+                reason="Client Error",
+                err=err,
+            )
+
+            return {"status_code": None, "text": ""}
+        except Exception as err:
+            self.logger.lazy_log(
+                LogLevelEnum.ERROR,
+                LogMessageEnum.ERROR_MESSAGES.CONNECTION_ERROR,
+                file=FILE,
+                reason="Exception",
+                err=err,
+            )
+
+            return {"status_code": None, "text": ""}
@@ -14,6 +14,9 @@
 
 """ Module for making requests, uses requests internally """
 
+import json
+import zlib
+
 import requests
 from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, Timeout, ConnectionError
@@ -26,110 +29,182 @@ from ..enums.log_level_enum import LogLevelEnum
 
 FILE = FileNameEnum.Http.Connection
 
+# json bodies are encoded without whitespace
+JSON_SEPARATORS = (",", ":")
+# zlib wbits of the supported Content-Encodings, gzip has a gzip header and deflate a zlib header
+COMPRESSION_WBITS = {"gzip": 16 + zlib.MAX_WBITS, "deflate": zlib.MAX_WBITS}
+# json of events is repetitive, fastest compression shrinks it nearly as much as the default level
+COMPRESSION_LEVEL = 1
+
+
+def encode_json_body(data, compression=None, compression_threshold=0):
+    """Encodes data as compact json, compressed if compression is passed and the json is large enough
+
+    Args:
+        data (dict): Json data to be encoded
+        compression (str|None): Content-Encoding to compress with i.e. gzip or deflate, None to not compress
+        compression_threshold (int): min bytes of the json to compress it
+
+    Returns:
+        tuple: body (bytes) and its Content-Encoding, None if not compressed
+    """
+    body = json.dumps(data, separators=JSON_SEPARATORS).encode("utf-8")
+    if compression is None or len(body) < compression_threshold:
+        return body, None
+    compressor = zlib.compressobj(COMPRESSION_LEVEL, zlib.DEFLATED, COMPRESSION_WBITS[compression])
+    return compressor.compress(body) + compressor.flush(), compression
+
 
 class Connection:
     """Connection class to provide SDK with network connectivity interfaces"""
 
-    def __init__(self):
-        """Initializes connection class with requests session object"""
+    def __init__(self, max_retries=3):
+        """Initializes connection class with requests session object
+
+        Args:
+            max_retries (int): times a failed request is retried, blocking the calling thread, 0 to not retry
+        """
         self.logger = VWOLogger.getInstance()
 
         self.session = requests.Session()
         retry_strategy = Retry(
-            total=3,
+            total=max_retries,
             backoff_factor=3,
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["HEAD", "GET", "OPTIONS", "POST"],
             raise_on_status=False,
-            connect=3,  # Retry on connection-related errors
-            read=3,  # Retry on read-related errors
+            connect=max_retries,  # Retry on connection-related errors
+            read=max_retries,  # Retry on read-related errors
         )
         adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
-    def get(self, url, params=None, headers=None):
+    def get(self, url, params=None, headers=None, include_headers=False):
         """Get method, it wraps upon requests' get method.
         Args:
             url (str): Unique resource locator
             params (dict): Parameters to be passed
+            headers (dict): Headers for request
+            include_headers (bool): whether to return the response headers too
         Returns:
-            dict : Status code and Response text
+            dict : Status code and Response text, and Response headers if include_headers
         """
 
         try:
             resp = self.session.get(url, params=params, headers=headers)
+            if include_headers:
+                return {"status_code": resp.status_code, "text": resp.text, "headers": resp.headers}
             return {"status_code": resp.status_code, "text": resp.text}
         except Timeout as err:
-            self.logger.log(
+            self.logger.lazy_log(
                 LogLevelEnum.ERROR,
-                LogMessageEnum.ERROR_MESSAGES.CONNECTION_ERROR.format(file=FILE, reason="Timeout Exception", err=err),
+                LogMessageEnum.ERROR_MESSAGES.CONNECTION_ERROR,
+                file=FILE,
+                reason="Timeout Exception",
+                err=err,
             )
 
             return {"status_code": None, "text": ""}
         except ConnectionError as err:
-            self.logger.log(
+            self.logger.lazy_log(
                 LogLevelEnum.ERROR,
-                LogMessageEnum.ERROR_MESSAGES.CONNECTION_ERROR.format(
-                    file=FILE, reason="Connection Error Exception", err=err
-                ),
+                LogMessageEnum.ERROR_MESSAGES.CONNECTION_ERROR,
+                file=FILE,
+                reason="Connection Error Exception",
+                err=err,
             )
 
             return {"status_code": None, "text": ""}
         except RequestException as err:
-            self.logger.log(
+            self.logger.lazy_log(
                 LogLevelEnum.ERROR,
-                LogMessageEnum.ERROR_MESSAGES.CONNECTION_ERROR.format(file=FILE, reason="Request Exception", err=err),
+                LogMessageEnum.ERROR_MESSAGES.CONNECTION_ERROR,
+                file=FILE,
+                reason="Request Exception",
+                err=err,
             )
 
             return {"status_code": None, "text": ""}
         except Exception as err:
-            self.logger.log(
+            self.logger.lazy_log(
                 LogLevelEnum.ERROR,
-                LogMessageEnum.ERROR_MESSAGES.CONNECTION_ERROR.format(file=FILE, reason="Exception", err=err),
+                LogMessageEnum.ERROR_MESSAGES.CONNECTION_ERROR,
+                file=FILE,
+                reason="Exception",
+                err=err,
             )
 
             return {"status_code": None, "text": ""}
 
-    def post(self, url, params=None, data=None, headers=None):
+    def post(
+        self,
+        url,
+        params=None,
+        data=None,
+        headers=None,
+        compression=None,
+        compression_threshold=0,
+        include_request_size=False,
+    ):
         """Post method, it wraps upon requests' post method.
         Args:
             url (str): Unique resource locator
             params (dict): Parameters to be passed
             data (dict): Json data to be passed
             headers (dict): Headers for request
+            compression (str|None): Content-Encoding to compress data with i.e. gzip or deflate
+            compression_threshold (int): min bytes of the json of data to compress it
+            include_request_size (bool): whether to return the bytes of the request body too
         Returns:
-            dict : Status code and Response text
+            dict : Status code and Response text, and request_size if include_request_size
         """
 
         try:
-            resp = self.session.post(url, params=params, json=data, headers=headers)
+            body = None
+            request_headers = dict(headers or {})
+            if data is not None:
+                body, content_encoding = encode_json_body(data, compression, compression_threshold)
+                request_headers["Content-Type"] = "application/json"
+                if content_encoding is not None:
+                    request_headers["Content-Encoding"] = content_encoding
+            resp = self.session.post(url, params=params, data=body, headers=request_headers)
+            if include_request_size:
+                return {"status_code": resp.status_code, "text": resp.text, "request_size": len(body or b"")}
             return {"status_code": resp.status_code, "text": resp.text}
         except Timeout as err:
-            self.logger.log(
-                LogLevelEnum.ERROR,
-                LogMessageEnum.ERROR_MESSAGES.CONNECTION_ERROR.format(file=FILE, reason="Timeout", err=err),
+            self.logger.lazy_log(
+                LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.CONNECTION_ERROR, file=FILE, reason="Timeout", err=err
             )
 
             return {"status_code": None, "text": ""}
         except ConnectionError as err:
-            self.logger.log(
+            self.logger.lazy_log(
                 LogLevelEnum.ERROR,
-                LogMessageEnum.ERROR_MESSAGES.CONNECTION_ERROR.format(file=FILE, reason="Connection Error", err=err),
+                LogMessageEnum.ERROR_MESSAGES.CONNECTION_ERROR,
+                file=FILE,
+                reason="Connection Error",
+                err=err,
             )
 
             return {"status_code": None, "text": ""}
         except RequestException as err:
-            self.logger.log(
+            self.logger.lazy_log(
                 LogLevelEnum.ERROR,
-                LogMessageEnum.ERROR_MESSAGES.CONNECTION_ERROR.format(file=FILE, reason="Request Exception", err=err),
+                LogMessageEnum.ERROR_MESSAGES.CONNECTION_ERROR,
+                file=FILE,
+                reason="Request Exception",
+                err=err,
             )
 
             return {"status_code": None, "text": ""}
         except Exception as err:
-            self.logger.log(
+            self.logger.lazy_log(
                 LogLevelEnum.ERROR,
-                LogMessageEnum.ERROR_MESSAGES.CONNECTION_ERROR.format(file=FILE, reason="Exception", err=err),
+                LogMessageEnum.ERROR_MESSAGES.CONNECTION_ERROR,
+                file=FILE,
+                reason="Exception",
+                err=err,
             )
 
             return {"status_code": None, "text": ""}
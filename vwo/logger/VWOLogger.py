@@ -125,6 +125,40 @@ class VWOLogger:
         """ It sets the api_name to the API currently being used, for logging purpose. """
         self.api_name = api_name
 
+    def is_enabled_for(self, level):
+        """Checks whether a message of given level would be logged by the logger.
+        Custom loggers without an isEnabledFor method log every level.
+
+        Args:
+            level (int): Level of log
+
+        Returns:
+            bool: True if the message would be logged
+        """
+
+        try:
+            return self.logger.isEnabledFor(level)
+        except Exception:
+            return True
+
+    def lazy_log(self, level, message, disable_logs=False, **kwargs):
+        """Log method which formats the message with kwargs only when it is going
+        to be logged, hence costs no formatting work for disabled levels.
+
+        Args:
+            level (int): Level of log
+            message (string): Message template to log, see LogMessageEnum
+            disable_logs (bool): disable logs if True
+
+        Keyword Args:
+            Values for the placeholders of the message template
+        """
+
+        if disable_logs or not self.is_enabled_for(level):
+            return
+
+        self.log(level, message.format(**kwargs))
+
     def log(self, level, message, disable_logs=False):
         """Log method which takes two parameters and logs the message according to
         handler of logger provided while instantiating this class.
@@ -136,7 +170,7 @@ class VWOLogger:
         """
 
         try:
-            if not disable_logs:
+            if not disable_logs and self.is_enabled_for(level):
                 self.logger.log(level, message.replace("API_NAME", self.api_name, 1))
         except Exception:
             # Even logging.Logger is broken somehow, simply print to console
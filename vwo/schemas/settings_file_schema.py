@@ -33,3 +33,11 @@ SETTINGS_FILE_SCHEMA = {
     },
     "required": ["version", "accountId", "campaigns"],
 }
+
+# campaigns are validated against CAMPAIGN one at a time, so that only the ones changed can be validated
+SETTINGS_FILE_SCHEMA_WITHOUT_CAMPAIGNS = dict(
+    SETTINGS_FILE_SCHEMA,
+    properties=dict(
+        SETTINGS_FILE_SCHEMA["properties"], campaigns={"if": {"type": "array"}, "then": {}, "else": EMPTY_OBJECT}
+    ),
+)
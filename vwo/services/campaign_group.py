@@ -0,0 +1,138 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Module for the mutually exclusive groups(MEG) of campaigns resolved from the settings_file """
+
+from __future__ import division
+
+from ..constants import constants
+from ..helpers import campaign_util
+
+# upper bound on the eligible subsets whose allocation ranges are kept per group
+MAX_MEMOIZED_ALLOCATIONS = 1024
+
+
+class CampaignGroup(object):
+    """Group of the settings_file resolved once, with its running campaigns, priority campaigns,
+    traffic weightage and algorithm, for deciding the winner campaign without scanning the campaigns.
+
+    Campaigns are shared with the settings_file and never modified. Allocation ranges of the
+    campaigns eligible for a user are memoized by the ids of those campaigns, so deciding the
+    winner again for the same eligible campaigns neither scales weights nor builds ranges."""
+
+    __slots__ = ("id", "name", "algo", "campaigns", "priority_campaign_ids", "traffic_weightage", "_allocations")
+
+    def __init__(self, group_id, group, campaign_id_map):
+        """
+        Args:
+            group_id (int|string): id of the group
+            group (dict): group from groups of the settings_file
+            campaign_id_map (dict): campaigns mapped to their ids, see campaign_util.get_campaign_id_map
+        """
+        campaigns = []
+        for campaign_id in group.get("campaigns") or []:
+            campaign = campaign_id_map.get(campaign_id)
+            if campaign and campaign.get("status") == constants.STATUS_RUNNING:
+                campaigns.append(campaign)
+
+        set_attribute = super(CampaignGroup, self).__setattr__
+        set_attribute("id", group_id)
+        set_attribute("name", group.get("name"))
+        set_attribute("algo", group.get("et"))
+        set_attribute("campaigns", tuple(campaigns))
+        set_attribute("priority_campaign_ids", tuple(group.get("p") or ()))
+        set_attribute("traffic_weightage", dict(group.get("wt") or {}))
+        set_attribute("_allocations", {})
+
+    def get_allocation(self, eligible_campaigns):
+        """Returns the campaigns sharing traffic equally among them along with their allocation ranges
+
+        Args:
+            eligible_campaigns (list): campaigns of the group eligible for the user, in group order
+
+        Returns:
+            tuple: campaigns and their sorted allocation ranges, see campaign_util.get_sorted_allocation_ranges
+        """
+        key = (False, frozenset(campaign.get("id") for campaign in eligible_campaigns))
+        allocation = self._allocations.get(key)
+        if allocation is None:
+            weight = 100 / len(eligible_campaigns)
+            allocation = self._memoize(key, eligible_campaigns, [weight] * len(eligible_campaigns))
+        return allocation
+
+    def get_traffic_weightage_allocation(self, eligible_campaigns):
+        """Returns the campaigns having traffic weightage along with their allocation ranges
+        as per the weightage
+
+        Args:
+            eligible_campaigns (list): campaigns of the group eligible for the user, in group order
+
+        Returns:
+            tuple: campaigns and their sorted allocation ranges, see campaign_util.get_sorted_allocation_ranges
+        """
+        key = (True, frozenset(campaign.get("id") for campaign in eligible_campaigns))
+        allocation = self._allocations.get(key)
+        if allocation is None:
+            weighted_campaigns = [
+                campaign for campaign in eligible_campaigns if str(campaign.get("id")) in self.traffic_weightage
+            ]
+            allocation = self._memoize(
+                key,
+                weighted_campaigns,
+                [self.traffic_weightage.get(str(campaign.get("id"))) for campaign in weighted_campaigns],
+            )
+        return allocation
+
+    def _memoize(self, key, campaigns, weights):
+        """Builds the allocation of the campaigns as per their weights and memoizes it by key,
+        unless MAX_MEMOIZED_ALLOCATIONS are memoized already
+
+        Args:
+            key (tuple): whether traffic weightage is used, and ids of the eligible campaigns
+            campaigns (list): campaigns sharing the traffic
+            weights (list): traffic weight of each campaign
+
+        Returns:
+            tuple: campaigns and their sorted allocation ranges
+        """
+        allocation = (tuple(campaigns), campaign_util.get_sorted_allocation_ranges_for_weights(weights))
+        # a racing thread may build the same allocation, either of them is kept
+        if len(self._allocations) < MAX_MEMOIZED_ALLOCATIONS:
+            self._allocations[key] = allocation
+        return allocation
+
+    def __setattr__(self, name, value):
+        """Blocks changes, as a group is shared by the snapshot among the threads deciding with it
+        without any lock, so it must stay as resolved"""
+        raise AttributeError("CampaignGroup is immutable")
+
+    def __delattr__(self, name):
+        """Blocks deletions, see __setattr__"""
+        raise AttributeError("CampaignGroup is immutable")
+
+
+def get_campaign_groups(settings_file, campaign_id_map):
+    """Resolves the groups of the settings_file
+
+    Args:
+        settings_file (dict): Settings file for the project
+        campaign_id_map (dict): campaigns mapped to their ids, see campaign_util.get_campaign_id_map
+
+    Returns:
+        dict: CampaignGroup of each group mapped to the group id as string
+    """
+    return {
+        group_id: CampaignGroup(group_id, group, campaign_id_map)
+        for group_id, group in (settings_file.get("groups") or {}).items()
+    }
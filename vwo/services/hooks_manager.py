@@ -50,14 +50,13 @@ class HooksManager(object):
             try:
                 self.integrations.callback(properties)
             except Exception as e:
-                self.logger.log(
+                self.logger.lazy_log(
                     LogLevelEnum.ERROR,
-                    LogMessageEnum.ERROR_MESSAGES.INTEGRATIONS_SERVICE_CALLBACK_EXECUTION_ERROR.format(
-                        file=FILE, error_message=e
-                    ),
+                    LogMessageEnum.ERROR_MESSAGES.INTEGRATIONS_SERVICE_CALLBACK_EXECUTION_ERROR,
+                    file=FILE,
+                    error_message=e,
                 )
         else:
-            self.logger.log(
-                LogLevelEnum.ERROR,
-                LogMessageEnum.ERROR_MESSAGES.INTEGRATIONS_SERVICE_CALLBACK_INVALID.format(file=FILE),
+            self.logger.lazy_log(
+                LogLevelEnum.ERROR, LogMessageEnum.ERROR_MESSAGES.INTEGRATIONS_SERVICE_CALLBACK_INVALID, file=FILE
             )
@@ -0,0 +1,401 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Opt-in instrumentation timing the stages of the decisions made by the APIs """
+
+from __future__ import division
+
+import functools
+import math
+import threading
+import time
+
+from ..constants.constants import INSTRUMENTATION
+from ..enums.file_name_enum import FileNameEnum
+from ..enums.log_level_enum import LogLevelEnum
+from ..enums.log_message_enum import LogMessageEnum
+from ..logger import VWOLogger
+
+FILE = FileNameEnum.Services.Instrumentation
+
+# monotonic where available, python 2 has only the wall clock
+clock = getattr(time, "perf_counter", time.time)
+
+# histograms have HISTOGRAM_BUCKETS_PER_OCTAVE buckets per doubling of duration from HISTOGRAM_MIN_DURATION,
+# hence percentiles are within 19% of the durations recorded
+HISTOGRAM_MIN_DURATION = 1e-6
+HISTOGRAM_BUCKETS_PER_OCTAVE = 4
+HISTOGRAM_BUCKETS = 128
+HISTOGRAM_PERCENTILES = (50, 90, 99)
+
+
+class DecisionTrace(object):
+    """Timings and counters of one API call. Time spent in a stage is exclusive of the stages
+    entered from it, e.g. whitelisting of the other campaigns of a group isn't part of meg,
+    whereas each stage entered is kept as a span, nested in the span of the stage it's entered from."""
+
+    __slots__ = ("api_method", "start_time", "duration", "stages", "counters", "spans", "_start_clock", "_stack")
+
+    def __init__(self, api_method):
+        """
+        Args:
+            api_method (string): name of the API called
+        """
+        self.api_method = api_method
+        # wall clock time at which the API was called, in seconds since epoch
+        self.start_time = time.time()
+        # seconds taken by the API, None till the trace is finished
+        self.duration = None
+        # seconds spent in each stage, see constants.INSTRUMENTATION
+        self.stages = {}
+        # counters e.g. of UserStorage calls and segments evaluated, see constants.INSTRUMENTATION
+        self.counters = {}
+        # (stage, start, end, parent index or None) of each stage entered, in order of entering, start and
+        # end in seconds since the API was called
+        self.spans = []
+        self._start_clock = clock()
+        self._stack = []
+
+    def enter(self, stage):
+        """Starts timing the stage, till exit is called
+
+        Args:
+            stage (string): stage of the decision
+        """
+        span_index = len(self.spans)
+        self.spans.append(None)
+        self._stack.append([stage, clock(), 0.0, span_index])
+
+    def exit(self):
+        """Stops timing the stage entered last"""
+        stage, start_clock, nested_duration, span_index = self._stack.pop()
+        end_clock = clock()
+        duration = end_clock - start_clock
+        self.stages[stage] = self.stages.get(stage, 0.0) + duration - nested_duration
+        if self._stack:
+            self._stack[-1][2] += duration
+        self.spans[span_index] = (
+            stage,
+            start_clock - self._start_clock,
+            end_clock - self._start_clock,
+            self._stack[-1][3] if self._stack else None,
+        )
+
+    def increment(self, counter, value=1):
+        """Increments the counter
+
+        Args:
+            counter (string): name of the counter
+            value (int): value to add
+        """
+        self.counters[counter] = self.counters.get(counter, 0) + value
+
+    def finish(self):
+        """Stops timing the API call, along with the stages left entered e.g. by an exception"""
+        while self._stack:
+            self.exit()
+        self.duration = clock() - self._start_clock
+
+
+class Instrumentation(object):
+    """Traces the API calls made in a thread, and hands each trace to the sink once the call returns.
+    The SDK checks for an Instrumentation before doing any of it, hence without one it costs nothing."""
+
+    def __init__(self, sink):
+        """
+        Args:
+            sink (function): called with the DecisionTrace of each API call e.g. a HistogramSink,
+                StatsdSink or SpanSink
+        """
+        self.logger = VWOLogger.getInstance()
+        self.sink = sink
+        self._local = threading.local()
+
+    def start_trace(self, api_method):
+        """Starts tracing an API call in the current thread
+
+        Args:
+            api_method (string): name of the API called
+
+        Returns:
+            DecisionTrace: trace to be passed to finish_trace
+        """
+        trace = DecisionTrace(api_method)
+        self._local.traces = getattr(self._local, "traces", ()) + (trace,)
+        return trace
+
+    def finish_trace(self, trace):
+        """Finishes the trace of the API call and hands it to the sink
+
+        Args:
+            trace (DecisionTrace): returned by start_trace
+        """
+        trace.finish()
+        self._local.traces = self._local.traces[:-1]
+        try:
+            self.sink(trace)
+        except Exception as e:
+            self.logger.lazy_log(
+                LogLevelEnum.ERROR,
+                LogMessageEnum.ERROR_MESSAGES.INSTRUMENTATION_SINK_EXECUTION_ERROR,
+                file=FILE,
+                error_message=e,
+            )
+
+    def get_trace(self):
+        """Returns the trace of the API being called in the current thread, None if none is"""
+        traces = getattr(self._local, "traces", None)
+        return traces[-1] if traces else None
+
+    def increment(self, counter, value=1):
+        """Increments the counter of the API being called in the current thread, if any
+
+        Args:
+            counter (string): name of the counter
+            value (int): value to add
+        """
+        trace = self.get_trace()
+        if trace is not None:
+            trace.increment(counter, value)
+
+    def time_stage(self, method, stage):
+        """Wraps the method to time its calls as the stage of the API being called, if any
+
+        Args:
+            method (function): method to be timed
+            stage (string): stage of the decision
+
+        Returns:
+            function: timed method
+        """
+
+        @functools.wraps(method)
+        def timed_method(*args, **kwargs):
+            trace = self.get_trace()
+            if trace is None:
+                return method(*args, **kwargs)
+            trace.enter(stage)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                trace.exit()
+
+        return timed_method
+
+    def instrument(self, instance, stage, *method_names):
+        """Times the calls of the methods of the instance as the stage, only the instance is changed
+
+        Args:
+            instance (object): object whose methods are to be timed
+            stage (string): stage of the decision
+            method_names (string): names of the methods
+        """
+        for method_name in method_names:
+            setattr(instance, method_name, self.time_stage(getattr(instance, method_name), stage))
+
+
+def traced(api_method, api_method_name):
+    """Wraps an API method of VWO to trace its calls with the Instrumentation of the VWO instance, if any
+
+    Args:
+        api_method (function): API method taking the VWO instance first
+        api_method_name (string): name of the API, see constants.API_METHODS
+
+    Returns:
+        function: traced API method
+    """
+
+    @functools.wraps(api_method)
+    def traced_api_method(vwo_instance, *args, **kwargs):
+        instrumentation = vwo_instance.instrumentation
+        if instrumentation is None:
+            return api_method(vwo_instance, *args, **kwargs)
+        trace = instrumentation.start_trace(api_method_name)
+        try:
+            return api_method(vwo_instance, *args, **kwargs)
+        finally:
+            instrumentation.finish_trace(trace)
+
+    return traced_api_method
+
+
+class Histogram(object):
+    """Durations bucketed by powers of 2 ** (1 / HISTOGRAM_BUCKETS_PER_OCTAVE), in constant memory"""
+
+    __slots__ = ("count", "sum", "max", "buckets")
+
+    def __init__(self):
+        """Starts empty, with HISTOGRAM_BUCKETS buckets the first of which holds durations up to HISTOGRAM_MIN_DURATION
+        and the last all the longer ones"""
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.buckets = [0] * HISTOGRAM_BUCKETS
+
+    def add(self, value):
+        """Records the value
+
+        Args:
+            value (float): duration in seconds
+        """
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+        if value <= HISTOGRAM_MIN_DURATION:
+            bucket = 0
+        else:
+            bucket = int(math.ceil(math.log(value / HISTOGRAM_MIN_DURATION, 2) * HISTOGRAM_BUCKETS_PER_OCTAVE))
+        self.buckets[min(bucket, HISTOGRAM_BUCKETS - 1)] += 1
+
+    def get_percentile(self, percentile):
+        """Returns the upper bound of the bucket having the percentile, or the max if lower
+
+        Args:
+            percentile (float): between 0 and 100
+
+        Returns:
+            float: duration in seconds
+        """
+        rank = self.count * percentile / 100
+        seen = 0
+        for bucket, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if bucket_count and seen >= rank:
+                return min(HISTOGRAM_MIN_DURATION * 2 ** (bucket / HISTOGRAM_BUCKETS_PER_OCTAVE), self.max)
+        return self.max
+
+    def get_stats(self):
+        """Returns count, sum, mean, max and percentiles i.e. p50, p90 and p99, durations in seconds"""
+        stats = {"count": self.count, "sum": self.sum, "mean": self.sum / self.count if self.count else 0.0}
+        stats["max"] = self.max
+        for percentile in HISTOGRAM_PERCENTILES:
+            stats["p{}".format(percentile)] = self.get_percentile(percentile)
+        return stats
+
+
+class HistogramSink(object):
+    """Sink aggregating the traces in memory, into a histogram per API and stage along with totals
+    of the counters. Stats are read with get_stats e.g. periodically, or when the p99 spikes."""
+
+    def __init__(self):
+        """Starts empty, histograms being kept by API and stage and counters by API, as traces are received
+        from the threads making API calls"""
+        self.lock = threading.Lock()
+        self.histograms = {}
+        self.counters = {}
+
+    def __call__(self, trace):
+        """Adds the durations of the API call and its stages to their histograms, and its counters to the totals
+
+        Args:
+            trace (DecisionTrace): trace of a finished API call
+        """
+        with self.lock:
+            api_histograms = self.histograms.setdefault(trace.api_method, {})
+            api_histograms.setdefault(INSTRUMENTATION.TOTAL, Histogram()).add(trace.duration)
+            for stage, duration in trace.stages.items():
+                api_histograms.setdefault(stage, Histogram()).add(duration)
+            api_counters = self.counters.setdefault(trace.api_method, {})
+            for counter, value in trace.counters.items():
+                api_counters[counter] = api_counters.get(counter, 0) + value
+
+    def get_stats(self):
+        """Returns stats of the traces so far
+
+        Returns:
+            dict: for each API, histogram stats of the total duration and of each stage along with
+                totals of the counters e.g. {"activate": {"stages": {"total": {"count": 2, "p99": 0.0001, ...},
+                "bucketing": {...}}, "counters": {"user_storage_calls": 4}}}, durations in seconds
+        """
+        with self.lock:
+            return {
+                api_method: {
+                    "stages": {stage: histogram.get_stats() for stage, histogram in api_histograms.items()},
+                    "counters": dict(self.counters.get(api_method, {})),
+                }
+                for api_method, api_histograms in self.histograms.items()
+            }
+
+    def reset(self):
+        """Discards the traces so far"""
+        with self.lock:
+            self.histograms = {}
+            self.counters = {}
+
+
+class StatsdSink(object):
+    """Sink reporting each trace as StatsD-style metrics, e.g. vwo.activate.total and vwo.activate.bucketing
+    timings in milliseconds, and vwo.activate.user_storage_calls counters"""
+
+    def __init__(self, callback, prefix="vwo"):
+        """
+        Args:
+            callback (function): called with the name, value and type i.e. "ms" or "c" of each metric
+                e.g. lambda name, value, metric_type: statsd_client.timing(name, value) if metric_type == "ms"
+                else statsd_client.incr(name, value)
+            prefix (string): prefix of the names of the metrics
+        """
+        self.callback = callback
+        self.prefix = prefix
+
+    def __call__(self, trace):
+        metric_prefix = "{}.{}.".format(self.prefix, trace.api_method)
+        self.callback(metric_prefix + INSTRUMENTATION.TOTAL, trace.duration * 1000, "ms")
+        for stage, duration in trace.stages.items():
+            self.callback(metric_prefix + stage, duration * 1000, "ms")
+        for counter, value in trace.counters.items():
+            self.callback(metric_prefix + counter, value, "c")
+
+
+class SpanSink(object):
+    """Sink reporting each trace as spans compatible with OpenTelemetry: a span of the API call,
+    e.g. vwo.activate having the counters as attributes, and a span nested in it for each stage entered."""
+
+    def __init__(self, callback):
+        """
+        Args:
+            callback (function): called with each span, parents before their children, as a dict having name,
+                start_time and end_time in nanoseconds since epoch, attributes, span_id and parent_id, the
+                span_id of the parent span or None, e.g. to tracer.start_span(name, context=..., start_time=...)
+                and span.end(end_time=...)
+        """
+        self.callback = callback
+
+    def __call__(self, trace):
+        def to_time_ns(offset):
+            return int((trace.start_time + offset) * 1e9)
+
+        attributes = {"vwo.{}".format(counter): value for counter, value in trace.counters.items()}
+        attributes["vwo.api_method"] = trace.api_method
+        self.callback(
+            {
+                "name": "vwo.{}".format(trace.api_method),
+                "start_time": to_time_ns(0),
+                "end_time": to_time_ns(trace.duration),
+                "attributes": attributes,
+                "span_id": 0,
+                "parent_id": None,
+            }
+        )
+        for span_index, (stage, start, end, parent_index) in enumerate(trace.spans):
+            self.callback(
+                {
+                    "name": "vwo.{}".format(stage),
+                    "start_time": to_time_ns(start),
+                    "end_time": to_time_ns(end),
+                    "attributes": {"vwo.api_method": trace.api_method},
+                    "span_id": span_index + 1,
+                    "parent_id": parent_index + 1 if parent_index is not None else 0,
+                }
+            )
@@ -16,7 +16,13 @@
 import re
 
 from ...helpers.generic_util import get_key_value
-from ...helpers.segment_utils import convert_to_true_types, process_custom_variables_value, process_operand_value
+from ...helpers.segment_utils import (
+    convert_to_true_type,
+    convert_to_true_types,
+    process_custom_variables_value,
+    process_operand_value,
+)
+from ...enums.segments import OperandValueTypes
 
 
 class OperandEvaluator:
@@ -148,8 +154,6 @@ class OperandEvaluator:
         """
         return float(custom_variables_value) >= float(operand_value)
 
-
-
     def evaluate_custom_variable(self, operand, custom_variables):
         """ Identifies the condition stated in the leaf node and evaluates the result
 
@@ -207,3 +211,110 @@ class OperandEvaluator:
             if user_id.strip() == _vwo_user_id:
                 return True
         return False
+
+    def compile_custom_variable(self, operand):
+        """ Compiles the leaf node into a function of custom_variables. Operand type, wildcard
+            split, number conversion and regex of operand_value are resolved here, once.
+            Leaves which can't be resolved upfront are evaluated via evaluate_custom_variable.
+
+        Args:
+            operand(str): String representation of operand_type and operand_value,
+            for eg. lower(vwo), wildcard(www.vwo.com/*), etc.
+
+        Returns:
+            function: takes custom_variables(dict) and returns the result same as
+            evaluate_custom_variable
+        """
+        try:
+            operand_key, operand_string = get_key_value(operand)
+            operand_type, operand_value = process_operand_value(operand_string)
+            match = self._get_matcher(operand_type, operand_value)
+            # Number representation of operand_value is compared against the number
+            # representation of custom_variables_value, see convert_to_true_types
+            true_type_operand_value = convert_to_true_type(operand_value)
+            match_true_type = (
+                self._get_matcher(operand_type, true_type_operand_value)
+                if true_type_operand_value is not None
+                else None
+            )
+        except Exception:
+            return lambda custom_variables: self.evaluate_custom_variable(operand, custom_variables)
+
+        def evaluate(custom_variables):
+            custom_variables_value = process_custom_variables_value(custom_variables.get(operand_key))
+            if custom_variables_value == "":
+                return False
+            if match_true_type is not None:
+                true_type_custom_variables_value = convert_to_true_type(custom_variables_value)
+                if true_type_custom_variables_value is not None:
+                    return match_true_type(true_type_custom_variables_value)
+            return match(custom_variables_value)
+
+        return evaluate
+
+    def compile_user(self, operand):
+        """ Compiles the leaf node into a function of variation_targeting_variables
+
+        Args:
+            operand(str): String representation of comma separated user_ids
+
+        Returns:
+            function: takes variation_targeting_variables(dict) and returns the result
+            same as evaluate_user
+        """
+        try:
+            operand_user_ids = tuple(user_id.strip() for user_id in operand.split(","))
+        except Exception:
+            return lambda variation_targeting_variables: self.evaluate_user(operand, variation_targeting_variables)
+
+        return lambda variation_targeting_variables: (
+            variation_targeting_variables.get("_vwo_user_id") in operand_user_ids
+        )
+
+    def _get_matcher(self, operand_type, operand_value):
+        """ Binds operand_value to the method corresponding to operand_type
+
+        Args:
+            operand_type(str): one of OperandValueTypes
+            operand_value: Leaf value from the segments
+
+        Returns:
+            function: takes custom_variables_value and returns the result of the operand_type method
+        """
+        if operand_type == OperandValueTypes.lower:
+            lower_operand_value = operand_value.lower()
+            return lambda custom_variables_value: lower_operand_value == custom_variables_value.lower()
+        if operand_type == OperandValueTypes.regex:
+            try:
+                pattern = re.compile(operand_value)
+            except Exception:
+                return lambda custom_variables_value: False
+            return lambda custom_variables_value: self._search(pattern, custom_variables_value)
+        if operand_type in (
+            OperandValueTypes.lessthan,
+            OperandValueTypes.greaterthan,
+            OperandValueTypes.lessthanequalto,
+            OperandValueTypes.greaterthanequalto,
+        ):
+            try:
+                operand_value = float(operand_value)
+            except Exception:
+                # raises the same way while evaluating
+                pass
+        method = getattr(self, operand_type)
+        return lambda custom_variables_value: method(operand_value, custom_variables_value)
+
+    def _search(self, pattern, custom_variables_value):
+        """ Checks if custom_variables_value matches the precompiled regex pattern
+
+        Args:
+            pattern: compiled regex
+            custom_variables_value: Value from the custom_variables
+
+        Returns:
+            bool (result): True or False
+        """
+        try:
+            return bool(pattern.search(custom_variables_value))
+        except Exception:
+            return False
@@ -51,3 +51,36 @@ class SegmentEvaluator:
             return self.operand_evaluator.evaluate_custom_variable(sub_segments, custom_variables)
         elif operator == OperandTypes.USER:
             return self.operand_evaluator.evaluate_user(sub_segments, custom_variables)
+
+    def compile(self, segments):
+        """Compiles the expression tree represented by segments into a function, so that
+        the tree is walked and the leaves are parsed only once instead of on every evaluation.
+
+        Args:
+            segments(dict): The segments representing the expression tree
+
+        Returns:
+            function: takes custom_variables(dict) and returns the result same as evaluate
+        """
+
+        try:
+            operator, sub_segments = get_key_value(segments)
+        except Exception:
+            return lambda custom_variables: self.evaluate(segments, custom_variables)
+
+        if operator == OperatorTypes.NOT:
+            sub_predicate = self.compile(sub_segments)
+            return lambda custom_variables: not sub_predicate(custom_variables)
+        elif operator in (OperatorTypes.AND, OperatorTypes.OR):
+            try:
+                sub_predicates = tuple(self.compile(y) for y in sub_segments)
+            except Exception:
+                return lambda custom_variables: self.evaluate(segments, custom_variables)
+            if operator == OperatorTypes.AND:
+                return lambda custom_variables: all(predicate(custom_variables) for predicate in sub_predicates)
+            return lambda custom_variables: any(predicate(custom_variables) for predicate in sub_predicates)
+        elif operator == OperandTypes.CUSTOM_VARIABLE:
+            return self.operand_evaluator.compile_custom_variable(sub_segments)
+        elif operator == OperandTypes.USER:
+            return self.operand_evaluator.compile_user(sub_segments)
+        return lambda custom_variables: None
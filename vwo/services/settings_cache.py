@@ -0,0 +1,239 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Module for caching the last good settings_file on disk """
+
+import hashlib
+import io
+import mmap
+import os
+import pickle
+import stat
+import struct
+import tempfile
+
+from ..constants import constants
+from ..enums.file_name_enum import FileNameEnum
+from ..enums.log_level_enum import LogLevelEnum
+from ..enums.log_message_enum import LogMessageEnum
+from ..helpers import validate_util
+from ..logger import VWOLogger
+from .settings_snapshot import SettingsSnapshot
+
+FILE = FileNameEnum.Services.SettingsCache
+
+# bumped whenever SettingsSnapshot.get_state changes, so that older snapshots are not loaded
+SNAPSHOT_FORMAT_VERSION = 4
+
+MAGIC = b"VWOCACH1"
+# magic and sha1 digest of the settings_file, followed by the pickled snapshot
+HEADER = struct.Struct("<8s20s")
+UNTRUSTED_FILE_ERROR = "{path} is not owned by the user running the SDK or is writable by others"
+
+_replace = getattr(os, "replace", os.rename)
+
+
+class SettingsCache(object):
+    """Keeps the last good settings_file in a directory, as the json string and as a pickled snapshot
+    having the variation allocation ranges and lookup tables already built. A process can then launch
+    from disk without fetching the settings_file, or without processing it if it's the same as cached.
+
+    The digest of the settings_file is kept ahead of the pickled snapshot, so a snapshot of some other
+    settings_file is never unpickled, and a settings_file same as the one cached needn't be validated.
+
+    Files are replaced atomically, so processes sharing the directory never see a partial write.
+    The pickled snapshot is trusted when loaded, hence it is loaded only if owned by the user running
+    the SDK and writable by no one else."""
+
+    SETTINGS_FILE_NAME = "settings_file.json"
+    SNAPSHOT_FILE_NAME = "settings_snapshot.pickle"
+
+    def __init__(self, cache_dir):
+        """
+        Args:
+            cache_dir (str): directory to keep the files in, created when writing if missing
+        """
+        self.logger = VWOLogger.getInstance()
+        self.cache_dir = cache_dir
+
+    def get_settings_file(self):
+        """Reads the cached settings_file
+
+        Returns:
+            json_string|None: stringified json representing the settings_file, None if not cached
+        """
+        try:
+            with io.open(os.path.join(self.cache_dir, self.SETTINGS_FILE_NAME), encoding="utf-8") as settings_file:
+                return settings_file.read()
+        except (IOError, OSError):
+            return None
+
+    def is_cached(self, settings_file_string):
+        """Checks whether the snapshot cached is of the settings_file, by its digest i.e. without unpickling
+        the snapshot. Only valid settings_files are cached, so one cached needn't be validated again.
+
+        Args:
+            settings_file_string (json_string): stringified json representing the settings_file
+
+        Returns:
+            bool: True if the snapshot of the settings_file is cached else False
+        """
+        if not validate_util.is_valid_string(settings_file_string):
+            return False
+        try:
+            with open(os.path.join(self.cache_dir, self.SNAPSHOT_FILE_NAME), "rb") as snapshot_file:
+                if not is_trusted_file(snapshot_file.fileno()):
+                    return False
+                magic, digest = HEADER.unpack(snapshot_file.read(HEADER.size))
+        except (IOError, OSError, struct.error):
+            return False
+        return magic == MAGIC and digest == get_digest(settings_file_string)
+
+    def load(self, settings_file_string, segment_evaluator):
+        """Loads the cached snapshot of the settings_file. The file is memory mapped, so it is
+        unpickled straight from the page cache without being read into a buffer first.
+
+        Args:
+            settings_file_string (json_string): settings_file the snapshot should be of
+            segment_evaluator (SegmentEvaluator): evaluator compiling the segments
+
+        Returns:
+            SettingsSnapshot|None: snapshot of the settings_file, None if it isn't cached
+        """
+        snapshot_path = os.path.join(self.cache_dir, self.SNAPSHOT_FILE_NAME)
+        try:
+            with open(snapshot_path, "rb") as snapshot_file:
+                if not is_trusted_file(snapshot_file.fileno()):
+                    raise ValueError(UNTRUSTED_FILE_ERROR.format(path=snapshot_path))
+                snapshot_map = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    magic, digest = HEADER.unpack_from(snapshot_map)
+                    # compared before unpickling, so that a snapshot of some other settings_file isn't unpickled
+                    if magic != MAGIC or digest != get_digest(settings_file_string):
+                        return None
+                    state_offset = HEADER.size
+                    snapshot_view = memoryview(snapshot_map)
+                    try:
+                        format_version, sdk_version, state = pickle.loads(snapshot_view[state_offset:])
+                    finally:
+                        snapshot_view.release()
+                finally:
+                    snapshot_map.close()
+        except (IOError, OSError):
+            return None
+        except Exception as e:
+            self.logger.lazy_log(
+                LogLevelEnum.ERROR,
+                LogMessageEnum.ERROR_MESSAGES.SETTINGS_CACHE_READ_FAILED,
+                file=FILE,
+                cache_dir=self.cache_dir,
+                error_message=e,
+            )
+            return None
+
+        if format_version != SNAPSHOT_FORMAT_VERSION or sdk_version != constants.SDK_VERSION:
+            return None
+
+        snapshot = SettingsSnapshot.from_state(state, segment_evaluator)
+        self.logger.lazy_log(
+            LogLevelEnum.DEBUG,
+            LogMessageEnum.DEBUG_MESSAGES.SETTINGS_FILE_LOADED_FROM_CACHE,
+            file=FILE,
+            cache_dir=self.cache_dir,
+        )
+        return snapshot
+
+    def save(self, snapshot):
+        """Writes the snapshot and its settings_file, unless the same settings_file is cached already
+
+        Args:
+            snapshot (SettingsSnapshot): snapshot to be cached
+        """
+        try:
+            if not os.path.isdir(self.cache_dir):
+                os.makedirs(self.cache_dir)
+
+            if self.get_settings_file() == snapshot.settings_file_string:
+                return
+
+            # the snapshot is written first, so that the settings_file is never newer than it
+            self._write(
+                self.SNAPSHOT_FILE_NAME,
+                HEADER.pack(MAGIC, get_digest(snapshot.settings_file_string))
+                + pickle.dumps(
+                    (SNAPSHOT_FORMAT_VERSION, constants.SDK_VERSION, snapshot.get_state()), pickle.HIGHEST_PROTOCOL
+                ),
+            )
+            self._write(self.SETTINGS_FILE_NAME, snapshot.settings_file_string.encode("utf-8"))
+        except Exception as e:
+            self.logger.lazy_log(
+                LogLevelEnum.ERROR,
+                LogMessageEnum.ERROR_MESSAGES.SETTINGS_CACHE_WRITE_FAILED,
+                file=FILE,
+                cache_dir=self.cache_dir,
+                error_message=e,
+            )
+
+    def _write(self, file_name, data):
+        """Writes data to the file in the directory atomically"""
+        write_atomically(os.path.join(self.cache_dir, file_name), data)
+
+
+def get_digest(settings_file_string):
+    """Returns sha1 digest of the settings_file
+
+    Args:
+        settings_file_string (json_string): stringified json representing the settings_file
+
+    Returns:
+        bytes: sha1 digest
+    """
+    return hashlib.sha1(settings_file_string.encode("utf-8")).digest()
+
+
+def is_trusted_file(fileno):
+    """Checks whether the file is owned by the user running the SDK and is writable by no one else,
+    so that the content unpickled from it could only have been written by the SDK
+
+    Args:
+        fileno (int): descriptor of the opened file
+
+    Returns:
+        bool: True if the file is trusted else False, always True where file ownership isn't available
+    """
+    if not hasattr(os, "geteuid"):
+        return True
+    file_stat = os.fstat(fileno)
+    return file_stat.st_uid == os.geteuid() and not file_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def write_atomically(path, data, mode=None):
+    """Writes data to a temporary file next to path and renames it to path, so that readers
+    see either the previous or the complete new content
+
+    Args:
+        path (str): path of the file to be written
+        data (bytes): content of the file
+        mode (int): permissions of the file, readable and writable by the owner only if None
+    """
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=os.path.basename(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as temp_file:
+            temp_file.write(data)
+        if mode is not None:
+            os.chmod(temp_path, mode)
+        _replace(temp_path, path)
+    except Exception:
+        os.remove(temp_path)
+        raise
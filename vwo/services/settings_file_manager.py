@@ -12,14 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
 from ..helpers.settings_file_util import get as get_settings_file
 from ..helpers import validate_util
 from ..enums.log_message_enum import LogMessageEnum
 from ..enums.file_name_enum import FileNameEnum
 from ..enums.log_level_enum import LogLevelEnum
-from ..helpers import campaign_util
 from ..logger import VWOLogger
+from .segmentor import SegmentEvaluator
+from .settings_snapshot import SettingsSnapshot
 
 FILE = FileNameEnum.Services.SettingsFileManager
 
@@ -27,35 +27,133 @@ FILE = FileNameEnum.Services.SettingsFileManager
 class SettingsFileManager(object):
     """VWO settings_file manager"""
 
-    def __init__(self, settings_file):
+    def __init__(self, settings_file, settings_cache=None, settings_update_callback=None):
         """Init method to load and set vwo object with settings_file data.
 
         Args:
             settings_file (json_string): stringified json representing the vwo settings_file.
+            settings_cache (SettingsCache): cache the snapshot is loaded from if the settings_file
+                is cached already, and the snapshots published are saved to
+            settings_update_callback (function): called with the summary of changes, see
+                SettingsSnapshot.changes, whenever the settings_file is updated
         """
         self.logger = VWOLogger.getInstance()
-        self.update_settings_file(settings_file)
+        self.segment_evaluator = SegmentEvaluator()
+        self.settings_cache = settings_cache
+        self.settings_update_callback = settings_update_callback
+
+        snapshot = settings_cache.load(settings_file, self.segment_evaluator) if settings_cache else None
+        if snapshot is not None:
+            self.snapshot = snapshot
+        else:
+            self.update_settings_file(settings_file)
 
     # PUBLIC METHODS
-    def process_settings_file(self):
-        """Processes the settings_file, assigns variation allocation range"""
+    @property
+    def settings_file(self):
+        """settings_file of the snapshot currently published"""
+        return self.snapshot.settings_file
+
+    @property
+    def settings_file_string(self):
+        """stringified settings_file of the snapshot currently published"""
+        return self.snapshot.settings_file_string
+
+    def get_snapshot(self):
+        """Retrieves the snapshot currently published, read it once and use it throughout a decision
+        to see a consistent settings_file even if it gets updated meanwhile
 
-        settings_file = self.settings_file
-        for campaign in settings_file.get("campaigns"):
-            campaign_util.set_variation_allocation(campaign)
-        self.logger.log(LogLevelEnum.DEBUG, LogMessageEnum.DEBUG_MESSAGES.SETTINGS_FILE_PROCESSED.format(file=FILE))
+        Returns:
+            SettingsSnapshot: processed settings_file along with the lookup tables
+        """
+
+        return self.snapshot
 
     def get_settings_file(self):
         """Retrieves settings file"""
 
         return self.settings_file
 
+    def get_campaign(self, campaign_key):
+        """Retrieves running campaign having the given campaign_key
+
+        Args:
+            campaign_key (string): Campaign identifier key
+
+        Returns:
+            dict|None: Campaign object, None if no running campaign found
+        """
+
+        return self.snapshot.get_campaign(campaign_key)
+
+    def get_campaigns(self, campaign_keys):
+        """Retrieves running campaigns having the given campaign_keys
+
+        Args:
+            campaign_keys (list): List of Campaign identifier keys
+
+        Returns:
+            dict: Dictionary of campaign object mapped to the campaign key
+        """
+
+        return self.snapshot.get_campaigns(campaign_keys)
+
+    def get_goal_campaigns(self, goal_identifier):
+        """Retrieves all the campaigns having a goal with the given goal_identifier
+
+        Args:
+            goal_identifier (string): Global goal identifier
+
+        Returns:
+            list: list of tuple(campaign, campaign_goal)
+        """
+
+        return self.snapshot.get_goal_campaigns(goal_identifier)
+
+    def get_group_campaigns(self, group_id):
+        """Retrieves running campaigns which are part of given group
+
+        Args:
+            group_id (int): id of group whose campaigns are to be return
+
+        Returns:
+            tuple: campaigns part of given group
+        """
+
+        campaign_group = self.get_campaign_group(group_id)
+        return campaign_group.campaigns if campaign_group else ()
+
+    def get_campaign_group(self, group_id):
+        """Retrieves the group resolved from the settings_file
+
+        Args:
+            group_id (int): id of group
+
+        Returns:
+            CampaignGroup|None: group, None if not found
+        """
+
+        return self.snapshot.get_campaign_group(group_id)
+
+    def get_compiled_segments(self, segments):
+        """Retrieves the function compiled for the given segments of a campaign/variation
+
+        Args:
+            segments (dict): segments of a campaign/variation from the settings_file
+
+        Returns:
+            function|None: compiled segments, see SegmentEvaluator.compile,
+                None if segments are not part of the current settings_file
+        """
+
+        return self.snapshot.get_compiled_segments(segments)
+
     def get_settings_file_string(self):
         """Retrieves stringified json representing the settings_file"""
 
         return self.settings_file_string
 
-    def get_and_update_settings_file(self, account_id, sdk_key, is_via_webhook):
+    def get_and_update_settings_file(self, account_id, sdk_key, is_via_webhook, latest_settings_file=None):
         """
         Fetch latest settings_file and update so that vwo_instance could use the latest settings
 
@@ -64,24 +162,33 @@ class SettingsFileManager(object):
             sdk_key (string): Unique sdk key for user,
                 can be retrieved from our webside
             is_via_webhook (bool): is triggered via webhook flag:
+            latest_settings_file (json_string): settings_file already fetched, fetched here if None
 
         Returns:
             bool: True if settings_file is updated else False
         """
 
-        latest_settings_file = get_settings_file(account_id, sdk_key, is_via_webhook)
+        if latest_settings_file is None:
+            latest_settings_file = get_settings_file(account_id, sdk_key, is_via_webhook)
 
-        if not validate_util.is_valid_settings_file(latest_settings_file):
-            self.logger.log(
-                LogLevelEnum.ERROR,
-                LogMessageEnum.ERROR_MESSAGES.INVALID_SETTINGS_FILE.format(
-                    file=FILE, account_id=account_id, settings_file=latest_settings_file
-                ),
-            )
+        snapshot = self.get_snapshot()
+        # the settings_file in use is valid, so one same as it needn't be validated
+        if latest_settings_file == snapshot.settings_file_string:
+            self.logger.lazy_log(LogLevelEnum.INFO, LogMessageEnum.INFO_MESSAGES.SETTINGS_FILE_NOT_UPDATED, file=FILE)
             return False
 
-        if latest_settings_file == self.settings_file_string:
-            self.logger.log(LogLevelEnum.INFO, LogMessageEnum.INFO_MESSAGES.SETTINGS_FILE_NOT_UPDATED.format(file=FILE))
+        if not validate_util.is_valid_settings_file(
+            # campaigns of the settings_file in use are valid, so only the ones changed are validated
+            latest_settings_file,
+            validated_campaign_digests=set(snapshot.campaign_digests.values()),
+        ):
+            self.logger.lazy_log(
+                LogLevelEnum.ERROR,
+                LogMessageEnum.ERROR_MESSAGES.INVALID_SETTINGS_FILE,
+                file=FILE,
+                account_id=account_id,
+                settings_file=latest_settings_file,
+            )
             return False
 
         self.update_settings_file(latest_settings_file)
@@ -89,12 +196,70 @@ class SettingsFileManager(object):
 
     def update_settings_file(self, settings_file):
         """Update the settings_file on the instance so that latest settings could be used
-        from next hit onwards
+        from next hit onwards. The new snapshot is processed completely before being published
+        with a single reference swap, hence hits in progress are never affected. Only the campaigns
+        changed since the snapshot in use are processed, the rest are reused as processed already.
 
         Args:
             settings_file (json_string): stringified json representing the settings_file,
                 as received from the website
         """
-        self.settings_file_string = settings_file
-        self.settings_file = json.loads(settings_file)
-        self.process_settings_file()
+        snapshot = SettingsSnapshot(settings_file, self.segment_evaluator, previous=getattr(self, "snapshot", None))
+        self.snapshot = snapshot
+        self.logger.lazy_log(LogLevelEnum.DEBUG, LogMessageEnum.DEBUG_MESSAGES.SETTINGS_FILE_PROCESSED, file=FILE)
+        if self.settings_cache:
+            self.settings_cache.save(snapshot)
+
+        if snapshot.changes is not None:
+            self.logger.lazy_log(
+                LogLevelEnum.DEBUG,
+                LogMessageEnum.DEBUG_MESSAGES.SETTINGS_FILE_CHANGES,
+                file=FILE,
+                changes=snapshot.changes,
+            )
+            if self.settings_update_callback:
+                try:
+                    self.settings_update_callback(snapshot.changes)
+                except Exception as e:
+                    self.logger.lazy_log(
+                        LogLevelEnum.ERROR,
+                        LogMessageEnum.ERROR_MESSAGES.SETTINGS_UPDATE_CALLBACK_EXECUTION_ERROR,
+                        file=FILE,
+                        error_message=e,
+                    )
+
+
+class SharedSettingsFileManager(SettingsFileManager):
+    """SettingsFileManager of a process sharing the settings_file with other processes via SharedSettings.
+    Snapshots published by any of them are picked up by the others on their next get_snapshot, i.e. once
+    per API call, by comparing the generation of the snapshot in use with the shared generation counter."""
+
+    def __init__(self, settings_file, shared_settings, settings_update_callback=None):
+        """
+        Args:
+            settings_file (json_string): stringified json representing the vwo settings_file.
+            shared_settings (SharedSettings): shared file the snapshot is loaded from if the settings_file
+                is published already, and the snapshots published are saved to
+            settings_update_callback (function): called with the summary of changes whenever this process
+                updates the settings_file, snapshots published by others are picked up without a summary
+        """
+        super(SharedSettingsFileManager, self).__init__(
+            settings_file, settings_cache=shared_settings, settings_update_callback=settings_update_callback
+        )
+
+    def get_snapshot(self):
+        """Retrieves the snapshot currently published, loaded afresh if another process published a newer one
+
+        Returns:
+            SettingsSnapshot: processed settings_file along with the lookup tables
+        """
+        shared_settings = self.settings_cache
+        if shared_settings.is_updated():
+            generation = shared_settings.get_generation()
+            snapshot = shared_settings.load(None, self.segment_evaluator)
+            if snapshot is not None:
+                self.snapshot = snapshot
+            else:
+                # not retried till the next publish, the snapshot in use is kept meanwhile
+                shared_settings.generation = generation
+        return self.snapshot
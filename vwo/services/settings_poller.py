@@ -0,0 +1,154 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Module for keeping the settings_file up to date in the background """
+
+import random
+import threading
+
+from ..constants.constants import SETTINGS_POLLER
+from ..enums.file_name_enum import FileNameEnum
+from ..enums.log_level_enum import LogLevelEnum
+from ..enums.log_message_enum import LogMessageEnum
+from ..helpers import settings_file_util
+from ..logger import VWOLogger
+
+FILE = FileNameEnum.Services.SettingsPoller
+
+
+class SettingsPoller(object):
+    """Fetches the settings_file every interval seconds on a daemon thread and publishes it via the
+    SettingsFileManager when its content has changed.
+
+    Requests are conditional on the ETag and Last-Modified of the last response, so an unchanged
+    settings_file costs a 304 without a body. The interval is jittered, so that many processes
+    started together don't poll in lockstep."""
+
+    def __init__(
+        self,
+        settings_file_manager,
+        connection,
+        account_id=None,
+        sdk_key=None,
+        interval=SETTINGS_POLLER.DEFAULT_INTERVAL,
+        jitter=SETTINGS_POLLER.DEFAULT_JITTER,
+    ):
+        """
+        Args:
+            settings_file_manager (SettingsFileManager): manager publishing the settings_file
+            connection (Connection): pooled connection to fetch the settings_file with
+            account_id (string|int): Account ID of user, accountId of the settings_file if None
+            sdk_key (string): Unique sdk key for user, sdkKey of the settings_file if None
+            interval (int|float): seconds between two fetches
+            jitter (int|float): fraction of interval by which each wait is randomly shortened or lengthened
+        """
+        self.logger = VWOLogger.getInstance()
+        self.settings_file_manager = settings_file_manager
+        self.connection = connection
+        settings_file = settings_file_manager.get_settings_file()
+        self.account_id = account_id if account_id is not None else settings_file.get("accountId")
+        self.sdk_key = sdk_key if sdk_key is not None else settings_file.get("sdkKey")
+        self.interval = interval
+        self.jitter = jitter
+
+        self.etag = None
+        self.last_modified = None
+        self.stop_event = threading.Event()
+        self.poller = None
+
+    def start(self):
+        """Starts the polling thread"""
+        self.poller = threading.Thread(target=self.run_poller)
+        self.poller.daemon = True
+        self.poller.start()
+        self.logger.lazy_log(
+            LogLevelEnum.DEBUG,
+            LogMessageEnum.DEBUG_MESSAGES.SETTINGS_POLLER_STARTED,
+            file=FILE,
+            interval=self.interval,
+            jitter=self.jitter,
+        )
+
+    def stop(self, timeout=None):
+        """Stops the polling thread, a fetch in progress is let to finish
+
+        Args:
+            timeout (int|float): seconds to wait for the thread to stop, waits till it stops if None
+        """
+        self.stop_event.set()
+        poller = self.poller
+        if poller is not None and poller is not threading.current_thread():
+            poller.join(timeout)
+
+    def get_wait_time(self):
+        """Returns seconds to wait before the next fetch, interval jittered uniformly by +/- jitter"""
+        return self.interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def run_poller(self):
+        """Loop of the polling thread, polls till stopped"""
+        while not self.stop_event.wait(self.get_wait_time()):
+            try:
+                self.poll()
+            except Exception as e:
+                self.logger.lazy_log(
+                    LogLevelEnum.ERROR,
+                    LogMessageEnum.ERROR_MESSAGES.SETTINGS_POLLER_FAILED,
+                    file=FILE,
+                    error_message=e,
+                )
+
+    def poll(self):
+        """Fetches the settings_file once and publishes it if it has changed
+
+        Returns:
+            bool: True if a new settings_file is published else False
+        """
+        request = settings_file_util.get_request(self.account_id, self.sdk_key)
+        if request is None:
+            return False
+
+        server_url, parameters = request
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+
+        resp = self.connection.get(server_url, params=parameters, headers=headers or None, include_headers=True)
+        status_code = resp.get("status_code")
+        if status_code is None:
+            return False
+
+        if status_code == 304:
+            self.logger.lazy_log(
+                LogLevelEnum.DEBUG, LogMessageEnum.DEBUG_MESSAGES.SETTINGS_FILE_NOT_MODIFIED, file=FILE
+            )
+            return False
+
+        latest_settings_file = settings_file_util.get_settings_file_from_response(status_code, resp.get("text"))
+        if status_code != 200:
+            return False
+
+        is_settings_file_updated = self.settings_file_manager.get_and_update_settings_file(
+            self.account_id, self.sdk_key, False, latest_settings_file
+        )
+        # validators are remembered only after the settings_file is accepted, so an invalid one is fetched again
+        response_headers = resp.get("headers") or {}
+        if latest_settings_file == self.settings_file_manager.get_settings_file_string():
+            self.etag = response_headers.get("ETag")
+            self.last_modified = response_headers.get("Last-Modified")
+
+        if is_settings_file_updated:
+            self.logger.lazy_log(LogLevelEnum.INFO, LogMessageEnum.INFO_MESSAGES.SETTINGS_FILE_UPDATED, file=FILE)
+        return is_settings_file_updated
@@ -0,0 +1,294 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+from ..helpers import campaign_util
+from ..helpers import validate_util
+from .campaign_group import get_campaign_groups
+
+
+class SettingsSnapshot(object):
+    """Fully processed settings_file along with everything derived from it i.e. variation allocation
+    ranges, lookup tables, resolved campaign groups and compiled segments.
+
+    A snapshot is built completely before being published and never changes afterwards, so a refresh
+    builds a new snapshot and swaps the reference. Decisions which started with the previous snapshot
+    keep using it undisturbed. Campaigns unchanged since the previous snapshot are reused as processed
+    in it, so a refresh processes only the campaigns added or changed.
+    """
+
+    __slots__ = (
+        "settings_file_string",
+        "settings_file",
+        "campaign_key_map",
+        "campaign_id_map",
+        "goal_campaigns_map",
+        "campaign_digests",
+        "campaign_groups",
+        "compiled_segments",
+        "variation_allocation_ranges",
+        "changes",
+    )
+
+    def __init__(self, settings_file_string, segment_evaluator, previous=None):
+        """
+        Args:
+            settings_file_string (json_string): stringified json representing the vwo settings_file
+            segment_evaluator (SegmentEvaluator): evaluator compiling the segments
+            previous (SettingsSnapshot): snapshot being replaced, whose unchanged campaigns are reused
+        """
+        # the dict is parsed afresh, so processing it in place can't be seen by anyone else
+        settings_file = json.loads(settings_file_string)
+        campaigns = []
+        # campaign id => digest of its content as received, to find the campaigns changed on next refresh
+        campaign_digests = {}
+        for campaign in settings_file.get("campaigns"):
+            campaign_id = campaign.get("id")
+            campaign_digest = campaign_util.get_campaign_digest(campaign)
+            if previous is not None and previous.campaign_digests.get(campaign_id) == campaign_digest:
+                campaign = previous.campaign_id_map[campaign_id]
+            else:
+                campaign_util.set_variation_allocation(campaign)
+            campaign_digests.setdefault(campaign_id, campaign_digest)
+            campaigns.append(campaign)
+        settings_file["campaigns"] = campaigns
+
+        # lookup tables, so that APIs don't have to scan campaigns on every call
+        self._set_state(
+            (
+                settings_file_string,
+                settings_file,
+                campaign_util.get_campaign_key_map(campaigns),
+                campaign_util.get_campaign_id_map(campaigns),
+                campaign_util.get_goal_campaigns_map(campaigns),
+                campaign_digests,
+            ),
+            segment_evaluator,
+            previous,
+        )
+        if previous is not None:
+            super(SettingsSnapshot, self).__setattr__("changes", self._get_changes(previous))
+
+    @classmethod
+    def from_state(cls, state, segment_evaluator):
+        """Rebuilds a snapshot from the state returned by get_state, e.g. after unpickling it
+
+        Args:
+            state (tuple): state returned by get_state
+            segment_evaluator (SegmentEvaluator): evaluator compiling the segments
+
+        Returns:
+            SettingsSnapshot: snapshot having the state
+        """
+        snapshot = cls.__new__(cls)
+        snapshot._set_state(state, segment_evaluator)
+        return snapshot
+
+    def get_state(self):
+        """Returns everything the snapshot holds except the compiled segments, which being functions
+        can't be pickled and are compiled again by from_state, and the campaign groups and variation
+        allocation ranges built again along with them
+
+        Returns:
+            tuple: settings_file_string, processed settings_file, the lookup tables and campaign digests
+        """
+        return (
+            self.settings_file_string,
+            self.settings_file,
+            self.campaign_key_map,
+            self.campaign_id_map,
+            self.goal_campaigns_map,
+            self.campaign_digests,
+        )
+
+    def _set_state(self, state, segment_evaluator, previous=None):
+        """Sets the state on the snapshot and builds everything get_state leaves out i.e. the variation
+        allocation ranges, campaign groups and compiled segments. Shared by __init__ and from_state.
+
+        Args:
+            state (tuple): settings_file_string, processed settings_file, campaign_key_map, campaign_id_map,
+                goal_campaigns_map and campaign_digests, see get_state
+            segment_evaluator (SegmentEvaluator): evaluator compiling the segments
+            previous (SettingsSnapshot): snapshot being replaced. Allocation ranges and compiled segments of
+                the campaigns reused from it as is, i.e. unchanged ones, are reused instead of built again
+        """
+        (
+            settings_file_string,
+            settings_file,
+            campaign_key_map,
+            campaign_id_map,
+            goal_campaigns_map,
+            campaign_digests,
+        ) = state
+
+        # segments are compiled upfront, so that decisions don't parse them on every call
+        compiled_segments = {}
+        # sorted ranges of the variations of each campaign, kept aside so that the settings_file stays plain json
+        variation_allocation_ranges = {}
+        for campaign in settings_file.get("campaigns"):
+            is_reused = previous is not None and previous.campaign_id_map.get(campaign.get("id")) is campaign
+            variations = campaign.get("variations")
+            reused_allocation_ranges = (
+                previous.variation_allocation_ranges.get(campaign.get("id")) if is_reused else None
+            )
+            variation_allocation_ranges[campaign.get("id")] = reused_allocation_ranges or (
+                variations,
+                campaign_util.get_sorted_allocation_ranges(variations),
+            )
+            segments_list = [campaign.get("segments")] + [
+                variation.get("segments") for variation in campaign.get("variations")
+            ]
+            for segments in segments_list:
+                if validate_util.is_valid_value(segments):
+                    reused_compiled_segments = previous.compiled_segments.get(id(segments)) if is_reused else None
+                    compiled_segments[id(segments)] = reused_compiled_segments or (
+                        segments,
+                        segment_evaluator.compile(segments),
+                    )
+
+        set_attribute = super(SettingsSnapshot, self).__setattr__
+        set_attribute("settings_file_string", settings_file_string)
+        set_attribute("settings_file", settings_file)
+        set_attribute("campaign_key_map", campaign_key_map)
+        set_attribute("campaign_id_map", campaign_id_map)
+        set_attribute("goal_campaigns_map", goal_campaigns_map)
+        set_attribute("campaign_digests", campaign_digests)
+        set_attribute("campaign_groups", get_campaign_groups(settings_file, campaign_id_map))
+        set_attribute("compiled_segments", compiled_segments)
+        set_attribute("variation_allocation_ranges", variation_allocation_ranges)
+        set_attribute("changes", None)
+
+    def get_campaign(self, campaign_key):
+        """Retrieves running campaign having the given campaign_key
+
+        Args:
+            campaign_key (string): Campaign identifier key
+
+        Returns:
+            dict|None: Campaign object, None if no running campaign found
+        """
+        return campaign_util.get_campaign(self.settings_file, campaign_key, campaign_key_map=self.campaign_key_map)
+
+    def get_campaigns(self, campaign_keys):
+        """Retrieves running campaigns having the given campaign_keys
+
+        Args:
+            campaign_keys (list): List of Campaign identifier keys
+
+        Returns:
+            dict: Dictionary of campaign object mapped to the campaign key
+        """
+        return campaign_util.get_campaigns(self.settings_file, campaign_keys, campaign_key_map=self.campaign_key_map)
+
+    def get_goal_campaigns(self, goal_identifier):
+        """Retrieves all the campaigns having a goal with the given goal_identifier
+
+        Args:
+            goal_identifier (string): Global goal identifier
+
+        Returns:
+            list: list of tuple(campaign, campaign_goal)
+        """
+        return self.goal_campaigns_map.get(goal_identifier, [])
+
+    def get_campaign_group(self, group_id):
+        """Retrieves the group resolved from the settings_file
+
+        Args:
+            group_id (int): id of group
+
+        Returns:
+            CampaignGroup|None: group, None if not found
+        """
+        return self.campaign_groups.get(str(group_id))
+
+    def get_compiled_segments(self, segments):
+        """Retrieves the function compiled for the given segments of a campaign/variation
+
+        Args:
+            segments (dict): segments of a campaign/variation from the settings_file
+
+        Returns:
+            function|None: compiled segments, see SegmentEvaluator.compile,
+                None if segments are not part of this settings_file
+        """
+        compiled_segments = self.compiled_segments.get(id(segments))
+        # segments object is kept along, so its id can't be reused by some other object
+        if compiled_segments and compiled_segments[0] is segments:
+            return compiled_segments[1]
+        return None
+
+    def get_variation_allocation_ranges(self, campaign):
+        """Retrieves the sorted allocation ranges of the variations of a campaign, see
+        campaign_util.get_sorted_allocation_ranges
+
+        Args:
+            campaign (dict): campaign from the settings_file
+
+        Returns:
+            tuple|None: allocation ranges, None if the campaign is not part of this settings_file
+        """
+        variation_allocation_ranges = self.variation_allocation_ranges.get(campaign.get("id"))
+        # variations are kept along, so ranges of some other campaign having the same id are never returned
+        if variation_allocation_ranges and variation_allocation_ranges[0] is campaign.get("variations"):
+            return variation_allocation_ranges[1]
+        return None
+
+    def _get_changes(self, previous):
+        """Summarizes the changes since the previous snapshot
+
+        Args:
+            previous (SettingsSnapshot): snapshot replaced by this one
+
+        Returns:
+            dict: keys of the campaigns added, changed and removed, and whether anything other
+                than campaigns changed
+        """
+        changes = {"added_campaigns": [], "changed_campaigns": [], "removed_campaigns": []}
+        for campaign_id, campaign_digest in self.campaign_digests.items():
+            previous_campaign_digest = previous.campaign_digests.get(campaign_id)
+            if previous_campaign_digest is None:
+                changes["added_campaigns"].append(self.campaign_id_map[campaign_id].get("key"))
+            elif previous_campaign_digest != campaign_digest:
+                changes["changed_campaigns"].append(self.campaign_id_map[campaign_id].get("key"))
+        for campaign_id in previous.campaign_digests:
+            if campaign_id not in self.campaign_digests:
+                changes["removed_campaigns"].append(previous.campaign_id_map[campaign_id].get("key"))
+
+        changes["is_other_settings_changed"] = _get_other_settings(self.settings_file) != _get_other_settings(
+            previous.settings_file
+        )
+        return changes
+
+    def __setattr__(self, name, value):
+        """Blocks changes, as decisions in progress may be using the snapshot"""
+        raise AttributeError("SettingsSnapshot is immutable, build a new one instead")
+
+    def __delattr__(self, name):
+        """Blocks deletions, as decisions in progress may be using the snapshot"""
+        raise AttributeError("SettingsSnapshot is immutable, build a new one instead")
+
+
+def _get_other_settings(settings_file):
+    """Returns the top-level keys of the settings_file other than campaigns, e.g. accountId, sdkKey, version,
+    groups and campaignGroups, whose change is reported as is_other_settings_changed
+
+    Args:
+        settings_file (dict): processed settings_file
+
+    Returns:
+        dict: settings_file without campaigns
+    """
+    return {key: value for key, value in settings_file.items() if key != "campaigns"}
@@ -0,0 +1,261 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Module for sharing the processed settings_file among processes e.g. workers of a pre-fork server """
+
+import mmap
+import os
+import pickle
+import struct
+
+from ..constants import constants
+from ..enums.file_name_enum import FileNameEnum
+from ..enums.log_level_enum import LogLevelEnum
+from ..enums.log_message_enum import LogMessageEnum
+from ..logger import VWOLogger
+from .settings_cache import SNAPSHOT_FORMAT_VERSION, UNTRUSTED_FILE_ERROR, get_digest, is_trusted_file, write_atomically
+from .settings_snapshot import SettingsSnapshot
+
+FILE = FileNameEnum.Services.SharedSettings
+
+MAGIC = b"VWOSNAP1"
+# magic, generation, sha1 digest of the settings_file and its length in bytes,
+# followed by the settings_file and the pickled snapshot state
+HEADER = struct.Struct("<8sQ20sQ")
+GENERATION = struct.Struct("<Q")
+
+
+class SharedSettings(object):
+    """Publishes the snapshot of the settings_file into a file, preferably on tmpfs e.g. /dev/shm,
+    for the processes sharing it to load it without fetching, validating or parsing the settings_file.
+
+    Every publish bumps a generation counter kept in a separate file memory mapped by each process,
+    so checking for a newer snapshot is a read of 8 bytes of shared memory. Nothing is inherited
+    across a fork except the mapping itself, which stays shared, so processes may be forked anytime.
+
+    What is shared is the work, not the memory: each process unpickles its own copy of the snapshot,
+    so every process still holds its own campaign dicts, however none of them fetches, validates,
+    parses or processes the settings_file published by another one.
+
+    The pickled snapshot is trusted when loaded, hence the processes sharing the file must run as the
+    same user. The files are written readable and writable by their owner only, and are loaded only
+    if owned by the user running the SDK and writable by no one else."""
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): path of the file, its directory must exist
+        """
+        self.logger = VWOLogger.getInstance()
+        self.path = path
+        self.generation_path = path + ".generation"
+        self.generation_map = None
+        # generation of the snapshot last loaded or published by this process
+        self.generation = 0
+
+    def get_generation(self):
+        """Reads the generation counter
+
+        Returns:
+            int: generation of the snapshot published last, 0 if none is published yet
+        """
+        if self.generation_map is None:
+            # mapped once it exists, which is before any snapshot is, see save
+            self._map_generation()
+            if self.generation_map is None:
+                return 0
+        return GENERATION.unpack_from(self.generation_map)[0]
+
+    def is_updated(self):
+        """Checks whether a snapshot newer than the one last loaded or published by this process is published
+
+        Returns:
+            bool: True if a newer snapshot is published else False
+        """
+        return self.get_generation() != self.generation
+
+    def get_settings_file(self):
+        """Reads the settings_file published last, without unpickling its snapshot
+
+        Returns:
+            json_string|None: stringified json representing the settings_file, None if none is published
+        """
+        try:
+            with open(self.path, "rb") as shared_file:
+                if not is_trusted_file(shared_file.fileno()):
+                    return None
+                header = shared_file.read(HEADER.size)
+                magic, generation, digest, length = HEADER.unpack(header)
+                if magic != MAGIC:
+                    return None
+                return shared_file.read(length).decode("utf-8")
+        except (IOError, OSError, struct.error):
+            return None
+
+    def load(self, settings_file_string, segment_evaluator):
+        """Loads the snapshot published last. The file is memory mapped, so it is unpickled straight
+        from the page cache without being read into a buffer first, into a snapshot private to this process.
+
+        Args:
+            settings_file_string (json_string): settings_file the snapshot should be of, any if None
+            segment_evaluator (SegmentEvaluator): evaluator compiling the segments
+
+        Returns:
+            SettingsSnapshot|None: snapshot of the settings_file, None if it isn't published
+        """
+        try:
+            with open(self.path, "rb") as shared_file:
+                if not is_trusted_file(shared_file.fileno()):
+                    raise ValueError(UNTRUSTED_FILE_ERROR.format(path=self.path))
+                shared_map = mmap.mmap(shared_file.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                magic, generation, digest, length = HEADER.unpack_from(shared_map)
+                if magic != MAGIC:
+                    raise ValueError("{path} is not a shared settings_file".format(path=self.path))
+                if settings_file_string is not None and digest != get_digest(settings_file_string):
+                    return None
+
+                settings_file_offset = HEADER.size
+                state_offset = settings_file_offset + length
+                shared_view = memoryview(shared_map)
+                try:
+                    if settings_file_string is None:
+                        settings_file_string = bytes(shared_view[settings_file_offset:state_offset]).decode("utf-8")
+                    format_version, sdk_version, state = pickle.loads(shared_view[state_offset:])
+                finally:
+                    shared_view.release()
+            finally:
+                shared_map.close()
+        except (IOError, OSError):
+            return None
+        except Exception as e:
+            self.logger.lazy_log(
+                LogLevelEnum.ERROR,
+                LogMessageEnum.ERROR_MESSAGES.SHARED_SETTINGS_READ_FAILED,
+                file=FILE,
+                path=self.path,
+                error_message=e,
+            )
+            return None
+
+        if format_version != SNAPSHOT_FORMAT_VERSION or sdk_version != constants.SDK_VERSION:
+            return None
+
+        snapshot = SettingsSnapshot.from_state((settings_file_string,) + tuple(state), segment_evaluator)
+        if self.generation_map is None:
+            self._map_generation()
+        self.generation = generation
+        self.logger.lazy_log(
+            LogLevelEnum.DEBUG,
+            LogMessageEnum.DEBUG_MESSAGES.SHARED_SETTINGS_FILE_LOADED,
+            file=FILE,
+            path=self.path,
+            generation=generation,
+        )
+        return snapshot
+
+    def save(self, snapshot):
+        """Publishes the snapshot with the next generation, unless the same settings_file is published already
+
+        Args:
+            snapshot (SettingsSnapshot): snapshot to be published
+        """
+        try:
+            settings_file_bytes = snapshot.settings_file_string.encode("utf-8")
+            digest = get_digest(snapshot.settings_file_string)
+            published_generation = 0
+            try:
+                with open(self.path, "rb") as shared_file:
+                    magic, published_generation, published_digest, length = HEADER.unpack(shared_file.read(HEADER.size))
+                if magic == MAGIC and published_digest == digest:
+                    self.generation = published_generation
+                    return
+            except (IOError, OSError, struct.error):
+                pass
+
+            generation = max(published_generation, self.get_generation()) + 1
+            state = snapshot.get_state()[1:]
+            # the counter is created before the snapshot, so that a process loading the snapshot can map it
+            generation_fd = self._open_generation_file()
+            try:
+                write_atomically(
+                    self.path,
+                    HEADER.pack(MAGIC, generation, digest, len(settings_file_bytes))
+                    + settings_file_bytes
+                    + pickle.dumps((SNAPSHOT_FORMAT_VERSION, constants.SDK_VERSION, state), pickle.HIGHEST_PROTOCOL),
+                )
+                # the counter is bumped only after the file is replaced, so a process seeing it finds the snapshot
+                self._set_generation(generation_fd, generation)
+            finally:
+                os.close(generation_fd)
+            if self.generation_map is None:
+                self._map_generation()
+            self.generation = generation
+        except Exception as e:
+            self.logger.lazy_log(
+                LogLevelEnum.ERROR,
+                LogMessageEnum.ERROR_MESSAGES.SHARED_SETTINGS_WRITE_FAILED,
+                file=FILE,
+                path=self.path,
+                error_message=e,
+            )
+
+    def _map_generation(self):
+        """Maps the generation counter read only, so that get_generation reads it without a syscall.
+        Left unmapped if the file isn't there yet or is shorter than the counter, to be retried later
+        """
+        try:
+            with open(self.generation_path, "rb") as generation_file:
+                self.generation_map = mmap.mmap(generation_file.fileno(), GENERATION.size, access=mmap.ACCESS_READ)
+        except (IOError, OSError, ValueError):
+            pass
+
+    def _open_generation_file(self):
+        """Opens the generation counter for writing, creating it if missing. Symlinks aren't followed,
+        so that a link planted at the path can't redirect the write to some other file
+
+        Returns:
+            int: descriptor of the file
+        """
+        generation_fd = os.open(
+            self.generation_path,
+            os.O_RDWR | os.O_CREAT | getattr(os, "O_NOFOLLOW", 0) | getattr(os, "O_BINARY", 0),
+            0o600,
+        )
+        try:
+            if not is_trusted_file(generation_fd):
+                raise ValueError(UNTRUSTED_FILE_ERROR.format(path=self.generation_path))
+            size = os.fstat(generation_fd).st_size
+            if size < GENERATION.size:
+                os.lseek(generation_fd, 0, os.SEEK_END)
+                os.write(generation_fd, b"\0" * (GENERATION.size - size))
+        except Exception:
+            os.close(generation_fd)
+            raise
+        return generation_fd
+
+    def _set_generation(self, generation_fd, generation):
+        """Writes the generation counter in place through a shared mapping, so that processes having
+        it mapped see the new generation, see _open_generation_file
+
+        Args:
+            generation_fd (int): descriptor returned by _open_generation_file
+            generation (int): generation of the snapshot published
+        """
+        generation_map = mmap.mmap(generation_fd, GENERATION.size)
+        try:
+            GENERATION.pack_into(generation_map, 0, generation)
+            generation_map.flush()
+        finally:
+            generation_map.close()
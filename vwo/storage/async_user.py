@@ -0,0 +1,207 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextvars
+import functools
+import inspect
+
+from .user import UserStorage
+from ..enums.file_name_enum import FileNameEnum
+from ..enums.log_level_enum import LogLevelEnum
+from ..enums.log_message_enum import LogMessageEnum
+from ..logger import VWOLogger
+
+FILE = FileNameEnum.Storage.AsyncUser
+
+# (user_id, campaign_key => user_data, user_data written) of the API call running in the current context
+_prefetched_user_storage_data = contextvars.ContextVar("vwo_prefetched_user_storage_data", default=None)
+
+
+class AsyncUserStorage(object):
+    """AsyncUserStorage Class is used to store user-variation mapping with AsyncVWO.
+    Override this class to implement your own functionality with coroutines.
+    SDK will ensure to use this while bucketing a user into a variation.
+
+    Optionally, implement get_many(user_id, campaign_keys) coroutine returning a dict of
+    campaign_key to user-variation mapping, to let SDK fetch the data of all the
+    campaigns an API call needs in one round-trip."""
+
+    async def get(self, user_id, campaign_key):
+        """To retrieve the stored variation for the user_id and
+        campaign_key
+
+        Args:
+            user_id (str): User ID for which data needs to be retrieved.
+            campaign_key (str): Campaign key to identify the campaign for
+            which stored variation should be retrieved.
+
+        Returns:
+            user_data (dict): user-variation mapping
+        """
+        pass
+
+    async def set(self, user_data):
+        """To store the the user variation-mapping
+
+        Args:
+            user_data (dict): user-variation mapping
+        """
+        pass
+
+
+class PrefetchedUserStorage(UserStorage):
+    """UserStorage given to the decision core by AsyncVWO. The data of the campaigns an API call
+    needs is fetched from the user's storage before the call, lookups are served from it and the data
+    set is collected to be stored after the call, so that the core never waits on the storage.
+
+    The user's storage may be an AsyncUserStorage or a UserStorage, methods of a UserStorage being
+    called off the event loop so that a blocking storage doesn't block it."""
+
+    def __init__(self, user_storage):
+        """
+        Args:
+            user_storage (AsyncUserStorage|UserStorage): storage provided by the user
+        """
+        self.logger = VWOLogger.getInstance()
+        self.user_storage = user_storage
+
+    async def prefetch(self, user_id, campaign_keys):
+        """Fetches the data of the campaigns for the user, to be served till release is called
+
+        Args:
+            user_id (str): User ID for which data needs to be retrieved.
+            campaign_keys (list): Campaign keys of the campaigns the API call needs
+
+        Returns:
+            token: to be passed to release
+        """
+        user_data_map = {}
+        campaign_keys = list(campaign_keys)
+
+        try:
+            get_many = getattr(self.user_storage, "get_many", None)
+            if callable(get_many):
+                user_data_map = await _call(get_many, user_id, campaign_keys) or {}
+            else:
+                user_data_list = await asyncio.gather(
+                    *[_call(self.user_storage.get, user_id, campaign_key) for campaign_key in campaign_keys]
+                )
+                user_data_map = {
+                    campaign_key: user_data
+                    for campaign_key, user_data in zip(campaign_keys, user_data_list)
+                    if user_data
+                }
+        except Exception:
+            self.logger.lazy_log(
+                LogLevelEnum.ERROR,
+                LogMessageEnum.ERROR_MESSAGES.LOOK_UP_USER_STORAGE_FAILED,
+                file=FILE,
+                user_id=user_id,
+            )
+
+        return _prefetched_user_storage_data.set((user_id, user_data_map, []))
+
+    def release(self, token):
+        """Stops serving the data fetched by prefetch
+
+        Args:
+            token: returned by prefetch
+
+        Returns:
+            list: user_data set by the API call, to be passed to store
+        """
+        user_data_written = _prefetched_user_storage_data.get()[2]
+        _prefetched_user_storage_data.reset(token)
+        return user_data_written
+
+    async def store(self, user_data_written):
+        """Stores the data set by an API call into the user's storage
+
+        Args:
+            user_data_written (list): user_data returned by release
+        """
+        for user_data in user_data_written:
+            try:
+                await _call(self.user_storage.set, user_data)
+            except Exception as e:
+                self.logger.lazy_log(
+                    LogLevelEnum.ERROR,
+                    LogMessageEnum.ERROR_MESSAGES.SET_USER_STORAGE_FAILED,
+                    file=FILE,
+                    user_id=user_data.get("userId"),
+                    error_message=e,
+                )
+
+    def get(self, user_id, campaign_key):
+        """To retrieve the prefetched variation for the user_id and campaign_key
+
+        Args:
+            user_id (str): User ID for which data needs to be retrieved.
+            campaign_key (str): Campaign key to identify the campaign for
+            which stored variation should be retrieved.
+
+        Returns:
+            user_data (dict): user-variation mapping
+        """
+        return self.get_many(user_id, [campaign_key]).get(campaign_key)
+
+    def get_many(self, user_id, campaign_keys):
+        """To retrieve the prefetched variations for the user_id and multiple campaign_keys
+
+        Args:
+            user_id (str): User ID for which data needs to be retrieved.
+            campaign_keys (list): Campaign keys to identify the campaigns for
+            which stored variations should be retrieved.
+
+        Returns:
+            dict: user-variation mapping of each campaign_key found
+        """
+        prefetched = _prefetched_user_storage_data.get()
+        if prefetched is None or prefetched[0] != user_id:
+            return {}
+
+        # a shallow copy keeps prefetched data safe from changes by the core
+        return {
+            campaign_key: dict(prefetched[1][campaign_key])
+            for campaign_key in campaign_keys
+            if prefetched[1].get(campaign_key)
+        }
+
+    def set(self, user_data):
+        """To collect the the user variation-mapping, stored after the API call
+
+        Args:
+            user_data (dict): user-variation mapping
+        """
+        prefetched = _prefetched_user_storage_data.get()
+        if prefetched is None:
+            raise RuntimeError("UserStorage can be set only from within an AsyncVWO API call")
+
+        if prefetched[0] == user_data.get("userId"):
+            prefetched[1][user_data.get("campaignKey")] = user_data
+        prefetched[2].append(user_data)
+
+
+async def _call(method, *args):
+    """Calls a storage method, a sync one off the event loop, and awaits its result if it is awaitable,
+    so sync storages can be used too"""
+    if inspect.iscoroutinefunction(method):
+        return await method(*args)
+
+    loop = asyncio.get_event_loop()
+    result = await loop.run_in_executor(None, functools.partial(method, *args))
+    if inspect.isawaitable(result):
+        return await result
+    return result
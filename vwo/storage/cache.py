@@ -0,0 +1,195 @@
+# Copyright 2019-2022 Wingify Software Pvt. Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from collections import OrderedDict
+
+from vwo.storage.user import UserStorage
+
+DEFAULT_MAX_SIZE = 10000
+
+
+class CachedUserStorage(UserStorage):
+    """
+    Cached User Storage wraps any UserStorage with a bounded in-process LRU cache
+    keyed by (user_id, campaign_key). Reads go to the wrapped storage only on a cache
+    miss, writes go to both. Data not found in the wrapped storage is cached too.
+
+    Entries written by other processes are seen only after the cached entry expires,
+    hence pass a ttl when the wrapped storage is shared.
+    """
+
+    def __init__(self, user_storage, max_size=DEFAULT_MAX_SIZE, ttl=None, negative_ttl=None, cache_misses=True):
+        """
+        Args:
+            user_storage (UserStorage): storage to be cached
+            max_size (int): max no. of (user_id, campaign_key) entries, least recently used are evicted
+            ttl (float|None): seconds after which an entry expires, never if None
+            negative_ttl (float|None): seconds after which a cached miss expires, ttl is used if None
+            cache_misses (bool): cache the misses of the wrapped storage or not
+        """
+        self.user_storage = user_storage
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl if negative_ttl is not None else ttl
+        self.cache_misses = cache_misses
+
+        self.hits = 0
+        self.misses = 0
+
+        # (user_id, campaign_key) => (user_data|None, expires_at|None)
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, user_id, campaign_key):
+        """To retrieve the stored variation for the user_id and
+        campaign_key, from cache if present else from the wrapped storage
+
+        Args:
+            user_id (str): User ID for which data needs to be retrieved.
+            campaign_key (str): Campaign key to identify the campaign for
+            which stored variation should be retrieved.
+
+        Returns:
+            user_data (dict): user-variation mapping
+        """
+        key = (user_id, campaign_key)
+
+        with self.lock:
+            entry = self.cache.pop(key, None)
+            if entry is not None and (entry[1] is None or entry[1] > time.time()):
+                # re-insert to mark it as most recently used
+                self.cache[key] = entry
+                self.hits += 1
+                return self._copy(entry[0])
+            self.misses += 1
+
+        user_data = self.user_storage.get(user_id, campaign_key)
+        if user_data or self.cache_misses:
+            self._put(key, user_data)
+        return self._copy(user_data)
+
+    def get_many(self, user_id, campaign_keys):
+        """To retrieve the stored variations for the user_id and multiple
+        campaign_keys, fetching the ones not in cache from the wrapped storage
+        in one lookup if it provides get_many
+
+        Args:
+            user_id (str): User ID for which data needs to be retrieved.
+            campaign_keys (list): Campaign keys to identify the campaigns for
+            which stored variations should be retrieved.
+
+        Returns:
+            dict: user-variation mapping of each campaign_key found
+        """
+        user_data_map = {}
+        missed_campaign_keys = []
+
+        with self.lock:
+            now = time.time()
+            for campaign_key in campaign_keys:
+                key = (user_id, campaign_key)
+                entry = self.cache.pop(key, None)
+                if entry is not None and (entry[1] is None or entry[1] > now):
+                    self.cache[key] = entry
+                    self.hits += 1
+                    if entry[0]:
+                        user_data_map[campaign_key] = self._copy(entry[0])
+                else:
+                    self.misses += 1
+                    missed_campaign_keys.append(campaign_key)
+
+        if not missed_campaign_keys:
+            return user_data_map
+
+        get_many = getattr(self.user_storage, "get_many", None)
+        if callable(get_many):
+            fetched_user_data_map = get_many(user_id, missed_campaign_keys) or {}
+        else:
+            fetched_user_data_map = {
+                campaign_key: self.user_storage.get(user_id, campaign_key) for campaign_key in missed_campaign_keys
+            }
+
+        for campaign_key in missed_campaign_keys:
+            user_data = fetched_user_data_map.get(campaign_key)
+            if user_data or self.cache_misses:
+                self._put((user_id, campaign_key), user_data)
+            if user_data:
+                user_data_map[campaign_key] = self._copy(user_data)
+        return user_data_map
+
+    def set(self, user_data):
+        """To store the the user variation-mapping in the wrapped storage and cache
+
+        Args:
+            user_data (dict): user-variation mapping
+        """
+        key = (user_data.get("userId"), user_data.get("campaignKey"))
+        try:
+            self.user_storage.set(user_data)
+        except Exception:
+            self.invalidate(*key)
+            raise
+        self._put(key, self._copy(user_data))
+
+    def invalidate(self, user_id, campaign_key):
+        """Removes the cached entry, if any, for the user_id and campaign_key
+
+        Args:
+            user_id (str): User ID
+            campaign_key (str): Campaign key
+        """
+        with self.lock:
+            self.cache.pop((user_id, campaign_key), None)
+
+    def clear(self):
+        """Removes all the cached entries and resets the counters"""
+        with self.lock:
+            self.cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self):
+        """Returns the cache counters
+
+        Returns:
+            dict: hits, misses and current size of the cache
+        """
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self.cache)}
+
+    def _put(self, key, user_data):
+        """Caches user_data as the most recently used entry, evicting the least recently used beyond max_size.
+        user_data found expires after ttl, whereas a miss i.e. no user_data expires after negative_ttl, which
+        is ttl unless passed. Entries never expire if their ttl is None
+
+        Args:
+            key (tuple): user_id and campaign_key
+            user_data (dict|None): user-variation mapping, None for a miss
+        """
+        ttl = self.ttl if user_data else self.negative_ttl
+        expires_at = time.time() + ttl if ttl is not None else None
+
+        with self.lock:
+            self.cache.pop(key, None)
+            self.cache[key] = (user_data, expires_at)
+            while len(self.cache) > self.max_size:
+                self.cache.popitem(last=False)
+
+    @staticmethod
+    def _copy(user_data):
+        """Returns a shallow copy of user_data, which being a flat dict keeps cached data safe from changes
+        by the caller"""
+        return dict(user_data) if isinstance(user_data, dict) else user_data
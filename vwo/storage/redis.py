@@ -12,27 +12,120 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import atexit
+import threading
+import weakref
+
 from vwo.storage.user import UserStorage
+from vwo.logger import VWOLogger
+from vwo.enums.log_message_enum import LogMessageEnum
+from vwo.enums.file_name_enum import FileNameEnum
+from vwo.enums.log_level_enum import LogLevelEnum
+from vwo.services.instrumentation import clock
 import redis
+from redis.backoff import ExponentialBackoff
+from redis.retry import Retry
 import json
 
+ENCODING_JSON = "json"
+ENCODING_COMPACT = "compact"
+
+# compact encoding: marker byte followed by variationName and goalIdentifiers separated by a NUL byte,
+# userId and campaignKey are not stored as they are already part of the key
+_COMPACT_MARKER = b"\x01"
+_COMPACT_MARKER_LENGTH = len(_COMPACT_MARKER)
+_COMPACT_SEPARATOR = b"\x00"
+_COMPACT_FIELDS = ("userId", "campaignKey", "variationName", "goalIdentifiers")
+
+FILE = FileNameEnum.Storage.Redis
+
+# storages having write-behind enabled, flushed when the interpreter exits
+_write_behind_storages = weakref.WeakSet()
+
 
 class RedisUserStorage(UserStorage):
     """
     Redis User Storage overrides UserStorage to provide storage in Redis
     """
 
-    def __init__(self, url, user_id, password):
+    def __init__(
+        self,
+        url,
+        user_id=None,
+        password=None,
+        port=6379,
+        db=0,
+        max_connections=None,
+        socket_timeout=None,
+        socket_connect_timeout=None,
+        retries=0,
+        ttl=None,
+        encoding=ENCODING_JSON,
+        write_behind=False,
+        write_behind_interval=1,
+        write_behind_batch_size=100,
+        write_behind_max_pending=10000,
+    ):
+        """
+        Args:
+            url (str): host of the redis server, or a redis:// or rediss:// URL
+            user_id (str): username for redis ACL, if any
+            password (str): password for redis, if any
+            port (int): port of the redis server
+            db (int): redis database index
+            max_connections (int): max no. of connections in the pool, unbounded if None
+            socket_timeout (float): seconds to wait for a command reply
+            socket_connect_timeout (float): seconds to wait for a connection
+            retries (int): no. of retries, with exponential backoff, on connection errors and timeouts
+            ttl (int): seconds after which stored data expires, never if None
+            encoding (str): json, or compact for a smaller binary value
+            write_behind (bool): buffer set calls and write them in pipelined batches from a background thread
+            write_behind_interval (float): max seconds a set call stays buffered
+            write_behind_batch_size (int): no. of buffered set calls which triggers a write
+            write_behind_max_pending (int): max no. of buffered set calls, set writes inline beyond it
+        """
+        self.logger = VWOLogger.getInstance()
         self.url = url
         self.user_id = user_id
         self.password = password
+        self.ttl = ttl
+        self.encoding = encoding
+
+        self.write_behind = write_behind
+        self.write_behind_interval = write_behind_interval
+        self.write_behind_batch_size = write_behind_batch_size
+        self.write_behind_max_pending = write_behind_max_pending
+        # key => encoded value, later set calls of a key replace the earlier ones
+        self.pending_writes = {}
+        self.writer = None
+        self.is_closed = False
+        self.condition = threading.Condition()
+
+        connection_kwargs = {
+            "password": password,
+            "max_connections": max_connections,
+            "socket_timeout": socket_timeout,
+            "socket_connect_timeout": socket_connect_timeout,
+        }
+        if user_id:
+            connection_kwargs["username"] = user_id
+        if retries:
+            connection_kwargs["retry"] = Retry(ExponentialBackoff(), retries)
+            connection_kwargs["retry_on_error"] = [redis.exceptions.ConnectionError, redis.exceptions.TimeoutError]
 
         try:
             # instantiate redis
-            self.redis = redis.Redis(host=url, port=6379, db=0)
+            if url.startswith(("redis://", "rediss://", "unix://")):
+                self.connection_pool = redis.ConnectionPool.from_url(url, **connection_kwargs)
+            else:
+                self.connection_pool = redis.ConnectionPool(host=url, port=port, db=db, **connection_kwargs)
+            self.redis = redis.Redis(connection_pool=self.connection_pool)
         except Exception as e:
             print(e)
 
+        if write_behind:
+            _write_behind_storages.add(self)
+
     def get(self, user_id, campaign_key):
         """To retrieve the stored variation for the user_id and
         campaign_key
@@ -46,22 +139,65 @@ class RedisUserStorage(UserStorage):
             user_data (dict): user-variation mapping
         """
         value = None
+        value_str = None
 
         # create the key for this and then get the value from redis
         key = campaign_key + ":" + user_id
 
         try:
-            # get from redis
-            value_str = self.redis.get(key)
+            # writes not yet flushed are the latest values
+            value_str = self.pending_writes.get(key)
+            if value_str is None:
+                # get from redis
+                value_str = self.redis.get(key)
         except Exception as e:
             print(e)
 
         # extract the map from the string value stored in redis
         if value_str:
-            value = json.loads(value_str)
+            value = self.decode(value_str, user_id, campaign_key)
 
         return value
 
+    def get_many(self, user_id, campaign_keys):
+        """To retrieve the stored variations for the user_id and
+        multiple campaign_keys in one round-trip using MGET
+
+        Args:
+            user_id (str): User ID for which data needs to be retrieved.
+            campaign_keys (list): Campaign keys to identify the campaigns for
+            which stored variations should be retrieved.
+
+        Returns:
+            dict: user-variation mapping of each campaign_key found
+        """
+        values = {}
+
+        # create the keys for these and then get the values from redis
+        keys = [campaign_key + ":" + user_id for campaign_key in campaign_keys]
+
+        try:
+            # get from redis
+            value_strs = self.redis.mget(keys)
+        except Exception as e:
+            self.logger.lazy_log(
+                LogLevelEnum.ERROR,
+                LogMessageEnum.ERROR_MESSAGES.REDIS_GET_MANY_FAILED,
+                file=FILE,
+                no_of_keys=len(keys),
+                user_id=user_id,
+                error_message=e,
+            )
+            return values
+
+        # extract the maps from the string values stored in redis
+        for key, campaign_key, value_str in zip(keys, campaign_keys, value_strs):
+            value_str = self.pending_writes.get(key, value_str)
+            if value_str:
+                values[campaign_key] = self.decode(value_str, user_id, campaign_key)
+
+        return values
+
     def set(self, user_data):
         """To store the the user variation-mapping
 
@@ -71,9 +207,152 @@ class RedisUserStorage(UserStorage):
         try:
             # create the key and value for this and set to redis
             key = str(user_data["campaignKey"]) + ":" + str(user_data["userId"])
-            value = json.dumps(user_data)
+            value = self.encode(user_data)
+
+            if self.write_behind and self.buffer_write(key, value):
+                return
 
             # set to redis
-            self.redis.set(key, value)
+            self.redis.set(key, value, ex=self.ttl)
         except Exception as e:
             print(e)
+
+    def encode(self, user_data):
+        """Encodes the user variation-mapping as per the encoding of the storage
+
+        Args:
+            user_data (dict): user-variation mapping
+
+        Returns:
+            str|bytes: value to be stored in redis
+        """
+        if self.encoding == ENCODING_COMPACT and set(user_data).issubset(_COMPACT_FIELDS):
+            value = _COMPACT_MARKER + (user_data.get("variationName") or "").encode("utf-8")
+            if user_data.get("goalIdentifiers") is not None:
+                value += _COMPACT_SEPARATOR + user_data.get("goalIdentifiers").encode("utf-8")
+            return value
+
+        # json is used for data having fields which compact encoding does not know of
+        return json.dumps(user_data)
+
+    def decode(self, value_str, user_id, campaign_key):
+        """Decodes a value stored in redis, of either of the encodings
+
+        Args:
+            value_str (str|bytes): value stored in redis
+            user_id (str): User ID of the key
+            campaign_key (str): Campaign key of the key
+
+        Returns:
+            dict: user-variation mapping
+        """
+        if isinstance(value_str, bytes) and value_str.startswith(_COMPACT_MARKER):
+            fields = value_str[_COMPACT_MARKER_LENGTH:].split(_COMPACT_SEPARATOR, 1)
+            value = {"userId": user_id, "campaignKey": campaign_key, "variationName": fields[0].decode("utf-8")}
+            if len(fields) > 1:
+                value["goalIdentifiers"] = fields[1].decode("utf-8")
+            return value
+
+        return json.loads(value_str)
+
+    def buffer_write(self, key, value):
+        """Buffers a write to be flushed by the background writer
+
+        Args:
+            key (str): redis key
+            value (str|bytes): encoded value
+
+        Returns:
+            bool: True if buffered, False if buffer is full or storage is closed
+        """
+        with self.condition:
+            if self.is_closed or (
+                key not in self.pending_writes and len(self.pending_writes) >= self.write_behind_max_pending
+            ):
+                return False
+
+            self.pending_writes[key] = value
+            if self.writer is None:
+                self.writer = threading.Thread(target=self.run_writer)
+                self.writer.daemon = True
+                self.writer.start()
+            if len(self.pending_writes) >= self.write_behind_batch_size:
+                self.condition.notify()
+            return True
+
+    def run_writer(self):
+        """Loop of the background writer, flushes buffered writes every write_behind_interval
+        or as soon as write_behind_batch_size writes are buffered. After a failed flush it waits a full
+        write_behind_interval before flushing again. Exits when nothing is buffered, or when closed after
+        a failed flush, the next buffered write starts it again."""
+        is_flushed = True
+        while True:
+            with self.condition:
+                if not is_flushed:
+                    retry_at = clock() + self.write_behind_interval
+                    while not self.is_closed and clock() < retry_at:
+                        self.condition.wait(retry_at - clock())
+                elif len(self.pending_writes) < self.write_behind_batch_size and not self.is_closed:
+                    self.condition.wait(self.write_behind_interval)
+                # close flushes once more by itself
+                if not self.pending_writes or (self.is_closed and not is_flushed):
+                    self.writer = None
+                    return
+
+            is_flushed = self.flush()
+
+    def flush(self):
+        """Writes the buffered set calls to redis in pipelined batches. Writes are unbuffered only once
+        their batch is written, on failure the rest stay buffered for the next flush.
+
+        Returns:
+            bool: True if every buffered write was written
+        """
+        with self.condition:
+            pending_writes = list(self.pending_writes.items())
+
+        batch_size = self.write_behind_batch_size
+        for start in range(0, len(pending_writes), batch_size):
+            end = start + batch_size
+            batch = pending_writes[start:end]
+            try:
+                pipeline = self.redis.pipeline(transaction=False)
+                for key, value in batch:
+                    pipeline.set(key, value, ex=self.ttl)
+                pipeline.execute()
+            except Exception as e:
+                self.logger.lazy_log(
+                    LogLevelEnum.ERROR,
+                    LogMessageEnum.ERROR_MESSAGES.REDIS_WRITE_BEHIND_FAILED,
+                    file=FILE,
+                    no_of_writes=len(pending_writes) - start,
+                    error_message=e,
+                )
+                return False
+
+            with self.condition:
+                # keep the writes made while the batch was being written
+                for key, value in batch:
+                    if self.pending_writes.get(key) is value:
+                        del self.pending_writes[key]
+
+        return True
+
+    def close(self):
+        """Flushes the buffered writes and stops the background writer.
+        Later set calls write to redis inline."""
+        with self.condition:
+            self.is_closed = True
+            self.condition.notify()
+            writer = self.writer
+
+        if writer is not None and writer is not threading.current_thread():
+            writer.join()
+        self.flush()
+
+
+@atexit.register
+def _flush_write_behind_storages():
+    """Writes the buffered set calls when the interpreter exits"""
+    for storage in list(_write_behind_storages):
+        storage.close()
@@ -16,7 +16,11 @@
 class UserStorage(object):
     """ UserStorage Class is used to store user-variation mapping.
     Override this class to implement your own functionality.
-    SDK will ensure to use this while bucketing a user into a variation."""
+    SDK will ensure to use this while bucketing a user into a variation.
+
+    Optionally, implement get_many(user_id, campaign_keys) returning a dict of
+    campaign_key to user-variation mapping, to let SDK fetch the data of all the
+    campaigns of a mutually exclusive group in one round-trip."""
 
     def get(self, user_id, campaign_key):
         """ To retrieve the stored variation for the user_id and
@@ -20,8 +20,10 @@ from .enums.log_message_enum import LogMessageEnum
 from .event.event_dispatcher import EventDispatcher
 from .helpers.generic_util import safe_method
 from .logger import VWOLogger
-from .services.settings_file_manager import SettingsFileManager
-from .constants.constants import GOAL_TYPES
+from .services.settings_file_manager import SettingsFileManager, SharedSettingsFileManager
+from .services.settings_poller import SettingsPoller
+from .services.instrumentation import Instrumentation, traced
+from .constants.constants import API_METHODS, GOAL_TYPES, INSTRUMENTATION
 from .services.url_manager import url_manager
 
 
@@ -32,8 +34,21 @@ logger = VWOLogger.getInstance()
 class VWO(object):
     """Core class of the SDK, consisting all the APIs featured in VWO Full Stack Server Side Testing"""
 
+    event_dispatcher_class = EventDispatcher
+
     def __init__(
-        self, settings_file, user_storage, is_development_mode, goal_type_to_track, batch_event_settings, integrations
+        self,
+        settings_file,
+        user_storage,
+        is_development_mode,
+        goal_type_to_track,
+        batch_event_settings,
+        integrations,
+        settings_poller_settings=None,
+        settings_cache=None,
+        shared_settings=None,
+        settings_update_callback=None,
+        instrumentation_sink=None,
     ):
         """__init__ method to initialize the VWO object, all the argument types should be pre-checked.
         Else object initialization fails.
@@ -49,37 +64,74 @@ class VWO(object):
             api. Default value is vwo.GOAL_TYPES.ALL
             batch_events_settings (dict): settings for configuring and enabling event batching
             integrations (dict): an integrations service instance for third party integrations
+            settings_poller_settings (dict): options of SettingsPoller i.e. account_id, sdk_key, interval
+            and jitter, for keeping the settings_file up to date in the background
+            settings_cache (SettingsCache): on-disk cache of the settings_file
+            shared_settings (SharedSettings): file sharing the processed settings_file among processes
+            settings_update_callback (function): called with the summary of changes on settings_file updates
+            instrumentation_sink (function): called with the DecisionTrace of each decision API call
         """
         self.logger = VWOLogger.getInstance()
-        self.config = SettingsFileManager(settings_file)
-        self.settings_file = self.config.get_settings_file()
+        self.instrumentation = Instrumentation(instrumentation_sink) if instrumentation_sink is not None else None
+        if shared_settings is not None:
+            self.config = SharedSettingsFileManager(
+                settings_file, shared_settings, settings_update_callback=settings_update_callback
+            )
+        else:
+            self.config = SettingsFileManager(
+                settings_file, settings_cache=settings_cache, settings_update_callback=settings_update_callback
+            )
         self.variation_decider = VariationDecider(
             user_storage,
             account_id=self.settings_file.get("accountId"),
             integrations=integrations,
-            settings_file=self.settings_file,
+            settings_file_manager=self.config,
+            instrumentation=self.instrumentation,
         )
         if is_development_mode:
-            self.logger.log(LogLevelEnum.DEBUG, LogMessageEnum.DEBUG_MESSAGES.SET_DEVELOPMENT_MODE.format(file=FILE))
-        self.event_dispatcher = EventDispatcher(
+            self.logger.lazy_log(LogLevelEnum.DEBUG, LogMessageEnum.DEBUG_MESSAGES.SET_DEVELOPMENT_MODE, file=FILE)
+        self.event_dispatcher = self.event_dispatcher_class(
             is_development_mode=is_development_mode or False,
             batch_event_settings=batch_event_settings,
             sdk_key=self.settings_file.get("sdkKey"),
         )
+        if self.instrumentation is not None:
+            self.instrumentation.instrument(
+                self.event_dispatcher, INSTRUMENTATION.DISPATCH, "dispatch", "dispatch_many", "dispatch_events"
+            )
         self.is_event_batching_enabled = bool(batch_event_settings)
         self.is_event_arch_enabled = bool(self.settings_file.get("isEventArchEnabled"))
         self.goal_type_to_track = goal_type_to_track or GOAL_TYPES.ALL
         self.url_manager = url_manager.set_config({"collection_prefix": self.settings_file.get("collectionPrefix")})
         self.is_opted_out = False
-        self.logger.log(LogLevelEnum.DEBUG, LogMessageEnum.DEBUG_MESSAGES.SDK_INITIALIZED.format(file=FILE))
+        self.settings_poller = None
+        if settings_poller_settings is not None:
+            # the settings_file is fetched with the pooled connection of the event_dispatcher
+            self.settings_poller = SettingsPoller(
+                self.config, self.event_dispatcher.connection, **settings_poller_settings
+            )
+            self.settings_poller.start()
+        self.logger.lazy_log(LogLevelEnum.DEBUG, LogMessageEnum.DEBUG_MESSAGES.SDK_INITIALIZED, file=FILE)
+
+    @property
+    def settings_file(self):
+        """settings_file currently published by config, None once opted out"""
+        return self.config.get_settings_file() if self.config else None
 
     # PUBLIC METHODS
-    activate = safe_method(api._activate, None, FILE)
-    get_variation_name = safe_method(api._get_variation_name, None, FILE)
-    track = safe_method(api._track, False, FILE)
-    is_feature_enabled = safe_method(api._is_feature_enabled, False, FILE)
-    get_feature_variable_value = safe_method(api._get_feature_variable_value, None, FILE)
+    activate = safe_method(traced(api._activate, API_METHODS.ACTIVATE), None, FILE)
+    get_variation_name = safe_method(traced(api._get_variation_name, API_METHODS.GET_VARIATION_NAME), None, FILE)
+    get_variation_names_bulk = safe_method(
+        traced(api._get_variation_names_bulk, API_METHODS.GET_VARIATION_NAMES_BULK), None, FILE
+    )
+    get_all_decisions = safe_method(traced(api._get_all_decisions, API_METHODS.GET_ALL_DECISIONS), None, FILE)
+    track = safe_method(traced(api._track, API_METHODS.TRACK), False, FILE)
+    is_feature_enabled = safe_method(traced(api._is_feature_enabled, API_METHODS.IS_FEATURE_ENABLED), False, FILE)
+    get_feature_variable_value = safe_method(
+        traced(api._get_feature_variable_value, API_METHODS.GET_FEATURE_VARIABLE_VALUE), None, FILE
+    )
     push = safe_method(api._push, False, FILE)
     flush_events = safe_method(api._flush_events, False, FILE)
     get_and_update_settings_file = safe_method(api._get_and_update_settings_file, None, FILE)
     set_opt_out = safe_method(api._set_opt_out, None, FILE)
+    get_dispatcher_stats = safe_method(api._get_dispatcher_stats, None, FILE)